@@ -1,4 +1,13 @@
 #!/bin/sh
 set -e
 
-exec uvicorn src.main:app --host 0.0.0.0 --port 8000
+WORKERS="${WEB_CONCURRENCY:-1}"
+
+# The in-memory job store lives inside one process; extra workers would
+# each see a different set of jobs.
+if [ "$WORKERS" -gt 1 ] && [ "${JOB_STORE_BACKEND:-memory}" != "sqlite" ]; then
+  echo "WEB_CONCURRENCY=$WORKERS requires JOB_STORE_BACKEND=sqlite" >&2
+  exit 1
+fi
+
+exec uvicorn src.main:app --host 0.0.0.0 --port 8000 --workers "$WORKERS"
@@ -0,0 +1,209 @@
+"""Benchmark InMemoryJobStore: do writes to different jobs wait for each other?
+
+Each thread owns a few jobs, all on a stripe no other thread uses, and
+loops the pattern a running job plus its polling clients produce: one
+``set_current_node`` followed by ``--reads`` ``get`` calls.  Every
+thread count runs against ``global`` -- the store with one lock around
+every call, as before striping -- and ``striped`` (the current store).
+Both stores get a real ``PipelineMetrics``, as ``deps.get_job_store``
+wires it, so the lock-wait histogram's cost is part of what is measured;
+``contended`` is the share of lock acquisitions it recorded as waiting
+longer than its first bucket (10 µs).
+
+Two workloads are measured:
+
+* ``cpu``: plain writes plus reads.  On a GIL build only one thread runs
+  Python at a time, so neither layout gets faster with threads; striping
+  only trims the per-call cost a little.  This is the common case.
+* ``latency``: each write also holds its stripe for ``--write-latency-ms``
+  without the GIL (standing in for blocking work under the lock).
+  ``global`` stays at one write per latency period with its waiters
+  piling up; ``striped`` overlaps those waits, because writes to
+  different jobs share no lock.  On a free-threaded build the ``cpu``
+  workload scales the same way.
+
+With ``--check`` the script exits non-zero unless, at the largest thread
+count, ``striped`` overlaps at least half of the ``latency`` workload's
+waits and under 5% of its lock acquisitions are contended in either
+workload.
+
+Run from the repo root::
+
+    python scripts/bench_job_store_concurrency.py [--seconds 1.0] [--threads 1 2 4 8]
+        [--write-latency-ms 2] [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.domain.models.job import JobRecord, JobStatus  # noqa: E402
+from src.domain.models.job_input import JobInput  # noqa: E402
+from src.infrastructure.metrics.pipeline_metrics import PipelineMetrics  # noqa: E402
+from src.infrastructure.metrics.timed_lock import timed_lock  # noqa: E402
+from src.infrastructure.stores.in_memory_job_store import (  # noqa: E402
+    InMemoryJobStore,
+    StoredJobState,
+)
+
+_NODES = ("collect_serp", "extract_themes", "planner", "write_article", "seo_packager")
+_JOBS_PER_THREAD = 4
+
+
+def _lock_waits(metrics: PipelineMetrics) -> tuple[int, int]:
+    """(acquisitions, acquisitions waiting over the first bucket) recorded so far."""
+    counts, _ = metrics.store_lock_wait.labels("memory").snapshot()
+    return sum(counts), sum(counts[1:])
+
+
+class _GlobalLockStore(InMemoryJobStore):
+    """The pre-striping layout: one store-wide lock around every call used here."""
+
+    def __init__(self, *, metrics: PipelineMetrics, **kwargs) -> None:
+        super().__init__(lock_stripes=1, metrics=metrics, **kwargs)
+        self._global = timed_lock(
+            threading.Lock(), metrics.store_lock_wait.labels("memory").observe
+        )
+
+    def get(self, job_id: str) -> JobRecord:
+        with self._global:
+            return super().get(job_id)
+
+    def set_current_node(self, job_id: str, current_node: str) -> JobRecord:
+        with self._global:
+            return super().set_current_node(job_id, current_node)
+
+
+def _with_write_latency(
+    store_cls: type[InMemoryJobStore], seconds: float
+) -> type[InMemoryJobStore]:
+    """*store_cls* whose writes block for *seconds* (GIL released) under their lock."""
+
+    class _Slow(store_cls):
+        def _update(self, state: StoredJobState, **fields: object) -> StoredJobState:
+            time.sleep(seconds)
+            return super()._update(state, **fields)
+
+    return _Slow
+
+
+def _prepare(store: InMemoryJobStore, threads: int) -> list[list[str]]:
+    """Create each thread's jobs on a stripe of its own (when there are enough)."""
+    stripes = len(store._stripes)
+    owned = []
+    job_input = JobInput(topic="seo tools", target_word_count=1500, language="en")
+    for t in range(threads):
+        candidates = (f"job-{t}-{n}" for n in range(1_000_000))
+        ids: list[str] = []
+        for job_id in candidates:
+            if store._stripe(job_id) is store._stripes[t % stripes]:
+                ids.append(job_id)
+                if len(ids) == _JOBS_PER_THREAD:
+                    break
+        for job_id in ids:
+            store.create(job_id)
+            store.set_input(job_id, job_input)
+            store.set_status(job_id, JobStatus.RUNNING, current_node=_NODES[0])
+        owned.append(ids)
+    return owned
+
+
+def _run(
+    store_cls: type[InMemoryJobStore], threads: int, seconds: float, reads: int
+) -> tuple[float, float]:
+    """Return (operations per second, share of lock acquisitions that waited)."""
+    metrics = PipelineMetrics()
+    store = store_cls(metrics=metrics)
+    owned = _prepare(store, threads)
+    acquired_before, waited_before = _lock_waits(metrics)
+    start = threading.Barrier(threads + 1)
+    stop = threading.Event()
+    counts = [0] * threads
+
+    def _worker(t: int) -> None:
+        ids = owned[t]
+        ops = 0
+        start.wait()
+        while not stop.is_set():
+            job_id = ids[ops % len(ids)]
+            store.set_current_node(job_id, _NODES[ops % len(_NODES)])
+            for _ in range(reads):
+                store.get(job_id)
+            ops += 1 + reads
+        counts[t] = ops
+
+    workers = [threading.Thread(target=_worker, args=(t,)) for t in range(threads)]
+    for worker in workers:
+        worker.start()
+    start.wait()
+    began = time.perf_counter()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - began
+    acquired, waited = _lock_waits(metrics)
+    acquired -= acquired_before
+    return sum(counts) / elapsed, (waited - waited_before) / max(acquired, 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--reads", type=int, default=4, help="gets per write")
+    parser.add_argument("--write-latency-ms", type=float, default=2.0)
+    parser.add_argument(
+        "--check", action="store_true", help="fail unless stripes overlap"
+    )
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL {'on' if gil else 'off'}")
+    latency = args.write_latency_ms / 1000
+    workloads = {
+        "cpu": (_GlobalLockStore, InMemoryJobStore, args.reads),
+        "latency": (
+            _with_write_latency(_GlobalLockStore, latency),
+            _with_write_latency(InMemoryJobStore, latency),
+            0,
+        ),
+    }
+    results: dict[str, dict[int, tuple[float, float]]] = {}
+    for name, (global_cls, striped_cls, reads) in workloads.items():
+        print(f"\n{name}: {reads} reads/write")
+        print(
+            f"{'threads':>7}  {'global':>12} {'contended':>9}  "
+            f"{'striped':>12} {'contended':>9}  speedup"
+        )
+        results[name] = {}
+        for threads in args.threads:
+            single, single_busy = _run(global_cls, threads, args.seconds, reads)
+            striped, striped_busy = _run(striped_cls, threads, args.seconds, reads)
+            results[name][threads] = (striped, striped_busy)
+            print(
+                f"{threads:>7}  {single:>10,.0f}/s {single_busy:>9.1%}  "
+                f"{striped:>10,.0f}/s {striped_busy:>9.1%}  {striped / single:6.2f}x"
+            )
+
+    if not args.check:
+        return 0
+    lo, hi = min(args.threads), max(args.threads)
+    scaling = results["latency"][hi][0] / results["latency"][lo][0]
+    contention = max(results[name][hi][1] for name in results)
+    ok = scaling >= (hi / lo) / 2 and contention < 0.05
+    print(
+        f"\nstriped: latency ops/s x{scaling:.1f} from {lo} to {hi} threads, "
+        f"at most {contention:.1%} contended at {hi} -> {'ok' if ok else 'FAIL'}"
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""Benchmark result-fetch serialization paths.
+
+Compares, for a realistic ~2,000-word result:
+
+* ``fastapi``  – the old path: load the record, return ``ResultResponse``
+  and let FastAPI validate and encode it via ``response_model``;
+* ``dump``     – load the record and emit ``model_dump_json`` bytes;
+* ``cached``   – serve the store's cached JSON bytes (current endpoint).
+
+Run from the repo root::
+
+    python scripts/bench_result_serialization.py [--iterations 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+
+from src.api.schemas.responses import ResultResponse  # noqa: E402
+from src.domain.models.outline import Outline, OutlineSection  # noqa: E402
+from src.domain.models.output import SeoArticleOutput  # noqa: E402
+from src.domain.models.seo_package import (  # noqa: E402
+    ExternalReference,
+    InternalLinkSuggestion,
+    KeywordCountItem,
+    KeywordUsage,
+    SeoMeta,
+)
+from src.domain.models.validation import ValidationReport  # noqa: E402
+from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore  # noqa: E402
+
+
+def _sample_output() -> SeoArticleOutput:
+    sections = [
+        OutlineSection(
+            section_id=f"s{i}",
+            h2=f"Section {i}",
+            h3=[f"Point {i}.{j}" for j in range(3)],
+        )
+        for i in range(8)
+    ]
+    body = "\n\n".join(
+        f"## {s.h2}\n\n" + ("SEO tools help teams rank better with data. " * 30)
+        for s in sections
+    )
+    output = SeoArticleOutput(
+        seo_meta=SeoMeta(
+            title_tag="Best SEO Tools for 2026", meta_description="x" * 150
+        ),
+        article_markdown=f"# Best SEO Tools\n\n{body}",
+        outline=Outline(h1="Best SEO Tools", sections=sections),
+        keyword_analysis=KeywordUsage(
+            primary="seo tools",
+            secondary=[f"keyword {i}" for i in range(10)],
+            counts=[
+                KeywordCountItem(keyword=f"keyword {i}", count=i) for i in range(10)
+            ],
+        ),
+        internal_links=[
+            InternalLinkSuggestion(anchor_text=f"link {i}", target_topic=f"topic {i}")
+            for i in range(5)
+        ],
+        external_references=[
+            ExternalReference(
+                source_name=f"source {i}",
+                url=f"https://example.com/{i}",
+                placement_hint="body",
+                credibility_reason="authoritative",
+            )
+            for i in range(4)
+        ],
+        validation_report=ValidationReport(passed=True, score=1.0),
+    )
+    # finalize duplicates the whole output into structured_data.
+    return output.model_copy(update={"structured_data": output.model_dump(mode="json")})
+
+
+def _time(fn, iterations: int) -> float:
+    """Return mean milliseconds per call."""
+    fn()  # warm up
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) * 1000 / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    store = InMemoryJobStore()
+    store.create("job")
+    store.set_result("job", _sample_output())
+    field = create_model_field(
+        name="Response", type_=ResultResponse, mode="serialization"
+    )
+    loop = asyncio.new_event_loop()
+
+    def fastapi_path() -> bytes:
+        content = ResultResponse(result=store.get("job").result)
+        encoded = loop.run_until_complete(
+            serialize_response(
+                field=field, response_content=content, is_coroutine=False
+            )
+        )
+        return _render_json(encoded)
+
+    def dump_path() -> bytes:
+        return ResultResponse(result=store.get("job").result).model_dump_json().encode()
+
+    def cached_path() -> bytes:
+        result_json, _ = store.get_result_json("job")
+        return b'{"result":' + result_json + b"}"
+
+    size = len(cached_path())
+    print(f"payload: {size / 1024:.1f} KiB, iterations: {args.iterations}")
+    baseline = None
+    for name, fn in (
+        ("fastapi", fastapi_path),
+        ("dump", dump_path),
+        ("cached", cached_path),
+    ):
+        ms = _time(fn, args.iterations)
+        baseline = baseline or ms
+        print(f"{name:>8}: {ms:8.3f} ms/request  ({baseline / ms:5.1f}x)")
+    loop.close()
+
+
+def _render_json(content: object) -> bytes:
+    """Render like ``JSONResponse.render`` does."""
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,23 +11,38 @@ RESP=$(curl -s -X POST "$BASE/jobs" \
 if command -v jq >/dev/null 2>&1; then
   JOB_ID=$(echo "$RESP" | jq -r '.job.id')
   STATUS=$(echo "$RESP" | jq -r '.job.status')
+  VERSION=$(echo "$RESP" | jq -r '.job.version')
 else
   JOB_ID=$(echo "$RESP" | grep -o '"id":"[^"]*"' | head -1 | cut -d'"' -f4)
   STATUS=$(echo "$RESP" | grep -o '"status":"[^"]*"' | head -1 | cut -d'"' -f4)
+  VERSION=$(echo "$RESP" | grep -oE '"version":[0-9]+' | head -1 | cut -d: -f2)
 fi
 
 echo "Job ID: $JOB_ID"
 echo "Status: $STATUS"
+echo "(polling through pending, queued, running and cancelling;"
+echo " stopping at completed, failed, cancelled or interrupted)"
 
-while [ "$STATUS" = "pending" ] || [ "$STATUS" = "running" ]; do
-  sleep 2
-  RESP=$(curl -s "$BASE/jobs/$JOB_ID")
+in_progress() {
+  case "$1" in
+    pending|queued|running|cancelling) return 0 ;;
+    *) return 1 ;;
+  esac
+}
+
+# Long-poll: the server holds each request until the job changes (or 30s pass).
+while in_progress "$STATUS"; do
+  RESP=$(curl -s "$BASE/jobs/$JOB_ID?wait=30&since=$VERSION")
   if command -v jq >/dev/null 2>&1; then
     STATUS=$(echo "$RESP" | jq -r '.status // .job.status')
+    NODE=$(echo "$RESP" | jq -r '.current_node // empty')
+    VERSION=$(echo "$RESP" | jq -r '.version')
   else
     STATUS=$(echo "$RESP" | grep -oE '"status":"[^"]*"' | head -1 | cut -d'"' -f4)
+    NODE=$(echo "$RESP" | grep -oE '"current_node":"[^"]*"' | head -1 | cut -d'"' -f4)
+    VERSION=$(echo "$RESP" | grep -oE '"version":[0-9]+' | head -1 | cut -d: -f2)
   fi
-  echo "  Status: $STATUS"
+  echo "  Status: $STATUS ${NODE:+($NODE)}"
 done
 
 if [ "$STATUS" = "completed" ]; then
@@ -9,12 +9,30 @@ from typing import Any
 from src.application.orchestration.graph_builder import build_graph
 from src.application.orchestration.nodes.deps import NodeDeps
 from src.application.orchestration.nodes.prompt_loader import PromptLoader
+from src.domain.models.job_input import JobPriority
+from src.infrastructure.events.draft_stream_hub import DraftStreamHub
+from src.infrastructure.events.job_event_bus import JobEventBus
+from src.infrastructure.metrics import PipelineMetrics
+from src.infrastructure.providers.llm.call_window import LLMCallWindow
 from src.infrastructure.providers.llm.openai_provider import OpenAIProvider
+from src.infrastructure.quotas.quota_store_factory import (
+    get_quota_store as _get_quota_store,
+)
+from src.infrastructure.quotas.tenant_quotas import TenantQuotas
 from src.infrastructure.providers.serp.serp_provider_factory import (
     SerpProviderProtocol,
     get_serp_provider as _get_serp_provider,
 )
-from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+from src.infrastructure.stores.job_store import JobStore
+from src.infrastructure.stores.job_store_factory import get_job_store as _get_job_store
+from src.infrastructure.stores.job_coalescer import JobCoalescer
+from src.infrastructure.stores.shared_upstream_cache import SharedUpstreamCache
+from src.infrastructure.webhooks import WebhookDispatcher, WebhookOutbox
+from src.infrastructure.webhooks.outbox_factory import (
+    get_webhook_outbox as _get_webhook_outbox,
+)
+from src.infrastructure.workers.async_job_worker_pool import AsyncJobWorkerPool
+from src.infrastructure.workers.job_worker_pool import JobWorkerPool, Lane
 from src.settings import Settings, get_settings as _get_settings
 
 
@@ -25,9 +43,107 @@ def get_settings() -> Settings:
 
 
 @lru_cache(maxsize=1)
-def get_job_store() -> InMemoryJobStore:
+def get_metrics() -> PipelineMetrics:
+    """Return singleton metrics shared by nodes, the LLM provider and the store."""
+    return PipelineMetrics()
+
+
+@lru_cache(maxsize=1)
+def get_job_store() -> JobStore:
     """Return singleton job store. Same instance used by graph checkpointer."""
-    return InMemoryJobStore()
+    return _get_job_store(get_settings(), metrics=get_metrics())
+
+
+@lru_cache(maxsize=1)
+def get_event_bus() -> JobEventBus:
+    """Return singleton bus carrying job progress events to SSE clients."""
+    return JobEventBus()
+
+
+@lru_cache(maxsize=1)
+def get_draft_stream() -> DraftStreamHub:
+    """Return singleton hub streaming write_article tokens to clients."""
+    return DraftStreamHub()
+
+
+@lru_cache(maxsize=1)
+def get_upstream_cache() -> SharedUpstreamCache:
+    """Return singleton cache for SERP/themes shared by jobs in a batch."""
+    return SharedUpstreamCache()
+
+
+@lru_cache(maxsize=1)
+def get_job_coalescer() -> JobCoalescer | None:
+    """Return singleton coalescer of identical in-flight jobs (None if disabled)."""
+    return JobCoalescer() if get_settings().JOB_COALESCING else None
+
+
+@lru_cache(maxsize=1)
+def get_tenant_quotas() -> TenantQuotas:
+    """Return singleton per-tenant rate limiter (0 disables a limit).
+
+    Bucket state lives in the job store's backend, so ``sqlite`` shares
+    it between workers.
+    """
+    settings = get_settings()
+    return TenantQuotas(
+        jobs_per_minute=settings.TENANT_JOBS_PER_MINUTE or None,
+        llm_tokens_per_minute=settings.TENANT_LLM_TOKENS_PER_MINUTE or None,
+        tokens_per_word=settings.TENANT_TOKENS_PER_WORD,
+        store=_get_quota_store(settings),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_webhook_outbox() -> WebhookOutbox:
+    """Return singleton outbox of completion webhooks (job store's backend)."""
+    return _get_webhook_outbox(get_settings())
+
+
+@lru_cache(maxsize=1)
+def get_webhook_dispatcher() -> WebhookDispatcher:
+    """Return singleton webhook dispatcher. Started by the app lifespan."""
+    settings = get_settings()
+    return WebhookDispatcher(
+        outbox=get_webhook_outbox(),
+        secret=settings.WEBHOOK_SECRET,
+        concurrency=settings.WEBHOOK_CONCURRENCY,
+        max_attempts=settings.WEBHOOK_MAX_ATTEMPTS,
+        base_delay=settings.WEBHOOK_BACKOFF_BASE_SECONDS,
+        max_delay=settings.WEBHOOK_BACKOFF_MAX_SECONDS,
+        timeout=settings.WEBHOOK_TIMEOUT_SECONDS,
+        allow_private_urls=settings.WEBHOOK_ALLOW_PRIVATE_URLS,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_worker_pool() -> JobWorkerPool:
+    """Return singleton worker pool that executes graph jobs in the background.
+
+    ``JOB_EXECUTION_MODE=async`` runs jobs as coroutines on one event loop.
+    Interactive and bulk jobs get separate lanes (see ``JobWorkerPool``).
+    """
+    settings = get_settings()
+    if settings.JOB_EXECUTION_MODE == "thread":
+        pool_cls = JobWorkerPool
+    elif settings.JOB_EXECUTION_MODE == "async":
+        pool_cls = AsyncJobWorkerPool
+    else:
+        raise ValueError(
+            f"Unsupported job execution mode: {settings.JOB_EXECUTION_MODE!r}"
+        )
+    return pool_cls(
+        workers=settings.JOB_WORKERS,
+        max_queue_depth=settings.JOB_QUEUE_MAX_DEPTH,
+        lanes={
+            JobPriority.INTERACTIVE.value: Lane(weight=settings.JOB_INTERACTIVE_WEIGHT),
+            JobPriority.BULK.value: Lane(
+                weight=settings.JOB_BULK_WEIGHT,
+                max_queue_depth=settings.JOB_BULK_QUEUE_MAX_DEPTH,
+            ),
+        },
+        aging_seconds=settings.JOB_QUEUE_AGING_SECONDS,
+    )
 
 
 @lru_cache(maxsize=1)
@@ -36,13 +152,21 @@ def get_serp_provider() -> SerpProviderProtocol:
     return _get_serp_provider(get_settings())
 
 
+@lru_cache(maxsize=1)
+def get_llm_call_window() -> LLMCallWindow:
+    """Return singleton record of recent LLM call outcomes (for readiness)."""
+    return LLMCallWindow(window_seconds=get_settings().READY_LLM_WINDOW_SECONDS)
+
+
 @lru_cache(maxsize=1)
 def get_llm_provider() -> OpenAIProvider | None:
     """Return LLM provider. None in dev when OPENAI_API_KEY is not set."""
     settings = get_settings()
     if settings.APP_ENV == "dev" and not settings.OPENAI_API_KEY:
         return None
-    return OpenAIProvider(settings=settings)
+    return OpenAIProvider(
+        settings=settings, call_window=get_llm_call_window(), metrics=get_metrics()
+    )
 
 
 @lru_cache(maxsize=1)
@@ -60,6 +184,9 @@ def get_node_deps() -> NodeDeps:
         job_store=get_job_store(),
         settings=get_settings(),
         prompts=get_prompt_loader(),
+        upstream_cache=get_upstream_cache(),
+        draft_stream=get_draft_stream(),
+        metrics=get_metrics(),
     )
 
 
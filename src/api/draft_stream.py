@@ -0,0 +1,78 @@
+"""Article draft streaming – bridge DraftStreamHub (threads) to an async response."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator
+
+from fastapi.concurrency import run_in_threadpool
+
+from src.domain.models.events import JobEvent, JobEventType
+from src.domain.models.job import JobRecord
+from src.infrastructure.events.draft_stream_hub import DraftStreamHub
+from src.infrastructure.events.job_event_bus import JobEventBus
+from src.infrastructure.stores.job_store import JobStore
+
+
+async def stream_article_draft(
+    *,
+    record: JobRecord,
+    drafts: DraftStreamHub,
+    events: JobEventBus,
+    job_store: JobStore,
+) -> AsyncIterator[str]:
+    """Yield the job's write_article draft as markdown text chunks.
+
+    Sends the text buffered so far, then each new chunk as the LLM produces
+    it, ending when the draft closes.  Also ends if the job reaches a
+    terminal state without ever writing a draft (e.g. it failed earlier).
+
+    Drafts are buffered in the process running the job.  For a job running
+    in another process the store is watched instead, and the stream ends
+    with the final article once the job completes (or empty if it fails).
+    """
+    loop = asyncio.get_running_loop()
+    # Draft chunks, a terminal record from the store, or None when the draft ends.
+    queue: asyncio.Queue[str | JobRecord | None] = asyncio.Queue()
+
+    def _put(item: str | JobRecord | None) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            pass  # loop closed: client went away
+
+    def _on_event(event: JobEvent) -> None:
+        if event.type == JobEventType.TERMINAL:
+            _put(None)
+
+    def _on_change(changed: JobRecord) -> None:
+        if changed.status.is_terminal:
+            _put(changed)
+
+    history, unsubscribe_events = events.subscribe(record.id, _on_event)
+    text, closed, unsubscribe_draft = drafts.subscribe(record.id, _put)
+    unwatch = job_store.watch(record.id, _on_change)
+    try:
+        if text:
+            yield text
+        if closed or any(e.type == JobEventType.TERMINAL for e in history):
+            return
+        # Re-read after watching so an end before ``watch`` is not missed.
+        record = await run_in_threadpool(job_store.get, record.id)
+        if record.status.is_terminal:
+            _put(record)
+        streamed = bool(text)
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            if isinstance(item, JobRecord):
+                if not streamed and item.result is not None:
+                    yield item.result.article_markdown
+                return
+            streamed = True
+            yield item
+    finally:
+        unwatch()
+        unsubscribe_draft()
+        unsubscribe_events()
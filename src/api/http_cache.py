@@ -0,0 +1,99 @@
+"""Conditional GET and response compression helpers for job resources."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+from typing import Iterable
+
+try:  # optional: pip install ".[brotli]"
+    import brotli
+except ImportError:  # pragma: no cover - depends on environment
+    brotli = None
+
+# Completed jobs never change; let clients and proxies keep them for a year.
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Everything else may change: cache, but revalidate with If-None-Match.
+REVALIDATE = "no-cache"
+
+# Below this size compression costs more than it saves.
+MIN_COMPRESS_BYTES = 1024
+
+
+def result_etag(result_hash: str, fields: Iterable[str] | None = None) -> str:
+    """Strong ETag for a job result, distinct per ``fields`` projection."""
+    tag = result_hash[:32]
+    if fields is not None:
+        projection = ",".join(sorted(fields)).encode()
+        tag += "." + hashlib.sha256(projection).hexdigest()[:8]
+    return f'"{tag}"'
+
+
+def job_etag(job_id: str, version: int) -> str:
+    """ETag for a job status document; changes with every store write."""
+    return f'"{job_id}.v{version}"'
+
+
+def match_etag(if_none_match: str | None, etag: str) -> str | None:
+    """Return the tag in *if_none_match* that matches *etag*, else ``None``.
+
+    Comparison is weak and ignores the content-coding suffix, so a tag
+    handed out for a gzip body still validates; the returned tag is the
+    client's own, suitable for echoing on a 304.
+    """
+    if not if_none_match:
+        return None
+    if if_none_match.strip() == "*":
+        return etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if _strip_encoding(candidate.removeprefix("W/")) == etag:
+            return candidate
+    return None
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """Pick ``br`` (if available) or ``gzip`` from an Accept-Encoding header."""
+    if not accept_encoding:
+        return None
+    accepted: set[str] = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        params = params.strip().replace(" ", "")
+        try:
+            q = float(params[2:]) if params.startswith("q=") else 1.0
+        except ValueError:
+            q = 0.0
+        if q > 0:
+            accepted.add(name.strip().lower())
+    if brotli is not None and ("br" in accepted or "*" in accepted):
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str | None) -> tuple[bytes, str | None]:
+    """Compress *body* with *encoding*; returns (bytes, applied encoding)."""
+    if encoding is None or len(body) < MIN_COMPRESS_BYTES:
+        return body, None
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body, quality=5), "br"
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6), "gzip"
+    return body, None
+
+
+def encoded_etag(etag: str, encoding: str | None) -> str:
+    """Suffix *etag* with the content coding so each representation differs."""
+    if encoding is None:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _strip_encoding(etag: str) -> str:
+    for encoding in ("br", "gzip"):
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+    return etag
@@ -0,0 +1,56 @@
+"""Long-poll helper – await the next change to a job without sleeping."""
+
+from __future__ import annotations
+
+import asyncio
+
+from fastapi.concurrency import run_in_threadpool
+
+from src.domain.models.job import JobRecord
+from src.infrastructure.stores.job_store import JobStore
+
+MAX_WAIT_SECONDS = 60.0
+
+
+async def wait_for_job_change(
+    *,
+    job_id: str,
+    since: int,
+    timeout: float,
+    job_store: JobStore,
+) -> JobRecord:
+    """Return the job once its ``version`` exceeds *since*, or after *timeout*.
+
+    The store calls our watcher on the writer's thread; it hands the record
+    to this coroutine's loop with ``call_soon_threadsafe``, so no thread is
+    parked per waiting client.  Store reads run in the threadpool, off the
+    loop.  On timeout the current record is returned.
+    Raises ``KeyError`` if the job does not exist.
+    """
+    loop = asyncio.get_running_loop()
+    changed: asyncio.Future[JobRecord] = loop.create_future()
+
+    def _resolve(record: JobRecord) -> None:
+        if not changed.done():
+            changed.set_result(record)
+
+    def _on_change(record: JobRecord) -> None:
+        if record.version > since:
+            try:
+                loop.call_soon_threadsafe(_resolve, record)
+            except RuntimeError:
+                pass  # loop closed: client went away
+
+    unwatch = job_store.watch(job_id, _on_change)
+    try:
+        # Re-read after registering so a change between the caller's read
+        # and ``watch`` is not missed.
+        record = await run_in_threadpool(job_store.get, job_id)
+        if record.version > since or record.status.is_terminal:
+            return record
+        try:
+            return await asyncio.wait_for(changed, timeout=timeout)
+        except TimeoutError:
+            return await run_in_threadpool(job_store.get, job_id)
+    finally:
+        unwatch()
@@ -0,0 +1,68 @@
+"""Readiness verdict from worker-pool saturation and recent LLM failures."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from src.api.schemas.responses import (
+    LLMHealthResponse,
+    QueueHealthResponse,
+    ReadinessResponse,
+    ReadinessThresholdsResponse,
+)
+from src.domain.models.job_input import JobPriority
+from src.infrastructure.providers.llm.call_window import LLMCallStats
+from src.infrastructure.workers.job_worker_pool import QueueStats
+from src.settings import Settings
+
+
+def assess_readiness(
+    *, queue: QueueStats, llm: LLMCallStats, settings: Settings
+) -> ReadinessResponse:
+    """Compare current load against the ``READY_*`` thresholds (0 disables one).
+
+    ``READY_MAX_QUEUED`` applies to the interactive lane only: the bulk
+    lane is a backlog by design (``JOB_BULK_QUEUE_MAX_DEPTH``), and a deep
+    bulk queue does not slow interactive jobs, so it should not take the
+    instance out of rotation.  A pool without lanes uses its total.
+
+    The LLM error rate only counts once the window holds at least
+    ``READY_LLM_MIN_CALLS`` attempts, so one failed call on an idle
+    instance does not take it out of rotation.
+    """
+    thresholds = ReadinessThresholdsResponse(
+        max_queued=settings.READY_MAX_QUEUED or None,
+        max_running=settings.READY_MAX_RUNNING or None,
+        max_llm_error_rate=settings.READY_MAX_LLM_ERROR_RATE or None,
+        llm_min_calls=settings.READY_LLM_MIN_CALLS,
+    )
+    reasons = []
+    interactive = queue.lanes.get(JobPriority.INTERACTIVE.value)
+    queued = queue.queued if interactive is None else interactive.queued
+    if thresholds.max_queued is not None and queued >= thresholds.max_queued:
+        lane = "" if interactive is None else "interactive "
+        reasons.append(f"{lane}queued jobs {queued} >= {thresholds.max_queued}")
+    if thresholds.max_running is not None and queue.running >= thresholds.max_running:
+        reasons.append(f"running jobs {queue.running} >= {thresholds.max_running}")
+    if (
+        thresholds.max_llm_error_rate is not None
+        and llm.calls >= max(thresholds.llm_min_calls, 1)
+        and llm.error_rate >= thresholds.max_llm_error_rate
+    ):
+        reasons.append(
+            f"LLM error rate {llm.error_rate:.2f} "
+            f">= {thresholds.max_llm_error_rate:.2f} "
+            f"over the last {llm.window_seconds:g}s"
+        )
+    return ReadinessResponse(
+        status="not_ready" if reasons else "ready",
+        reasons=reasons,
+        queue=QueueHealthResponse(**asdict(queue)),
+        llm=LLMHealthResponse(
+            window_seconds=llm.window_seconds,
+            calls=llm.calls,
+            errors=llm.errors,
+            error_rate=round(llm.error_rate, 4),
+        ),
+        thresholds=thresholds,
+    )
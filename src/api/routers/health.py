@@ -1,15 +1,50 @@
-"""Health check router."""
+"""Health check router – liveness and readiness."""
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from dataclasses import asdict
 
-from src.api.schemas.responses import HealthResponse
+from fastapi import APIRouter, Depends, Response
+
+from src.api.deps import get_llm_call_window, get_settings, get_worker_pool
+from src.api.readiness import assess_readiness
+from src.api.schemas.responses import (
+    HealthResponse,
+    QueueHealthResponse,
+    ReadinessResponse,
+)
+from src.infrastructure.providers.llm.call_window import LLMCallWindow
+from src.infrastructure.workers.job_worker_pool import JobWorkerPool
+from src.settings import Settings
 
 router = APIRouter(tags=["health"])
 
 
 @router.get("/health", response_model=HealthResponse)
-def health() -> HealthResponse:
-    """Health check endpoint."""
-    return HealthResponse()
+def health(worker_pool: JobWorkerPool = Depends(get_worker_pool)) -> HealthResponse:
+    """Health check endpoint. Includes job queue depth and wait times."""
+    return HealthResponse(queue=QueueHealthResponse(**asdict(worker_pool.stats())))
+
+
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse, "description": "Not ready"}},
+)
+def ready(
+    response: Response,
+    worker_pool: JobWorkerPool = Depends(get_worker_pool),
+    call_window: LLMCallWindow = Depends(get_llm_call_window),
+    settings: Settings = Depends(get_settings),
+) -> ReadinessResponse:
+    """Readiness probe: 200 when ready, 503 when load or LLM errors are too high.
+
+    The body carries the current numbers either way, so an orchestrator
+    can shed load gradually instead of only flipping on the status code.
+    """
+    result = assess_readiness(
+        queue=worker_pool.stats(), llm=call_window.stats(), settings=settings
+    )
+    if result.status != "ready":
+        response.status_code = 503
+    return result
@@ -1,65 +1,276 @@
-"""Jobs router – create, run, status, result."""
+"""Jobs router – create, list, run, resume, cancel, status, events, draft, result."""
 
 from __future__ import annotations
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
-from src.api.deps import get_graph, get_job_store, get_settings
-from src.api.schemas.requests import CreateJobRequest
+from src.api.deps import (
+    get_draft_stream,
+    get_event_bus,
+    get_graph,
+    get_job_coalescer,
+    get_job_store,
+    get_settings,
+    get_tenant_quotas,
+    get_upstream_cache,
+    get_webhook_outbox,
+    get_worker_pool,
+)
+from src.api.draft_stream import stream_article_draft
+from src.api.http_cache import (
+    IMMUTABLE,
+    REVALIDATE,
+    compress,
+    encoded_etag,
+    job_etag,
+    match_etag,
+    negotiate_encoding,
+    result_etag,
+)
+from src.api.long_poll import MAX_WAIT_SECONDS, wait_for_job_change
+from src.api.schemas.requests import CreateJobRequest, CreateJobsBatchRequest
 from src.api.schemas.responses import (
     CreateJobResponse,
+    CreateJobsBatchResponse,
+    JobListResponse,
     JobResponse,
     ResultResponse,
     job_response_from_record,
 )
+from src.api.sse import stream_job_events
+from src.api.tenancy import get_tenant_id
 from src.application.orchestration.state import GraphState
-from src.application.use_cases import create_job, get_job, get_result, run_job
+from src.application.use_cases import (
+    BatchItem,
+    cancel_job,
+    create_job,
+    create_job_idempotent,
+    discard_job,
+    get_job,
+    get_result_json,
+    list_jobs,
+    require_result,
+    resume_job,
+    submit_batch,
+    submit_job,
+)
 from src.domain.models.job import JobStatus
-from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+from src.domain.models.job_input import JobInput, JobPriority
+from src.domain.models.output import SeoArticleOutput
+from src.infrastructure.events.draft_stream_hub import DraftStreamHub
+from src.infrastructure.events.job_event_bus import JobEventBus
+from src.infrastructure.quotas.errors import QuotaExceededError
+from src.infrastructure.quotas.tenant_quotas import TenantQuotas
+from src.infrastructure.stores.job_coalescer import JobCoalescer
+from src.infrastructure.stores.job_store import JobStore
+from src.infrastructure.stores.shared_upstream_cache import SharedUpstreamCache
+from src.infrastructure.webhooks import WebhookOutbox
+from src.infrastructure.workers.errors import PoolClosedError, QueueFullError
+from src.infrastructure.workers.job_worker_pool import JobWorkerPool
 from src.settings import Settings
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
+def _queue_full(exc: QueueFullError | QuotaExceededError) -> HTTPException:
+    """Translate a rejected submission into 429 with a Retry-After hint."""
+    return HTTPException(
+        status_code=429,
+        detail=str(exc),
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+def _shutting_down(exc: PoolClosedError) -> HTTPException:
+    """Turn a submission refused during shutdown into 503 for another instance."""
+    return HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "1"})
+
+
+def _resolve_defaults(body: CreateJobRequest, settings: Settings) -> tuple[int, str]:
+    """Fill target_word_count and language from settings when omitted."""
+    target_word_count = (
+        body.target_word_count
+        if body.target_word_count is not None
+        else settings.DEFAULT_WORD_COUNT
+    )
+    language = (
+        body.language if body.language is not None else settings.DEFAULT_LANGUAGE
+    )
+    return target_word_count, language
+
+
+def _parse_fields(fields: str) -> set[str]:
+    """Split a ``fields=`` projection and reject names not on SeoArticleOutput."""
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        raise HTTPException(
+            status_code=422, detail="fields: at least one field is required"
+        )
+    unknown = requested - SeoArticleOutput.model_fields.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"fields: unknown field(s) {', '.join(sorted(unknown))}",
+        )
+    return requested
+
+
 @router.post("", response_model=CreateJobResponse)
 def create_job_endpoint(
     body: CreateJobRequest,
-    job_store: InMemoryJobStore = Depends(get_job_store),
+    response: Response,
+    idempotency_key: str | None = Header(
+        default=None, alias="Idempotency-Key", max_length=255
+    ),
+    tenant_id: str = Depends(get_tenant_id),
+    job_store: JobStore = Depends(get_job_store),
     settings: Settings = Depends(get_settings),
     graph: Any = Depends(get_graph),
+    worker_pool: JobWorkerPool = Depends(get_worker_pool),
+    events: JobEventBus = Depends(get_event_bus),
+    quotas: TenantQuotas = Depends(get_tenant_quotas),
+    webhooks: WebhookOutbox = Depends(get_webhook_outbox),
+    coalescer: JobCoalescer | None = Depends(get_job_coalescer),
 ) -> CreateJobResponse:
-    """Create a job. Optionally run immediately."""
-    target_word_count = body.target_word_count if body.target_word_count is not None else settings.DEFAULT_WORD_COUNT
-    language = body.language if body.language is not None else settings.DEFAULT_LANGUAGE
+    """Create a job. Optionally queue it for background execution (202).
+
+    With an ``Idempotency-Key`` header, a retry of the same request within
+    ``IDEMPOTENCY_TTL_SECONDS`` returns the original job (200, header
+    ``Idempotent-Replayed: true``) instead of creating another.  Queueing
+    counts against the ``X-Tenant-ID`` tenant's quotas (429 when over).
+    """
+    target_word_count, language = _resolve_defaults(body, settings)
 
     try:
-        record, state = create_job(
-            topic=body.topic,
-            target_word_count=target_word_count,
-            language=language,
-            job_store=job_store,
-            settings=settings,
-        )
+        if idempotency_key is None:
+            record, state = create_job(
+                topic=body.topic,
+                target_word_count=target_word_count,
+                language=language,
+                job_store=job_store,
+                settings=settings,
+                deadline_seconds=body.deadline_seconds,
+                priority=body.priority or JobPriority.INTERACTIVE,
+                tenant_id=tenant_id,
+                callback_url=body.callback_url,
+            )
+        else:
+            record, state = create_job_idempotent(
+                idempotency_key=idempotency_key,
+                topic=body.topic,
+                target_word_count=target_word_count,
+                language=language,
+                job_store=job_store,
+                settings=settings,
+                deadline_seconds=body.deadline_seconds,
+                priority=body.priority or JobPriority.INTERACTIVE,
+                tenant_id=tenant_id,
+                callback_url=body.callback_url,
+            )
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
+    if state is None:
+        response.headers["Idempotent-Replayed"] = "true"
+        return CreateJobResponse(job=job_response_from_record(record))
+
     if body.run_immediately:
-        run_job(state=state, graph=graph, job_store=job_store)
-        record = get_job(job_id=record.id, job_store=job_store)
+        try:
+            record = submit_job(
+                state=state,
+                graph=graph,
+                job_store=job_store,
+                worker_pool=worker_pool,
+                events=events,
+                quotas=quotas,
+                webhooks=webhooks,
+                coalescer=coalescer,
+            )
+        except (QueueFullError, QuotaExceededError, PoolClosedError) as exc:
+            discard_job(
+                job_id=record.id,
+                job_store=job_store,
+                idempotency_key=idempotency_key,
+                tenant_id=tenant_id,
+            )
+            if isinstance(exc, PoolClosedError):
+                raise _shutting_down(exc) from exc
+            raise _queue_full(exc) from exc
+        response.status_code = 202
 
     return CreateJobResponse(job=job_response_from_record(record))
 
 
-@router.post("/{job_id}/run", response_model=JobResponse)
+@router.post(":batch", response_model=CreateJobsBatchResponse, status_code=202)
+def create_jobs_batch_endpoint(
+    body: CreateJobsBatchRequest,
+    tenant_id: str = Depends(get_tenant_id),
+    job_store: JobStore = Depends(get_job_store),
+    settings: Settings = Depends(get_settings),
+    graph: Any = Depends(get_graph),
+    worker_pool: JobWorkerPool = Depends(get_worker_pool),
+    upstream_cache: SharedUpstreamCache = Depends(get_upstream_cache),
+    events: JobEventBus = Depends(get_event_bus),
+    quotas: TenantQuotas = Depends(get_tenant_quotas),
+    webhooks: WebhookOutbox = Depends(get_webhook_outbox),
+    coalescer: JobCoalescer | None = Depends(get_job_coalescer),
+) -> CreateJobsBatchResponse:
+    """Create many jobs in one call. Same (topic, language) share SERP and themes.
+
+    Jobs run in the bulk lane unless they set ``priority``.  Jobs that do
+    not fit in the queue or the tenant's quota are returned as ``pending``.
+    """
+    try:
+        items = []
+        for job in body.jobs:
+            target_word_count, language = _resolve_defaults(job, settings)
+            job_input = JobInput(
+                topic=job.topic,
+                target_word_count=target_word_count,
+                language=language,
+                deadline_seconds=job.deadline_seconds,
+                priority=job.priority or JobPriority.BULK,
+                tenant_id=tenant_id,
+                callback_url=job.callback_url,
+            )
+            items.append(
+                BatchItem(input=job_input, run_immediately=job.run_immediately)
+            )
+        records = submit_batch(
+            items=items,
+            graph=graph,
+            job_store=job_store,
+            settings=settings,
+            worker_pool=worker_pool,
+            upstream_cache=upstream_cache,
+            events=events,
+            quotas=quotas,
+            webhooks=webhooks,
+            coalescer=coalescer,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    return CreateJobsBatchResponse(jobs=[job_response_from_record(r) for r in records])
+
+
+@router.post("/{job_id}/run", response_model=JobResponse, status_code=202)
 def run_job_endpoint(
     job_id: str,
-    job_store: InMemoryJobStore = Depends(get_job_store),
+    job_store: JobStore = Depends(get_job_store),
     settings: Settings = Depends(get_settings),
     graph: Any = Depends(get_graph),
+    worker_pool: JobWorkerPool = Depends(get_worker_pool),
+    events: JobEventBus = Depends(get_event_bus),
+    quotas: TenantQuotas = Depends(get_tenant_quotas),
+    webhooks: WebhookOutbox = Depends(get_webhook_outbox),
+    coalescer: JobCoalescer | None = Depends(get_job_coalescer),
 ) -> JobResponse:
-    """Run a pending job."""
+    """Queue a pending job for background execution (against its tenant's quotas)."""
     try:
         record = get_job(job_id=job_id, job_store=job_store)
     except KeyError as exc:
@@ -69,6 +280,14 @@ def run_job_endpoint(
         raise HTTPException(status_code=409, detail="Job already completed")
     if record.status == JobStatus.RUNNING:
         raise HTTPException(status_code=409, detail="Job already running")
+    if record.status == JobStatus.QUEUED:
+        raise HTTPException(status_code=409, detail="Job already queued")
+    if record.status == JobStatus.CANCELLING:
+        raise HTTPException(status_code=409, detail="Job is being cancelled")
+    if record.status == JobStatus.INTERRUPTED:
+        raise HTTPException(
+            status_code=409, detail="Job was interrupted; resume it instead"
+        )
     if record.input is None:
         raise HTTPException(status_code=409, detail="Job input missing")
 
@@ -78,35 +297,247 @@ def run_job_endpoint(
         target_word_count=record.input.target_word_count,
         language=record.input.language,
         max_revisions=settings.MAX_REVISIONS,
+        deadline_seconds=record.input.deadline_seconds,
     )
-    run_job(state=state, graph=graph, job_store=job_store)
-    record = get_job(job_id=job_id, job_store=job_store)
+    try:
+        record = submit_job(
+            state=state,
+            graph=graph,
+            job_store=job_store,
+            worker_pool=worker_pool,
+            events=events,
+            quotas=quotas,
+            webhooks=webhooks,
+            coalescer=coalescer,
+        )
+    except (QueueFullError, QuotaExceededError) as exc:
+        raise _queue_full(exc) from exc
+    except PoolClosedError as exc:
+        raise _shutting_down(exc) from exc
     return job_response_from_record(record)
 
 
-@router.get("/{job_id}", response_model=JobResponse)
-def get_job_endpoint(
+@router.post("/{job_id}/resume", response_model=JobResponse, status_code=202)
+def resume_job_endpoint(
     job_id: str,
-    job_store: InMemoryJobStore = Depends(get_job_store),
+    job_store: JobStore = Depends(get_job_store),
+    graph: Any = Depends(get_graph),
+    worker_pool: JobWorkerPool = Depends(get_worker_pool),
+    events: JobEventBus = Depends(get_event_bus),
+    quotas: TenantQuotas = Depends(get_tenant_quotas),
+    webhooks: WebhookOutbox = Depends(get_webhook_outbox),
 ) -> JobResponse:
-    """Get job status."""
+    """Queue a failed, cancelled or interrupted job to continue where it stopped."""
     try:
-        record = get_job(job_id=job_id, job_store=job_store)
+        record = resume_job(
+            job_id=job_id,
+            graph=graph,
+            job_store=job_store,
+            worker_pool=worker_pool,
+            events=events,
+            quotas=quotas,
+            webhooks=webhooks,
+        )
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except PoolClosedError as exc:
+        raise _shutting_down(exc) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    except (QueueFullError, QuotaExceededError) as exc:
+        raise _queue_full(exc) from exc
     return job_response_from_record(record)
 
 
+@router.post("/{job_id}/cancel", response_model=JobResponse, status_code=202)
+def cancel_job_endpoint(
+    job_id: str,
+    job_store: JobStore = Depends(get_job_store),
+) -> JobResponse:
+    """Cancel a job: queued jobs stop at once, running ones before their next node."""
+    try:
+        record = cancel_job(job_id=job_id, job_store=job_store)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return job_response_from_record(record)
+
+
+@router.get("", response_model=JobListResponse)
+def list_jobs_endpoint(
+    job_store: JobStore = Depends(get_job_store),
+    status: JobStatus | None = None,
+    cursor: str | None = None,
+    limit: int = Query(default=50, ge=1, le=500),
+) -> JobListResponse:
+    """List jobs oldest-update first, optionally filtered by status.
+
+    Pass ``next_cursor`` from the previous page as ``cursor`` to continue.
+    """
+    try:
+        page = list_jobs(job_store=job_store, status=status, cursor=cursor, limit=limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return JobListResponse(
+        jobs=[job_response_from_record(r) for r in page.jobs],
+        next_cursor=page.next_cursor,
+    )
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job_endpoint(
+    job_id: str,
+    response: Response,
+    job_store: JobStore = Depends(get_job_store),
+    wait: float = Query(default=0, ge=0, le=MAX_WAIT_SECONDS),
+    since: int | None = Query(default=None, ge=0),
+    if_none_match: str | None = Header(default=None),
+) -> Any:
+    """Get job status.
+
+    With ``wait`` > 0, hold the request until the job's ``version`` exceeds
+    ``since`` (default: the current version) or ``wait`` seconds pass.
+    Terminal jobs answer immediately.  The ETag tracks ``version``;
+    ``If-None-Match`` returns 304 while it is unchanged.  Store reads run
+    in the threadpool, so a blocking backend (SQLite) never stalls the
+    loop serving long-polls and streams.
+    """
+    try:
+        record = await run_in_threadpool(get_job, job_id=job_id, job_store=job_store)
+        if wait > 0 and not record.status.is_terminal:
+            record = await wait_for_job_change(
+                job_id=job_id,
+                since=record.version if since is None else since,
+                timeout=wait,
+                job_store=job_store,
+            )
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    headers = {
+        "ETag": job_etag(record.id, record.version),
+        "Cache-Control": (
+            IMMUTABLE if record.status == JobStatus.COMPLETED else REVALIDATE
+        ),
+    }
+    if match_etag(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return job_response_from_record(record)
+
+
+@router.get("/{job_id}/events", response_class=StreamingResponse)
+async def job_events_endpoint(
+    job_id: str,
+    job_store: JobStore = Depends(get_job_store),
+    events: JobEventBus = Depends(get_event_bus),
+    last_event_id: int = Header(default=0),
+) -> StreamingResponse:
+    """Stream node progress as Server-Sent Events until the job is terminal.
+
+    Honours ``Last-Event-ID`` so reconnecting clients skip replayed events.
+    """
+    try:
+        record = await run_in_threadpool(get_job, job_id=job_id, job_store=job_store)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return StreamingResponse(
+        stream_job_events(
+            record=record,
+            events=events,
+            job_store=job_store,
+            last_event_id=last_event_id,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{job_id}/draft", response_class=StreamingResponse)
+async def article_draft_endpoint(
+    job_id: str,
+    job_store: JobStore = Depends(get_job_store),
+    drafts: DraftStreamHub = Depends(get_draft_stream),
+    events: JobEventBus = Depends(get_event_bus),
+) -> Response:
+    """Stream the article markdown while write_article generates it.
+
+    Completed jobs return the final (post-revision) article in one piece.
+    """
+    try:
+        record = await run_in_threadpool(get_job, job_id=job_id, job_store=job_store)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+    if record.status == JobStatus.COMPLETED and record.result is not None:
+        return PlainTextResponse(
+            record.result.article_markdown, media_type="text/markdown"
+        )
+    if record.status.is_terminal and not drafts.started(job_id):
+        raise HTTPException(status_code=409, detail="No draft available")
+    return StreamingResponse(
+        stream_article_draft(
+            record=record, drafts=drafts, events=events, job_store=job_store
+        ),
+        media_type="text/markdown",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{job_id}/result", response_model=ResultResponse)
 def get_result_endpoint(
     job_id: str,
-    job_store: InMemoryJobStore = Depends(get_job_store),
-) -> ResultResponse:
-    """Get completed job result."""
+    job_store: JobStore = Depends(get_job_store),
+    fields: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    accept_encoding: str | None = Header(default=None),
+) -> Any:
+    """Get completed job result.
+
+    ``fields=seo_meta,article_markdown`` serializes only those top-level
+    fields of the result; the rest are never dumped.  The full result is
+    served from the store's cached JSON bytes, skipping model validation
+    and FastAPI's encoder.  Results are immutable: the ETag comes from the
+    content hash stored by ``finalize``, so ``If-None-Match`` answers 304
+    without serializing.  Bodies are compressed (brotli when installed,
+    else gzip).
+    """
+    include = _parse_fields(fields) if fields is not None else None
+    body: bytes | None = None
     try:
-        result = get_result(job_id=job_id, job_store=job_store)
+        if include is None:
+            result_json, result_hash = get_result_json(
+                job_id=job_id, job_store=job_store
+            )
+            body = b'{"result":' + result_json + b"}"
+        else:
+            record = get_job(job_id=job_id, job_store=job_store)
+            result = require_result(record)
+            result_hash = record.result_hash
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except RuntimeError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
-    return ResultResponse(result=result)
+
+    etag = result_etag(result_hash, include) if result_hash else None
+    matched = match_etag(if_none_match, etag) if etag is not None else None
+    if matched is not None:
+        return Response(
+            status_code=304,
+            headers={
+                "ETag": matched,
+                "Cache-Control": IMMUTABLE,
+                "Vary": "Accept-Encoding",
+            },
+        )
+
+    if body is None:
+        envelope = ResultResponse(result=result)
+        body = envelope.model_dump_json(include={"result": include}).encode()
+    body, encoding = compress(body, negotiate_encoding(accept_encoding))
+    headers = {"Cache-Control": IMMUTABLE, "Vary": "Accept-Encoding"}
+    if etag is not None:
+        headers["ETag"] = encoded_etag(etag, encoding)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,22 @@
+"""Metrics router – Prometheus scrape endpoint."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from src.api.deps import get_metrics, get_worker_pool
+from src.infrastructure.metrics import CONTENT_TYPE, PipelineMetrics
+from src.infrastructure.workers.job_worker_pool import JobWorkerPool
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics(
+    pipeline_metrics: PipelineMetrics = Depends(get_metrics),
+    worker_pool: JobWorkerPool = Depends(get_worker_pool),
+) -> PlainTextResponse:
+    """Node, LLM, revision, store-lock and queue metrics as Prometheus text."""
+    pipeline_metrics.sample_queue(worker_pool.stats())
+    return PlainTextResponse(pipeline_metrics.render(), media_type=CONTENT_TYPE)
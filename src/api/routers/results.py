@@ -0,0 +1,39 @@
+"""Results router – bulk NDJSON export of completed results."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+
+from src.api.deps import get_job_store
+from src.application.use_cases import export_results
+from src.domain.models.job import JobStatus
+from src.infrastructure.stores.job_store import JobStore
+
+router = APIRouter(prefix="/results", tags=["results"])
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_results_endpoint(
+    job_store: JobStore = Depends(get_job_store),
+    status: JobStatus = JobStatus.COMPLETED,
+    since: datetime | None = None,
+    cursor: str | None = None,
+) -> StreamingResponse:
+    """Stream completed results as NDJSON, oldest update first.
+
+    Each line carries a ``cursor``; pass the last one received to resume.
+    """
+    try:
+        lines = export_results(
+            job_store=job_store, status=status, since=since, cursor=cursor
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return StreamingResponse(
+        lines, media_type=NDJSON_MEDIA_TYPE, headers={"Cache-Control": "no-store"}
+    )
@@ -0,0 +1,23 @@
+"""Tenants router – per-tenant quota usage."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, Path
+
+from src.api.deps import get_tenant_quotas
+from src.api.schemas.responses import TenantUsageResponse
+from src.api.tenancy import TENANT_ID_PATTERN
+from src.infrastructure.quotas.tenant_quotas import TenantQuotas
+
+router = APIRouter(prefix="/tenants", tags=["tenants"])
+
+
+@router.get("/{tenant_id}/usage", response_model=TenantUsageResponse)
+def tenant_usage(
+    tenant_id: str = Path(pattern=TENANT_ID_PATTERN),
+    quotas: TenantQuotas = Depends(get_tenant_quotas),
+) -> TenantUsageResponse:
+    """Jobs and LLM tokens the tenant consumed in the current per-minute window."""
+    return TenantUsageResponse(**asdict(quotas.usage(tenant_id)))
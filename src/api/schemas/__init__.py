@@ -1,10 +1,13 @@
 """API schemas."""
 
-from .requests import CreateJobRequest
+from .requests import CreateJobRequest, CreateJobsBatchRequest
 from .responses import (
     CreateJobResponse,
+    CreateJobsBatchResponse,
     HealthResponse,
+    JobListResponse,
     JobResponse,
+    QueueHealthResponse,
     ResultResponse,
     job_response_from_record,
 )
@@ -12,8 +15,12 @@ from .responses import (
 __all__ = [
     "CreateJobRequest",
     "CreateJobResponse",
+    "CreateJobsBatchRequest",
+    "CreateJobsBatchResponse",
     "HealthResponse",
+    "JobListResponse",
     "JobResponse",
+    "QueueHealthResponse",
     "ResultResponse",
     "job_response_from_record",
 ]
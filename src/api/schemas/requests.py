@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pydantic import BaseModel, Field
 
+from src.domain.models.job_input import JobPriority
+
 
 class CreateJobRequest(BaseModel):
     """Request body for creating a job."""
@@ -12,3 +14,15 @@ class CreateJobRequest(BaseModel):
     target_word_count: int | None = None
     language: str | None = None
     run_immediately: bool = True
+    # Total time budget for the run, counted from when it is queued.
+    deadline_seconds: float | None = Field(default=None, gt=0, le=86_400)
+    # Scheduling lane; defaults to interactive for POST /jobs, bulk in batches.
+    priority: JobPriority | None = None
+    # POSTed a signed job.completed / job.failed / job.cancelled event at the end.
+    callback_url: str | None = Field(default=None, max_length=2048, pattern=r"^https?://\S+$")
+
+
+class CreateJobsBatchRequest(BaseModel):
+    """Request body for creating many jobs in one call."""
+
+    jobs: list[CreateJobRequest] = Field(min_length=1, max_length=1000)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+
 from pydantic import BaseModel
 
 from src.domain.models.job import JobRecord
@@ -15,6 +17,8 @@ def job_response_from_record(record: JobRecord) -> "JobResponse":
         status=record.status.value,
         current_node=record.current_node,
         error=record.error,
+        version=record.version,
+        updated_at=record.updated_at,
     )
 
 
@@ -25,6 +29,8 @@ class JobResponse(BaseModel):
     status: str
     current_node: str | None = None
     error: str | None = None
+    version: int
+    updated_at: datetime | None = None
 
 
 class CreateJobResponse(BaseModel):
@@ -33,13 +39,99 @@ class CreateJobResponse(BaseModel):
     job: JobResponse
 
 
+class CreateJobsBatchResponse(BaseModel):
+    """Response for batch job creation, in request order."""
+
+    jobs: list[JobResponse]
+
+
+class JobListResponse(BaseModel):
+    """One page of jobs in ascending ``updated_at`` order."""
+
+    jobs: list[JobResponse]
+    next_cursor: str | None = None
+
+
 class ResultResponse(BaseModel):
     """Response with completed article result."""
 
     result: SeoArticleOutput
 
 
+class LaneHealthResponse(BaseModel):
+    """Occupancy and latency of one scheduling lane."""
+
+    weight: int
+    queued: int
+    max_queue_depth: int
+    avg_wait_seconds: float
+    oldest_wait_seconds: float
+
+
+class QueueHealthResponse(BaseModel):
+    """Job queue occupancy and latency."""
+
+    workers: int
+    running: int
+    queued: int
+    max_queue_depth: int
+    avg_wait_seconds: float
+    oldest_wait_seconds: float
+    lanes: dict[str, LaneHealthResponse] = {}
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
 
     status: str = "ok"
+    queue: QueueHealthResponse | None = None
+
+
+class LLMHealthResponse(BaseModel):
+    """LLM request attempts and failures over the recent window."""
+
+    window_seconds: float
+    calls: int
+    errors: int
+    error_rate: float
+
+
+class ReadinessThresholdsResponse(BaseModel):
+    """Limits past which the instance reports not ready (``None`` = disabled)."""
+
+    max_queued: int | None
+    max_running: int | None
+    max_llm_error_rate: float | None
+    llm_min_calls: int
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness verdict with the numbers it was based on.
+
+    ``status`` is ``ready`` or ``not_ready``; ``reasons`` names each
+    threshold that was crossed.
+    """
+
+    status: str
+    reasons: list[str] = []
+    queue: QueueHealthResponse
+    llm: LLMHealthResponse
+    thresholds: ReadinessThresholdsResponse
+
+
+class TenantUsageResponse(BaseModel):
+    """Current quota consumption of one tenant.
+
+    ``*_used`` is consumption within the rolling per-minute budget; limits
+    are ``None`` when disabled.  Totals count since process start.
+    """
+
+    tenant_id: str
+    jobs_per_minute: int | None
+    jobs_used: float
+    llm_tokens_per_minute: int | None
+    llm_tokens_used: float
+    llm_tokens_reserved: int
+    jobs_admitted_total: int
+    jobs_rejected_total: int
+    llm_tokens_total: int
@@ -0,0 +1,114 @@
+"""Server-Sent Events helpers – bridge JobEventBus (threads) to async responses."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator
+
+from fastapi.concurrency import run_in_threadpool
+
+from src.domain.models.events import JobEvent, JobEventType
+from src.domain.models.job import JobRecord
+from src.infrastructure.events.job_event_bus import JobEventBus
+from src.infrastructure.stores.job_store import JobStore
+
+HEARTBEAT_SECONDS = 15.0
+
+
+def format_sse(event: JobEvent) -> str:
+    """Render *event* as one SSE frame (``id`` / ``event`` / ``data``)."""
+    return (
+        f"id: {event.seq}\nevent: {event.type.value}\n"
+        f"data: {event.model_dump_json()}\n\n"
+    )
+
+
+async def stream_job_events(
+    *,
+    record: JobRecord,
+    events: JobEventBus,
+    job_store: JobStore,
+    last_event_id: int = 0,
+    heartbeat_seconds: float = HEARTBEAT_SECONDS,
+) -> AsyncIterator[str]:
+    """Yield SSE frames for *record*'s job until its terminal event.
+
+    Replays recorded history after *last_event_id*, then forwards live
+    events.  Worker threads hand events to this coroutine's loop with
+    ``call_soon_threadsafe``, so no thread is parked per client.  A comment
+    frame is sent every *heartbeat_seconds* to keep proxies from timing out.
+    If the job is already terminal but its history is gone, a synthetic
+    terminal event is sent so clients always see an end.  If the job was
+    resumed after its history ended, the previous run's terminal event is
+    skipped and the new run's events follow.
+
+    The event bus is per process.  A job running in another process
+    (several uvicorn workers sharing the SQLite store) publishes nothing
+    here, so the store is watched too: once it reports the job terminal,
+    a synthetic terminal event ends the stream.  Jobs running in this
+    process end on their own, later terminal event instead.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[JobEvent] = asyncio.Queue()
+
+    def _deliver(event: JobEvent) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+        except RuntimeError:
+            pass  # loop closed: client went away
+
+    def _on_change(changed: JobRecord) -> None:
+        if changed.status.is_terminal:
+            # seq 0 marks an event from the store rather than the bus.
+            _deliver(_terminal_event(changed, seq=0))
+
+    history, unsubscribe = events.subscribe(record.id, _deliver)
+    unwatch = job_store.watch(record.id, _on_change)
+    try:
+        # Re-read after watching so an end between the caller's read and
+        # ``watch`` is not missed.
+        record = await run_in_threadpool(job_store.get, record.id)
+        # An open channel means a run in this process is publishing.
+        local = bool(history) and history[-1].type != JobEventType.TERMINAL
+        last_seq = history[-1].seq if history else 0
+        for event in history:
+            if event.type == JobEventType.TERMINAL and not record.status.is_terminal:
+                continue  # the previous run's end; the job has been resumed
+            if event.seq > last_event_id:
+                yield format_sse(event)
+            if event.type == JobEventType.TERMINAL:
+                return
+
+        if record.status.is_terminal:
+            yield format_sse(_terminal_event(record, seq=last_seq + 1))
+            return
+
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event.seq == 0:
+                if local:
+                    continue  # the bus's own terminal event follows
+                yield format_sse(event.model_copy(update={"seq": last_seq + 1}))
+                return
+            local = True
+            last_seq = event.seq
+            yield format_sse(event)
+            if event.type == JobEventType.TERMINAL:
+                return
+    finally:
+        unwatch()
+        unsubscribe()
+
+
+def _terminal_event(record: JobRecord, *, seq: int) -> JobEvent:
+    return JobEvent(
+        seq=seq,
+        job_id=record.id,
+        type=JobEventType.TERMINAL,
+        status=record.status.value,
+        error=record.error,
+    )
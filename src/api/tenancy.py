@@ -0,0 +1,18 @@
+"""Tenant identification for API requests."""
+
+from __future__ import annotations
+
+from fastapi import Header
+
+from src.domain.models.job_input import DEFAULT_TENANT_ID
+
+TENANT_ID_PATTERN = r"^[A-Za-z0-9._-]{1,64}$"
+
+
+def get_tenant_id(
+    x_tenant_id: str | None = Header(
+        default=None, alias="X-Tenant-ID", pattern=TENANT_ID_PATTERN
+    ),
+) -> str:
+    """Tenant named by the ``X-Tenant-ID`` header, or the default tenant."""
+    return x_tenant_id or DEFAULT_TENANT_ID
@@ -1,12 +1,32 @@
-"""Application orchestration – graph state and checkpointer wiring."""
+"""Application orchestration – graph state, checkpointer, cancellation and deadlines."""
 
 from __future__ import annotations
 
+from .cancellation import (
+    JobCancelledError,
+    JobInterruptedError,
+    cancel_scope,
+    interrupt_scope,
+    raise_if_cancelled,
+    raise_if_interrupted,
+    stop_check,
+)
 from .checkpointer import make_checkpointer, thread_config
+from .deadline import DeadlineExceededError, start_deadline, time_left
 from .state import GraphState
 
 __all__ = [
+    "DeadlineExceededError",
     "GraphState",
+    "JobCancelledError",
+    "JobInterruptedError",
+    "cancel_scope",
+    "interrupt_scope",
     "make_checkpointer",
+    "raise_if_cancelled",
+    "raise_if_interrupted",
+    "start_deadline",
+    "stop_check",
     "thread_config",
+    "time_left",
 ]
@@ -0,0 +1,83 @@
+"""Cancellation wiring – lets a job runner stop its graph between nodes.
+
+Two signals: a per-job cancel request, and the worker pool's interrupt
+(set on shutdown), which is only honoured at node boundaries so the node
+in flight finishes and is checkpointed.  The cancel event itself lives in
+``src.infrastructure.cancellation`` so the LLM provider can abort an
+in-flight request on it.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from src.application.orchestration.deadline import require_time
+from src.infrastructure.cancellation import JobCancelledError
+from src.infrastructure.cancellation import cancel_event as _cancel_event
+
+if TYPE_CHECKING:
+    from src.application.orchestration.state import GraphState
+
+_interrupt_event: ContextVar[threading.Event | None] = ContextVar(
+    "job_interrupt_event", default=None
+)
+
+
+class JobInterruptedError(Exception):
+    """Raised at a node boundary once the process has begun shutting down."""
+
+
+@contextmanager
+def cancel_scope(event: threading.Event) -> Iterator[None]:
+    """Make *event* the cancel signal for graph nodes run inside this block."""
+    token = _cancel_event.set(event)
+    try:
+        yield
+    finally:
+        _cancel_event.reset(token)
+
+
+@contextmanager
+def interrupt_scope(event: threading.Event | None) -> Iterator[None]:
+    """Make *event* the shutdown signal checked by ``raise_if_interrupted``."""
+    token = _interrupt_event.set(event)
+    try:
+        yield
+    finally:
+        _interrupt_event.reset(token)
+
+
+def raise_if_interrupted(node_name: str) -> None:
+    """Raise ``JobInterruptedError`` before *node_name* runs if shutdown has begun.
+
+    A no-op outside ``interrupt_scope``.
+    """
+    event = _interrupt_event.get()
+    if event is not None and event.is_set():
+        raise JobInterruptedError(f"{node_name}: interrupted by shutdown")
+
+
+def raise_if_cancelled(node_name: str) -> None:
+    """Raise ``JobCancelledError`` if the current run has been cancelled.
+
+    A no-op outside ``cancel_scope`` (e.g. a bare ``graph.invoke``).
+    """
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise JobCancelledError(f"{node_name}: job cancelled")
+
+
+def stop_check(state: GraphState, node_name: str) -> Callable[[], None]:
+    """A check raising once the run is cancelled or *state*'s deadline has passed.
+
+    For nodes that block waiting on another job's work (``SharedUpstreamCache``).
+    """
+
+    def _check() -> None:
+        raise_if_cancelled(node_name)
+        require_time(state, node_name)
+
+    return _check
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
 
 
 def thread_config(job_id: str) -> dict:
@@ -10,11 +10,11 @@ def thread_config(job_id: str) -> dict:
     return {"configurable": {"thread_id": job_id}}
 
 
-def make_checkpointer(*, saver: InMemorySaver) -> InMemorySaver:
+def make_checkpointer(*, saver: BaseCheckpointSaver) -> BaseCheckpointSaver:
     """Return the shared *saver* instance for graph compilation.
 
     This thin wiring point exists so the caller (e.g. a runner service)
-    can inject the ``InMemorySaver`` owned by ``InMemoryJobStore`` without
-    the graph module knowing where the saver came from.
+    can inject the saver owned by the job store (``InMemorySaver`` or
+    ``SqliteSaver``) without the graph module knowing where it came from.
     """
     return saver
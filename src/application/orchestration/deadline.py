@@ -0,0 +1,55 @@
+"""Deadline budget – wall-clock limit for one job run, carried in GraphState."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.application.orchestration.state import GraphState
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a job's deadline leaves no time for its next step."""
+
+
+def start_deadline(state: GraphState) -> GraphState:
+    """Stamp ``deadline_at`` from ``input.deadline_seconds`` if not already set.
+
+    The budget starts when the job is submitted, so queue wait counts
+    against it.  Returns *state* unchanged when there is no deadline.
+    """
+    if state.deadline_at is not None or state.input.deadline_seconds is None:
+        return state
+    return state.model_copy(
+        update={"deadline_at": time.time() + state.input.deadline_seconds}
+    )
+
+
+def time_left(state: GraphState) -> float | None:
+    """Seconds until the job's deadline (may be negative); ``None`` if unbounded."""
+    if state.deadline_at is None:
+        return None
+    return state.deadline_at - time.time()
+
+
+def require_time(state: GraphState, node_name: str) -> float | None:
+    """Return the remaining budget, raising ``DeadlineExceededError`` if it is spent."""
+    remaining = time_left(state)
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceededError(
+            f"{node_name}: deadline of {state.input.deadline_seconds:g}s exceeded"
+        )
+    return remaining
+
+
+def can_afford_revision(state: GraphState) -> bool:
+    """True unless another revision round would likely overrun the deadline.
+
+    A round (``repair_spec`` → ``revise_targeted`` → ``validate_and_score``)
+    is estimated from how long the last full draft took.
+    """
+    remaining = time_left(state)
+    if remaining is None:
+        return True
+    return remaining > (state.draft_seconds or 0.0)
@@ -3,19 +3,44 @@
 State machine: linear pipeline (collect_serp -> ... -> validate_and_score) -> conditional
 (finalize | repair_spec -> revise_targeted -> validate_and_score loop | fail_job).
 
-Durability: shared InMemorySaver from job_store.saver for thread-level checkpoints.
+Durability: shared checkpointer from job_store.saver (InMemorySaver or SqliteSaver).
 
 Run: compiled.invoke(initial_state, config=thread_config(job_id)) where thread_id == job_id.
+LLM nodes also carry an async implementation, so the same compiled graph supports
+ainvoke/astream; CPU-only nodes run in the executor under the async path.
+
+Cancellation: every node first calls raise_if_cancelled, so a cancelled run stops
+before its next node; raise_if_interrupted does the same once shutdown has begun.
+
+Deadline: nodes other than finalize/fail_job fail fast once the job's budget is spent,
+and a revision round is skipped (-> fail_job) when the budget cannot cover it.
+
+Metrics: with deps.metrics, every node's wall time is observed (per node name), plus
+revision-loop iterations and the rounds a job used when it reaches finalize/fail_job.
 """
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, START, StateGraph
 
+from src.application.orchestration.cancellation import (
+    raise_if_cancelled,
+    raise_if_interrupted,
+)
 from src.application.orchestration.checkpointer import make_checkpointer
+from src.application.orchestration.deadline import can_afford_revision, require_time
 from src.application.orchestration.nodes import (
+    abuild_outline,
+    aextract_themes,
+    akeyword_plan,
+    aplanner,
+    arevise_targeted,
+    aseo_packager,
+    awrite_article,
     build_outline,
     collect_serp,
     extract_themes,
@@ -40,11 +65,85 @@ def _route_after_validate(state: GraphState) -> str:
         return "fail_job"
     if report.passed:
         return "finalize"
-    if state.revisions_left > 0:
+    if state.revisions_left > 0 and can_afford_revision(state):
         return "repair_spec"
     return "fail_job"
 
 
+# Terminal bookkeeping nodes still run after the deadline so the outcome is recorded.
+_DEADLINE_EXEMPT = frozenset({"finalize", "fail_job"})
+
+
+# Terminal node -> outcome label for the revision-rounds histogram.
+_OUTCOMES = {"finalize": "completed", "fail_job": "failed"}
+
+
+def _node(name: str, fn: Any, deps: NodeDeps, afn: Any = None) -> RunnableLambda:
+    """Bind *deps* to a node (and its async twin) behind cancel/deadline checks."""
+
+    def _check(state: GraphState) -> None:
+        raise_if_cancelled(name)
+        raise_if_interrupted(name)
+        if name not in _DEADLINE_EXEMPT:
+            require_time(state, name)
+
+    def _run(state: GraphState) -> dict:
+        _check(state)
+        return fn(state, deps)
+
+    async def _arun(state: GraphState) -> dict:
+        _check(state)
+        return await afn(state, deps)
+
+    if deps.metrics is not None:
+        _run, _arun = _timed(name, deps, _run, _arun)
+    return RunnableLambda(_run, afunc=_arun if afn is not None else None, name=name)
+
+
+def _timed(name: str, deps: NodeDeps, run: Any, arun: Any) -> tuple[Any, Any]:
+    """Wrap a node's sync and async bodies so ``deps.metrics`` observes each run."""
+    metrics = deps.metrics
+    # Resolve label children once per graph, not per run.
+    seconds = metrics.node_seconds.labels(name)
+    errors = metrics.node_errors.labels(name)
+    rounds = (
+        metrics.revision_rounds.labels(_OUTCOMES[name]) if name in _OUTCOMES else None
+    )
+    max_revisions = deps.settings.MAX_REVISIONS if deps.settings is not None else None
+
+    def _observe(state: GraphState, started: float, failed: bool) -> None:
+        seconds.observe(time.perf_counter() - started)
+        if failed:
+            errors.inc()
+            return
+        if name == "repair_spec":
+            metrics.revision_loops.labels().inc()
+        elif rounds is not None and max_revisions is not None:
+            rounds.observe(max(max_revisions - state.revisions_left, 0))
+
+    def _timed_run(state: GraphState) -> dict:
+        started = time.perf_counter()
+        try:
+            patch = run(state)
+        except BaseException:
+            _observe(state, started, failed=True)
+            raise
+        _observe(state, started, failed=False)
+        return patch
+
+    async def _timed_arun(state: GraphState) -> dict:
+        started = time.perf_counter()
+        try:
+            patch = await arun(state)
+        except BaseException:
+            _observe(state, started, failed=True)
+            raise
+        _observe(state, started, failed=False)
+        return patch
+
+    return _timed_run, _timed_arun
+
+
 def build_graph(*, deps: NodeDeps) -> Any:
     """Build and compile the LangGraph StateGraph for GraphState."""
     if deps.job_store is None:
@@ -52,18 +151,33 @@ def build_graph(*, deps: NodeDeps) -> Any:
 
     graph = StateGraph(GraphState)
 
-    graph.add_node("collect_serp", lambda s: collect_serp(s, deps))
-    graph.add_node("extract_themes", lambda s: extract_themes(s, deps))
-    graph.add_node("planner", lambda s: planner(s, deps))
-    graph.add_node("build_outline", lambda s: build_outline(s, deps))
-    graph.add_node("keyword_plan", lambda s: keyword_plan(s, deps))
-    graph.add_node("write_article", lambda s: write_article(s, deps))
-    graph.add_node("seo_packager", lambda s: seo_packager(s, deps))
-    graph.add_node("validate_and_score", lambda s: validate_and_score(s, deps))
-    graph.add_node("repair_spec", lambda s: repair_spec(s, deps))
-    graph.add_node("revise_targeted", lambda s: revise_targeted(s, deps))
-    graph.add_node("finalize", lambda s: finalize(s, deps))
-    graph.add_node("fail_job", lambda s: fail_job(s, deps))
+    graph.add_node("collect_serp", _node("collect_serp", collect_serp, deps))
+    graph.add_node(
+        "extract_themes", _node("extract_themes", extract_themes, deps, aextract_themes)
+    )
+    graph.add_node("planner", _node("planner", planner, deps, aplanner))
+    graph.add_node(
+        "build_outline", _node("build_outline", build_outline, deps, abuild_outline)
+    )
+    graph.add_node(
+        "keyword_plan", _node("keyword_plan", keyword_plan, deps, akeyword_plan)
+    )
+    graph.add_node(
+        "write_article", _node("write_article", write_article, deps, awrite_article)
+    )
+    graph.add_node(
+        "seo_packager", _node("seo_packager", seo_packager, deps, aseo_packager)
+    )
+    graph.add_node(
+        "validate_and_score", _node("validate_and_score", validate_and_score, deps)
+    )
+    graph.add_node("repair_spec", _node("repair_spec", repair_spec, deps))
+    graph.add_node(
+        "revise_targeted",
+        _node("revise_targeted", revise_targeted, deps, arevise_targeted),
+    )
+    graph.add_node("finalize", _node("finalize", finalize, deps))
+    graph.add_node("fail_job", _node("fail_job", fail_job, deps))
 
     graph.add_edge(START, "collect_serp")
     graph.add_edge("collect_serp", "extract_themes")
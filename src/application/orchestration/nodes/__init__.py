@@ -2,24 +2,31 @@
 
 from __future__ import annotations
 
-from .build_outline import build_outline
+from .build_outline import abuild_outline, build_outline
 from .collect_serp import collect_serp
 from .deps import NodeDeps
-from .extract_themes import extract_themes
+from .extract_themes import aextract_themes, extract_themes
 from .fail_job import fail_job
 from .finalize import finalize
-from .keyword_plan import keyword_plan
-from .planner import planner
+from .keyword_plan import akeyword_plan, keyword_plan
+from .planner import aplanner, planner
 from .repair_spec import repair_spec
-from .revise_targeted import revise_targeted
-from .seo_packager import seo_packager
+from .revise_targeted import arevise_targeted, revise_targeted
+from .seo_packager import aseo_packager, seo_packager
 from .validate_and_score import validate_and_score
-from .write_article import write_article
+from .write_article import awrite_article, write_article
 from .prompt_loader import PromptLoader, render_prompt
 
 __all__ = [
     "NodeDeps",
     "PromptLoader",
+    "abuild_outline",
+    "aextract_themes",
+    "akeyword_plan",
+    "aplanner",
+    "arevise_targeted",
+    "aseo_packager",
+    "awrite_article",
     "build_outline",
     "collect_serp",
     "extract_themes",
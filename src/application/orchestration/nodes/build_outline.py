@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+from src.application.orchestration.deadline import time_left
 from src.application.orchestration.state import GraphState
 from .deps import NodeDeps
 from .prompt_loader import render_prompt
 from src.domain.models.outline import Outline
 
 
-def build_outline(state: GraphState, deps: NodeDeps) -> dict:
-    """Generate Outline from plan. Returns a patch dict. Hard-fails if section IDs mismatch."""
+def _prompt(state: GraphState, deps: NodeDeps) -> str:
+    """Validate inputs and render the outline prompt."""
     if deps.llm is None:
         raise ValueError("build_outline: deps.llm is required")
     if deps.prompts is None:
@@ -22,7 +23,7 @@ def build_outline(state: GraphState, deps: NodeDeps) -> dict:
     plan_data = state.plan.model_dump(mode="json")
     themes_data = state.themes.model_dump(mode="json") if state.themes else None
     template = deps.prompts.get("outline")
-    prompt = render_prompt(
+    return render_prompt(
         template,
         topic=state.input.topic,
         language=state.input.language,
@@ -30,12 +31,9 @@ def build_outline(state: GraphState, deps: NodeDeps) -> dict:
         themes=themes_data,
     )
 
-    outline = deps.llm.generate_structured(
-        node_name="build_outline",
-        prompt=prompt,
-        schema=Outline,
-    )
 
+def _patch(state: GraphState, outline: Outline) -> dict:
+    """Hard-match outline section IDs against the plan and build the patch."""
     plan_ids = [s.section_id for s in state.plan.sections]
     outline_ids = [s.section_id for s in outline.sections]
     if len(outline_ids) != len(plan_ids) or outline_ids != plan_ids:
@@ -45,3 +43,30 @@ def build_outline(state: GraphState, deps: NodeDeps) -> dict:
         )
 
     return {"current_node": "build_outline", "outline": outline}
+
+
+def build_outline(state: GraphState, deps: NodeDeps) -> dict:
+    """Generate Outline from plan. Returns a patch dict.
+
+    Hard-fails if section IDs mismatch.
+    """
+    prompt = _prompt(state, deps)
+    outline = deps.llm.generate_structured(
+        node_name="build_outline",
+        prompt=prompt,
+        schema=Outline,
+        timeout=time_left(state),
+    )
+    return _patch(state, outline)
+
+
+async def abuild_outline(state: GraphState, deps: NodeDeps) -> dict:
+    """Async ``build_outline``."""
+    prompt = _prompt(state, deps)
+    outline = await deps.llm.agenerate_structured(
+        node_name="build_outline",
+        prompt=prompt,
+        schema=Outline,
+        timeout=time_left(state),
+    )
+    return _patch(state, outline)
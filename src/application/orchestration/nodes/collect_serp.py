@@ -1,7 +1,8 @@
-"""collect_serp node – fetch top 10 SERP results for the topic."""
+"""collect_serp node – fetch top 10 SERP results (shared per batch group)."""
 
 from __future__ import annotations
 
+from src.application.orchestration.cancellation import stop_check
 from src.application.orchestration.state import GraphState
 from .deps import NodeDeps
 
@@ -15,7 +16,18 @@ def collect_serp(state: GraphState, deps: NodeDeps) -> dict:
         raise ValueError("collect_serp: state.input.topic must be non-empty")
     language = state.input.language if state.input.language else None
 
-    results = deps.serp.fetch_top_results(topic=topic, language=language, k=10)
+    def _fetch() -> list:
+        return deps.serp.fetch_top_results(topic=topic, language=language, k=10)
+
+    if state.upstream_key and deps.upstream_cache is not None:
+        results = deps.upstream_cache.get_or_compute(
+            state.upstream_key,
+            "collect_serp",
+            _fetch,
+            check=stop_check(state, "collect_serp"),
+        )
+    else:
+        results = _fetch()
     if len(results) != 10:
         raise ValueError(
             f"collect_serp: expected 10 results, got {len(results)}"
@@ -11,8 +11,11 @@ from src.settings import Settings
 from .prompt_loader import PromptLoader
 
 if TYPE_CHECKING:
+    from src.infrastructure.events.draft_stream_hub import DraftStreamHub
+    from src.infrastructure.metrics.pipeline_metrics import PipelineMetrics
     from src.infrastructure.providers.llm.openai_provider import OpenAIProvider
-    from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+    from src.infrastructure.stores.job_store import JobStore
+    from src.infrastructure.stores.shared_upstream_cache import SharedUpstreamCache
 
 
 @dataclass(frozen=True)
@@ -21,6 +24,9 @@ class NodeDeps:
 
     serp: SerpProviderProtocol
     llm: OpenAIProvider | None = None
-    job_store: InMemoryJobStore | None = None
+    job_store: JobStore | None = None
     settings: Settings | None = None
     prompts: PromptLoader | None = None
+    upstream_cache: SharedUpstreamCache | None = None
+    draft_stream: DraftStreamHub | None = None
+    metrics: PipelineMetrics | None = None
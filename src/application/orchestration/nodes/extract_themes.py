@@ -1,15 +1,17 @@
-"""extract_themes node – distill Themes from SERP results via LLM."""
+"""extract_themes node – distill Themes from SERP results via LLM (shared per batch)."""
 
 from __future__ import annotations
 
+from src.application.orchestration.cancellation import stop_check
+from src.application.orchestration.deadline import time_left
 from src.application.orchestration.state import GraphState
 from .deps import NodeDeps
 from .prompt_loader import render_prompt
 from src.domain.models.themes import Themes
 
 
-def extract_themes(state: GraphState, deps: NodeDeps) -> dict:
-    """Extract themes from SERP results using the LLM. Returns a patch dict."""
+def _prompt(state: GraphState, deps: NodeDeps) -> str:
+    """Validate inputs and render the themes prompt."""
     if deps.llm is None:
         raise ValueError("extract_themes: deps.llm is required")
     if deps.prompts is None:
@@ -19,22 +21,69 @@ def extract_themes(state: GraphState, deps: NodeDeps) -> dict:
     if state.input is None:
         raise ValueError("extract_themes: state.input is required")
 
-    topic = state.input.topic
-    language = state.input.language
     serp_data = [r.model_dump(mode="json") for r in state.serp_results]
-
     template = deps.prompts.get("themes")
-    prompt = render_prompt(
+    return render_prompt(
         template,
-        topic=topic,
-        language=language,
+        topic=state.input.topic,
+        language=state.input.language,
         serp_results=serp_data,
     )
 
-    themes = deps.llm.generate_structured(
-        node_name="extract_themes",
-        prompt=prompt,
-        schema=Themes,
-    )
+
+def extract_themes(state: GraphState, deps: NodeDeps) -> dict:
+    """Extract themes from SERP results using the LLM. Returns a patch dict."""
+    prompt = _prompt(state, deps)
+
+    def _extract() -> Themes:
+        return deps.llm.generate_structured(
+            node_name="extract_themes",
+            prompt=prompt,
+            schema=Themes,
+            timeout=time_left(state),
+        )
+
+    if state.upstream_key and deps.upstream_cache is not None:
+        # The group's last shared node: release early (the run releases again
+        # when it ends, which covers jobs that never get here).
+        try:
+            themes = deps.upstream_cache.get_or_compute(
+                state.upstream_key,
+                "extract_themes",
+                _extract,
+                check=stop_check(state, "extract_themes"),
+            )
+        finally:
+            deps.upstream_cache.release(state.upstream_key, state.job_id)
+    else:
+        themes = _extract()
+
+    return {"current_node": "extract_themes", "themes": themes}
+
+
+async def aextract_themes(state: GraphState, deps: NodeDeps) -> dict:
+    """Async ``extract_themes``; batch followers await the shared result."""
+    prompt = _prompt(state, deps)
+
+    async def _extract() -> Themes:
+        return await deps.llm.agenerate_structured(
+            node_name="extract_themes",
+            prompt=prompt,
+            schema=Themes,
+            timeout=time_left(state),
+        )
+
+    if state.upstream_key and deps.upstream_cache is not None:
+        try:
+            themes = await deps.upstream_cache.aget_or_compute(
+                state.upstream_key,
+                "extract_themes",
+                _extract,
+                check=stop_check(state, "extract_themes"),
+            )
+        finally:
+            deps.upstream_cache.release(state.upstream_key, state.job_id)
+    else:
+        themes = await _extract()
 
     return {"current_node": "extract_themes", "themes": themes}
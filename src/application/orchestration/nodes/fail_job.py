@@ -1,4 +1,4 @@
-"""fail_job node – mark job as failed when validation fails and revisions exhausted."""
+"""fail_job node – mark job failed once validation fails and revisions/time run out."""
 
 from __future__ import annotations
 
@@ -14,8 +14,12 @@ def fail_job(state: GraphState, deps: NodeDeps) -> dict:
     if not state.job_id or not state.job_id.strip():
         raise ValueError("fail_job: state.job_id is required")
 
-    parts = ["Validation failed after revisions exhausted"]
     report = state.validation_report
+    if report is not None and state.revisions_left > 0:
+        # Routed here with revisions left: the deadline could not cover another round.
+        parts = ["Validation failed; deadline leaves no time for another revision"]
+    else:
+        parts = ["Validation failed after revisions exhausted"]
     if report and report.issues:
         issues_summary = "; ".join(report.issues[:5])
         parts.append(f"; issues: {issues_summary}")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from src.application.orchestration.deadline import time_left
 from src.application.orchestration.state import GraphState
 from .deps import NodeDeps
 from src.application.services.keyword_candidates import extract_secondary_candidates
@@ -9,8 +10,8 @@ from .prompt_loader import render_prompt
 from src.domain.models.keyword_plan import KeywordPlan
 
 
-def keyword_plan(state: GraphState, deps: NodeDeps) -> dict:
-    """Produce KeywordPlan from SERP candidates and themes. Returns a patch dict."""
+def _prompt(state: GraphState, deps: NodeDeps) -> str:
+    """Validate inputs, gather SERP candidates and render the prompt."""
     if deps.llm is None:
         raise ValueError("keyword_plan: deps.llm is required")
     if deps.prompts is None:
@@ -28,7 +29,7 @@ def keyword_plan(state: GraphState, deps: NodeDeps) -> dict:
     )
     themes_data = state.themes.model_dump(mode="json")
     template = deps.prompts.get("keyword_plan")
-    prompt = render_prompt(
+    return render_prompt(
         template,
         topic=state.input.topic,
         language=state.input.language,
@@ -37,12 +38,10 @@ def keyword_plan(state: GraphState, deps: NodeDeps) -> dict:
         themes=themes_data,
     )
 
-    kp = deps.llm.generate_structured(
-        node_name="keyword_plan",
-        prompt=prompt,
-        schema=KeywordPlan,
-    )
 
+def _patch(state: GraphState, kp: KeywordPlan) -> dict:
+    """Check the primary keyword, dedupe secondaries and build the patch."""
+    primary = state.input.topic
     if kp.primary != primary:
         raise ValueError("keyword_plan: LLM returned wrong primary")
     if any(primary.lower() in s.lower() for s in kp.secondary):
@@ -57,3 +56,27 @@ def keyword_plan(state: GraphState, deps: NodeDeps) -> dict:
     kp = kp.model_copy(update={"secondary": deduped})
 
     return {"current_node": "keyword_plan", "keyword_plan": kp}
+
+
+def keyword_plan(state: GraphState, deps: NodeDeps) -> dict:
+    """Produce KeywordPlan from SERP candidates and themes. Returns a patch dict."""
+    prompt = _prompt(state, deps)
+    kp = deps.llm.generate_structured(
+        node_name="keyword_plan",
+        prompt=prompt,
+        schema=KeywordPlan,
+        timeout=time_left(state),
+    )
+    return _patch(state, kp)
+
+
+async def akeyword_plan(state: GraphState, deps: NodeDeps) -> dict:
+    """Async ``keyword_plan``."""
+    prompt = _prompt(state, deps)
+    kp = await deps.llm.agenerate_structured(
+        node_name="keyword_plan",
+        prompt=prompt,
+        schema=KeywordPlan,
+        timeout=time_left(state),
+    )
+    return _patch(state, kp)
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+from src.application.orchestration.deadline import time_left
 from src.application.orchestration.state import GraphState
 from .deps import NodeDeps
 from .prompt_loader import render_prompt
 from src.domain.models.plan import Plan
 
 
-def planner(state: GraphState, deps: NodeDeps) -> dict:
-    """Produce a Plan from themes and input constraints. Returns a patch dict."""
+def _prompt(state: GraphState, deps: NodeDeps) -> str:
+    """Validate inputs and render the planner prompt."""
     if deps.llm is None:
         raise ValueError("planner: deps.llm is required")
     if deps.prompts is None:
@@ -30,7 +31,7 @@ def planner(state: GraphState, deps: NodeDeps) -> dict:
     themes_data = state.themes.model_dump(mode="json")
     serp_data = [r.model_dump(mode="json") for r in state.serp_results]
     template = deps.prompts.get("planner")
-    prompt = render_prompt(
+    return render_prompt(
         template,
         topic=state.input.topic,
         primary_keyword=state.input.topic,
@@ -40,12 +41,9 @@ def planner(state: GraphState, deps: NodeDeps) -> dict:
         serp_results=serp_data,
     )
 
-    plan = deps.llm.generate_structured(
-        node_name="planner",
-        prompt=prompt,
-        schema=Plan,
-    )
 
+def _patch(state: GraphState, plan: Plan) -> dict:
+    """Check section budgets against the target and build the patch."""
     total_budget = plan.intro_target_word_count + sum(
         s.target_word_count for s in plan.sections
     )
@@ -56,3 +54,27 @@ def planner(state: GraphState, deps: NodeDeps) -> dict:
         )
 
     return {"current_node": "planner", "plan": plan}
+
+
+def planner(state: GraphState, deps: NodeDeps) -> dict:
+    """Produce a Plan from themes and input constraints. Returns a patch dict."""
+    prompt = _prompt(state, deps)
+    plan = deps.llm.generate_structured(
+        node_name="planner",
+        prompt=prompt,
+        schema=Plan,
+        timeout=time_left(state),
+    )
+    return _patch(state, plan)
+
+
+async def aplanner(state: GraphState, deps: NodeDeps) -> dict:
+    """Async ``planner``."""
+    prompt = _prompt(state, deps)
+    plan = await deps.llm.agenerate_structured(
+        node_name="planner",
+        prompt=prompt,
+        schema=Plan,
+        timeout=time_left(state),
+    )
+    return _patch(state, plan)
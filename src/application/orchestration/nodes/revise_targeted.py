@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import time
+
+from src.application.orchestration.deadline import time_left
 from src.application.orchestration.state import GraphState
 from src.application.services.markdown_tools import extract_headings
 from src.domain.models.revision import RevisionResult
@@ -31,8 +34,8 @@ def _word_count_budget(target: int, outline) -> str:
     return ". ".join(parts)
 
 
-def revise_targeted(state: GraphState, deps: NodeDeps) -> dict:
-    """Revise article per RepairSpec. Returns patch with article_markdown, optional seo_package."""
+def _prompt(state: GraphState, deps: NodeDeps) -> str:
+    """Validate inputs and render the reviser prompt."""
     if deps.llm is None:
         raise ValueError("revise_targeted: deps.llm is required")
     if deps.prompts is None:
@@ -52,7 +55,7 @@ def revise_targeted(state: GraphState, deps: NodeDeps) -> dict:
     word_count_budget = _word_count_budget(
         state.input.target_word_count, state.outline
     )
-    prompt = render_prompt(
+    return render_prompt(
         template,
         topic=state.input.topic,
         language=state.input.language,
@@ -65,12 +68,9 @@ def revise_targeted(state: GraphState, deps: NodeDeps) -> dict:
         repair_spec=state.repair_spec.model_dump(mode="json"),
     )
 
-    revision = deps.llm.generate_structured(
-        node_name="revise_targeted",
-        prompt=prompt,
-        schema=RevisionResult,
-    )
 
+def _patch(state: GraphState, revision: RevisionResult, started: float) -> dict:
+    """Check the revised article and package, then build the patch."""
     md = revision.article_markdown.strip()
     headings = extract_headings(md)
     h1_count = sum(1 for lvl, _ in headings if lvl == 1)
@@ -112,7 +112,37 @@ def revise_targeted(state: GraphState, deps: NodeDeps) -> dict:
         "current_node": "revise_targeted",
         "article_markdown": md,
         "revisions_left": new_revisions_left,
+        "draft_seconds": time.monotonic() - started,
     }
     if revision.seo_package is not None:
         patch["seo_package"] = revision.seo_package
     return patch
+
+
+def revise_targeted(state: GraphState, deps: NodeDeps) -> dict:
+    """Revise article per RepairSpec.
+
+    Returns patch with article_markdown, optional seo_package.
+    """
+    prompt = _prompt(state, deps)
+    started = time.monotonic()
+    revision = deps.llm.generate_structured(
+        node_name="revise_targeted",
+        prompt=prompt,
+        schema=RevisionResult,
+        timeout=time_left(state),
+    )
+    return _patch(state, revision, started)
+
+
+async def arevise_targeted(state: GraphState, deps: NodeDeps) -> dict:
+    """Async ``revise_targeted``."""
+    prompt = _prompt(state, deps)
+    started = time.monotonic()
+    revision = await deps.llm.agenerate_structured(
+        node_name="revise_targeted",
+        prompt=prompt,
+        schema=RevisionResult,
+        timeout=time_left(state),
+    )
+    return _patch(state, revision, started)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from src.application.orchestration.deadline import time_left
 from src.application.orchestration.state import GraphState
 from src.domain.models.seo_package import SeoPackage
 
@@ -9,8 +10,8 @@ from .deps import NodeDeps
 from .prompt_loader import render_prompt
 
 
-def seo_packager(state: GraphState, deps: NodeDeps) -> dict:
-    """Produce SeoPackage from article_markdown, plan, keyword_plan. Returns a patch dict."""
+def _prompt(state: GraphState, deps: NodeDeps) -> str:
+    """Validate inputs and render the SEO packager prompt."""
     if deps.llm is None:
         raise ValueError("seo_packager: deps.llm is required")
     if deps.prompts is None:
@@ -25,7 +26,7 @@ def seo_packager(state: GraphState, deps: NodeDeps) -> dict:
         raise ValueError("seo_packager: article_markdown is required")
 
     template = deps.prompts.get("seo_packager")
-    prompt = render_prompt(
+    return render_prompt(
         template,
         topic=state.input.topic,
         language=state.input.language,
@@ -36,12 +37,9 @@ def seo_packager(state: GraphState, deps: NodeDeps) -> dict:
         primary=state.keyword_plan.primary,
     )
 
-    pkg = deps.llm.generate_structured(
-        node_name="seo_packager",
-        prompt=prompt,
-        schema=SeoPackage,
-    )
 
+def _patch(state: GraphState, pkg: SeoPackage) -> dict:
+    """Check keyword usage and link placements, then build the patch."""
     if pkg.keyword_usage.primary != state.keyword_plan.primary:
         raise ValueError(
             f"seo_packager: keyword_usage.primary mismatch "
@@ -57,3 +55,30 @@ def seo_packager(state: GraphState, deps: NodeDeps) -> dict:
                 )
 
     return {"current_node": "seo_packager", "seo_package": pkg}
+
+
+def seo_packager(state: GraphState, deps: NodeDeps) -> dict:
+    """Produce SeoPackage from article_markdown, plan, keyword_plan.
+
+    Returns a patch dict.
+    """
+    prompt = _prompt(state, deps)
+    pkg = deps.llm.generate_structured(
+        node_name="seo_packager",
+        prompt=prompt,
+        schema=SeoPackage,
+        timeout=time_left(state),
+    )
+    return _patch(state, pkg)
+
+
+async def aseo_packager(state: GraphState, deps: NodeDeps) -> dict:
+    """Async ``seo_packager``."""
+    prompt = _prompt(state, deps)
+    pkg = await deps.llm.agenerate_structured(
+        node_name="seo_packager",
+        prompt=prompt,
+        schema=SeoPackage,
+        timeout=time_left(state),
+    )
+    return _patch(state, pkg)
@@ -1,7 +1,12 @@
-"""write_article node – generate Markdown via LLM text output."""
+"""write_article node – generate Markdown via LLM text output, optionally streamed."""
 
 from __future__ import annotations
 
+import time
+from contextlib import aclosing
+
+from src.application.orchestration.cancellation import raise_if_cancelled
+from src.application.orchestration.deadline import require_time, time_left
 from src.application.orchestration.state import GraphState
 from src.application.services.markdown_tools import extract_headings
 
@@ -14,8 +19,52 @@ def _norm(s: str) -> str:
     return " ".join(s.lower().split())
 
 
-def write_article(state: GraphState, deps: NodeDeps) -> dict:
-    """Generate article Markdown from plan, outline, keyword_plan. Returns a patch dict."""
+def _stream_draft(state: GraphState, prompt: str, deps: NodeDeps) -> str:
+    """Stream tokens to ``deps.draft_stream`` as they arrive; return the full text.
+
+    Checks for cancellation and the deadline between chunks and closes the
+    stream (aborting the upstream request) if either stops the job mid-draft.
+    """
+    job_id = state.job_id
+    chunks: list[str] = []
+    deps.draft_stream.open(job_id)
+    stream = deps.llm.stream_text(
+        node_name="write_article", prompt=prompt, timeout=time_left(state)
+    )
+    try:
+        for chunk in stream:
+            raise_if_cancelled("write_article")
+            require_time(state, "write_article")
+            chunks.append(chunk)
+            deps.draft_stream.append(job_id, chunk)
+    finally:
+        stream.close()
+        deps.draft_stream.close(job_id)
+    return "".join(chunks)
+
+
+async def _astream_draft(state: GraphState, prompt: str, deps: NodeDeps) -> str:
+    """Async ``_stream_draft``."""
+    job_id = state.job_id
+    chunks: list[str] = []
+    deps.draft_stream.open(job_id)
+    stream = deps.llm.astream_text(
+        node_name="write_article", prompt=prompt, timeout=time_left(state)
+    )
+    try:
+        # aclosing: stopping mid-draft must close the LLM stream now, not at GC.
+        async with aclosing(stream):
+            async for chunk in stream:
+                require_time(state, "write_article")
+                chunks.append(chunk)
+                deps.draft_stream.append(job_id, chunk)
+    finally:
+        deps.draft_stream.close(job_id)
+    return "".join(chunks)
+
+
+def _prompt(state: GraphState, deps: NodeDeps) -> str:
+    """Validate inputs and render the writer prompt."""
     if deps.llm is None:
         raise ValueError("write_article: deps.llm is required")
     if deps.prompts is None:
@@ -30,7 +79,7 @@ def write_article(state: GraphState, deps: NodeDeps) -> dict:
         raise ValueError("write_article: state.keyword_plan is required")
 
     template = deps.prompts.get("writer")
-    prompt = render_prompt(
+    return render_prompt(
         template,
         topic=state.input.topic,
         language=state.input.language,
@@ -40,7 +89,9 @@ def write_article(state: GraphState, deps: NodeDeps) -> dict:
         keyword_plan=state.keyword_plan.model_dump(mode="json"),
     )
 
-    md = deps.llm.generate_text(node_name="write_article", prompt=prompt)
+
+def _patch(state: GraphState, md: str, started: float) -> dict:
+    """Check H1/H2 structure of the generated Markdown and build the patch."""
     md = md.strip()
     if not md:
         raise ValueError("write_article: LLM returned empty markdown")
@@ -58,4 +109,38 @@ def write_article(state: GraphState, deps: NodeDeps) -> dict:
     if missing:
         raise ValueError(f"write_article: missing required H2 headings: {missing}")
 
-    return {"current_node": "write_article", "article_markdown": md}
+    return {
+        "current_node": "write_article",
+        "article_markdown": md,
+        "draft_seconds": time.monotonic() - started,
+    }
+
+
+def write_article(state: GraphState, deps: NodeDeps) -> dict:
+    """Generate article Markdown from plan, outline, keyword_plan. Returns a patch dict.
+
+    With ``deps.draft_stream`` set, tokens are published as they arrive;
+    H1/H2 checks still run on the assembled text.
+    """
+    prompt = _prompt(state, deps)
+    started = time.monotonic()
+    if deps.draft_stream is not None:
+        md = _stream_draft(state, prompt, deps)
+    else:
+        md = deps.llm.generate_text(
+            node_name="write_article", prompt=prompt, timeout=time_left(state)
+        )
+    return _patch(state, md, started)
+
+
+async def awrite_article(state: GraphState, deps: NodeDeps) -> dict:
+    """Async ``write_article``."""
+    prompt = _prompt(state, deps)
+    started = time.monotonic()
+    if deps.draft_stream is not None:
+        md = await _astream_draft(state, prompt, deps)
+    else:
+        md = await deps.llm.agenerate_text(
+            node_name="write_article", prompt=prompt, timeout=time_left(state)
+        )
+    return _patch(state, md, started)
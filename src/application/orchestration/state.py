@@ -41,6 +41,11 @@ class GraphState(BaseModel):
     revisions_left: int = 0
     current_node: str | None = None
     last_error: str | None = None
+    upstream_key: str | None = None
+    # Wall-clock (epoch seconds) deadline; see orchestration.deadline.
+    deadline_at: float | None = None
+    # How long the last full draft (write or revision) took, in seconds.
+    draft_seconds: float | None = None
 
     @classmethod
     def new(
@@ -51,14 +56,23 @@ class GraphState(BaseModel):
         target_word_count: int,
         language: str,
         max_revisions: int,
+        upstream_key: str | None = None,
+        deadline_seconds: float | None = None,
     ) -> GraphState:
-        """Create initial state with all intermediate fields set to ``None``."""
+        """Create initial state with all intermediate fields set to ``None``.
+
+        *upstream_key* groups jobs whose SERP and themes are computed once
+        and shared (see ``SharedUpstreamCache``).  *deadline_seconds* is the
+        job's total time budget; the clock starts at submission.
+        """
         return cls(
             job_id=job_id,
             input=JobInput(
                 topic=topic,
                 target_word_count=target_word_count,
                 language=language,
+                deadline_seconds=deadline_seconds,
             ),
             revisions_left=max_revisions,
+            upstream_key=upstream_key,
         )
@@ -2,9 +2,36 @@
 
 from __future__ import annotations
 
-from .create_job import create_job
+from .cancel_job import cancel_job
+from .create_job import create_job, create_job_idempotent, discard_job
+from .drain_jobs import DrainResult, drain_jobs
+from .export_results import export_results
 from .get_job import get_job
-from .get_result import get_result
-from .run_job import run_job
+from .get_result import get_result, get_result_json, require_result
+from .list_jobs import JobPage, list_jobs
+from .resume_job import resume_job
+from .run_job import arun_job, run_job
+from .submit_batch import BatchItem, submit_batch
+from .submit_job import submit_job
 
-__all__ = ["create_job", "get_job", "get_result", "run_job"]
+__all__ = [
+    "arun_job",
+    "BatchItem",
+    "cancel_job",
+    "create_job",
+    "create_job_idempotent",
+    "discard_job",
+    "drain_jobs",
+    "DrainResult",
+    "export_results",
+    "get_job",
+    "get_result",
+    "get_result_json",
+    "JobPage",
+    "list_jobs",
+    "require_result",
+    "resume_job",
+    "run_job",
+    "submit_batch",
+    "submit_job",
+]
@@ -0,0 +1,35 @@
+"""Cancel job use case – stop a queued job or ask a running one to stop."""
+
+from __future__ import annotations
+
+from src.domain.models.job import JobRecord, JobStatus
+from src.infrastructure.stores.job_store import JobStore
+
+_NOT_RUNNING = frozenset({JobStatus.PENDING, JobStatus.QUEUED, JobStatus.INTERRUPTED})
+
+
+def cancel_job(*, job_id: str, job_store: JobStore) -> JobRecord:
+    """Cancel *job_id*. Idempotent for jobs already cancelling or cancelled.
+
+    Pending, queued and interrupted jobs become CANCELLED at once (a
+    queued run exits without starting).  Running jobs become CANCELLING;
+    their runner stops the graph and records CANCELLED.  Raises
+    ``KeyError`` if the job does not exist, ``RuntimeError`` if it already
+    completed or failed.
+    """
+    while True:
+        record = job_store.get(job_id)
+        if record.status in (JobStatus.CANCELLING, JobStatus.CANCELLED):
+            return record
+        if record.status.is_terminal:
+            raise RuntimeError(f"Job already {record.status.value}")
+        if record.status in _NOT_RUNNING:
+            target = JobStatus.CANCELLED
+            expected = _NOT_RUNNING
+        else:
+            target = JobStatus.CANCELLING
+            expected = frozenset({JobStatus.RUNNING})
+        updated = job_store.compare_and_set_status(job_id, expected, target)
+        if updated is not None:
+            return updated
+        # Status moved under us (e.g. the job just started); re-read.
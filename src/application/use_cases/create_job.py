@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import hashlib
 import uuid
 
 from src.application.orchestration.state import GraphState
 from src.domain.models.job import JobRecord
-from src.domain.models.job_input import JobInput
-from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+from src.domain.models.job_input import DEFAULT_TENANT_ID, JobInput, JobPriority
+from src.infrastructure.stores.job_store import JobStore
+from src.infrastructure.webhooks.url_guard import (
+    UnsafeCallbackURLError,
+    check_callback_url,
+    require_http_url,
+)
 from src.settings import Settings
 
 
@@ -16,22 +22,49 @@ def create_job(
     topic: str,
     language: str,
     target_word_count: int,
-    job_store: InMemoryJobStore,
+    job_store: JobStore,
     settings: Settings,
+    upstream_key: str | None = None,
+    deadline_seconds: float | None = None,
+    priority: JobPriority = JobPriority.INTERACTIVE,
+    tenant_id: str = DEFAULT_TENANT_ID,
+    callback_url: str | None = None,
 ) -> tuple[JobRecord, GraphState]:
-    """Create a pending job and initial graph state. Does not run the graph."""
+    """Create a pending job and initial graph state. Does not run the graph.
+
+    *deadline_seconds* bounds the whole run, counted from submission.
+    *priority* picks the worker-pool lane the job is queued in;
+    *tenant_id* is the caller whose quotas the job counts against.
+    *callback_url* gets a webhook when the job finishes; it must be
+    http(s) and, unless ``WEBHOOK_ALLOW_PRIVATE_URLS`` is set, must not
+    resolve to a private, loopback or link-local address.
+    """
     if not topic or not topic.strip():
         raise ValueError("create_job: topic must be non-empty")
     if not language or not language.strip():
         raise ValueError("create_job: language must be non-empty")
     if target_word_count <= 0:
         raise ValueError("create_job: target_word_count must be > 0")
+    if deadline_seconds is not None and deadline_seconds <= 0:
+        raise ValueError("create_job: deadline_seconds must be > 0")
+    if callback_url is not None:
+        try:
+            if settings.WEBHOOK_ALLOW_PRIVATE_URLS:
+                require_http_url(callback_url)
+            else:
+                check_callback_url(callback_url)
+        except UnsafeCallbackURLError as exc:
+            raise ValueError(f"create_job: {exc}") from exc
 
     job_id = str(uuid.uuid4())
     job_input = JobInput(
         topic=topic.strip(),
         target_word_count=target_word_count,
         language=language.strip(),
+        deadline_seconds=deadline_seconds,
+        priority=priority,
+        tenant_id=tenant_id,
+        callback_url=callback_url,
     )
     record = job_store.create(job_id)
     record = job_store.set_input(job_id, job_input)
@@ -41,5 +74,91 @@ def create_job(
         target_word_count=job_input.target_word_count,
         language=job_input.language,
         max_revisions=settings.MAX_REVISIONS,
+        upstream_key=upstream_key,
+        deadline_seconds=job_input.deadline_seconds,
     )
     return (record, state)
+
+
+def create_job_idempotent(
+    *,
+    idempotency_key: str,
+    topic: str,
+    language: str,
+    target_word_count: int,
+    job_store: JobStore,
+    settings: Settings,
+    deadline_seconds: float | None = None,
+    priority: JobPriority = JobPriority.INTERACTIVE,
+    tenant_id: str = DEFAULT_TENANT_ID,
+    callback_url: str | None = None,
+) -> tuple[JobRecord, GraphState | None]:
+    """Create a job once per *idempotency_key* within ``IDEMPOTENCY_TTL_SECONDS``.
+
+    Returns ``(record, state)`` for a new job, or ``(record, None)`` with
+    the job first created under the key when this is a replay.  The job is
+    created before the key is claimed so a concurrent replay never sees a
+    key pointing at a missing job; the loser of a race deletes its copy.
+    Keys are scoped to *tenant_id*.  Raises ``ValueError`` if the key was
+    used for a different request.
+    """
+    if not idempotency_key or not idempotency_key.strip():
+        raise ValueError("create_job: Idempotency-Key must be non-empty")
+    scoped_key = _scoped_key(tenant_id, idempotency_key)
+    while True:
+        record, state = create_job(
+            topic=topic,
+            language=language,
+            target_word_count=target_word_count,
+            job_store=job_store,
+            settings=settings,
+            deadline_seconds=deadline_seconds,
+            priority=priority,
+            tenant_id=tenant_id,
+            callback_url=callback_url,
+        )
+        fingerprint = _fingerprint(record.input)
+        owner_id, owner_fingerprint = job_store.claim_idempotency_key(
+            scoped_key, record.id, fingerprint, settings.IDEMPOTENCY_TTL_SECONDS
+        )
+        if owner_id == record.id:
+            return record, state
+        job_store.delete(record.id)
+        if owner_fingerprint != fingerprint:
+            raise ValueError(
+                "create_job: Idempotency-Key was already used with a different request"
+            )
+        try:
+            return job_store.get(owner_id), None
+        except KeyError:
+            # Original job was deleted (e.g. shed on a full queue); reclaim.
+            job_store.release_idempotency_key(scoped_key, owner_id)
+
+
+def discard_job(
+    *,
+    job_id: str,
+    job_store: JobStore,
+    idempotency_key: str | None = None,
+    tenant_id: str = DEFAULT_TENANT_ID,
+) -> None:
+    """Delete a job that was never queued and free its Idempotency-Key.
+
+    Used when admission is refused after creation, so a client retry with
+    the same key creates the job afresh instead of replaying a missing one.
+    """
+    job_store.delete(job_id)
+    if idempotency_key is not None:
+        job_store.release_idempotency_key(
+            _scoped_key(tenant_id, idempotency_key), job_id
+        )
+
+
+def _scoped_key(tenant_id: str, idempotency_key: str) -> str:
+    return f"{tenant_id}:{idempotency_key}"
+
+
+def _fingerprint(job_input: JobInput | None) -> str:
+    """Hash the resolved input so a reused key with a new body is detected."""
+    payload = job_input.model_dump_json() if job_input is not None else ""
+    return hashlib.sha256(payload.encode()).hexdigest()
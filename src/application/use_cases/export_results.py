@@ -0,0 +1,73 @@
+"""Export results use case – stream completed results as NDJSON by ``updated_at``."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from typing import Iterator
+
+from src.domain.models.job import JobStatus
+from src.infrastructure.stores.job_store import IndexKey, JobStore
+
+from .list_jobs import decode_cursor, encode_index_key
+
+# Results fetched from the store per round trip; bounds the export's memory.
+EXPORT_PAGE_SIZE = 100
+
+
+def export_results(
+    *,
+    job_store: JobStore,
+    status: JobStatus = JobStatus.COMPLETED,
+    since: datetime | None = None,
+    cursor: str | None = None,
+    page_size: int = EXPORT_PAGE_SIZE,
+) -> Iterator[bytes]:
+    """Return an iterator of NDJSON lines, one per completed job, oldest update first.
+
+    Each line is ``{"job_id", "updated_at", "result_hash", "cursor",
+    "result"}``; the result bytes come straight from the store, so they
+    are never re-validated.  Pages of *page_size* are fetched lazily, so
+    memory stays constant however many results exist.
+
+    *since* keeps jobs updated at or after it (naive times are UTC).
+    Pass a line's ``cursor`` to continue after that line, e.g. when a
+    long export was interrupted.  Jobs updated while an export runs move
+    to the end of the order and may be exported again.
+
+    Raises ``ValueError`` (before anything is streamed) for a status other
+    than completed -- only completed jobs have results -- a malformed
+    cursor or a non-positive *page_size*.
+    """
+    if status != JobStatus.COMPLETED:
+        raise ValueError("export_results: only completed jobs have results")
+    if page_size <= 0:
+        raise ValueError("export_results: page_size must be > 0")
+    after: IndexKey | None = decode_cursor(cursor) if cursor else None
+    if since is not None:
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # "" sorts before every job id, so jobs updated exactly at *since* are kept.
+        after = max(after, (since, "")) if after is not None else (since, "")
+    return _stream(job_store, after, page_size)
+
+
+def _stream(
+    job_store: JobStore, after: IndexKey | None, page_size: int
+) -> Iterator[bytes]:
+    while True:
+        rows = job_store.list_result_json(after=after, limit=page_size)
+        if not rows:
+            return
+        for key, result_json, result_hash in rows:
+            head = json.dumps(
+                {
+                    "job_id": key[1],
+                    "updated_at": key[0].isoformat(),
+                    "result_hash": result_hash,
+                    "cursor": encode_index_key(key),
+                },
+                separators=(",", ":"),
+            )
+            yield b"".join((head[:-1].encode(), b',"result":', result_json, b"}\n"))
+        after = rows[-1][0]
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from src.domain.models.job import JobRecord
-from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+from src.infrastructure.stores.job_store import JobStore
 
 
-def get_job(*, job_id: str, job_store: InMemoryJobStore) -> JobRecord:
+def get_job(*, job_id: str, job_store: JobStore) -> JobRecord:
     """Retrieve job record. Raises KeyError if not found."""
     return job_store.get(job_id)
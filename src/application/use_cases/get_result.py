@@ -2,14 +2,31 @@
 
 from __future__ import annotations
 
-from src.domain.models.job import JobStatus
+from src.domain.models.job import JobRecord, JobStatus
 from src.domain.models.output import SeoArticleOutput
-from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+from src.infrastructure.stores.job_store import JobStore
 
 
-def get_result(*, job_id: str, job_store: InMemoryJobStore) -> SeoArticleOutput:
+def get_result(*, job_id: str, job_store: JobStore) -> SeoArticleOutput:
     """Return completed job result. Raises KeyError if not found, RuntimeError if not completed."""
-    record = job_store.get(job_id)
+    return require_result(job_store.get(job_id))
+
+
+def get_result_json(*, job_id: str, job_store: JobStore) -> tuple[bytes, str]:
+    """Return (serialized result JSON, content hash) for a completed job.
+
+    Uses the store's byte cache so repeat fetches skip model validation and
+    serialization.  Raises like ``get_result``.
+    """
+    cached = job_store.get_result_json(job_id)
+    if cached is None:
+        require_result(job_store.get(job_id))  # raises the matching error
+        raise RuntimeError("Job completed but result is missing")
+    return cached
+
+
+def require_result(record: JobRecord) -> SeoArticleOutput:
+    """Return *record*'s result. Raises RuntimeError if the job is not completed."""
     if record.status != JobStatus.COMPLETED:
         if record.status == JobStatus.FAILED:
             raise RuntimeError("Job failed")
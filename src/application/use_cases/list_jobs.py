@@ -0,0 +1,65 @@
+"""List jobs use case – cursor-paginated listing in ``updated_at`` order."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.domain.models.job import JobRecord, JobStatus
+from src.infrastructure.stores.job_store import IndexKey, JobStore
+
+
+@dataclass(frozen=True)
+class JobPage:
+    """One page of jobs plus the cursor for the next page (``None`` at the end)."""
+
+    jobs: list[JobRecord]
+    next_cursor: str | None
+
+
+def encode_cursor(record: JobRecord) -> str:
+    """Opaque cursor pointing just past *record*."""
+    return encode_index_key((record.updated_at, record.id))
+
+
+def encode_index_key(key: IndexKey) -> str:
+    """Opaque cursor pointing just past the job at listing position *key*."""
+    updated_at, job_id = key
+    raw = f"{updated_at.isoformat()}|{job_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> IndexKey:
+    """Inverse of ``encode_cursor``. Raises ``ValueError`` if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        updated_at, job_id = raw.split("|", 1)
+        key = (datetime.fromisoformat(updated_at), job_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("list_jobs: cursor is invalid") from exc
+    if key[0].tzinfo is None:
+        raise ValueError("list_jobs: cursor is invalid")
+    return key
+
+
+def list_jobs(
+    *,
+    job_store: JobStore,
+    status: JobStatus | None = None,
+    cursor: str | None = None,
+    limit: int = 50,
+) -> JobPage:
+    """Return the next page of jobs, oldest update first.
+
+    Raises ``ValueError`` for a malformed cursor or non-positive *limit*.
+    """
+    if limit <= 0:
+        raise ValueError("list_jobs: limit must be > 0")
+    after = decode_cursor(cursor) if cursor else None
+    records = job_store.list_jobs(status=status, after=after, limit=limit + 1)
+    if len(records) <= limit:
+        return JobPage(jobs=records, next_cursor=None)
+    page = records[:limit]
+    return JobPage(jobs=page, next_cursor=encode_cursor(page[-1]))
@@ -0,0 +1,69 @@
+"""Resume job use case – continue a stopped job from its last checkpoint."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from src.application.orchestration.checkpointer import thread_config
+from src.application.orchestration.state import GraphState
+from src.domain.models.job import JobRecord, JobStatus
+from src.infrastructure.events.job_event_bus import JobEventBus
+from src.infrastructure.quotas.tenant_quotas import TenantQuotas
+from src.infrastructure.stores.job_store import JobStore
+from src.infrastructure.webhooks.outbox import WebhookOutbox
+from src.infrastructure.workers.job_worker_pool import JobWorkerPool
+
+from .submit_job import submit_job
+
+_RESUMABLE = frozenset({JobStatus.FAILED, JobStatus.CANCELLED, JobStatus.INTERRUPTED})
+
+
+def resume_job(
+    *,
+    job_id: str,
+    graph: Any,
+    job_store: JobStore,
+    worker_pool: JobWorkerPool,
+    events: JobEventBus | None = None,
+    quotas: TenantQuotas | None = None,
+    webhooks: WebhookOutbox | None = None,
+) -> JobRecord:
+    """Queue a failed, cancelled or interrupted job to resume at its unfinished node.
+
+    The graph checkpoints after every node under ``thread_id == job_id``,
+    so the stored SERP results, plan, outline and article are reused and
+    only the remaining nodes run.  A job with a deadline gets a fresh
+    budget, counted from now.
+
+    Raises ``KeyError`` if the job does not exist, ``RuntimeError`` if it
+    is not failed, cancelled or interrupted, or its checkpoint has nothing left to run
+    (e.g. it failed validation in ``fail_job``), and ``QueueFullError`` /
+    ``QuotaExceededError`` like ``submit_job``.
+    """
+    record = job_store.get(job_id)
+    if record.status not in _RESUMABLE:
+        raise RuntimeError(
+            f"Job is {record.status.value}; only failed, cancelled or interrupted jobs "
+            "can be resumed"
+        )
+    config = thread_config(job_id)
+    snapshot = graph.get_state(config)
+    if not snapshot.next:
+        raise RuntimeError("Job has no checkpoint to resume from")
+
+    state = GraphState.model_validate(snapshot.values)
+    if state.input.deadline_seconds is not None:
+        deadline_at = time.time() + state.input.deadline_seconds
+        graph.update_state(config, {"deadline_at": deadline_at})
+        state = state.model_copy(update={"deadline_at": deadline_at})
+    return submit_job(
+        state=state,
+        graph=graph,
+        job_store=job_store,
+        worker_pool=worker_pool,
+        events=events,
+        quotas=quotas,
+        webhooks=webhooks,
+        resume=True,
+    )
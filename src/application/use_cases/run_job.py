@@ -1,34 +1,284 @@
-"""Run job use case – invoke graph with thread_config, handle exceptions."""
+"""Run job use case – stream the graph, publish progress, handle errors."""
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import threading
+import time
+from typing import Any, Callable
 
+from langchain_core.callbacks import get_usage_metadata_callback
+
+from src.application.orchestration.cancellation import (
+    JobCancelledError,
+    JobInterruptedError,
+    cancel_scope,
+    interrupt_scope,
+)
 from src.application.orchestration.checkpointer import thread_config
+from src.application.orchestration.deadline import start_deadline
 from src.application.orchestration.state import GraphState
-from src.domain.models.job import JobStatus
-from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+from src.domain.models.events import JobEvent, JobEventType
+from src.domain.models.job import JobRecord, JobStatus
+from src.infrastructure.events.job_event_bus import JobEventBus
+from src.infrastructure.stores.job_store import JobStore
+from src.infrastructure.stores.shared_upstream_cache import SharedUpstreamCache
+from src.infrastructure.webhooks.outbox import WebhookOutbox, enqueue_job_finished
+
+# A run may start from any status except a pending or completed cancellation.
+_STARTABLE = frozenset(JobStatus) - {JobStatus.CANCELLING, JobStatus.CANCELLED}
+
+
+def _ms(start: float) -> float:
+    return round((time.monotonic() - start) * 1000, 1)
+
+
+def _total_tokens(usage: Any) -> int:
+    """Sum ``total_tokens`` over every model a usage callback saw."""
+    return sum(item.get("total_tokens", 0) for item in usage.usage_metadata.values())
+
+
+class _JobRun:
+    """Progress bookkeeping shared by ``run_job`` and ``arun_job``."""
+
+    def __init__(
+        self,
+        *,
+        job_id: str,
+        job_store: JobStore,
+        events: JobEventBus | None,
+        webhooks: WebhookOutbox | None = None,
+        upstream_cache: SharedUpstreamCache | None = None,
+        upstream_key: str | None = None,
+    ) -> None:
+        self.job_id = job_id
+        self.job_store = job_store
+        self.events = events
+        self.webhooks = webhooks
+        self.upstream_cache = upstream_cache
+        self.upstream_key = upstream_key
+        self.started = time.monotonic()
+        self.open_tasks: dict[str, tuple[str, float]] = {}
+        self.cancel_requested = threading.Event()
+        self.on_cancel: Callable[[], None] | None = None
+        self._unwatch: Callable[[], None] | None = None
+
+    def start(self, current_node: str | None = "collect_serp") -> bool:
+        """Set RUNNING and start watching for a cancel request.
+
+        *current_node* of ``None`` keeps the stored one (used on resume).
+        Returns ``False`` (nothing to run) if the job was cancelled while
+        it waited in the queue.
+        """
+        self._unwatch = self.job_store.watch(self.job_id, self._on_change)
+        record = self.job_store.compare_and_set_status(
+            self.job_id, _STARTABLE, JobStatus.RUNNING, current_node=current_node
+        )
+        if record is None:
+            self.job_store.compare_and_set_status(
+                self.job_id, {JobStatus.CANCELLING}, JobStatus.CANCELLED
+            )
+        return record is not None
+
+    def _on_change(self, record: JobRecord) -> None:
+        if record.status != JobStatus.CANCELLING or self.cancel_requested.is_set():
+            return
+        self.cancel_requested.set()
+        if self.on_cancel is not None:
+            self.on_cancel()
+
+    def publish(self, event_type: JobEventType, **fields: Any) -> None:
+        if self.events is not None:
+            self.events.publish(JobEvent(job_id=self.job_id, type=event_type, **fields))
+
+    def on_task(self, task: dict[str, Any]) -> None:
+        """Publish node start/end (and revision-loop) for one ``tasks`` stream item."""
+        name = task["name"]
+        if "input" in task:
+            self.open_tasks[task["id"]] = (name, time.monotonic())
+            if name == "repair_spec":
+                self.publish(
+                    JobEventType.REVISION_LOOP,
+                    node=name,
+                    revisions_left=task["input"].revisions_left,
+                )
+            self.publish(JobEventType.NODE_START, node=name)
+        else:
+            _, node_started = self.open_tasks.pop(task["id"], (name, time.monotonic()))
+            self.publish(
+                JobEventType.NODE_END,
+                node=name,
+                duration_ms=_ms(node_started),
+                error=str(task["error"]) if task.get("error") else None,
+            )
+
+    def on_complete(self) -> None:
+        record = self.job_store.get(self.job_id)
+        if record.status == JobStatus.RUNNING:
+            self.job_store.set_error(
+                self.job_id, "Graph ended without finalize/fail_job updating status"
+            )
+
+    def on_error(self, exc: BaseException) -> None:
+        for name, node_started in self.open_tasks.values():
+            self.publish(
+                JobEventType.NODE_END,
+                node=name,
+                duration_ms=_ms(node_started),
+                error=f"{type(exc).__name__}: {exc}",
+            )
+        if isinstance(exc, JobCancelledError) or self.cancel_requested.is_set():
+            self.job_store.compare_and_set_status(
+                self.job_id,
+                {JobStatus.RUNNING, JobStatus.CANCELLING},
+                JobStatus.CANCELLED,
+            )
+            return
+        if isinstance(exc, JobInterruptedError):
+            self.job_store.compare_and_set_status(
+                self.job_id, {JobStatus.RUNNING}, JobStatus.INTERRUPTED
+            )
+            return
+        record = self.job_store.get(self.job_id)
+        if not record.status.is_terminal:
+            self.job_store.set_error(self.job_id, f"{type(exc).__name__}: {exc}")
+
+    def finish(self) -> JobRecord:
+        if self._unwatch is not None:
+            self._unwatch()
+        if self.upstream_cache is not None and self.upstream_key:
+            # Covers runs that ended (failed, cancelled, out of time) before
+            # extract_themes released the batch group; a repeat is a no-op.
+            self.upstream_cache.release(self.upstream_key, self.job_id)
+        record = self.job_store.get(self.job_id)
+        if record.status.is_terminal:
+            enqueue_job_finished(self.webhooks, record)
+        self.publish(
+            JobEventType.TERMINAL,
+            status=record.status.value,
+            error=record.error,
+            duration_ms=_ms(self.started),
+        )
+        return record
 
 
 def run_job(
     *,
     state: GraphState,
     graph: Any,
-    job_store: InMemoryJobStore,
+    job_store: JobStore,
+    events: JobEventBus | None = None,
+    on_usage: Callable[[int], None] | None = None,
+    on_finish: Callable[[JobRecord], None] | None = None,
+    webhooks: WebhookOutbox | None = None,
+    interrupt: threading.Event | None = None,
+    resume: bool = False,
+    upstream_cache: SharedUpstreamCache | None = None,
 ) -> None:
-    """Run the graph for the given state. Sets RUNNING, invokes graph, handles exceptions."""
-    job_id = state.job_id
-    job_store.set_status(job_id, JobStatus.RUNNING, current_node="collect_serp")
+    """Run the graph for *state*. Sets RUNNING, streams graph, handles exceptions.
 
-    try:
-        graph.invoke(state, config=thread_config(job_id))
+    When *events* is given, node start/end (with durations), revision-loop
+    and terminal events are published as the graph progresses.
+    *webhooks* gets the job's completion webhook once its final status is
+    stored, whether it completed, failed or was cancelled.
+    *on_usage* is called once at the end with the LLM tokens the run used,
+    *on_finish* with the job's final record (also when it never started).
+    *upstream_cache* is released for the job's batch group (if any) when
+    the run ends, however it ends.
+    With *resume*, the graph continues the job's checkpointed thread from
+    the node that did not finish instead of starting from *state*.
 
-        record = job_store.get(job_id)
-        if record.status == JobStatus.RUNNING:
-            job_store.set_error(job_id, "Graph ended without finalize/fail_job updating status")
+    Once *interrupt* is set (the worker pool is shutting down) the graph
+    stops before its next node and the job ends INTERRUPTED, resumable
+    from that node.  Once the job is marked CANCELLING the graph stops
+    before its next node (a streamed draft stops at its next chunk, and
+    an in-flight LLM call made under the cancel scope is aborted) and the
+    job ends CANCELLED.
+    """
+    state = start_deadline(state)
+    run = _JobRun(
+        job_id=state.job_id,
+        job_store=job_store,
+        events=events,
+        webhooks=webhooks,
+        upstream_cache=upstream_cache,
+        upstream_key=state.upstream_key,
+    )
+    with get_usage_metadata_callback() as usage:
+        try:
+            if not run.start(None if resume else "collect_serp"):
+                return
+            with cancel_scope(run.cancel_requested), interrupt_scope(interrupt):
+                for task in graph.stream(
+                    None if resume else state,
+                    config=thread_config(state.job_id),
+                    stream_mode="tasks",
+                ):
+                    run.on_task(task)
+            run.on_complete()
+        except Exception as exc:
+            run.on_error(exc)
+        finally:
+            record = run.finish()
+            if on_usage is not None:
+                on_usage(_total_tokens(usage))
+            if on_finish is not None:
+                on_finish(record)
 
-    except Exception as exc:
-        record = job_store.get(job_id)
-        if record.status in (JobStatus.COMPLETED, JobStatus.FAILED):
-            return
-        job_store.set_error(job_id, f"{type(exc).__name__}: {exc}")
+
+async def arun_job(
+    *,
+    state: GraphState,
+    graph: Any,
+    job_store: JobStore,
+    events: JobEventBus | None = None,
+    on_usage: Callable[[int], None] | None = None,
+    on_finish: Callable[[JobRecord], None] | None = None,
+    webhooks: WebhookOutbox | None = None,
+    interrupt: threading.Event | None = None,
+    resume: bool = False,
+    upstream_cache: SharedUpstreamCache | None = None,
+) -> None:
+    """Async ``run_job``: drives the graph with ``astream`` on the caller's event loop.
+
+    LLM nodes await the provider instead of holding a thread; nodes without
+    an async implementation run in the loop's default executor.  A cancel
+    request cancels the running task, aborting any in-flight LLM request.
+    """
+    task = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+    state = start_deadline(state)
+    run = _JobRun(
+        job_id=state.job_id,
+        job_store=job_store,
+        events=events,
+        webhooks=webhooks,
+        upstream_cache=upstream_cache,
+        upstream_key=state.upstream_key,
+    )
+    run.on_cancel = lambda: loop.call_soon_threadsafe(task.cancel)
+    with get_usage_metadata_callback() as usage:
+        try:
+            if not run.start(None if resume else "collect_serp"):
+                return
+            with cancel_scope(run.cancel_requested), interrupt_scope(interrupt):
+                async for item in graph.astream(
+                    None if resume else state,
+                    config=thread_config(state.job_id),
+                    stream_mode="tasks",
+                ):
+                    run.on_task(item)
+            run.on_complete()
+        except asyncio.CancelledError as exc:
+            if not run.cancel_requested.is_set():
+                raise
+            task.uncancel()
+            run.on_error(exc)
+        except Exception as exc:
+            run.on_error(exc)
+        finally:
+            record = run.finish()
+            if on_usage is not None:
+                on_usage(_total_tokens(usage))
+            if on_finish is not None:
+                on_finish(record)
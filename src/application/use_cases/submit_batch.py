@@ -0,0 +1,112 @@
+"""Submit batch use case – create many jobs at once, sharing upstream work per group."""
+
+from __future__ import annotations
+
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from src.domain.models.job import JobRecord
+from src.domain.models.job_input import JobInput
+from src.infrastructure.events.job_event_bus import JobEventBus
+from src.infrastructure.quotas.errors import QuotaExceededError
+from src.infrastructure.quotas.tenant_quotas import TenantQuotas
+from src.infrastructure.stores.job_coalescer import JobCoalescer
+from src.infrastructure.stores.job_store import JobStore
+from src.infrastructure.stores.shared_upstream_cache import SharedUpstreamCache
+from src.infrastructure.webhooks.outbox import WebhookOutbox
+from src.infrastructure.workers.errors import PoolClosedError, QueueFullError
+from src.infrastructure.workers.job_worker_pool import JobWorkerPool
+from src.settings import Settings
+
+from .create_job import create_job
+from .submit_job import submit_job
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """One job in a batch: resolved inputs plus whether to queue it now."""
+
+    input: JobInput
+    run_immediately: bool = True
+
+
+def _group_key(batch_id: str, job_input: JobInput) -> str:
+    return f"{batch_id}|{job_input.topic.strip()}|{job_input.language.strip()}"
+
+
+def submit_batch(
+    *,
+    items: Sequence[BatchItem],
+    graph: Any,
+    job_store: JobStore,
+    settings: Settings,
+    worker_pool: JobWorkerPool,
+    upstream_cache: SharedUpstreamCache,
+    events: JobEventBus | None = None,
+    quotas: TenantQuotas | None = None,
+    webhooks: WebhookOutbox | None = None,
+    coalescer: JobCoalescer | None = None,
+) -> list[JobRecord]:
+    """Create a job per item and queue those with ``run_immediately``.
+
+    Queued jobs with the same ``(topic, language)`` share one upstream key,
+    so ``collect_serp`` and ``extract_themes`` run once per group.  Inputs
+    are validated before anything is created.  If the queue fills up (or
+    the tenant runs out of quota) part way, the remaining jobs are left
+    PENDING (runnable later via ``POST /jobs/{id}/run``) rather than
+    failing the whole batch.  With *coalescer*, jobs identical to one
+    already in flight follow it (see ``submit_job``).
+    Returns records in input order.
+    """
+    for item in items:
+        if not item.input.topic.strip():
+            raise ValueError("submit_batch: topic must be non-empty")
+        if not item.input.language.strip():
+            raise ValueError("submit_batch: language must be non-empty")
+
+    batch_id = str(uuid.uuid4())
+    runnable = [item for item in items if item.run_immediately]
+    group_sizes = Counter(_group_key(batch_id, item.input) for item in runnable)
+    for key, size in group_sizes.items():
+        if size > 1:
+            upstream_cache.register(key, consumers=size)
+
+    records: list[JobRecord] = []
+    admission_closed = False
+    for item in items:
+        key = _group_key(batch_id, item.input) if item.run_immediately else None
+        shared = key is not None and group_sizes[key] > 1
+        record, state = create_job(
+            topic=item.input.topic,
+            target_word_count=item.input.target_word_count,
+            language=item.input.language,
+            job_store=job_store,
+            settings=settings,
+            upstream_key=key if shared else None,
+            deadline_seconds=item.input.deadline_seconds,
+            priority=item.input.priority,
+            tenant_id=item.input.tenant_id,
+            callback_url=item.input.callback_url,
+        )
+        if item.run_immediately and not admission_closed:
+            try:
+                record = submit_job(
+                    state=state,
+                    graph=graph,
+                    job_store=job_store,
+                    worker_pool=worker_pool,
+                    events=events,
+                    quotas=quotas,
+                    webhooks=webhooks,
+                    coalescer=coalescer,
+                    upstream_cache=upstream_cache if shared else None,
+                )
+            except (QueueFullError, QuotaExceededError, PoolClosedError):
+                admission_closed = True
+        following = coalescer is not None and coalescer.leader_of(record.id) is not None
+        if item.run_immediately and (admission_closed or following) and shared:
+            upstream_cache.release(key, record.id)
+        records.append(record)
+    return records
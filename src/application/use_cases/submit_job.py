@@ -0,0 +1,209 @@
+"""Submit job use case – queue a job on the worker pool and return immediately."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from src.application.orchestration.deadline import start_deadline
+from src.application.orchestration.state import GraphState
+from src.domain.models.events import JobEvent, JobEventType
+from src.domain.models.job import JobRecord, JobStatus
+from src.infrastructure.events.job_event_bus import JobEventBus
+from src.infrastructure.quotas.errors import QuotaExceededError
+from src.infrastructure.quotas.tenant_quotas import TenantQuotas
+from src.infrastructure.stores.job_coalescer import JobCoalescer, coalesce_key
+from src.infrastructure.stores.job_store import JobStore
+from src.infrastructure.stores.shared_upstream_cache import SharedUpstreamCache
+from src.infrastructure.webhooks.outbox import WebhookOutbox, enqueue_job_finished
+from src.infrastructure.workers.errors import PoolClosedError, QueueFullError
+from src.infrastructure.workers.job_worker_pool import JobWorkerPool
+from src.logging_config import get_logger
+
+from .run_job import arun_job, run_job
+
+_logger = get_logger(__name__)
+
+
+def submit_job(
+    *,
+    state: GraphState,
+    graph: Any,
+    job_store: JobStore,
+    worker_pool: JobWorkerPool,
+    events: JobEventBus | None = None,
+    quotas: TenantQuotas | None = None,
+    webhooks: WebhookOutbox | None = None,
+    coalescer: JobCoalescer | None = None,
+    resume: bool = False,
+    upstream_cache: SharedUpstreamCache | None = None,
+) -> JobRecord:
+    """Mark the job QUEUED and hand ``run_job`` to the worker pool. Does not wait.
+
+    Pools that run coroutines (``worker_pool.runs_async``) get ``arun_job``.
+    The job is queued in the lane of its stored ``input.priority``.
+    A job deadline starts counting here, so time spent queued is included.
+
+    With *quotas*, the job's tenant must first be admitted (one job plus
+    an estimate of its LLM tokens); the run settles the estimate against
+    actual usage when it ends, or releases it if shutdown drops the job
+    before it starts.  *resume* continues the job's checkpointed
+    thread (see ``run_job``).  *webhooks* receives the job's completion
+    webhook, if it has a ``callback_url``.  *upstream_cache* is the batch
+    cache the job's run releases when it ends.
+
+    With *coalescer*, a job identical to one already in flight (same
+    topic, language, word count, priority and deadline) follows it
+    instead: it stays QUEUED without taking a worker or quota, and gets a
+    copy of the leader's result when it completes.  If the leader fails or
+    is cancelled, its followers are submitted to run on their own.
+    Resumes never coalesce.
+
+    Raises ``QuotaExceededError`` (job unchanged) when the tenant is over
+    its rate, ``QueueFullError`` (job reverted to its previous status) when
+    the pool is at capacity, and ``PoolClosedError`` (likewise reverted)
+    once the pool has begun shutting down.
+    """
+    job_id = state.job_id
+    previous = job_store.get(job_id)
+    # The stored input carries priority and tenant; GraphState.input may not.
+    job_input = previous.input or state.input
+    tenant_id = job_input.tenant_id
+
+    key = None
+    on_finish = None
+    if coalescer is not None and not resume:
+        key = coalesce_key(job_input)
+        # QUEUED before joining, so a leader finishing at once sees a waiting follower.
+        record = job_store.set_status(job_id, JobStatus.QUEUED)
+
+        def on_leader_done(leader: JobRecord) -> None:
+            _settle_follower(
+                leader,
+                state=state,
+                graph=graph,
+                job_store=job_store,
+                worker_pool=worker_pool,
+                events=events,
+                quotas=quotas,
+                webhooks=webhooks,
+                coalescer=coalescer,
+                upstream_cache=upstream_cache,
+            )
+
+        if coalescer.join(key, job_id, on_leader_done) is not None:
+            return record
+
+        def on_finish(record: JobRecord) -> None:
+            coalescer.finish(key, record)
+
+    reserved = 0
+    on_usage = None
+    on_drop = None
+    if quotas is not None:
+        try:
+            reserved = quotas.admit(
+                tenant_id,
+                estimated_tokens=quotas.estimate_tokens(job_input.target_word_count),
+            )
+        except QuotaExceededError:
+            if key is not None:
+                coalescer.finish(key, job_store.set_status(job_id, previous.status))
+            raise
+
+        def on_usage(tokens: int) -> None:
+            quotas.settle(tenant_id, reserved=reserved, actual_tokens=tokens)
+
+        def on_drop() -> None:
+            quotas.release(tenant_id, reserved=reserved)
+
+    state = start_deadline(state)
+    record = job_store.set_status(job_id, JobStatus.QUEUED)
+    runner = arun_job if worker_pool.runs_async else run_job
+    try:
+        worker_pool.submit(
+            job_id,
+            lambda: runner(
+                state=state,
+                graph=graph,
+                job_store=job_store,
+                events=events,
+                on_usage=on_usage,
+                on_finish=on_finish,
+                webhooks=webhooks,
+                interrupt=worker_pool.stopping,
+                resume=resume,
+                upstream_cache=upstream_cache,
+            ),
+            lane=job_input.priority.value,
+            on_drop=on_drop,
+        )
+    except (QueueFullError, PoolClosedError):
+        reverted = job_store.set_status(job_id, previous.status)
+        if quotas is not None:
+            quotas.release(tenant_id, reserved=reserved)
+        if key is not None:
+            coalescer.finish(key, reverted)
+        raise
+    return record
+
+
+def _settle_follower(
+    leader: JobRecord,
+    *,
+    state: GraphState,
+    graph: Any,
+    job_store: JobStore,
+    worker_pool: JobWorkerPool,
+    events: JobEventBus | None,
+    quotas: TenantQuotas | None,
+    webhooks: WebhookOutbox | None,
+    coalescer: JobCoalescer,
+    upstream_cache: SharedUpstreamCache | None,
+) -> None:
+    """Copy a completed leader's result to the follower, or queue the follower itself.
+
+    Followers cancelled while waiting are left alone.  A follower that
+    cannot be queued (pool full, over quota, shutting down) is left
+    PENDING, runnable later with ``POST /jobs/{id}/run``.
+    """
+    job_id = state.job_id
+    if leader.status == JobStatus.COMPLETED and leader.result is not None:
+        record = job_store.compare_and_set_result(
+            job_id, {JobStatus.QUEUED}, leader.result
+        )
+        if record is None:
+            return
+        enqueue_job_finished(webhooks, record)
+        if events is not None:
+            events.publish(
+                JobEvent(
+                    job_id=job_id,
+                    type=JobEventType.TERMINAL,
+                    status=record.status.value,
+                )
+            )
+        return
+    if not job_store.compare_and_set_status(
+        job_id, {JobStatus.QUEUED}, JobStatus.PENDING
+    ):
+        return
+    try:
+        submit_job(
+            state=state,
+            graph=graph,
+            job_store=job_store,
+            worker_pool=worker_pool,
+            events=events,
+            quotas=quotas,
+            webhooks=webhooks,
+            coalescer=coalescer,
+            upstream_cache=upstream_cache,
+        )
+    except (QueueFullError, QuotaExceededError, PoolClosedError) as exc:
+        _logger.warning(
+            "Job %s left pending after its leader %s ended %s: %s",
+            job_id,
+            leader.id,
+            leader.status.value,
+            exc,
+        )
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from .events import JobEvent, JobEventType
 from .job import JobRecord, JobStatus
-from .job_input import JobInput
+from .job_input import JobInput, JobPriority
 from .keyword_plan import KeywordPlan, UsageTargetItem
 from .outline import Outline, OutlineSection
 from .output import SeoArticleOutput
@@ -59,8 +60,12 @@ __all__ = [
     "RepairSpec",
     # output
     "SeoArticleOutput",
+    # events
+    "JobEvent",
+    "JobEventType",
     # job
     "JobInput",
+    "JobPriority",
     "JobRecord",
     "JobStatus",
 ]
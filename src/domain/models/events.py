@@ -0,0 +1,31 @@
+"""Job progress events – emitted while the graph runs, streamed to clients."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class JobEventType(str, Enum):
+    """Kinds of progress events a job emits."""
+
+    NODE_START = "node_start"
+    NODE_END = "node_end"
+    REVISION_LOOP = "revision_loop"
+    TERMINAL = "terminal"
+
+
+class JobEvent(BaseModel):
+    """A single progress event. ``seq`` is assigned by the event bus, per job."""
+
+    seq: int = 0
+    job_id: str
+    type: JobEventType
+    node: str | None = None
+    duration_ms: float | None = None
+    revisions_left: int | None = None
+    status: str | None = None
+    error: str | None = None
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from enum import Enum
 
 from pydantic import BaseModel
@@ -14,9 +15,19 @@ class JobStatus(str, Enum):
     """Lifecycle states for a pipeline job."""
 
     PENDING = "pending"
+    QUEUED = "queued"
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLING = "cancelling"
+    CANCELLED = "cancelled"
+    # Stopped at a node boundary by a shutdown; continue with POST /jobs/{id}/resume.
+    INTERRUPTED = "interrupted"
+
+    @property
+    def is_terminal(self) -> bool:
+        """True once the job can no longer change on its own."""
+        return self in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
 
 
 class JobRecord(BaseModel):
@@ -28,3 +39,6 @@ class JobRecord(BaseModel):
     current_node: str | None = None
     error: str | None = None
     result: SeoArticleOutput | None = None
+    result_hash: str | None = None
+    version: int = 1
+    updated_at: datetime | None = None
@@ -2,8 +2,20 @@
 
 from __future__ import annotations
 
+from enum import Enum
+
 from pydantic import BaseModel, Field
 
+# Tenant for requests without an X-Tenant-ID header.
+DEFAULT_TENANT_ID = "default"
+
+
+class JobPriority(str, Enum):
+    """Scheduling lane a job is queued in."""
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
 
 class JobInput(BaseModel):
     """User-provided inputs that kick off a pipeline run."""
@@ -11,3 +23,8 @@ class JobInput(BaseModel):
     topic: str = Field(min_length=1)
     target_word_count: int = Field(gt=0)
     language: str = Field(min_length=1)
+    deadline_seconds: float | None = Field(default=None, gt=0)
+    priority: JobPriority = JobPriority.INTERACTIVE
+    tenant_id: str = Field(default=DEFAULT_TENANT_ID, min_length=1)
+    # Receives a POST when the job reaches a terminal status.
+    callback_url: str | None = None
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, field_serializer
 
 
 class SerpResult(BaseModel):
@@ -13,5 +13,10 @@ class SerpResult(BaseModel):
     title: str = Field(min_length=1)
     snippet: str = Field(min_length=1)
 
+    @field_serializer("url")
+    def _url_as_str(self, url: HttpUrl) -> str:
+        # A plain string keeps checkpoints msgpack-encodable (no pickle).
+        return str(url)
+
 
 SerpResults = list[SerpResult]
@@ -0,0 +1,25 @@
+"""Per-run cancel signal, readable by providers below the orchestration layer.
+
+The job runner sets the event through ``src.application.orchestration``'s
+``cancel_scope``; blocking calls (e.g. ``OpenAIProvider``) read it here to
+abort an in-flight request instead of waiting for the next node boundary.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextvars import ContextVar
+
+# Set by the runner for the duration of one graph run; nodes inherit it.
+cancel_event: ContextVar[threading.Event | None] = ContextVar(
+    "job_cancel_event", default=None
+)
+
+
+class JobCancelledError(Exception):
+    """Raised inside a graph run once its job has been asked to cancel."""
+
+
+def current_cancel_event() -> threading.Event | None:
+    """The running job's cancel event; ``None`` outside a cancel scope."""
+    return cancel_event.get()
@@ -0,0 +1,8 @@
+"""Job progress events – in-process event bus and draft token streams."""
+
+from __future__ import annotations
+
+from .draft_stream_hub import DraftStreamHub
+from .job_event_bus import JobEventBus
+
+__all__ = ["DraftStreamHub", "JobEventBus"]
@@ -0,0 +1,99 @@
+"""In-process fan-out of article draft tokens while write_article runs."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+# Called with a text chunk, or ``None`` once the draft is closed.
+DraftSubscriber = Callable[[str | None], None]
+
+
+class _Draft:
+    def __init__(self) -> None:
+        self.chunks: list[str] = []
+        self.subscribers: list[DraftSubscriber] = []
+        self.started = False
+        self.closed = False
+
+
+class DraftStreamHub:
+    """Buffers each job's streamed draft and forwards chunks to readers.
+
+    ``write_article`` calls ``open`` / ``append`` / ``close``; readers call
+    ``subscribe`` and get the text so far plus every later chunk through
+    their callback (run on the writer's thread, must not block), then
+    ``None`` when the draft is closed.  Readers may subscribe before the
+    draft starts.  Buffers for the most recent ``max_jobs`` jobs are kept
+    so a late reader can still fetch a finished draft.
+    """
+
+    def __init__(self, *, max_jobs: int = 256) -> None:
+        self._max_jobs = max_jobs
+        self._drafts: OrderedDict[str, _Draft] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def open(self, job_id: str) -> None:
+        """Start (or restart) the draft for *job_id*, keeping waiting readers."""
+        with self._lock:
+            draft = self._draft(job_id)
+            draft.chunks.clear()
+            draft.started = True
+            draft.closed = False
+
+    def append(self, job_id: str, chunk: str) -> None:
+        """Record *chunk* and deliver it to current readers."""
+        with self._lock:
+            draft = self._draft(job_id)
+            draft.chunks.append(chunk)
+            subscribers = list(draft.subscribers)
+        for callback in subscribers:
+            callback(chunk)
+
+    def close(self, job_id: str) -> None:
+        """Mark the draft finished and release its readers."""
+        with self._lock:
+            draft = self._draft(job_id)
+            draft.closed = True
+            subscribers = list(draft.subscribers)
+            draft.subscribers.clear()
+        for callback in subscribers:
+            callback(None)
+
+    def subscribe(
+        self, job_id: str, callback: DraftSubscriber
+    ) -> tuple[str, bool, Callable[[], None]]:
+        """Return (text so far, closed, unsubscribe). No callbacks if closed."""
+        with self._lock:
+            draft = self._draft(job_id)
+            text = "".join(draft.chunks)
+            closed = draft.closed
+            if not closed:
+                draft.subscribers.append(callback)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                if callback in draft.subscribers:
+                    draft.subscribers.remove(callback)
+
+        return text, closed, _unsubscribe
+
+    def started(self, job_id: str) -> bool:
+        """True if a draft for *job_id* has been opened and is still buffered."""
+        with self._lock:
+            draft = self._drafts.get(job_id)
+            return draft is not None and draft.started
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _draft(self, job_id: str) -> _Draft:
+        """Get or create the buffer for *job_id*. Caller holds ``_lock``."""
+        draft = self._drafts.get(job_id)
+        if draft is None:
+            draft = self._drafts[job_id] = _Draft()
+            while len(self._drafts) > self._max_jobs:
+                self._drafts.popitem(last=False)
+        else:
+            self._drafts.move_to_end(job_id)
+        return draft
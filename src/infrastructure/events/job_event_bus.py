@@ -0,0 +1,99 @@
+"""In-process pub/sub of job progress events with per-job replay history."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from src.domain.models.events import JobEvent, JobEventType
+
+Subscriber = Callable[[JobEvent], None]
+
+
+class _Channel:
+    def __init__(
+        self, *, last_seq: int = 0, subscribers: list[Subscriber] | None = None
+    ) -> None:
+        self.history: list[JobEvent] = []
+        self.subscribers: list[Subscriber] = [] if subscribers is None else subscribers
+        self.last_seq = last_seq
+        self.closed = False
+
+
+class JobEventBus:
+    """Thread-safe fan-out of ``JobEvent``s, keyed by job id.
+
+    Publishers (graph workers) call ``publish``; readers call ``subscribe``
+    and receive the history so far plus every later event via their
+    callback, which runs on the publisher's thread and must not block.
+    History for the most recent ``max_jobs`` jobs is retained so late
+    subscribers can replay a finished job.  A channel is closed after its
+    ``TERMINAL`` event; if the job runs again (a resume), the next event
+    opens a fresh history but ``seq`` keeps counting, so a client resuming
+    from ``Last-Event-ID`` never mistakes new events for ones it has seen.
+    """
+
+    def __init__(self, *, max_jobs: int = 10_000) -> None:
+        self._max_jobs = max_jobs
+        self._channels: OrderedDict[str, _Channel] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def publish(self, event: JobEvent) -> JobEvent:
+        """Assign the next ``seq`` for the job, record and deliver *event*."""
+        with self._lock:
+            channel = self._channel(event.job_id)
+            if channel.closed:
+                # Share the list: subscribers waiting on the closed run carry over.
+                channel = self._channels[event.job_id] = _Channel(
+                    last_seq=channel.last_seq, subscribers=channel.subscribers
+                )
+            channel.last_seq += 1
+            event = event.model_copy(update={"seq": channel.last_seq})
+            channel.history.append(event)
+            subscribers = list(channel.subscribers)
+            if event.type == JobEventType.TERMINAL:
+                channel.closed = True
+                channel.subscribers.clear()
+        for callback in subscribers:
+            callback(event)
+        return event
+
+    def subscribe(
+        self, job_id: str, callback: Subscriber
+    ) -> tuple[list[JobEvent], Callable[[], None]]:
+        """Return (history, unsubscribe). *callback* gets events after history.
+
+        If the job's channel is already closed, the history ends with the
+        terminal event and *callback* is only called if the job runs again.
+        """
+        with self._lock:
+            channel = self._channel(job_id)
+            history = list(channel.history)
+            channel.subscribers.append(callback)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                if callback in channel.subscribers:
+                    channel.subscribers.remove(callback)
+
+        return history, _unsubscribe
+
+    def history(self, job_id: str) -> list[JobEvent]:
+        """Return events recorded so far for *job_id*."""
+        with self._lock:
+            channel = self._channels.get(job_id)
+            return list(channel.history) if channel else []
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _channel(self, job_id: str) -> _Channel:
+        """Get or create the channel for *job_id*. Caller holds ``_lock``."""
+        channel = self._channels.get(job_id)
+        if channel is None:
+            channel = self._channels[job_id] = _Channel()
+            while len(self._channels) > self._max_jobs:
+                self._channels.popitem(last=False)
+        else:
+            self._channels.move_to_end(job_id)
+        return channel
@@ -0,0 +1,15 @@
+"""In-process metrics exposed at ``/metrics`` in the Prometheus text format."""
+
+from __future__ import annotations
+
+from .pipeline_metrics import PipelineMetrics
+from .registry import CONTENT_TYPE, MetricsRegistry
+from .timed_lock import TimedLock, timed_lock
+
+__all__ = [
+    "CONTENT_TYPE",
+    "MetricsRegistry",
+    "PipelineMetrics",
+    "TimedLock",
+    "timed_lock",
+]
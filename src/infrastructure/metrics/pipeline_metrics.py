@@ -0,0 +1,101 @@
+"""The pipeline's metric set – node, LLM, revision, store-lock and queue metrics."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+from .registry import MetricsRegistry
+
+# Store lock waits are normally microseconds; the tail is what matters.
+_LOCK_WAIT_BUCKETS = (0.00001, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+_REVISION_BUCKETS = (0, 1, 2, 3, 5, 8)
+
+
+class PipelineMetrics:
+    """Metric families shared by graph nodes, the LLM provider, stores and the API.
+
+    One instance per process (see ``deps.get_metrics``); components get it
+    injected and record only when it is set, so tests and tools that pass
+    nothing pay nothing.  Queue gauges are sampled when ``/metrics`` is
+    scraped rather than on every submit.
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None) -> None:
+        self.registry = registry or MetricsRegistry()
+        r = self.registry
+        self.node_seconds = r.histogram(
+            "aiseo_node_duration_seconds",
+            "Wall time of one graph node run, including failed runs.",
+            ["node"],
+        )
+        self.node_errors = r.counter(
+            "aiseo_node_errors_total", "Graph node runs that raised.", ["node"]
+        )
+        self.llm_requests = r.counter(
+            "aiseo_llm_requests_total",
+            "LLM request attempts by outcome (ok or error); retries count separately.",
+            ["node", "model", "outcome"],
+        )
+        self.llm_request_seconds = r.histogram(
+            "aiseo_llm_request_duration_seconds",
+            "Latency of one LLM request attempt (to the first token for streams).",
+            ["node", "model"],
+        )
+        self.llm_retries = r.counter(
+            "aiseo_llm_retries_total",
+            "LLM attempts retried after backoff.",
+            ["node", "model"],
+        )
+        self.llm_tokens = r.counter(
+            "aiseo_llm_tokens_total",
+            "LLM tokens reported by the provider, by direction (input or output).",
+            ["node", "model", "direction"],
+        )
+        self.revision_loops = r.counter(
+            "aiseo_revision_loops_total", "Revision-loop iterations (repair_spec runs)."
+        )
+        self.revision_rounds = r.histogram(
+            "aiseo_revision_rounds",
+            "Revision rounds a job used before it finished, by outcome.",
+            ["outcome"],
+            buckets=_REVISION_BUCKETS,
+        )
+        self.store_lock_wait = r.histogram(
+            "aiseo_job_store_lock_wait_seconds",
+            "Time spent waiting to acquire the job store lock.",
+            ["backend"],
+            buckets=_LOCK_WAIT_BUCKETS,
+        )
+        self.queue_depth = r.gauge(
+            "aiseo_queue_depth", "Jobs waiting for a worker, per lane.", ["lane"]
+        )
+        self.queue_oldest_wait = r.gauge(
+            "aiseo_queue_oldest_wait_seconds",
+            "Wait of the oldest queued job, per lane.",
+            ["lane"],
+        )
+        self.jobs_running = r.gauge("aiseo_jobs_running", "Jobs currently executing.")
+        self.workers = r.gauge("aiseo_workers", "Maximum jobs executing concurrently.")
+
+    def record_llm_usage(
+        self, node: str, model: str, usage: Mapping[str, Any] | None
+    ) -> None:
+        """Count the tokens in a LangChain ``usage_metadata`` dict (``None``: no-op)."""
+        if not usage:
+            return
+        for direction in ("input", "output"):
+            tokens = usage.get(f"{direction}_tokens")
+            if tokens:
+                self.llm_tokens.labels(node, model, direction).inc(tokens)
+
+    def sample_queue(self, stats: Any) -> None:
+        """Set the queue gauges from a worker pool ``QueueStats``."""
+        self.jobs_running.labels().set(stats.running)
+        self.workers.labels().set(stats.workers)
+        for lane, lane_stats in stats.lanes.items():
+            self.queue_depth.labels(lane).set(lane_stats.queued)
+            self.queue_oldest_wait.labels(lane).set(lane_stats.oldest_wait_seconds)
+
+    def render(self) -> str:
+        """Prometheus text exposition of every metric."""
+        return self.registry.render()
@@ -0,0 +1,252 @@
+"""Minimal in-process metrics registry rendered in the Prometheus text format."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from typing import Generic, Sequence, TypeVar
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds, from sub-ms store calls to multi-minute LLM drafts.
+DEFAULT_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+C = TypeVar("C")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "counts", "sum", "_lock", "_parts")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        # Per-bucket (not cumulative) counts; the last slot is +Inf.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+        self._parts: list[_HistogramChild] = []
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def split(self, n: int) -> list[_HistogramChild]:
+        """*n* recorders with their own locks, merged into this child at scrape.
+
+        For callers that observe from many threads at once (e.g. one per
+        lock stripe), so recording does not serialize them on one lock.
+        """
+        parts = [_HistogramChild(self._bounds) for _ in range(n)]
+        with self._lock:
+            self._parts.extend(parts)
+        return parts
+
+    def snapshot(self) -> tuple[list[int], float]:
+        """Per-bucket counts and sum, including every ``split`` part."""
+        with self._lock:
+            counts = list(self.counts)
+            total = self.sum
+            parts = list(self._parts)
+        for part in parts:
+            part_counts, part_sum = part.snapshot()
+            counts = [a + b for a, b in zip(counts, part_counts)]
+            total += part_sum
+        return counts, total
+
+
+class _Family(Generic[C]):
+    """A named metric and its children, one per label-value tuple."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str]) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], C] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> C:
+        """Child for *values* (in ``labelnames`` order). Cache it on hot paths."""
+        child = self._children.get(values)
+        if child is not None:
+            return child
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name}: expected labels {self.labelnames}, got {values}"
+            )
+        with self._lock:
+            return self._children.setdefault(values, self._new_child())
+
+    def _new_child(self) -> C:
+        raise NotImplementedError
+
+    def _samples(self, children: list[tuple[tuple[str, ...], C]]) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        with self._lock:
+            children = sorted(self._children.items(), key=lambda item: item[0])
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples(children))
+        return "\n".join(lines)
+
+
+class Counter(_Family[_CounterChild]):
+    """Monotonic total; ``labels(...).inc(n)``."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def _samples(
+        self, children: list[tuple[tuple[str, ...], _CounterChild]]
+    ) -> list[str]:
+        return [
+            f"{self.name}{_labels(self.labelnames, values)} "
+            f"{_format_value(child.value)}"
+            for values, child in children
+        ]
+
+
+class Gauge(_Family[_GaugeChild]):
+    """Point-in-time value; ``labels(...).set(v)``."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def _samples(
+        self, children: list[tuple[tuple[str, ...], _GaugeChild]]
+    ) -> list[str]:
+        return [
+            f"{self.name}{_labels(self.labelnames, values)} "
+            f"{_format_value(child.value)}"
+            for values, child in children
+        ]
+
+
+class Histogram(_Family[_HistogramChild]):
+    """Bucketed distribution; ``labels(...).observe(v)``."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def _samples(
+        self, children: list[tuple[tuple[str, ...], _HistogramChild]]
+    ) -> list[str]:
+        lines = []
+        for values, child in children:
+            counts, total = child.snapshot()
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                labels = _labels(self.labelnames, values, le)
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Owns metric families and renders them for a scrape.
+
+    Recording is a dict lookup (skipped when the child is cached) plus an
+    uncontended lock around one or two additions, so instrumented hot
+    paths pay well under a microsecond.  All aggregation happens at
+    ``render`` time.
+    """
+
+    def __init__(self) -> None:
+        self._families: dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        """All families in the Prometheus text exposition format."""
+        with self._lock:
+            families = list(self._families.values())
+        return "\n".join(family.render() for family in families) + "\n"
+
+    def _register(self, family: _Family) -> _Family:
+        with self._lock:
+            if family.name in self._families:
+                raise ValueError(f"MetricsRegistry: {family.name!r} already registered")
+            self._families[family.name] = family
+        return family
@@ -0,0 +1,43 @@
+"""Lock wrapper that reports how long each acquisition waited."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+
+class TimedLock:
+    """Context-manager lock that passes each acquisition's wait to *observe*.
+
+    The uncontended path is one non-blocking ``acquire`` plus the observer
+    call with ``0.0``; the clock is only read when the lock is busy.
+    """
+
+    __slots__ = ("_lock", "_observe")
+
+    def __init__(self, lock: Any, observe: Callable[[float], None]) -> None:
+        self._lock = lock
+        self._observe = observe
+
+    def acquire(self) -> bool:
+        if self._lock.acquire(blocking=False):
+            self._observe(0.0)
+            return True
+        started = time.perf_counter()
+        self._lock.acquire()
+        self._observe(time.perf_counter() - started)
+        return True
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc: object) -> None:
+        self._lock.release()
+
+
+def timed_lock(lock: Any, observe: Callable[[float], None] | None) -> Any:
+    """*lock* wrapped in ``TimedLock`` when there is an observer, else *lock* itself."""
+    return lock if observe is None else TimedLock(lock, observe)
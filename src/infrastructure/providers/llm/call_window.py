@@ -0,0 +1,70 @@
+"""Sliding window of recent LLM call outcomes."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LLMCallStats:
+    """LLM requests and failures over the last ``window_seconds``."""
+
+    window_seconds: float
+    calls: int
+    errors: int
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of calls that failed (0 when there were none)."""
+        return self.errors / self.calls if self.calls else 0.0
+
+
+class LLMCallWindow:
+    """Counts LLM request attempts and failures over a rolling window.
+
+    ``OpenAIProvider`` records every attempt, so a retried call that
+    eventually succeeds still shows its failed attempts -- the signal
+    readiness needs when the provider is degraded.  Outcomes are kept in
+    one-second buckets, so memory is bounded by the window length, not
+    the call rate.  Thread-safe.
+    """
+
+    def __init__(self, *, window_seconds: float = 60.0, clock=time.monotonic) -> None:
+        if window_seconds <= 0:
+            raise ValueError("LLMCallWindow: window_seconds must be > 0")
+        self._window = window_seconds
+        self._clock = clock
+        # [second, calls, errors], oldest first.
+        self._buckets: deque[list[int]] = deque()
+        self._lock = threading.Lock()
+
+    def record(self, *, ok: bool) -> None:
+        """Count one request attempt."""
+        now = self._clock()
+        second = int(now)
+        with self._lock:
+            self._expire(now)
+            if not self._buckets or self._buckets[-1][0] != second:
+                self._buckets.append([second, 0, 0])
+            bucket = self._buckets[-1]
+            bucket[1] += 1
+            if not ok:
+                bucket[2] += 1
+
+    def stats(self) -> LLMCallStats:
+        """Calls and errors within the window, as of now."""
+        with self._lock:
+            self._expire(self._clock())
+            calls = sum(bucket[1] for bucket in self._buckets)
+            errors = sum(bucket[2] for bucket in self._buckets)
+        return LLMCallStats(window_seconds=self._window, calls=calls, errors=errors)
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _expire(self, now: float) -> None:
+        """Drop buckets that ended before the window. Caller holds ``_lock``."""
+        while self._buckets and self._buckets[0][0] + 1 <= now - self._window:
+            self._buckets.popleft()
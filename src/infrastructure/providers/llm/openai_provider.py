@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import random
+import threading
 import time
-from typing import Any, Callable, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    TypeVar,
+)
 
 from pydantic import BaseModel
 
+from src.infrastructure.cancellation import JobCancelledError, current_cancel_event
+
+from .call_window import LLMCallWindow
+
 T = TypeVar("T", bound=BaseModel)
 
 from langchain_openai import ChatOpenAI
@@ -15,6 +30,9 @@ from langchain_openai import ChatOpenAI
 from .errors import LLMProviderError
 from src.settings import Settings
 
+if TYPE_CHECKING:
+    from src.infrastructure.metrics.pipeline_metrics import PipelineMetrics
+
 _TRANSIENT_PATTERNS = (
     "rate limit",
     "timeout",
@@ -31,6 +49,9 @@ _BACKOFF_FACTOR = 2
 _BACKOFF_JITTER = 0.25
 _BACKOFF_CAP = 8.0
 
+# How often a blocking call inside a cancel scope checks the job's cancel event.
+_CANCEL_POLL_SECONDS = 0.1
+
 
 def _is_transient(exc: Exception) -> bool:
     """Heuristic: match error message against known transient patterns.
@@ -42,11 +63,84 @@ def _is_transient(exc: Exception) -> bool:
     return any(p in msg for p in _TRANSIENT_PATTERNS)
 
 
+def _backoff_delay(attempt: int) -> float:
+    return min(
+        _BACKOFF_BASE * (_BACKOFF_FACTOR ** attempt)
+        + random.uniform(0, _BACKOFF_JITTER),
+        _BACKOFF_CAP,
+    )
+
+
+def _remaining(deadline: float | None) -> float | None:
+    """Seconds until the monotonic *deadline*; ``None`` when unbounded."""
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def _with_timeout(llm: ChatOpenAI, timeout: float | None) -> ChatOpenAI:
+    """Copy of *llm* whose requests time out after *timeout* seconds.
+
+    The copy reuses the original HTTP connection pools.
+    """
+    if timeout is None:
+        return llm
+    root = llm.root_client.with_options(timeout=timeout)
+    aroot = llm.root_async_client.with_options(timeout=timeout)
+    return llm.model_copy(
+        update={
+            "root_client": root,
+            "client": root.chat.completions,
+            "root_async_client": aroot,
+            "async_client": aroot.chat.completions,
+        }
+    )
+
+
+def _sleep(seconds: float) -> None:
+    """``time.sleep`` that ends early with ``JobCancelledError`` on a job cancel."""
+    cancel = current_cancel_event()
+    if cancel is None:
+        time.sleep(seconds)
+    elif cancel.wait(seconds):
+        raise JobCancelledError("LLM backoff: job cancelled")
+
+
+def _usage_metadata(result: Any) -> dict | None:
+    """LangChain ``usage_metadata`` of a message or structured-output result, if any."""
+    if isinstance(result, dict):
+        result = result.get("raw")
+    usage = getattr(result, "usage_metadata", None)
+    return usage if isinstance(usage, dict) else None
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Return the text of a streamed message chunk ('' for non-text chunks)."""
+    content = getattr(chunk, "content", chunk)
+    return content if isinstance(content, str) else ""
+
+
 class OpenAIProvider:
     """Thin wrapper around ``ChatOpenAI`` for structured JSON and text generation.
 
     Provides consistent retry/backoff and rich error context (node name,
-    model, raw excerpt) on every failure path.
+    model, raw excerpt) on every failure path.  Every call has an ``a``-
+    prefixed coroutine twin (``ainvoke`` / ``astream``, ``asyncio.sleep``
+    backoff) so graphs run with ``ainvoke`` do not pin a thread per job.
+
+    ``timeout`` bounds a call's total time, retries included: each attempt
+    gets the time that is left as its request timeout, and no retry is
+    started that the remaining budget cannot cover.
+
+    Blocking calls made inside a job's cancel scope
+    (``src.infrastructure.cancellation``) run as their async twin on an
+    event-loop thread owned by the provider, while the calling thread
+    polls the cancel event; a cancel cancels that task, which closes the
+    HTTP request, and raises ``JobCancelledError`` within
+    ``_CANCEL_POLL_SECONDS``.  Backoff sleeps wake on a cancel too.
+
+    With ``call_window``, every attempt's outcome is recorded there (used
+    by the readiness check).  With ``metrics``, each attempt's latency and
+    outcome, every retry and the reported input/output tokens are counted
+    per node and model.
     """
 
     def __init__(
@@ -58,6 +152,8 @@ class OpenAIProvider:
         model_text: str = "gpt-4.1",
         temperature_json: float = 0,
         temperature_text: float = 0.7,
+        call_window: LLMCallWindow | None = None,
+        metrics: PipelineMetrics | None = None,
     ) -> None:
         resolved_key = api_key or (settings.OPENAI_API_KEY if settings else None)
         if not resolved_key:
@@ -69,6 +165,10 @@ class OpenAIProvider:
 
         self._model_json = model_json
         self._model_text = model_text
+        self._call_window = call_window
+        self._metrics = metrics
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
 
         self._llm_json = ChatOpenAI(
             api_key=resolved_key,
@@ -90,27 +190,216 @@ class OpenAIProvider:
         prompt: str,
         schema: type[T],
         max_retries: int = 3,
+        timeout: float | None = None,
     ) -> T:
         """Call the LLM and return a validated Pydantic model instance.
 
         Uses OpenAI native JSON schema mode via LangChain's
         ``with_structured_output``.
         """
-        runnable = self._llm_json.with_structured_output(
-            schema,
-            method="json_schema",
-            strict=True,
-            include_raw=True,
+        result = self._call_with_retry(
+            lambda t: self._invoke(self._structured_runnable(schema, t), prompt),
+            node_name=node_name,
+            model=self._model_json,
+            max_retries=max_retries,
+            timeout=timeout,
         )
+        return self._parsed(result, node_name=node_name)
 
-        result = self._call_with_retry(
-            runnable.invoke,
-            prompt,
+    async def agenerate_structured(
+        self,
+        *,
+        node_name: str,
+        prompt: str,
+        schema: type[T],
+        max_retries: int = 3,
+        timeout: float | None = None,
+    ) -> T:
+        """Async ``generate_structured``."""
+        result = await self._acall_with_retry(
+            lambda t: self._structured_runnable(schema, t).ainvoke(prompt),
             node_name=node_name,
             model=self._model_json,
             max_retries=max_retries,
+            timeout=timeout,
+        )
+        return self._parsed(result, node_name=node_name)
+
+    def generate_text(
+        self,
+        *,
+        node_name: str,
+        prompt: str,
+        max_retries: int = 3,
+        timeout: float | None = None,
+    ) -> str:
+        """Call the LLM and return plain text content."""
+        ai_message = self._call_with_retry(
+            lambda t: self._invoke(_with_timeout(self._llm_text, t), prompt),
+            node_name=node_name,
+            model=self._model_text,
+            max_retries=max_retries,
+            timeout=timeout,
+        )
+        return self._text(ai_message, node_name=node_name)
+
+    async def agenerate_text(
+        self,
+        *,
+        node_name: str,
+        prompt: str,
+        max_retries: int = 3,
+        timeout: float | None = None,
+    ) -> str:
+        """Async ``generate_text``."""
+        ai_message = await self._acall_with_retry(
+            lambda t: _with_timeout(self._llm_text, t).ainvoke(prompt),
+            node_name=node_name,
+            model=self._model_text,
+            max_retries=max_retries,
+            timeout=timeout,
+        )
+        return self._text(ai_message, node_name=node_name)
+
+    def stream_text(
+        self,
+        *,
+        node_name: str,
+        prompt: str,
+        max_retries: int = 3,
+        timeout: float | None = None,
+    ) -> Iterator[str]:
+        """Call the LLM and yield plain text content chunk by chunk.
+
+        Opening the stream (up to the first non-empty chunk) goes through
+        the usual retry/backoff; once tokens have been yielded a failure
+        cannot be retried transparently and is raised as ``LLMProviderError``.
+        """
+        first, rest = self._call_with_retry(
+            lambda t: self._open_text_stream(prompt, t),
+            node_name=node_name,
+            model=self._model_text,
+            max_retries=max_retries,
+            timeout=timeout,
+        )
+        if first is None:
+            raise LLMProviderError(
+                node_name=node_name,
+                model=self._model_text,
+                message="LLM returned empty text content",
+            )
+
+        try:
+            yield first
+            for chunk in rest:
+                self._record_usage(node_name, self._model_text, _usage_metadata(chunk))
+                text = _chunk_text(chunk)
+                if text:
+                    yield text
+        except Exception as exc:
+            raise LLMProviderError(
+                node_name=node_name,
+                model=self._model_text,
+                message=f"LLM stream interrupted: {exc}",
+                original_exc=exc,
+            ) from exc
+        finally:
+            # Closing early (e.g. the job was cancelled) releases the HTTP stream.
+            close = getattr(rest, "close", None)
+            if close is not None:
+                close()
+
+    async def astream_text(
+        self,
+        *,
+        node_name: str,
+        prompt: str,
+        max_retries: int = 3,
+        timeout: float | None = None,
+    ) -> AsyncIterator[str]:
+        """Async ``stream_text``."""
+        first, rest = await self._acall_with_retry(
+            lambda t: self._aopen_text_stream(prompt, t),
+            node_name=node_name,
+            model=self._model_text,
+            max_retries=max_retries,
+            timeout=timeout,
         )
+        if first is None:
+            raise LLMProviderError(
+                node_name=node_name,
+                model=self._model_text,
+                message="LLM returned empty text content",
+            )
 
+        try:
+            yield first
+            async for chunk in rest:
+                self._record_usage(node_name, self._model_text, _usage_metadata(chunk))
+                text = _chunk_text(chunk)
+                if text:
+                    yield text
+        except Exception as exc:
+            raise LLMProviderError(
+                node_name=node_name,
+                model=self._model_text,
+                message=f"LLM stream interrupted: {exc}",
+                original_exc=exc,
+            ) from exc
+        finally:
+            # Async generators are not closed on garbage collection; release the
+            # HTTP stream explicitly when the consumer stops early.
+            aclose = getattr(rest, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _invoke(self, runnable: Any, prompt: str) -> Any:
+        """``runnable.invoke(prompt)`` that a job cancel aborts (see class docstring).
+
+        Outside a cancel scope this is the plain blocking call.
+        """
+        cancel = current_cancel_event()
+        if cancel is None:
+            return runnable.invoke(prompt)
+        if cancel.is_set():
+            raise JobCancelledError("LLM call: job cancelled")
+        future = asyncio.run_coroutine_threadsafe(
+            runnable.ainvoke(prompt), self._event_loop()
+        )
+        while True:
+            done, _ = concurrent.futures.wait([future], timeout=_CANCEL_POLL_SECONDS)
+            if done:
+                return future.result()
+            if cancel.is_set():
+                future.cancel()
+                raise JobCancelledError("LLM call: job cancelled")
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """The provider's event loop, started on a daemon thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="openai-provider-loop", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    def _structured_runnable(
+        self, schema: type[T], timeout: float | None = None
+    ) -> Any:
+        """JSON-schema structured output runnable returning raw + parsed."""
+        return _with_timeout(self._llm_json, timeout).with_structured_output(
+            schema,
+            method="json_schema",
+            strict=True,
+            include_raw=True,
+        )
+
+    def _parsed(self, result: dict, *, node_name: str) -> Any:
+        """Return the parsed model from a structured-output result or raise."""
         parsing_error = result.get("parsing_error")
         parsed = result.get("parsed")
 
@@ -125,29 +414,19 @@ class OpenAIProvider:
                 model=self._model_json,
                 message=f"Structured output parsing failed: {parsing_error}",
                 raw_excerpt=raw_content[:300] if raw_content else None,
-                original_exc=parsing_error if isinstance(parsing_error, Exception) else None,
+                original_exc=(
+                    parsing_error if isinstance(parsing_error, Exception) else None
+                ),
             )
 
         return parsed
 
-    def generate_text(
-        self,
-        *,
-        node_name: str,
-        prompt: str,
-        max_retries: int = 3,
-    ) -> str:
-        """Call the LLM and return plain text content."""
-        ai_message = self._call_with_retry(
-            self._llm_text.invoke,
-            prompt,
-            node_name=node_name,
-            model=self._model_text,
-            max_retries=max_retries,
+    def _text(self, ai_message: Any, *, node_name: str) -> str:
+        """Return non-empty text content from an LLM message or raise."""
+        content = (
+            ai_message.content if hasattr(ai_message, "content") else str(ai_message)
         )
 
-        content = ai_message.content if hasattr(ai_message, "content") else str(ai_message)
-
         if not content or not content.strip():
             raise LLMProviderError(
                 node_name=node_name,
@@ -157,41 +436,179 @@ class OpenAIProvider:
 
         return content
 
+    async def _aopen_text_stream(
+        self, prompt: str, timeout: float | None = None
+    ) -> tuple[str | None, AsyncIterator[Any]]:
+        """Async ``_open_text_stream``."""
+        chunks = aiter(_with_timeout(self._llm_text, timeout).astream(prompt))
+        async for chunk in chunks:
+            text = _chunk_text(chunk)
+            if text:
+                return text, chunks
+        return None, chunks
+
     # -- internal retry helper -----------------------------------------------
 
+    def _open_text_stream(
+        self, prompt: str, timeout: float | None = None
+    ) -> tuple[str | None, Iterator[Any]]:
+        """Start streaming and return (first non-empty chunk, remaining chunks)."""
+        chunks = iter(_with_timeout(self._llm_text, timeout).stream(prompt))
+        for chunk in chunks:
+            text = _chunk_text(chunk)
+            if text:
+                return text, chunks
+        return None, chunks
+
     def _call_with_retry(
         self,
-        fn: Callable[..., Any],
-        *args: object,
+        fn: Callable[[float | None], Any],
+        *,
         node_name: str,
         model: str,
         max_retries: int,
+        timeout: float | None = None,
     ) -> Any:
+        """Call ``fn(attempt_timeout)`` with retry/backoff within the *timeout*."""
+        deadline = None if timeout is None else time.monotonic() + timeout
         last_exc: Exception | None = None
+        attempts = 0
 
         for attempt in range(max_retries):
+            remaining = self._attempt_budget(deadline, node_name, model, last_exc)
+            attempts = attempt + 1
+            started = time.perf_counter()
             try:
-                return fn(*args)
+                result = fn(remaining)
+            except JobCancelledError:
+                raise
             except Exception as exc:
+                self._record(node_name, model, started, ok=False)
                 last_exc = exc
-                is_last = attempt == max_retries - 1
-                if is_last:
+                delay = self._retry_delay(attempt, max_retries, exc, deadline)
+                if delay is None:
                     break
+                self._record_retry(node_name, model)
+                _sleep(delay)
+            else:
+                self._record(node_name, model, started, ok=True, result=result)
+                return result
 
-                transient = _is_transient(exc)
-                if not transient and attempt >= 1:
-                    break
+        raise LLMProviderError(
+            node_name=node_name,
+            model=model,
+            message=f"LLM call failed after {attempts} attempt(s): {last_exc}",
+            original_exc=last_exc,
+        )
+
+    async def _acall_with_retry(
+        self,
+        fn: Callable[[float | None], Awaitable[Any]],
+        *,
+        node_name: str,
+        model: str,
+        max_retries: int,
+        timeout: float | None = None,
+    ) -> Any:
+        """Async ``_call_with_retry``: awaits *fn* and backs off with ``asyncio.sleep``.
 
-                delay = min(
-                    _BACKOFF_BASE * (_BACKOFF_FACTOR ** attempt)
-                    + random.uniform(0, _BACKOFF_JITTER),
-                    _BACKOFF_CAP,
-                )
-                time.sleep(delay)
+        Each attempt is also cut off with ``asyncio.wait_for`` at the time
+        left, so a slow response cannot outlive the budget.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        last_exc: Exception | None = None
+        attempts = 0
+
+        for attempt in range(max_retries):
+            remaining = self._attempt_budget(deadline, node_name, model, last_exc)
+            attempts = attempt + 1
+            started = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(fn(remaining), remaining)
+            except Exception as exc:
+                self._record(node_name, model, started, ok=False)
+                last_exc = exc
+                delay = self._retry_delay(attempt, max_retries, exc, deadline)
+                if delay is None:
+                    break
+                self._record_retry(node_name, model)
+                await asyncio.sleep(delay)
+            else:
+                self._record(node_name, model, started, ok=True, result=result)
+                return result
 
         raise LLMProviderError(
             node_name=node_name,
             model=model,
-            message=f"LLM call failed after {max_retries} attempt(s): {last_exc}",
+            message=f"LLM call failed after {attempts} attempt(s): {last_exc}",
             original_exc=last_exc,
         )
+
+    # -- metrics -------------------------------------------------------------
+
+    def _record(
+        self,
+        node_name: str,
+        model: str,
+        started: float,
+        *,
+        ok: bool,
+        result: Any = None,
+    ) -> None:
+        """Record one attempt's outcome, latency and (on success) token usage."""
+        if self._call_window is not None:
+            self._call_window.record(ok=ok)
+        if self._metrics is None:
+            return
+        metrics = self._metrics
+        metrics.llm_request_seconds.labels(node_name, model).observe(
+            time.perf_counter() - started
+        )
+        metrics.llm_requests.labels(node_name, model, "ok" if ok else "error").inc()
+        if ok:
+            metrics.record_llm_usage(node_name, model, _usage_metadata(result))
+
+    def _record_retry(self, node_name: str, model: str) -> None:
+        if self._metrics is not None:
+            self._metrics.llm_retries.labels(node_name, model).inc()
+
+    def _record_usage(self, node_name: str, model: str, usage: dict | None) -> None:
+        if self._metrics is not None:
+            self._metrics.record_llm_usage(node_name, model, usage)
+
+    @staticmethod
+    def _attempt_budget(
+        deadline: float | None,
+        node_name: str,
+        model: str,
+        last_exc: Exception | None,
+    ) -> float | None:
+        """Time left for the next attempt; raise if the budget is already spent."""
+        remaining = _remaining(deadline)
+        if remaining is not None and remaining <= 0:
+            raise LLMProviderError(
+                node_name=node_name,
+                model=model,
+                message="LLM call timeout budget exhausted"
+                + (f" (last error: {last_exc})" if last_exc else ""),
+                original_exc=last_exc,
+            )
+        return remaining
+
+    @staticmethod
+    def _retry_delay(
+        attempt: int,
+        max_retries: int,
+        exc: Exception,
+        deadline: float | None,
+    ) -> float | None:
+        """Backoff before the next attempt, or ``None`` to give up now."""
+        if attempt == max_retries - 1:
+            return None
+        if not _is_transient(exc) and attempt >= 1:
+            return None
+        delay = _backoff_delay(attempt)
+        remaining = _remaining(deadline)
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
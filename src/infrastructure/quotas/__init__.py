@@ -0,0 +1,21 @@
+"""Per-tenant admission control – token buckets for jobs and LLM tokens."""
+
+from __future__ import annotations
+
+from .errors import QuotaExceededError
+from .in_memory_quota_store import InMemoryQuotaStore
+from .quota_store import QuotaStore, TenantState
+from .sqlite_quota_store import SqliteQuotaStore
+from .tenant_quotas import TenantQuotas, TenantUsage
+from .token_bucket import TokenBucket
+
+__all__ = [
+    "InMemoryQuotaStore",
+    "QuotaExceededError",
+    "QuotaStore",
+    "SqliteQuotaStore",
+    "TenantQuotas",
+    "TenantState",
+    "TenantUsage",
+    "TokenBucket",
+]
@@ -0,0 +1,20 @@
+"""Infrastructure-level exceptions for tenant quotas."""
+
+from __future__ import annotations
+
+
+class QuotaExceededError(Exception):
+    """Raised by ``TenantQuotas.admit`` when a tenant is over a rate limit.
+
+    ``limit`` names the exhausted bucket (``jobs`` or ``llm_tokens``);
+    ``retry_after`` is a whole-second estimate of when it refills enough.
+    """
+
+    def __init__(self, *, tenant_id: str, limit: str, retry_after: int) -> None:
+        self.tenant_id = tenant_id
+        self.limit = limit
+        self.retry_after = retry_after
+        super().__init__(
+            f"Tenant {tenant_id!r} exceeded its {limit} per minute quota; "
+            f"retry after {retry_after}s"
+        )
@@ -0,0 +1,61 @@
+"""In-memory QuotaStore – per process, bounded by idle time and tenant count."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+
+from .quota_store import StateUpdate, TenantState
+
+
+class InMemoryQuotaStore:
+    """Tenant states in least-recently-updated order.
+
+    Each ``update`` drops tenants idle for ``idle_seconds`` with nothing
+    reserved, then the least recently updated ones beyond ``max_tenants``
+    (reserved or not: memory is bounded first).  State is per process, so
+    several uvicorn workers each enforce the full limit.
+    """
+
+    def __init__(
+        self, *, idle_seconds: float = 3600.0, max_tenants: int = 10_000
+    ) -> None:
+        if idle_seconds <= 0:
+            raise ValueError("InMemoryQuotaStore: idle_seconds must be > 0")
+        if max_tenants <= 0:
+            raise ValueError("InMemoryQuotaStore: max_tenants must be > 0")
+        self._idle = idle_seconds
+        self._max_tenants = max_tenants
+        self._tenants: OrderedDict[str, TenantState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def update(self, tenant_id: str, fn: StateUpdate) -> TenantState:
+        with self._lock:
+            current = self._tenants.get(tenant_id)
+            state = fn(None if current is None else replace(current))
+            self._tenants[tenant_id] = state
+            self._tenants.move_to_end(tenant_id)
+            self._evict(now=state.updated_at)
+            return replace(state)
+
+    def get(self, tenant_id: str) -> TenantState | None:
+        with self._lock:
+            state = self._tenants.get(tenant_id)
+            return None if state is None else replace(state)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tenants)
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _evict(self, *, now: float) -> None:
+        """Drop idle tenants, then any over ``max_tenants``. Caller holds ``_lock``."""
+        while self._tenants:
+            tenant_id, oldest = next(iter(self._tenants.items()))
+            if oldest.updated_at > now - self._idle or oldest.reserved > 0:
+                break
+            del self._tenants[tenant_id]
+        while len(self._tenants) > self._max_tenants:
+            self._tenants.popitem(last=False)
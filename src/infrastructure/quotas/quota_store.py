@@ -0,0 +1,43 @@
+"""QuotaStore protocol – where per-tenant bucket levels and counters live."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Protocol, runtime_checkable
+
+
+@dataclass
+class TenantState:
+    """Persisted quota state of one tenant.
+
+    Bucket levels are as of ``updated_at`` (seconds on the quota clock);
+    ``None`` means that bucket is full (or disabled).
+    """
+
+    updated_at: float
+    jobs_level: float | None = None
+    tokens_level: float | None = None
+    reserved: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    tokens_total: int = 0
+
+
+# Receives the stored state (None for a new tenant) and returns the state to store.
+StateUpdate = Callable[[TenantState | None], TenantState]
+
+
+@runtime_checkable
+class QuotaStore(Protocol):
+    """Per-tenant quota state, shared by every process on the backend.
+
+    ``update`` applies a read-modify-write atomically with respect to
+    every other ``update`` of the same tenant, in any process.  Tenants
+    idle for ``idle_seconds`` with nothing reserved are dropped, so
+    arbitrary ``X-Tenant-ID`` values cannot grow the store without bound;
+    a dropped tenant starts again with full buckets.
+    """
+
+    def update(self, tenant_id: str, fn: StateUpdate) -> TenantState: ...
+
+    def get(self, tenant_id: str) -> TenantState | None: ...
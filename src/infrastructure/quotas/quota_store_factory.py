@@ -0,0 +1,27 @@
+"""Factory for selecting the tenant quota store backend based on settings."""
+
+from __future__ import annotations
+
+from src.settings import Settings
+
+from .quota_store import QuotaStore
+
+
+def get_quota_store(settings: Settings) -> QuotaStore:
+    """Return the quota store matching ``settings.JOB_STORE_BACKEND``."""
+    if settings.JOB_STORE_BACKEND == "memory":
+        from .in_memory_quota_store import InMemoryQuotaStore
+
+        return InMemoryQuotaStore(
+            idle_seconds=settings.TENANT_QUOTA_IDLE_SECONDS,
+            max_tenants=settings.TENANT_QUOTA_MAX_TENANTS,
+        )
+
+    if settings.JOB_STORE_BACKEND == "sqlite":
+        from .sqlite_quota_store import SqliteQuotaStore
+
+        return SqliteQuotaStore(
+            settings.JOB_STORE_PATH, idle_seconds=settings.TENANT_QUOTA_IDLE_SECONDS
+        )
+
+    raise ValueError(f"Unsupported job store backend: {settings.JOB_STORE_BACKEND!r}")
@@ -0,0 +1,130 @@
+"""SQLite QuotaStore – tenant buckets shared by every process on the database file."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+from .quota_store import StateUpdate, TenantState
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tenant_quotas (
+    tenant_id    TEXT PRIMARY KEY,
+    updated_at   REAL NOT NULL,
+    jobs_level   REAL,
+    tokens_level REAL,
+    reserved     INTEGER NOT NULL DEFAULT 0,
+    admitted     INTEGER NOT NULL DEFAULT 0,
+    rejected     INTEGER NOT NULL DEFAULT 0,
+    tokens_total INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS tenant_quotas_by_updated ON tenant_quotas (updated_at);
+"""
+
+_COLUMNS = (
+    "updated_at",
+    "jobs_level",
+    "tokens_level",
+    "reserved",
+    "admitted",
+    "rejected",
+    "tokens_total",
+)
+
+
+_UPSERT = (
+    f"INSERT OR REPLACE INTO tenant_quotas (tenant_id, {', '.join(_COLUMNS)}) "
+    f"VALUES (?{', ?' * len(_COLUMNS)})"
+)
+
+
+def _to_state(row: sqlite3.Row) -> TenantState:
+    return TenantState(**{column: row[column] for column in _COLUMNS})
+
+
+def _values(state: TenantState) -> tuple:
+    return tuple(getattr(state, column) for column in _COLUMNS)
+
+
+class SqliteQuotaStore:
+    """``tenant_quotas`` table next to the jobs in ``JOB_STORE_PATH``.
+
+    ``update`` reads and writes a tenant inside one ``BEGIN IMMEDIATE``
+    transaction, so every uvicorn worker or container on the file draws
+    from the same buckets.  Idle tenants are purged at most once per
+    ``purge_interval`` seconds, in the transaction of the next update.
+    Timestamps must come from a clock shared by those processes
+    (``TenantQuotas`` uses ``time.time``).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        idle_seconds: float = 3600.0,
+        purge_interval: float = 60.0,
+        busy_timeout: float = 5.0,
+    ) -> None:
+        if idle_seconds <= 0:
+            raise ValueError("SqliteQuotaStore: idle_seconds must be > 0")
+        self._path = str(path)
+        if self._path != ":memory:":
+            Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self._path,
+            timeout=busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._idle = idle_seconds
+        self._purge_interval = purge_interval
+        self._purged_at: float | None = None
+        self._lock = threading.Lock()
+
+    def update(self, tenant_id: str, fn: StateUpdate) -> TenantState:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM tenant_quotas WHERE tenant_id = ?", (tenant_id,)
+                ).fetchone()
+                state = fn(None if row is None else _to_state(row))
+                self._conn.execute(_UPSERT, (tenant_id, *_values(state)))
+                self._maybe_purge(now=state.updated_at)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return state
+
+    def get(self, tenant_id: str) -> TenantState | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM tenant_quotas WHERE tenant_id = ?", (tenant_id,)
+            ).fetchone()
+        return None if row is None else _to_state(row)
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM tenant_quotas").fetchone()
+        return row[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _maybe_purge(self, *, now: float) -> None:
+        """Delete idle tenants with nothing reserved. Caller holds ``_lock``."""
+        if self._purged_at is not None and now - self._purged_at < self._purge_interval:
+            return
+        self._purged_at = now
+        self._conn.execute(
+            "DELETE FROM tenant_quotas WHERE updated_at <= ? AND reserved = 0",
+            (now - self._idle,),
+        )
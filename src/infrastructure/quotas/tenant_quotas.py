@@ -0,0 +1,185 @@
+"""Per-tenant job and LLM-token rate limits, checked before a job is queued."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from .errors import QuotaExceededError
+from .in_memory_quota_store import InMemoryQuotaStore
+from .quota_store import QuotaStore, TenantState
+from .token_bucket import TokenBucket
+
+
+@dataclass(frozen=True)
+class TenantUsage:
+    """Point-in-time consumption of one tenant.
+
+    ``*_used`` is what the tenant consumed from the current per-minute
+    budget (refills continuously); ``*_total`` counts since the tenant was
+    first seen, or last dropped from the quota store for being idle.
+    ``llm_tokens_reserved`` is held for queued or running jobs whose
+    actual usage is not settled yet.
+    """
+
+    tenant_id: str
+    jobs_per_minute: int | None
+    jobs_used: float
+    llm_tokens_per_minute: int | None
+    llm_tokens_used: float
+    llm_tokens_reserved: int
+    jobs_admitted_total: int
+    jobs_rejected_total: int
+    llm_tokens_total: int
+
+
+class TenantQuotas:
+    """Token buckets per tenant for jobs/minute and LLM tokens/minute.
+
+    ``admit`` takes one job and a token *estimate* for the job, or raises
+    ``QuotaExceededError`` without taking anything.  A job's LLM usage is
+    only known once it has run, so the runner calls ``settle`` with the
+    actual count: the difference is refunded or charged (a tenant whose
+    estimates were too low goes into debt and waits longer next time).
+    ``release`` returns an admission whose job never ran.  A limit of
+    ``None`` disables that bucket.
+
+    Bucket levels and counters live in *store* (default: in memory, per
+    process); a ``SqliteQuotaStore`` shares them between processes, which
+    then needs a wall *clock*.  Each call is one atomic store update.
+    """
+
+    def __init__(
+        self,
+        *,
+        jobs_per_minute: int | None,
+        llm_tokens_per_minute: int | None,
+        tokens_per_word: float = 8.0,
+        store: QuotaStore | None = None,
+        clock=time.time,
+    ) -> None:
+        self._jobs_per_minute = jobs_per_minute
+        self._tokens_per_minute = llm_tokens_per_minute
+        self._tokens_per_word = tokens_per_word
+        self._store = InMemoryQuotaStore() if store is None else store
+        self._clock = clock
+
+    def estimate_tokens(self, target_word_count: int) -> int:
+        """Rough LLM tokens (prompts + outputs, all nodes) for one article."""
+        return int(target_word_count * self._tokens_per_word)
+
+    def admit(self, tenant_id: str, *, estimated_tokens: int) -> int:
+        """Take one job and *estimated_tokens*; return the tokens reserved.
+
+        The estimate is capped at one minute's budget so a single large
+        job is still admissible.  Raises ``QuotaExceededError``.
+        """
+        reserve = estimated_tokens
+        rejected: QuotaExceededError | None = None
+
+        def _admit(stored: TenantState | None) -> TenantState:
+            nonlocal reserve, rejected
+            state, jobs, tokens = self._load(stored)
+            if tokens is not None:
+                reserve = min(estimated_tokens, int(tokens.capacity))
+            if jobs is not None and jobs.level < 1:
+                rejected = QuotaExceededError(
+                    tenant_id=tenant_id, limit="jobs", retry_after=jobs.seconds_until(1)
+                )
+            elif tokens is not None and not tokens.try_take(reserve):
+                rejected = QuotaExceededError(
+                    tenant_id=tenant_id,
+                    limit="llm_tokens",
+                    retry_after=tokens.seconds_until(reserve),
+                )
+            if rejected is not None:
+                state.rejected += 1
+            else:
+                if jobs is not None:
+                    jobs.try_take(1)
+                state.reserved += reserve
+                state.admitted += 1
+            return self._save(state, jobs, tokens)
+
+        self._store.update(tenant_id, _admit)
+        if rejected is not None:
+            raise rejected
+        return reserve
+
+    def settle(self, tenant_id: str, *, reserved: int, actual_tokens: int) -> None:
+        """Replace a job's token reservation with its *actual_tokens*."""
+
+        def _settle(stored: TenantState | None) -> TenantState:
+            state, jobs, tokens = self._load(stored)
+            state.reserved = max(state.reserved - reserved, 0)
+            state.tokens_total += actual_tokens
+            if tokens is not None:
+                tokens.adjust(reserved - actual_tokens)
+            return self._save(state, jobs, tokens)
+
+        self._store.update(tenant_id, _settle)
+
+    def release(self, tenant_id: str, *, reserved: int) -> None:
+        """Undo an ``admit`` whose job was never queued or never started."""
+
+        def _release(stored: TenantState | None) -> TenantState:
+            state, jobs, tokens = self._load(stored)
+            state.reserved = max(state.reserved - reserved, 0)
+            state.admitted = max(state.admitted - 1, 0)
+            if jobs is not None:
+                jobs.adjust(1)
+            if tokens is not None:
+                tokens.adjust(reserved)
+            return self._save(state, jobs, tokens)
+
+        self._store.update(tenant_id, _release)
+
+    def usage(self, tenant_id: str) -> TenantUsage:
+        """Return current consumption for *tenant_id* (zeros if never seen).
+
+        Read-only: looking up an unknown tenant does not store it.
+        """
+        state, jobs, tokens = self._load(self._store.get(tenant_id))
+        return TenantUsage(
+            tenant_id=tenant_id,
+            jobs_per_minute=self._jobs_per_minute,
+            jobs_used=_used(jobs),
+            llm_tokens_per_minute=self._tokens_per_minute,
+            llm_tokens_used=_used(tokens),
+            llm_tokens_reserved=state.reserved,
+            jobs_admitted_total=state.admitted,
+            jobs_rejected_total=state.rejected,
+            llm_tokens_total=state.tokens_total,
+        )
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _load(
+        self, stored: TenantState | None
+    ) -> tuple[TenantState, TokenBucket | None, TokenBucket | None]:
+        """Rebuild a tenant's buckets from *stored* (full buckets if ``None``)."""
+        state = TenantState(updated_at=self._clock()) if stored is None else stored
+        updated = state.updated_at
+        jobs = self._bucket(self._jobs_per_minute, state.jobs_level, updated)
+        tokens = self._bucket(self._tokens_per_minute, state.tokens_level, updated)
+        return state, jobs, tokens
+
+    def _save(
+        self, state: TenantState, jobs: TokenBucket | None, tokens: TokenBucket | None
+    ) -> TenantState:
+        """Write the buckets' current levels back into *state*."""
+        state.jobs_level = None if jobs is None else jobs.level
+        state.tokens_level = None if tokens is None else tokens.level
+        state.updated_at = self._clock()
+        return state
+
+    def _bucket(
+        self, per_minute: int | None, level: float | None, updated: float
+    ) -> TokenBucket | None:
+        if per_minute is None:
+            return None
+        return TokenBucket(per_minute, clock=self._clock, level=level, updated=updated)
+
+
+def _used(bucket: TokenBucket | None) -> float:
+    return 0.0 if bucket is None else round(bucket.capacity - bucket.level, 1)
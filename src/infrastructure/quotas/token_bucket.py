@@ -0,0 +1,64 @@
+"""Token bucket refilled continuously at a per-minute rate."""
+
+from __future__ import annotations
+
+import math
+import time
+
+
+class TokenBucket:
+    """Holds up to ``per_minute`` tokens, refilling ``per_minute / 60`` per second.
+
+    ``try_take`` is all-or-nothing.  ``adjust`` moves the level by a signed
+    amount without the check, so actual usage can be settled after the
+    fact; the level may go negative (debt), which delays later takes.  Not
+    thread-safe on its own: ``TenantQuotas`` serializes access.  *level*
+    and *updated* restore a bucket saved earlier (default: full, now).
+    """
+
+    def __init__(
+        self,
+        per_minute: float,
+        *,
+        clock=time.monotonic,
+        level: float | None = None,
+        updated: float | None = None,
+    ) -> None:
+        if per_minute <= 0:
+            raise ValueError("TokenBucket: per_minute must be > 0")
+        self.capacity = float(per_minute)
+        self._rate = per_minute / 60.0
+        self._clock = clock
+        self._level = self.capacity if level is None else level
+        self._updated = clock() if updated is None else updated
+
+    @property
+    def level(self) -> float:
+        """Tokens available now (negative while in debt)."""
+        self._refill()
+        return self._level
+
+    def try_take(self, amount: float) -> bool:
+        """Take *amount* tokens if available. Returns whether it did."""
+        self._refill()
+        if self._level < amount:
+            return False
+        self._level -= amount
+        return True
+
+    def adjust(self, amount: float) -> None:
+        """Add *amount* tokens (negative to charge), capped at capacity."""
+        self._refill()
+        self._level = min(self.capacity, self._level + amount)
+
+    def seconds_until(self, amount: float) -> int:
+        """Whole seconds until *amount* tokens are available (at least 1)."""
+        missing = amount - self.level
+        return max(1, math.ceil(missing / self._rate))
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._level = min(
+            self.capacity, self._level + (now - self._updated) * self._rate
+        )
+        self._updated = now
@@ -0,0 +1,38 @@
+"""Checkpoint serializer shared by the job stores' LangGraph savers."""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import pkgutil
+from enum import Enum
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from pydantic import BaseModel
+
+import src.domain.models as _domain_models
+
+
+def checkpoint_serde() -> JsonPlusSerializer:
+    """Return a serializer that registers every domain model for msgpack.
+
+    Graph state is made of ``src.domain.models`` types.  Listing them lets
+    checkpoints be read back (``get_state``, resume) without LangGraph's
+    "unregistered type" warnings, and blocks any other class from being
+    revived out of a checkpoint.  There is no pickle fallback: the SQLite
+    checkpoint file can sit on a shared volume, and a "pickle" blob
+    written there must not run code when a job resumes.
+    """
+    return JsonPlusSerializer(allowed_msgpack_modules=_domain_types())
+
+
+def _domain_types() -> list[type]:
+    types: list[type] = []
+    for info in pkgutil.iter_modules(_domain_models.__path__):
+        module = importlib.import_module(f"{_domain_models.__name__}.{info.name}")
+        types.extend(
+            obj
+            for _, obj in inspect.getmembers(module, inspect.isclass)
+            if obj.__module__ == module.__name__ and issubclass(obj, (BaseModel, Enum))
+        )
+    return types
@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import bisect
+import hashlib
 import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Collection
 
 from pydantic import BaseModel
 
 from langgraph.checkpoint.memory import InMemorySaver
-from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.store.memory import InMemoryStore
 
 from src.domain.models.job import JobRecord, JobStatus
 from src.domain.models.job_input import JobInput
 from src.domain.models.output import SeoArticleOutput
+from src.infrastructure.metrics.timed_lock import timed_lock
+
+from .checkpoint_serde import checkpoint_serde
+from .job_store import IndexKey, JobWatcher
+
+if TYPE_CHECKING:
+    from src.infrastructure.metrics.pipeline_metrics import PipelineMetrics
 
 
 class StoredJobState(BaseModel):
@@ -29,7 +40,9 @@ class StoredJobState(BaseModel):
     current_node: str | None = None
     error: str | None = None
     result: SeoArticleOutput | None = None
+    result_hash: str | None = None
     updated_at: datetime
+    version: int = 1
 
 
 _JOBS_NS: tuple[str, ...] = ("jobs",)
@@ -43,6 +56,9 @@ def _to_record(state: StoredJobState) -> JobRecord:
         current_node=state.current_node,
         error=state.error,
         result=state.result,
+        result_hash=state.result_hash,
+        version=state.version,
+        updated_at=state.updated_at,
     )
 
 
@@ -53,6 +69,37 @@ class InMemoryJobStore:
     ``InMemorySaver`` is held here so Module 7 can share it when
     compiling the graph -- but this class never calls ``put()`` on the
     saver directly.
+
+    The JSON bytes of completed results (with their content hash) are
+    cached for the most recent ``result_cache_size`` jobs, so the result
+    endpoint can return them without rebuilding or re-serializing the
+    model.
+
+    Locking is striped by job: a write holds its job's stripe (one of
+    ``lock_stripes``) across the read-modify-write, so Pydantic
+    validation, serialization and the KV put of different jobs run under
+    different locks, and no lock is shared between writes to different
+    jobs.  Sorted ``(updated_at, job_id)`` indexes -- one over all jobs
+    and one per status -- serve ``list_jobs`` without scanning the
+    namespace.  A write does not touch them: it records the job's new
+    index entry in its stripe's change set, which keeps only the latest
+    entry per job.  A listing takes ``_index_lock``, drains every
+    stripe's changes into the indexes (holding each stripe only for the
+    swap), then slices its page, so a page costs O(log n + limit) plus
+    the jobs changed since the previous listing.  The result cache has
+    its own lock, taken only when a write completes a job or moves it out
+    of ``completed``; watchers and idempotency keys have theirs.  Reads
+    take no lock: a KV put replaces the whole item, so ``get`` always
+    sees one complete version.
+
+    Writes to different jobs never wait for each other.  On a GIL build
+    pure-Python writes still run one at a time, so their throughput only
+    grows with threads where a write blocks without the GIL
+    (``scripts/bench_job_store_concurrency.py``).
+
+    With ``metrics``, the wait for every store lock is observed on each
+    acquisition.  Each lock records into its own ``split`` part of the
+    histogram, so timing adds no lock shared between stripes.
     """
 
     def __init__(
@@ -60,11 +107,42 @@ class InMemoryJobStore:
         *,
         store: InMemoryStore | None = None,
         saver: InMemorySaver | None = None,
+        result_cache_size: int = 1024,
+        lock_stripes: int = 64,
+        metrics: PipelineMetrics | None = None,
     ) -> None:
+        if lock_stripes <= 0:
+            raise ValueError("InMemoryJobStore: lock_stripes must be > 0")
         self._store = store or InMemoryStore()
-        serde = JsonPlusSerializer(pickle_fallback=True)
-        self._saver = saver or InMemorySaver(serde=serde)
-        self._lock = threading.Lock()
+        self._saver = saver or InMemorySaver(serde=checkpoint_serde())
+        observers = self._lock_observers(metrics, lock_stripes + 4)
+        self._stripes = [
+            timed_lock(threading.Lock(), observers[i]) for i in range(lock_stripes)
+        ]
+        # Per stripe, guarded by it: job_id -> status, and job_id -> latest
+        # (index key, status, stored value), or None once deleted, not yet
+        # moved into the indexes.
+        self._statuses: list[dict[str, JobStatus]] = [{} for _ in self._stripes]
+        self._changed: list[dict[str, tuple[IndexKey, JobStatus, dict] | None]] = [
+            {} for _ in self._stripes
+        ]
+        self._index_lock = timed_lock(threading.Lock(), observers[lock_stripes])
+        self._cache_lock = timed_lock(threading.Lock(), observers[lock_stripes + 1])
+        self._watch_lock = timed_lock(threading.Lock(), observers[lock_stripes + 2])
+        self._idempotency_lock = timed_lock(
+            threading.Lock(), observers[lock_stripes + 3]
+        )
+        self._watchers: dict[str, list[JobWatcher]] = {}
+        # Guarded by _index_lock.  None -> all jobs; JobStatus -> jobs
+        # currently in that status.
+        self._indexes: dict[JobStatus | None, list[IndexKey]] = {None: []}
+        # job_id -> (index key, status, stored value), for page snapshots.
+        self._indexed: dict[str, tuple[IndexKey, JobStatus, dict]] = {}
+        self._result_cache_size = result_cache_size
+        # job_id -> (serialized result JSON, content hash), LRU order.
+        self._result_json: OrderedDict[str, tuple[bytes, str]] = OrderedDict()
+        # idempotency key -> (job_id, fingerprint, expires_at), oldest first.
+        self._idempotency: OrderedDict[str, tuple[str, str, float]] = OrderedDict()
 
     @property
     def store(self) -> InMemoryStore:
@@ -78,8 +156,104 @@ class InMemoryJobStore:
 
     # -- internal helpers ----------------------------------------------------
 
-    def _save(self, state: StoredJobState) -> None:
-        self._store.put(_JOBS_NS, state.job_id, state.model_dump(mode="json"))
+    @staticmethod
+    def _lock_observers(
+        metrics: PipelineMetrics | None, count: int
+    ) -> list[Callable[[float], None] | None]:
+        """One lock-wait recorder per lock, each on its own histogram part."""
+        if metrics is None:
+            return [None] * count
+        parts = metrics.store_lock_wait.labels("memory").split(count)
+        return [part.observe for part in parts]
+
+    def _slot(self, job_id: str) -> int:
+        """Index of *job_id*'s stripe."""
+        return hash(job_id) % len(self._stripes)
+
+    def _stripe(self, job_id: str) -> Any:
+        """The lock serializing writes to *job_id*."""
+        return self._stripes[self._slot(job_id)]
+
+    def _save(
+        self, state: StoredJobState, result_json: tuple[bytes, str] | None = None
+    ) -> None:
+        """Save *state*, queue its index entry, cache *result_json*.
+
+        Caller holds the job's stripe.
+        """
+        value = state.model_dump(mode="json")
+        self._store.put(_JOBS_NS, state.job_id, value)
+        slot = self._slot(state.job_id)
+        previous = self._statuses[slot].get(state.job_id)
+        self._statuses[slot][state.job_id] = state.status
+        self._changed[slot][state.job_id] = (
+            (state.updated_at, state.job_id),
+            state.status,
+            value,
+        )
+        if result_json is not None:
+            with self._cache_lock:
+                self._cache_result_json(state.job_id, *result_json)
+        elif previous == JobStatus.COMPLETED and state.status != JobStatus.COMPLETED:
+            with self._cache_lock:
+                self._result_json.pop(state.job_id, None)
+
+    def _catch_up(self) -> None:
+        """Move every stripe's queued changes into the indexes.
+
+        Caller holds ``_index_lock``.  Each stripe is held only to swap out
+        its change set; stripes are drained one at a time, in order, so a
+        job's entries are always applied oldest first.
+        """
+        for slot, stripe in enumerate(self._stripes):
+            if not self._changed[slot]:
+                continue
+            with stripe:
+                changed, self._changed[slot] = self._changed[slot], {}
+            for job_id, entry in changed.items():
+                self._unindex(job_id)
+                if entry is None:
+                    continue
+                key, status, _ = entry
+                bisect.insort(self._indexes[None], key)
+                bisect.insort(self._indexes.setdefault(status, []), key)
+                self._indexed[job_id] = entry
+
+    def _unindex(self, job_id: str) -> None:
+        """Drop *job_id* from the indexes. Caller holds ``_index_lock``."""
+        entry = self._indexed.pop(job_id, None)
+        if entry is None:
+            return
+        key, status, _ = entry
+        for index in (self._indexes[None], self._indexes[status]):
+            i = bisect.bisect_left(index, key)
+            if i < len(index) and index[i] == key:
+                del index[i]
+
+    def _cache_result_json(
+        self, job_id: str, result_json: bytes, result_hash: str
+    ) -> None:
+        """Remember result bytes, evicting the LRU. Caller holds ``_cache_lock``."""
+        if self._result_cache_size <= 0:
+            return
+        self._result_json[job_id] = (result_json, result_hash)
+        self._result_json.move_to_end(job_id)
+        while len(self._result_json) > self._result_cache_size:
+            self._result_json.popitem(last=False)
+
+    def _page(
+        self, status: JobStatus | None, after: IndexKey | None, limit: int
+    ) -> list[tuple[IndexKey, dict]]:
+        """Snapshot up to *limit* ``(key, value)`` pairs after *after*."""
+        with self._index_lock:
+            self._catch_up()
+            index = self._indexes.get(status)
+            if not index:
+                return []
+            start = 0 if after is None else bisect.bisect_right(index, after)
+            return [
+                (key, self._indexed[key[1]][2]) for key in index[start : start + limit]
+            ]
 
     def _load(self, job_id: str) -> StoredJobState:
         item = self._store.get(_JOBS_NS, job_id)
@@ -88,11 +262,33 @@ class InMemoryJobStore:
         return StoredJobState.model_validate(item.value)
 
     def _update(self, state: StoredJobState, **fields: object) -> StoredJobState:
-        """Return a new validated state with *fields* merged in."""
+        """Return a new validated state with *fields* merged in and version bumped."""
         return StoredJobState.model_validate(
-            state.model_dump() | {"updated_at": datetime.now(timezone.utc)} | fields
+            state.model_dump()
+            | {"updated_at": datetime.now(timezone.utc), "version": state.version + 1}
+            | fields
         )
 
+    def _write(self, job_id: str, **fields: object) -> JobRecord:
+        """Merge *fields* into the job under its stripe, then notify watchers."""
+        with self._stripe(job_id):
+            state = self._update(self._load(job_id), **fields)
+            self._save(state)
+        record = _to_record(state)
+        self._notify(record)
+        return record
+
+    def _notify(self, record: JobRecord) -> None:
+        """Call watchers of *record*'s job. Must be called without a store lock held."""
+        # Unwatched jobs (most writes) skip the shared lock.  A watcher added
+        # concurrently re-reads the job after registering, so it misses nothing.
+        if record.id not in self._watchers:
+            return
+        with self._watch_lock:
+            watchers = list(self._watchers.get(record.id, ()))
+        for callback in watchers:
+            callback(record)
+
     # -- public API ----------------------------------------------------------
 
     def create(self, job_id: str) -> JobRecord:
@@ -100,7 +296,7 @@ class InMemoryJobStore:
 
         Raises ``ValueError`` if *job_id* already exists (idempotency guard).
         """
-        with self._lock:
+        with self._stripe(job_id):
             if self._store.get(_JOBS_NS, job_id) is not None:
                 raise ValueError(f"Job '{job_id}' already exists")
             state = StoredJobState(
@@ -112,16 +308,12 @@ class InMemoryJobStore:
         return _to_record(state)
 
     def get(self, job_id: str) -> JobRecord:
-        """Retrieve current job record."""
-        with self._lock:
-            return _to_record(self._load(job_id))
+        """Retrieve current job record. Lock-free (see class docstring)."""
+        return _to_record(self._load(job_id))
 
     def set_input(self, job_id: str, job_input: JobInput) -> JobRecord:
         """Store job input (topic, target_word_count, language)."""
-        with self._lock:
-            state = self._update(self._load(job_id), input=job_input)
-            self._save(state)
-            return _to_record(state)
+        return self._write(job_id, input=job_input)
 
     def set_status(
         self,
@@ -130,42 +322,220 @@ class InMemoryJobStore:
         current_node: str | None = None,
     ) -> JobRecord:
         """Update job status and optionally the current node."""
-        with self._lock:
-            state = self._update(
-                self._load(job_id), status=status, current_node=current_node,
-            )
+        return self._write(job_id, status=status, current_node=current_node)
+
+    def compare_and_set_status(
+        self,
+        job_id: str,
+        expected: Collection[JobStatus],
+        status: JobStatus,
+        current_node: str | None = None,
+    ) -> JobRecord | None:
+        """Set *status* only if the job is currently in *expected*.
+
+        Returns the updated record, or ``None`` (nothing written) when the
+        job's status is not in *expected*.  *current_node* replaces the
+        stored node only when given.
+        """
+        fields: dict[str, object] = {"status": status}
+        if current_node is not None:
+            fields["current_node"] = current_node
+        with self._stripe(job_id):
+            state = self._load(job_id)
+            if state.status not in expected:
+                return None
+            state = self._update(state, **fields)
             self._save(state)
-            return _to_record(state)
+        record = _to_record(state)
+        self._notify(record)
+        return record
 
     def set_current_node(self, job_id: str, current_node: str) -> JobRecord:
         """Update the node currently being executed."""
-        with self._lock:
-            state = self._update(self._load(job_id), current_node=current_node)
-            self._save(state)
-            return _to_record(state)
+        return self._write(job_id, current_node=current_node)
 
     def set_error(self, job_id: str, error: str) -> JobRecord:
         """Mark job as failed with an error message."""
-        with self._lock:
-            state = self._update(
-                self._load(job_id), status=JobStatus.FAILED, error=error,
-            )
-            self._save(state)
-            return _to_record(state)
+        return self._write(job_id, status=JobStatus.FAILED, error=error)
 
     def set_result(self, job_id: str, result: SeoArticleOutput) -> JobRecord:
-        """Mark job as completed with the final output."""
-        with self._lock:
+        """Mark job as completed with the final output and its content hash."""
+        return self._write_result(job_id, result)
+
+    def compare_and_set_result(
+        self,
+        job_id: str,
+        expected: Collection[JobStatus],
+        result: SeoArticleOutput,
+    ) -> JobRecord | None:
+        """Complete the job with *result* only if it is currently in *expected*.
+
+        Check and write happen under the job's stripe.  Returns ``None``
+        (nothing written) when the job's status is not in *expected*.
+        """
+        return self._write_result(job_id, result, expected=expected)
+
+    def _write_result(
+        self,
+        job_id: str,
+        result: SeoArticleOutput,
+        *,
+        expected: Collection[JobStatus] | None = None,
+    ) -> JobRecord | None:
+        result_json = result.model_dump_json().encode()
+        result_hash = hashlib.sha256(result_json).hexdigest()
+        with self._stripe(job_id):
+            state = self._load(job_id)
+            if expected is not None and state.status not in expected:
+                return None
             state = self._update(
-                self._load(job_id),
+                state,
                 status=JobStatus.COMPLETED,
                 result=result,
+                result_hash=result_hash,
                 error=None,
             )
-            self._save(state)
-            return _to_record(state)
+            self._save(state, (result_json, result_hash))
+        record = _to_record(state)
+        self._notify(record)
+        return record
+
+    def get_result_json(self, job_id: str) -> tuple[bytes, str] | None:
+        """Return (result JSON bytes, content hash) for a completed job.
+
+        Served from the cache when possible; otherwise the stored result is
+        serialized once (outside every lock) and cached.  ``None`` if the
+        job is not completed; raises ``KeyError`` if it does not exist.
+        """
+        with self._cache_lock:
+            cached = self._result_json.get(job_id)
+            if cached is not None:
+                self._result_json.move_to_end(job_id)
+                return cached
+        state = self._load(job_id)
+        if state.status != JobStatus.COMPLETED or state.result is None:
+            return None
+        result_json = state.result.model_dump_json().encode()
+        result_hash = state.result_hash or hashlib.sha256(result_json).hexdigest()
+        with self._stripe(job_id):
+            current = self._store.get(_JOBS_NS, job_id)
+            # Cache only if the job was not rewritten while we serialized.
+            if current is not None and current.value["version"] == state.version:
+                with self._cache_lock:
+                    self._cache_result_json(job_id, result_json, result_hash)
+        return result_json, result_hash
+
+    def watch(self, job_id: str, callback: JobWatcher) -> Callable[[], None]:
+        """Call *callback* with the new record after each change to *job_id*.
+
+        The callback runs on the writer's thread and must not block.
+        Returns a function that removes the watcher.
+        """
+        with self._watch_lock:
+            self._watchers.setdefault(job_id, []).append(callback)
+
+        def _unwatch() -> None:
+            with self._watch_lock:
+                watchers = self._watchers.get(job_id, [])
+                if callback in watchers:
+                    watchers.remove(callback)
+                if not watchers:
+                    self._watchers.pop(job_id, None)
+
+        return _unwatch
+
+    def list_jobs(
+        self,
+        *,
+        status: JobStatus | None = None,
+        after: IndexKey | None = None,
+        limit: int,
+    ) -> list[JobRecord]:
+        """Return up to *limit* jobs in ascending ``updated_at`` order.
+
+        *after* is the ``(updated_at, job_id)`` of the last job on the
+        previous page; only jobs strictly after it are returned.  The page
+        is snapshotted under ``_index_lock`` after catching the indexes up
+        with every write that finished before the call; validation runs
+        outside it.
+        """
+        return [
+            _to_record(StoredJobState.model_validate(value))
+            for _, value in self._page(status, after, limit)
+        ]
+
+    def list_result_json(
+        self, *, after: IndexKey | None = None, limit: int
+    ) -> list[tuple[IndexKey, bytes, str]]:
+        """Return up to *limit* completed results in ascending ``updated_at`` order.
+
+        Each item is ``((updated_at, job_id), result JSON, content hash)``.
+        Cached bytes are reused; the rest are serialized outside the locks
+        and not cached, so a bulk export does not evict the hot results.
+        """
+        page = self._page(JobStatus.COMPLETED, after, limit)
+        with self._cache_lock:
+            cached = [self._result_json.get(key[1]) for key, _ in page]
+        rows = []
+        for (key, value), hit in zip(page, cached):
+            # The cache may already hold a newer result than the snapshot.
+            if hit is None or hit[1] != value.get("result_hash"):
+                state = StoredJobState.model_validate(value)
+                if state.result is None:
+                    continue
+                result_json = state.result.model_dump_json().encode()
+                hit = (
+                    result_json,
+                    state.result_hash or hashlib.sha256(result_json).hexdigest(),
+                )
+            rows.append((key, *hit))
+        return rows
+
+    def claim_idempotency_key(
+        self, key: str, job_id: str, fingerprint: str, ttl_seconds: float
+    ) -> tuple[str, str]:
+        """Map *key* to *job_id* unless a live mapping exists.
+
+        Returns the (job_id, fingerprint) that owns *key* afterwards: the
+        arguments if this call claimed it, otherwise the earlier claim.
+        """
+        now = time.time()
+        with self._idempotency_lock:
+            self._purge_idempotency(now)
+            entry = self._idempotency.get(key)
+            if entry is not None and entry[2] > now:
+                return entry[0], entry[1]
+            self._idempotency[key] = (job_id, fingerprint, now + ttl_seconds)
+            self._idempotency.move_to_end(key)
+            return job_id, fingerprint
+
+    def release_idempotency_key(self, key: str, job_id: str) -> None:
+        """Forget *key* if it still maps to *job_id* (e.g. the job was discarded)."""
+        with self._idempotency_lock:
+            entry = self._idempotency.get(key)
+            if entry is not None and entry[0] == job_id:
+                del self._idempotency[key]
+
+    def _purge_idempotency(self, now: float) -> None:
+        """Drop expired keys from the front. Caller holds ``_idempotency_lock``.
+
+        Keys are kept in claim order, so with a fixed TTL the oldest expire
+        first and the scan stops at the first live one.
+        """
+        while self._idempotency:
+            key, (_, _, expires_at) = next(iter(self._idempotency.items()))
+            if expires_at > now:
+                break
+            del self._idempotency[key]
 
     def delete(self, job_id: str) -> None:
         """Remove a job entry. No-op if it doesn't exist."""
-        with self._lock:
+        slot = self._slot(job_id)
+        with self._stripes[slot]:
             self._store.delete(_JOBS_NS, job_id)
+            previous = self._statuses[slot].pop(job_id, None)
+            if previous is not None:
+                self._changed[slot][job_id] = None
+            if previous == JobStatus.COMPLETED:
+                with self._cache_lock:
+                    self._result_json.pop(job_id, None)
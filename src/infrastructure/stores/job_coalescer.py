@@ -0,0 +1,105 @@
+"""Singleflight registry that lets identical concurrent jobs share one execution."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Callable
+
+from src.domain.models.job import JobRecord
+from src.domain.models.job_input import JobInput
+from src.logging_config import get_logger
+
+_logger = get_logger(__name__)
+
+# Called with the leader's final record once its run ends.
+FollowerCallback = Callable[[JobRecord], None]
+
+
+def coalesce_key(job_input: JobInput) -> str:
+    """Jobs with equal keys produce interchangeable articles on the same schedule.
+
+    Priority and deadline are part of the key, so a job never waits on a
+    leader queued in a slower lane or running under a looser deadline.
+    """
+    topic = " ".join(job_input.topic.split()).casefold()
+    return "|".join(
+        (
+            topic,
+            job_input.language.strip().casefold(),
+            str(job_input.target_word_count),
+            job_input.priority.value,
+            f"{job_input.deadline_seconds or 0:g}",
+        )
+    )
+
+
+@dataclass
+class _Flight:
+    leader: str
+    followers: dict[str, FollowerCallback] = field(default_factory=dict)
+
+
+class JobCoalescer:
+    """Coalesce identical in-flight jobs onto one leader execution.
+
+    The first job to ``join`` a key leads: it runs the graph and calls
+    ``finish`` with its final record when the run ends.  Jobs joining
+    while it is in flight follow: they do not run, and their callback
+    receives the leader's final record (to copy its result, or to run on
+    their own if the leader did not complete).  Only jobs in this process
+    are coalesced.  Thread-safe; callbacks run on the leader's worker,
+    outside the lock.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def join(self, key: str, job_id: str, on_done: FollowerCallback) -> str | None:
+        """Follow the in-flight leader for *key*, or become it.
+
+        Returns the leader's job id when *job_id* now follows it, or
+        ``None`` when *job_id* leads and must call ``finish`` once its run
+        ends, or at once if it could not be started.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                self._flights[key] = _Flight(leader=job_id)
+                return None
+            flight.followers[job_id] = on_done
+            return flight.leader
+
+    def leader_of(self, job_id: str) -> str | None:
+        """The leader *job_id* is waiting on, if it is a follower."""
+        with self._lock:
+            for flight in self._flights.values():
+                if job_id in flight.followers:
+                    return flight.leader
+        return None
+
+    def finish(self, key: str, record: JobRecord) -> None:
+        """End the flight led by ``record.id`` and hand *record* to its followers."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None or flight.leader != record.id:
+                return
+            del self._flights[key]
+        for job_id, on_done in flight.followers.items():
+            try:
+                on_done(record)
+            except Exception:
+                _logger.exception(
+                    "Follower %s of job %s failed to settle", job_id, record.id
+                )
+
+    def close(self) -> list[str]:
+        """Drop every flight without notifying anyone; return the follower ids."""
+        with self._lock:
+            flights, self._flights = self._flights, {}
+        return [job_id for flight in flights.values() for job_id in flight.followers]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._flights)
@@ -0,0 +1,93 @@
+"""Job store interface shared by the in-memory and SQLite backends."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Callable, Collection, Protocol
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+from src.domain.models.job import JobRecord, JobStatus
+from src.domain.models.job_input import JobInput
+from src.domain.models.output import SeoArticleOutput
+
+# Called with the updated record after every change to a watched job.
+JobWatcher = Callable[[JobRecord], None]
+
+# Position of a job in the listing indexes: ordered by update time, then id.
+IndexKey = tuple[datetime, str]
+
+
+class JobStore(Protocol):
+    """Structural interface every job store must satisfy.
+
+    Every write bumps the job's ``version`` and ``updated_at``.
+    ``claim_idempotency_key`` maps a client key to the first job created
+    with it (plus a request fingerprint) until ``ttl_seconds`` pass, and
+    returns whichever job owns the key.  ``list_result_json`` pages
+    through completed jobs like ``list_jobs`` but yields each result's
+    ``(position, JSON bytes, content hash)`` instead of the record.  ``saver``
+    is the LangGraph checkpointer that shares the store's durability, so
+    graph checkpoints live wherever job metadata does.
+    """
+
+    @property
+    def saver(self) -> BaseCheckpointSaver: ...
+
+    def create(self, job_id: str) -> JobRecord: ...
+
+    def get(self, job_id: str) -> JobRecord: ...
+
+    def set_input(self, job_id: str, job_input: JobInput) -> JobRecord: ...
+
+    def set_status(
+        self,
+        job_id: str,
+        status: JobStatus,
+        current_node: str | None = None,
+    ) -> JobRecord: ...
+
+    def compare_and_set_status(
+        self,
+        job_id: str,
+        expected: Collection[JobStatus],
+        status: JobStatus,
+        current_node: str | None = None,
+    ) -> JobRecord | None: ...
+
+    def set_current_node(self, job_id: str, current_node: str) -> JobRecord: ...
+
+    def set_error(self, job_id: str, error: str) -> JobRecord: ...
+
+    def set_result(self, job_id: str, result: SeoArticleOutput) -> JobRecord: ...
+
+    def compare_and_set_result(
+        self,
+        job_id: str,
+        expected: Collection[JobStatus],
+        result: SeoArticleOutput,
+    ) -> JobRecord | None: ...
+
+    def get_result_json(self, job_id: str) -> tuple[bytes, str] | None: ...
+
+    def list_jobs(
+        self,
+        *,
+        status: JobStatus | None = None,
+        after: IndexKey | None = None,
+        limit: int,
+    ) -> list[JobRecord]: ...
+
+    def list_result_json(
+        self, *, after: IndexKey | None = None, limit: int
+    ) -> list[tuple[IndexKey, bytes, str]]: ...
+
+    def watch(self, job_id: str, callback: JobWatcher) -> Callable[[], None]: ...
+
+    def claim_idempotency_key(
+        self, key: str, job_id: str, fingerprint: str, ttl_seconds: float
+    ) -> tuple[str, str]: ...
+
+    def release_idempotency_key(self, key: str, job_id: str) -> None: ...
+
+    def delete(self, job_id: str) -> None: ...
@@ -0,0 +1,29 @@
+"""Factory for selecting the job store backend based on settings."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.settings import Settings
+
+from .job_store import JobStore
+
+if TYPE_CHECKING:
+    from src.infrastructure.metrics.pipeline_metrics import PipelineMetrics
+
+
+def get_job_store(
+    settings: Settings, *, metrics: PipelineMetrics | None = None
+) -> JobStore:
+    """Return the job store indicated by ``settings.JOB_STORE_BACKEND``."""
+    if settings.JOB_STORE_BACKEND == "memory":
+        from .in_memory_job_store import InMemoryJobStore
+
+        return InMemoryJobStore(metrics=metrics)
+
+    if settings.JOB_STORE_BACKEND == "sqlite":
+        from .sqlite_job_store import SqliteJobStore
+
+        return SqliteJobStore(settings.JOB_STORE_PATH, metrics=metrics)
+
+    raise ValueError(f"Unsupported job store backend: {settings.JOB_STORE_BACKEND!r}")
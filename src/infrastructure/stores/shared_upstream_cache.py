@@ -0,0 +1,209 @@
+"""Singleflight memo for upstream node outputs shared by jobs in one batch."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+# How often a waiting follower runs its ``check`` (cancel / deadline).
+_WAIT_POLL_SECONDS = 0.1
+
+
+class _Slot:
+    """One in-flight or completed computation for a (key, name) pair."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.failed = False
+        self._callbacks: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def finish(self, value: Any = None, *, failed: bool = False) -> None:
+        """Publish the outcome and wake blocking and async waiters."""
+        with self._lock:
+            self.value = value
+            self.failed = failed
+            self.done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    async def wait(self, check: Callable[[], None] | None = None) -> None:
+        """Await completion without blocking the event loop, polling *check*."""
+        loop = asyncio.get_running_loop()
+        finished = loop.create_future()
+
+        def _resolve() -> None:
+            if not finished.done():
+                finished.set_result(None)
+
+        def _wake() -> None:
+            try:
+                loop.call_soon_threadsafe(_resolve)
+            except RuntimeError:
+                pass  # waiter's loop already closed
+
+        with self._lock:
+            if self.done.is_set():
+                return
+            self._callbacks.append(_wake)
+        timeout = None if check is None else _WAIT_POLL_SECONDS
+        while not (await asyncio.wait({finished}, timeout=timeout))[0]:
+            check()
+
+
+@dataclass
+class _Entry:
+    consumers: int
+    expires_at: float
+    slots: dict[str, _Slot] = field(default_factory=dict)
+    released: set[str] = field(default_factory=set)
+
+
+class SharedUpstreamCache:
+    """Compute ``collect_serp`` / ``extract_themes`` once per batch group.
+
+    A batch registers each group key with the number of jobs that will read
+    it.  The first job to ask for a value computes it; concurrent askers
+    block (or, via ``aget_or_compute``, await) until it is ready and
+    receive the same object; a waiter's ``check`` runs every
+    ``_WAIT_POLL_SECONDS`` and may raise to stop waiting (e.g. its job was
+    cancelled or ran out of time).  If the computation raises, the slot
+    is cleared and the next asker retries.  Each consumer calls
+    ``release`` with its id once it no longer needs the group -- repeat
+    calls for the same id are ignored, so a job may release both after
+    its last shared node and when its run ends.  The entry is dropped when
+    the last consumer releases, or after ``ttl_seconds`` if one never
+    does.  Unknown keys are computed directly without caching.
+    """
+
+    def __init__(self, *, ttl_seconds: float = 900.0) -> None:
+        self._ttl = ttl_seconds
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def register(self, key: str, consumers: int) -> None:
+        """Declare that *consumers* jobs will share values under *key*."""
+        if consumers <= 0:
+            raise ValueError("SharedUpstreamCache: consumers must be > 0")
+        with self._lock:
+            self._purge_expired()
+            entry = self._entries.get(key)
+            if entry is None:
+                self._entries[key] = _Entry(
+                    consumers=consumers, expires_at=time.monotonic() + self._ttl
+                )
+            else:
+                entry.consumers += consumers
+
+    def get_or_compute(
+        self,
+        key: str,
+        name: str,
+        compute: Callable[[], T],
+        *,
+        check: Callable[[], None] | None = None,
+    ) -> T:
+        """Return the shared value for (*key*, *name*), computing it at most once.
+
+        While another consumer computes it, *check* is called between
+        waits; whatever it raises ends the wait.
+        """
+        timeout = None if check is None else _WAIT_POLL_SECONDS
+        while True:
+            entry, slot, owner = self._claim(key, name)
+            if slot is None:
+                return compute()
+            if owner:
+                return self._fill(entry, name, slot, compute)
+            while not slot.done.wait(timeout):
+                check()
+            if not slot.failed:
+                return slot.value
+
+    async def aget_or_compute(
+        self,
+        key: str,
+        name: str,
+        compute: Callable[[], Awaitable[T]],
+        *,
+        check: Callable[[], None] | None = None,
+    ) -> T:
+        """Async ``get_or_compute``: followers await instead of blocking a thread."""
+        while True:
+            entry, slot, owner = self._claim(key, name)
+            if slot is None:
+                return await compute()
+            if owner:
+                try:
+                    value = await compute()
+                except BaseException:
+                    self._abandon(entry, name, slot)
+                    raise
+                slot.finish(value)
+                return value
+            await slot.wait(check)
+            if not slot.failed:
+                return slot.value
+
+    def release(self, key: str, consumer: str) -> None:
+        """Signal that *consumer* is done with *key*.
+
+        No-op for unknown keys and for a consumer that already released.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or consumer in entry.released:
+                return
+            entry.released.add(consumer)
+            entry.consumers -= 1
+            if entry.consumers <= 0:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _claim(self, key: str, name: str) -> tuple[_Entry | None, _Slot | None, bool]:
+        """Return (entry, slot, owner); slot is ``None`` for unregistered keys."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, None, False
+            slot = entry.slots.get(name)
+            if slot is not None:
+                return entry, slot, False
+            slot = entry.slots[name] = _Slot()
+            return entry, slot, True
+
+    def _fill(
+        self, entry: _Entry, name: str, slot: _Slot, compute: Callable[[], T]
+    ) -> T:
+        try:
+            value = compute()
+        except BaseException:
+            self._abandon(entry, name, slot)
+            raise
+        slot.finish(value)
+        return value
+
+    def _abandon(self, entry: _Entry, name: str, slot: _Slot) -> None:
+        """Clear a failed slot so the next asker retries, and wake waiters."""
+        with self._lock:
+            if entry.slots.get(name) is slot:
+                del entry.slots[name]
+        slot.finish(failed=True)
+
+    def _purge_expired(self) -> None:
+        """Drop entries past their TTL. Caller holds ``_lock``."""
+        now = time.monotonic()
+        for key in [k for k, e in self._entries.items() if e.expires_at <= now]:
+            del self._entries[key]
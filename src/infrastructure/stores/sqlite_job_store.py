@@ -0,0 +1,469 @@
+"""Job store backed by SQLite in WAL mode, shared by every process on a host."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Collection
+
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from src.domain.models.job import JobRecord, JobStatus
+from src.domain.models.job_input import JobInput
+from src.domain.models.output import SeoArticleOutput
+from src.infrastructure.metrics.timed_lock import timed_lock
+
+from .checkpoint_serde import checkpoint_serde
+from .job_store import IndexKey, JobWatcher
+
+if TYPE_CHECKING:
+    from src.infrastructure.metrics.pipeline_metrics import PipelineMetrics
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id       TEXT PRIMARY KEY,
+    status       TEXT NOT NULL,
+    input        TEXT,
+    current_node TEXT,
+    error        TEXT,
+    result       BLOB,
+    result_hash  TEXT,
+    updated_at   TEXT NOT NULL,
+    version      INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS jobs_by_updated ON jobs (updated_at, job_id);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status, updated_at, job_id);
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    key         TEXT PRIMARY KEY,
+    job_id      TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    expires_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idempotency_keys_by_expiry ON idempotency_keys (expires_at);
+"""
+
+
+def _ts(value: datetime) -> str:
+    """Fixed-width UTC timestamp so text order equals time order."""
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f+00:00")
+
+
+def _now() -> str:
+    return _ts(datetime.now(timezone.utc))
+
+
+def _to_record(row: sqlite3.Row) -> JobRecord:
+    return JobRecord(
+        id=row["job_id"],
+        status=JobStatus(row["status"]),
+        input=JobInput.model_validate_json(row["input"]) if row["input"] else None,
+        current_node=row["current_node"],
+        error=row["error"],
+        result=(
+            SeoArticleOutput.model_validate_json(row["result"])
+            if row["result"]
+            else None
+        ),
+        result_hash=row["result_hash"],
+        version=row["version"],
+        updated_at=datetime.fromisoformat(row["updated_at"]),
+    )
+
+
+class SqliteJobStore:
+    """Process-safe job store on a SQLite file (WAL mode).
+
+    Every uvicorn worker or container that mounts the same file sees the
+    same jobs, so lookups no longer depend on which process created the
+    job.  Each thread gets its own connection; every write is a single
+    ``UPDATE ... RETURNING`` statement, so version bumps are atomic across
+    processes.  Graph checkpoints go to the same file through LangGraph's
+    ``SqliteSaver``.
+
+    ``watch`` callbacks fire immediately for writes made by this process.
+    Writes from other processes are picked up by a poller thread that
+    checks ``PRAGMA data_version`` every ``poll_interval`` seconds (only
+    while someone is watching) and re-reads the watched jobs when it moves.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        poll_interval: float = 0.1,
+        busy_timeout: float = 5.0,
+        metrics: PipelineMetrics | None = None,
+    ) -> None:
+        self._path = str(path)
+        Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        self._busy_timeout = busy_timeout
+        self._poll_interval = poll_interval
+        self._local = threading.local()
+        self._lock = timed_lock(
+            threading.Lock(),
+            metrics.store_lock_wait.labels("sqlite").observe if metrics else None,
+        )
+        self._watchers: dict[str, list[JobWatcher]] = {}
+        self._notified: dict[str, int] = {}
+        self._poller: threading.Thread | None = None
+        self._closed = threading.Event()
+        self._conn().executescript(_SCHEMA)
+        saver_conn = sqlite3.connect(
+            self._path, timeout=busy_timeout, check_same_thread=False
+        )
+        self._saver = SqliteSaver(saver_conn, serde=checkpoint_serde())
+        self._saver.setup()
+
+    @property
+    def saver(self) -> SqliteSaver:
+        """The checkpointer for graph compilation, on the same database file."""
+        return self._saver
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._path, timeout=self._busy_timeout, isolation_level=None
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _conn(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def _write(
+        self,
+        job_id: str,
+        assignments: str,
+        params: tuple,
+        *,
+        expected: Collection[JobStatus] | None = None,
+    ) -> JobRecord | None:
+        """Apply *assignments*, bump version/updated_at, notify watchers.
+
+        With *expected*, the row is only updated while its status is one of
+        them; ``None`` is returned (nothing written) otherwise.
+        """
+        guard = ""
+        guard_params: tuple = ()
+        if expected is not None:
+            statuses = [s.value for s in expected]
+            guard = f" AND status IN ({','.join('?' * len(statuses))})"
+            guard_params = tuple(statuses)
+        row = self._conn().execute(
+            f"UPDATE jobs SET {assignments}, updated_at = ?, version = version + 1 "
+            f"WHERE job_id = ?{guard} RETURNING *",
+            (*params, _now(), job_id, *guard_params),
+        ).fetchone()
+        if row is None:
+            self.get(job_id)  # KeyError for unknown jobs
+            return None
+        record = _to_record(row)
+        self._notify(record)
+        return record
+
+    def _notify(self, record: JobRecord) -> None:
+        """Call watchers once per new version. Must be called without ``_lock``."""
+        with self._lock:
+            watchers = list(self._watchers.get(record.id, ()))
+            if not watchers or record.version <= self._notified.get(record.id, 0):
+                return
+            self._notified[record.id] = record.version
+        for callback in watchers:
+            callback(record)
+
+    def _ensure_poller(self) -> None:
+        """Start the cross-process change poller. Caller holds ``_lock``."""
+        if self._poller is None:
+            self._poller = threading.Thread(
+                target=self._poll_loop, name="sqlite-job-store-poller", daemon=True
+            )
+            self._poller.start()
+
+    def _poll_loop(self) -> None:
+        conn = self._connect()
+        last_version = None
+        try:
+            while not self._closed.wait(self._poll_interval):
+                with self._lock:
+                    job_ids = list(self._watchers)
+                if not job_ids:
+                    continue
+                data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+                if data_version == last_version:
+                    continue
+                last_version = data_version
+                placeholders = ",".join("?" * len(job_ids))
+                rows = conn.execute(
+                    f"SELECT * FROM jobs WHERE job_id IN ({placeholders})", job_ids
+                ).fetchall()
+                for row in rows:
+                    self._notify(_to_record(row))
+        finally:
+            conn.close()
+
+    # -- public API ----------------------------------------------------------
+
+    def create(self, job_id: str) -> JobRecord:
+        """Create a new job in *pending* state.
+
+        Raises ``ValueError`` if *job_id* already exists (idempotency guard).
+        """
+        try:
+            row = self._conn().execute(
+                "INSERT INTO jobs (job_id, status, updated_at) VALUES (?, ?, ?) "
+                "RETURNING *",
+                (job_id, JobStatus.PENDING.value, _now()),
+            ).fetchone()
+        except sqlite3.IntegrityError as exc:
+            raise ValueError(f"Job '{job_id}' already exists") from exc
+        return _to_record(row)
+
+    def get(self, job_id: str) -> JobRecord:
+        """Retrieve current job record."""
+        row = self._conn().execute(
+            "SELECT * FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Job '{job_id}' not found")
+        return _to_record(row)
+
+    def set_input(self, job_id: str, job_input: JobInput) -> JobRecord:
+        """Attach the job input."""
+        return self._write(job_id, "input = ?", (job_input.model_dump_json(),))
+
+    def set_status(
+        self,
+        job_id: str,
+        status: JobStatus,
+        current_node: str | None = None,
+    ) -> JobRecord:
+        """Update job status and optionally the current node."""
+        return self._write(
+            job_id, "status = ?, current_node = ?", (status.value, current_node)
+        )
+
+    def compare_and_set_status(
+        self,
+        job_id: str,
+        expected: Collection[JobStatus],
+        status: JobStatus,
+        current_node: str | None = None,
+    ) -> JobRecord | None:
+        """Set *status* only if the job is currently in *expected*.
+
+        Check and write are one statement, so concurrent callers in any
+        process cannot both win.  Returns ``None`` when nothing was written.
+        """
+        if current_node is None:
+            return self._write(job_id, "status = ?", (status.value,), expected=expected)
+        return self._write(
+            job_id,
+            "status = ?, current_node = ?",
+            (status.value, current_node),
+            expected=expected,
+        )
+
+    def set_current_node(self, job_id: str, current_node: str) -> JobRecord:
+        """Update the node currently being executed."""
+        return self._write(job_id, "current_node = ?", (current_node,))
+
+    def set_error(self, job_id: str, error: str) -> JobRecord:
+        """Mark job as failed with an error message."""
+        return self._write(
+            job_id, "status = ?, error = ?", (JobStatus.FAILED.value, error)
+        )
+
+    def set_result(self, job_id: str, result: SeoArticleOutput) -> JobRecord:
+        """Mark job as completed with the final output and its content hash."""
+        return self._write_result(job_id, result)
+
+    def compare_and_set_result(
+        self,
+        job_id: str,
+        expected: Collection[JobStatus],
+        result: SeoArticleOutput,
+    ) -> JobRecord | None:
+        """Complete the job with *result* only if it is currently in *expected*.
+
+        Same guarantees as ``compare_and_set_status``.  Returns ``None``
+        when nothing was written.
+        """
+        return self._write_result(job_id, result, expected=expected)
+
+    def _write_result(
+        self,
+        job_id: str,
+        result: SeoArticleOutput,
+        *,
+        expected: Collection[JobStatus] | None = None,
+    ) -> JobRecord | None:
+        result_json = result.model_dump_json().encode()
+        return self._write(
+            job_id,
+            "status = ?, result = ?, result_hash = ?, error = NULL",
+            (
+                JobStatus.COMPLETED.value,
+                result_json,
+                hashlib.sha256(result_json).hexdigest(),
+            ),
+            expected=expected,
+        )
+
+    def get_result_json(self, job_id: str) -> tuple[bytes, str] | None:
+        """Return (result JSON bytes, content hash) for a completed job.
+
+        The bytes are stored exactly as serialized by ``set_result``.
+        ``None`` if the job is not completed; ``KeyError`` if it is unknown.
+        """
+        row = self._conn().execute(
+            "SELECT status, result, result_hash FROM jobs WHERE job_id = ?",
+            (job_id,),
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Job '{job_id}' not found")
+        if row["status"] != JobStatus.COMPLETED.value or row["result"] is None:
+            return None
+        return bytes(row["result"]), row["result_hash"]
+
+    def list_jobs(
+        self,
+        *,
+        status: JobStatus | None = None,
+        after: IndexKey | None = None,
+        limit: int,
+    ) -> list[JobRecord]:
+        """Return up to *limit* jobs in ascending ``updated_at`` order.
+
+        *after* is the ``(updated_at, job_id)`` of the last job on the
+        previous page; only jobs strictly after it are returned.  Served
+        from the ``(status, updated_at, job_id)`` indexes.
+        """
+        clauses: list[str] = []
+        params: list[object] = []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status.value)
+        if after is not None:
+            clauses.append("(updated_at, job_id) > (?, ?)")
+            params += [_ts(after[0]), after[1]]
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        rows = self._conn().execute(
+            f"SELECT * FROM jobs {where}ORDER BY updated_at, job_id LIMIT ?",
+            (*params, limit),
+        ).fetchall()
+        return [_to_record(row) for row in rows]
+
+    def list_result_json(
+        self, *, after: IndexKey | None = None, limit: int
+    ) -> list[tuple[IndexKey, bytes, str]]:
+        """Return up to *limit* completed results in ascending ``updated_at`` order.
+
+        Each item is ``((updated_at, job_id), result JSON, content hash)``,
+        the bytes exactly as stored by ``set_result``.  Served from the
+        ``(status, updated_at, job_id)`` index without decoding results.
+        """
+        clauses = ["status = ?", "result IS NOT NULL"]
+        params: list[object] = [JobStatus.COMPLETED.value]
+        if after is not None:
+            clauses.append("(updated_at, job_id) > (?, ?)")
+            params += [_ts(after[0]), after[1]]
+        rows = self._conn().execute(
+            "SELECT job_id, updated_at, result, result_hash FROM jobs "
+            f"WHERE {' AND '.join(clauses)} ORDER BY updated_at, job_id LIMIT ?",
+            (*params, limit),
+        ).fetchall()
+        return [
+            (
+                (datetime.fromisoformat(row["updated_at"]), row["job_id"]),
+                bytes(row["result"]),
+                row["result_hash"],
+            )
+            for row in rows
+        ]
+
+    def watch(self, job_id: str, callback: JobWatcher) -> Callable[[], None]:
+        """Call *callback* with the new record after each change to *job_id*.
+
+        Changes made by other processes arrive within ``poll_interval``.
+        The callback must not block.  Returns a function that removes it.
+        """
+        with self._lock:
+            self._watchers.setdefault(job_id, []).append(callback)
+            self._ensure_poller()
+
+        def _unwatch() -> None:
+            with self._lock:
+                watchers = self._watchers.get(job_id, [])
+                if callback in watchers:
+                    watchers.remove(callback)
+                if not watchers:
+                    self._watchers.pop(job_id, None)
+                    self._notified.pop(job_id, None)
+
+        return _unwatch
+
+    def claim_idempotency_key(
+        self, key: str, job_id: str, fingerprint: str, ttl_seconds: float
+    ) -> tuple[str, str]:
+        """Map *key* to *job_id* unless a live mapping exists.
+
+        Expired keys are purged first.  The upsert only overwrites a row
+        that is still expired, so concurrent claims from any process agree
+        on one owner.  Returns the (job_id, fingerprint) that owns *key*
+        afterwards.  If the live owner is released between the upsert and
+        the read-back, the claim is simply made again.
+        """
+        now = time.time()
+        self._conn().execute(
+            "DELETE FROM idempotency_keys WHERE expires_at <= ?", (now,)
+        )
+        while True:
+            row = self._conn().execute(
+                "INSERT INTO idempotency_keys (key, job_id, fingerprint, expires_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET job_id = excluded.job_id, "
+                "fingerprint = excluded.fingerprint, "
+                "expires_at = excluded.expires_at "
+                "WHERE idempotency_keys.expires_at <= ? "
+                "RETURNING job_id, fingerprint",
+                (key, job_id, fingerprint, now + ttl_seconds, now),
+            ).fetchone()
+            if row is None:
+                row = self._conn().execute(
+                    "SELECT job_id, fingerprint FROM idempotency_keys WHERE key = ?",
+                    (key,),
+                ).fetchone()
+            if row is not None:
+                return row["job_id"], row["fingerprint"]
+
+    def release_idempotency_key(self, key: str, job_id: str) -> None:
+        """Forget *key* if it still maps to *job_id* (e.g. the job was discarded)."""
+        self._conn().execute(
+            "DELETE FROM idempotency_keys WHERE key = ? AND job_id = ?", (key, job_id)
+        )
+
+    def delete(self, job_id: str) -> None:
+        """Remove a job entry. No-op if it doesn't exist."""
+        self._conn().execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    def close(self) -> None:
+        """Stop the poller and close this thread's and the saver's connections."""
+        self._closed.set()
+        if self._poller is not None:
+            self._poller.join(timeout=1)
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+        self._saver.conn.close()
@@ -0,0 +1,19 @@
+"""Completion webhooks – durable outbox and background dispatcher."""
+
+from __future__ import annotations
+
+from .dispatcher import WebhookDispatcher
+from .outbox import WebhookDelivery, WebhookOutbox, WebhookStatus, enqueue_job_finished
+from .signing import sign
+from .url_guard import UnsafeCallbackURLError, check_callback_url
+
+__all__ = [
+    "check_callback_url",
+    "enqueue_job_finished",
+    "sign",
+    "UnsafeCallbackURLError",
+    "WebhookDelivery",
+    "WebhookDispatcher",
+    "WebhookOutbox",
+    "WebhookStatus",
+]
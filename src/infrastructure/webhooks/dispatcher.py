@@ -0,0 +1,193 @@
+"""Background delivery of queued webhooks with retries and HMAC signatures."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from src.logging_config import get_logger
+
+from .outbox import WebhookDelivery, WebhookOutbox
+from .signing import SIGNATURE_HEADER, TIMESTAMP_HEADER, sign
+from .url_guard import UnsafeCallbackURLError, build_webhook_opener, require_http_url
+
+_logger = get_logger(__name__)
+
+# Client errors worth retrying; any other 4xx is treated as permanent.
+_RETRYABLE_4XX = frozenset({408, 425, 429})
+
+
+class WebhookDispatcher:
+    """Polls a ``WebhookOutbox`` and POSTs due deliveries off the graph workers.
+
+    At most ``concurrency`` requests are in flight; the poller only claims
+    as many deliveries as there are free slots.  A delivery succeeds on any
+    2xx.  Network errors, timeouts, 5xx and 408/425/429 are retried after
+    ``base_delay * 2**(attempt - 1)`` seconds (capped at ``max_delay``,
+    with full jitter) until ``max_attempts``; other responses give up at
+    once.  With a ``secret``, each request carries ``X-Webhook-Timestamp``
+    and ``X-Webhook-Signature`` (see ``signing.sign``), plus
+    ``X-Webhook-Id`` for receiver-side de-duplication.
+
+    Requests never follow redirects or use proxies, and connect only to
+    hosts that resolve to public addresses (re-checked on every attempt);
+    a URL that fails the check is given up without retrying.
+    ``allow_private_urls`` lifts the address check for local receivers.
+    """
+
+    def __init__(
+        self,
+        *,
+        outbox: WebhookOutbox,
+        secret: str | None = None,
+        concurrency: int = 4,
+        max_attempts: int = 8,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        timeout: float = 10.0,
+        poll_interval: float = 0.5,
+        allow_private_urls: bool = False,
+    ) -> None:
+        if concurrency <= 0:
+            raise ValueError("WebhookDispatcher: concurrency must be > 0")
+        if max_attempts <= 0:
+            raise ValueError("WebhookDispatcher: max_attempts must be > 0")
+        self._outbox = outbox
+        self._secret = secret or None
+        self._concurrency = concurrency
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._timeout = timeout
+        self._poll_interval = poll_interval
+        self._opener = build_webhook_opener(allow_private=allow_private_urls)
+        # A claim outlives the slowest attempt, so a live dispatcher keeps its lease.
+        self._lease_seconds = timeout * 2 + 5
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._executor: ThreadPoolExecutor | None = None
+        self._poller: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Start the poller and delivery threads. Idempotent."""
+        if self._poller is not None:
+            return
+        self._stopped.clear()
+        self._executor = ThreadPoolExecutor(
+            self._concurrency, thread_name_prefix="webhook"
+        )
+        self._poller = threading.Thread(
+            target=self._poll_loop, name="webhook-poller", daemon=True
+        )
+        self._poller.start()
+
+    def stop(self, *, timeout: float | None = None) -> None:
+        """Stop claiming and wait for in-flight requests (the rest stay queued)."""
+        self._stopped.set()
+        if self._poller is not None:
+            self._poller.join(timeout)
+            self._poller = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def run_once(self) -> int:
+        """Claim and deliver due webhooks synchronously. Returns how many were sent."""
+        deliveries = self._outbox.claim(
+            limit=self._concurrency, lease_seconds=self._lease_seconds
+        )
+        for delivery in deliveries:
+            self.deliver(delivery)
+        return len(deliveries)
+
+    def deliver(self, delivery: WebhookDelivery) -> None:
+        """POST one delivery and record the outcome in the outbox."""
+        try:
+            status = self._post(delivery)
+        except UnsafeCallbackURLError as exc:
+            self._failed(delivery, str(exc), retryable=False)
+            return
+        except (urllib.error.URLError, OSError) as exc:
+            reason = getattr(exc, "reason", exc)
+            self._failed(delivery, f"{type(exc).__name__}: {reason}", retryable=True)
+            return
+        if 200 <= status < 300:
+            self._outbox.succeed(delivery.id)
+            return
+        retryable = status >= 500 or status in _RETRYABLE_4XX
+        self._failed(delivery, f"HTTP {status}", retryable=retryable)
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _post(self, delivery: WebhookDelivery) -> int:
+        require_http_url(delivery.url)
+        headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "aiseo-webhooks/1",
+            "X-Webhook-Id": delivery.id,
+        }
+        if self._secret is not None:
+            timestamp = int(time.time())
+            headers[TIMESTAMP_HEADER] = str(timestamp)
+            headers[SIGNATURE_HEADER] = sign(self._secret, timestamp, delivery.body)
+        request = urllib.request.Request(
+            delivery.url, data=delivery.body, headers=headers, method="POST"
+        )
+        try:
+            with self._opener.open(request, timeout=self._timeout) as response:
+                return response.status
+        except urllib.error.HTTPError as exc:
+            exc.close()
+            return exc.code
+
+    def _failed(
+        self, delivery: WebhookDelivery, error: str, *, retryable: bool
+    ) -> None:
+        if not retryable or delivery.attempts >= self._max_attempts:
+            _logger.warning(
+                "Webhook %s for job %s dead after %d attempt(s): %s",
+                delivery.id, delivery.job_id, delivery.attempts, error,
+            )
+            self._outbox.give_up(delivery.id, error=error)
+            return
+        self._outbox.retry(
+            delivery.id, delay=self._backoff(delivery.attempts), error=error
+        )
+
+    def _backoff(self, attempts: int) -> float:
+        """Full-jitter exponential backoff for the retry after *attempts* tries."""
+        ceiling = min(self._max_delay, self._base_delay * 2 ** (attempts - 1))
+        return random.uniform(ceiling / 2, ceiling)
+
+    def _poll_loop(self) -> None:
+        while not self._stopped.is_set():
+            free = 0
+            while free < self._concurrency and self._slots.acquire(blocking=False):
+                free += 1
+            try:
+                deliveries = (
+                    self._outbox.claim(limit=free, lease_seconds=self._lease_seconds)
+                    if free
+                    else []
+                )
+            except Exception:
+                _logger.exception("Webhook outbox claim failed")
+                deliveries = []
+            for _ in range(free - len(deliveries)):
+                self._slots.release()
+            for delivery in deliveries:
+                self._executor.submit(self._deliver_and_release, delivery)
+            if len(deliveries) < free or not free:
+                self._stopped.wait(self._poll_interval)
+
+    def _deliver_and_release(self, delivery: WebhookDelivery) -> None:
+        try:
+            self.deliver(delivery)
+        except Exception:
+            _logger.exception("Webhook %s delivery crashed", delivery.id)
+        finally:
+            self._slots.release()
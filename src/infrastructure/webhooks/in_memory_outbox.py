@@ -0,0 +1,92 @@
+"""In-memory WebhookOutbox – single process, lost on restart."""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from dataclasses import replace
+
+from .outbox import WebhookDelivery, WebhookStatus
+
+
+class InMemoryWebhookOutbox:
+    """Dict-backed outbox for the ``memory`` backend and tests.
+
+    Matches ``InMemoryJobStore``: deliveries survive as long as the
+    process does.  Finished deliveries are kept for inspection until
+    ``max_finished`` newer ones have finished.
+    """
+
+    def __init__(self, *, max_finished: int = 10_000) -> None:
+        self._max_finished = max_finished
+        self._deliveries: dict[str, WebhookDelivery] = {}
+        self._leases: dict[str, float] = {}
+        self._finished: list[str] = []
+        self._lock = threading.Lock()
+
+    def enqueue(self, *, job_id: str, url: str, body: bytes) -> str:
+        delivery_id = str(uuid.uuid4())
+        with self._lock:
+            self._deliveries[delivery_id] = WebhookDelivery(
+                id=delivery_id,
+                job_id=job_id,
+                url=url,
+                body=body,
+                status=WebhookStatus.PENDING,
+                attempts=0,
+                next_attempt_at=time.time(),
+            )
+        return delivery_id
+
+    def claim(self, *, limit: int, lease_seconds: float) -> list[WebhookDelivery]:
+        now = time.time()
+        claimed: list[WebhookDelivery] = []
+        with self._lock:
+            for delivery in self._deliveries.values():
+                if len(claimed) >= limit:
+                    break
+                if (
+                    delivery.status != WebhookStatus.PENDING
+                    or delivery.next_attempt_at > now
+                    or self._leases.get(delivery.id, 0.0) > now
+                ):
+                    continue
+                delivery = replace(delivery, attempts=delivery.attempts + 1)
+                self._deliveries[delivery.id] = delivery
+                self._leases[delivery.id] = now + lease_seconds
+                claimed.append(delivery)
+        return claimed
+
+    def succeed(self, delivery_id: str) -> None:
+        self._finish(delivery_id, status=WebhookStatus.DELIVERED, last_error=None)
+
+    def retry(self, delivery_id: str, *, delay: float, error: str) -> None:
+        with self._lock:
+            delivery = self._deliveries[delivery_id]
+            self._deliveries[delivery_id] = replace(
+                delivery, next_attempt_at=time.time() + delay, last_error=error
+            )
+            self._leases.pop(delivery_id, None)
+
+    def give_up(self, delivery_id: str, *, error: str) -> None:
+        self._finish(delivery_id, status=WebhookStatus.DEAD, last_error=error)
+
+    def deliveries(self, job_id: str) -> list[WebhookDelivery]:
+        with self._lock:
+            return [d for d in self._deliveries.values() if d.job_id == job_id]
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _finish(
+        self, delivery_id: str, *, status: WebhookStatus, last_error: str | None
+    ) -> None:
+        with self._lock:
+            delivery = self._deliveries[delivery_id]
+            self._deliveries[delivery_id] = replace(
+                delivery, status=status, last_error=last_error
+            )
+            self._leases.pop(delivery_id, None)
+            self._finished.append(delivery_id)
+            while len(self._finished) > self._max_finished:
+                self._deliveries.pop(self._finished.pop(0), None)
@@ -0,0 +1,81 @@
+"""WebhookOutbox protocol – delivery queue between graph workers and the dispatcher."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Protocol, runtime_checkable
+
+from src.domain.models.job import JobRecord
+
+
+class WebhookStatus(str, Enum):
+    """Delivery lifecycle: pending (incl. awaiting a retry) until delivered or dead."""
+
+    PENDING = "pending"
+    DELIVERED = "delivered"
+    DEAD = "dead"
+
+
+@dataclass(frozen=True)
+class WebhookDelivery:
+    """One queued POST of *body* to *url*."""
+
+    id: str
+    job_id: str
+    url: str
+    body: bytes
+    status: WebhookStatus
+    attempts: int
+    next_attempt_at: float
+    last_error: str | None = None
+
+
+@runtime_checkable
+class WebhookOutbox(Protocol):
+    """Queue of webhook deliveries, shared by every process on the backend.
+
+    ``enqueue`` is called on the graph worker and only records the
+    delivery.  The dispatcher ``claim``s due deliveries -- leasing them
+    for ``lease_seconds`` so a crashed dispatcher's claims become due
+    again -- and reports each outcome with ``succeed``, ``retry`` or
+    ``give_up``.  ``attempts`` counts claims.
+    """
+
+    def enqueue(self, *, job_id: str, url: str, body: bytes) -> str: ...
+
+    def claim(self, *, limit: int, lease_seconds: float) -> list[WebhookDelivery]: ...
+
+    def succeed(self, delivery_id: str) -> None: ...
+
+    def retry(self, delivery_id: str, *, delay: float, error: str) -> None: ...
+
+    def give_up(self, delivery_id: str, *, error: str) -> None: ...
+
+    def deliveries(self, job_id: str) -> list[WebhookDelivery]: ...
+
+
+def job_finished_body(record: JobRecord) -> bytes:
+    """JSON payload announcing that *record*'s job reached a terminal status."""
+    return json.dumps(
+        {
+            "event": f"job.{record.status.value}",
+            "job_id": record.id,
+            "status": record.status.value,
+            "error": record.error,
+            "result_hash": record.result_hash,
+            "sent_at": datetime.now(timezone.utc).isoformat(),
+        },
+        separators=(",", ":"),
+    ).encode()
+
+
+def enqueue_job_finished(outbox: WebhookOutbox | None, record: JobRecord) -> str | None:
+    """Queue a completion webhook if the job asked for one. No network calls."""
+    if outbox is None or record.input is None or record.input.callback_url is None:
+        return None
+    return outbox.enqueue(
+        job_id=record.id, url=record.input.callback_url, body=job_finished_body(record)
+    )
@@ -0,0 +1,22 @@
+"""Factory for selecting the webhook outbox backend based on settings."""
+
+from __future__ import annotations
+
+from src.settings import Settings
+
+from .outbox import WebhookOutbox
+
+
+def get_webhook_outbox(settings: Settings) -> WebhookOutbox:
+    """Return the outbox for ``settings.JOB_STORE_BACKEND`` (as durable as the jobs)."""
+    if settings.JOB_STORE_BACKEND == "memory":
+        from .in_memory_outbox import InMemoryWebhookOutbox
+
+        return InMemoryWebhookOutbox()
+
+    if settings.JOB_STORE_BACKEND == "sqlite":
+        from .sqlite_outbox import SqliteWebhookOutbox
+
+        return SqliteWebhookOutbox(settings.JOB_STORE_PATH)
+
+    raise ValueError(f"Unsupported job store backend: {settings.JOB_STORE_BACKEND!r}")
@@ -0,0 +1,19 @@
+"""HMAC signing of webhook bodies."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+
+SIGNATURE_HEADER = "X-Webhook-Signature"
+TIMESTAMP_HEADER = "X-Webhook-Timestamp"
+
+
+def sign(secret: str, timestamp: int, body: bytes) -> str:
+    """Return ``sha256=<hex>`` over ``"{timestamp}." + body``.
+
+    Receivers recompute it with the shared secret and reject stale
+    timestamps, which stops both tampering and replay.
+    """
+    message = str(timestamp).encode() + b"." + body
+    return "sha256=" + hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
@@ -0,0 +1,137 @@
+"""SQLite WebhookOutbox – durable, shared by every process on the database file."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from .outbox import WebhookDelivery, WebhookStatus
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS webhook_deliveries (
+    id              TEXT PRIMARY KEY,
+    job_id          TEXT NOT NULL,
+    url             TEXT NOT NULL,
+    body            BLOB NOT NULL,
+    status          TEXT NOT NULL,
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    lease_until     REAL NOT NULL DEFAULT 0,
+    last_error      TEXT
+);
+CREATE INDEX IF NOT EXISTS webhook_deliveries_due
+    ON webhook_deliveries (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS webhook_deliveries_by_job ON webhook_deliveries (job_id);
+"""
+
+
+def _to_delivery(row: sqlite3.Row) -> WebhookDelivery:
+    return WebhookDelivery(
+        id=row["id"],
+        job_id=row["job_id"],
+        url=row["url"],
+        body=bytes(row["body"]),
+        status=WebhookStatus(row["status"]),
+        attempts=row["attempts"],
+        next_attempt_at=row["next_attempt_at"],
+        last_error=row["last_error"],
+    )
+
+
+class SqliteWebhookOutbox:
+    """Outbox table next to the jobs in ``JOB_STORE_PATH``.
+
+    Deliveries enqueued before a crash or redeploy are still sent
+    afterwards.  ``claim`` leases rows with one ``UPDATE … RETURNING``,
+    so dispatchers in several processes never send the same delivery
+    concurrently.
+    """
+
+    def __init__(self, path: str | Path, *, busy_timeout: float = 30.0) -> None:
+        self._path = str(path)
+        if self._path != ":memory:":
+            Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self._path,
+            timeout=busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def enqueue(self, *, job_id: str, url: str, body: bytes) -> str:
+        delivery_id = str(uuid.uuid4())
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO webhook_deliveries "
+                "(id, job_id, url, body, status, next_attempt_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    delivery_id,
+                    job_id,
+                    url,
+                    body,
+                    WebhookStatus.PENDING.value,
+                    time.time(),
+                ),
+            )
+        return delivery_id
+
+    def claim(self, *, limit: int, lease_seconds: float) -> list[WebhookDelivery]:
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "UPDATE webhook_deliveries "
+                "SET attempts = attempts + 1, lease_until = ? "
+                "WHERE id IN (SELECT id FROM webhook_deliveries WHERE status = ? "
+                "AND next_attempt_at <= ? AND lease_until <= ? "
+                "ORDER BY next_attempt_at LIMIT ?) "
+                "RETURNING *",
+                (now + lease_seconds, WebhookStatus.PENDING.value, now, now, limit),
+            ).fetchall()
+        return [_to_delivery(row) for row in rows]
+
+    def succeed(self, delivery_id: str) -> None:
+        self._set(
+            delivery_id,
+            "status = ?, last_error = NULL",
+            (WebhookStatus.DELIVERED.value,),
+        )
+
+    def retry(self, delivery_id: str, *, delay: float, error: str) -> None:
+        self._set(
+            delivery_id,
+            "next_attempt_at = ?, last_error = ?",
+            (time.time() + delay, error),
+        )
+
+    def give_up(self, delivery_id: str, *, error: str) -> None:
+        self._set(
+            delivery_id, "status = ?, last_error = ?", (WebhookStatus.DEAD.value, error)
+        )
+
+    def deliveries(self, job_id: str) -> list[WebhookDelivery]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM webhook_deliveries WHERE job_id = ?", (job_id,)
+            ).fetchall()
+        return [_to_delivery(row) for row in rows]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _set(self, delivery_id: str, assignments: str, params: tuple) -> None:
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE webhook_deliveries SET {assignments}, lease_until = 0 "
+                "WHERE id = ?",
+                (*params, delivery_id),
+            )
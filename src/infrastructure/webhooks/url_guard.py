@@ -0,0 +1,130 @@
+"""Callback URL checks that keep webhooks off internal networks (SSRF)."""
+
+from __future__ import annotations
+
+import http.client
+import ipaddress
+import socket
+import urllib.request
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+Resolver = Callable[..., list]
+
+
+class UnsafeCallbackURLError(ValueError):
+    """A callback URL is not http(s), or its host has a non-public address."""
+
+
+def is_public_address(address: str) -> bool:
+    """Whether *address* is globally routable (not private, loopback, link-local, …)."""
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if ip.version == 6 and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+def public_addresses(
+    host: str, port: int, *, resolve: Resolver = socket.getaddrinfo
+) -> list[str]:
+    """Resolve *host*; raise ``UnsafeCallbackURLError`` unless every address is public.
+
+    Resolution failures propagate as ``OSError`` (``socket.gaierror``).
+    """
+    infos = resolve(host, port, type=socket.SOCK_STREAM)
+    addresses = list(dict.fromkeys(info[4][0] for info in infos))
+    for address in addresses:
+        if not is_public_address(address):
+            raise UnsafeCallbackURLError(
+                f"callback_url host {host!r} resolves to non-public address {address}"
+            )
+    return addresses
+
+
+def require_http_url(url: str) -> tuple[str, int]:
+    """Return the (host, port) of an http(s) *url*; reject anything else."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise UnsafeCallbackURLError("callback_url must be an http(s) URL")
+    try:
+        port = parts.port
+    except ValueError as exc:
+        raise UnsafeCallbackURLError(f"callback_url has a bad port: {exc}") from exc
+    return parts.hostname, port or (443 if parts.scheme == "https" else 80)
+
+
+def check_callback_url(url: str, *, resolve: Resolver = socket.getaddrinfo) -> None:
+    """Reject *url* unless it is http(s) and its host resolves only to public addresses.
+
+    A host that does not resolve right now is accepted: the dispatcher
+    checks again before every attempt, when it connects.
+    """
+    host, port = require_http_url(url)
+    try:
+        public_addresses(host, port, resolve=resolve)
+    except OSError:
+        pass
+
+
+def _connect_public(
+    address: tuple[str, int],
+    timeout: Any = socket._GLOBAL_DEFAULT_TIMEOUT,
+    source_address: tuple[str, int] | None = None,
+) -> socket.socket:
+    """``socket.create_connection`` that only dials the host's vetted public addresses.
+
+    Connecting to the checked IP (not the name again) closes the DNS
+    rebinding gap between the check and the connection.
+    """
+    host, port = address
+    last_exc: OSError | None = None
+    for ip in public_addresses(host, port):
+        try:
+            return socket.create_connection((ip, port), timeout, source_address)
+        except OSError as exc:
+            last_exc = exc
+    raise last_exc or OSError(f"no address to connect to for {host!r}")
+
+
+def _public_only(connection_cls: type[http.client.HTTPConnection]) -> Callable:
+    def _factory(host: str, **kwargs: Any) -> http.client.HTTPConnection:
+        connection = connection_cls(host, **kwargs)
+        connection._create_connection = _connect_public
+        return connection
+
+    return _factory
+
+
+class _PublicHTTPHandler(urllib.request.HTTPHandler):
+    def http_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        return self.do_open(_public_only(http.client.HTTPConnection), req)
+
+
+class _PublicHTTPSHandler(urllib.request.HTTPSHandler):
+    def https_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        return self.do_open(
+            _public_only(http.client.HTTPSConnection), req, context=self._context
+        )
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """Surface 3xx as the response status instead of following ``Location``."""
+
+    def redirect_request(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+
+def build_webhook_opener(
+    *, allow_private: bool = False
+) -> urllib.request.OpenerDirector:
+    """An opener for webhook POSTs: no proxies, no redirects, public hosts only.
+
+    *allow_private* skips the address check (local development and tests).
+    """
+    handlers: list[urllib.request.BaseHandler] = [
+        urllib.request.ProxyHandler({}),
+        _NoRedirect(),
+    ]
+    if not allow_private:
+        handlers += [_PublicHTTPHandler(), _PublicHTTPSHandler()]
+    return urllib.request.build_opener(*handlers)
@@ -0,0 +1,18 @@
+"""Background job execution – bounded worker pool with admission control."""
+
+from __future__ import annotations
+
+from .async_job_worker_pool import AsyncJobWorkerPool
+from .errors import PoolClosedError, QueueFullError
+from .job_worker_pool import DEFAULT_LANES, JobWorkerPool, Lane, LaneStats, QueueStats
+
+__all__ = [
+    "AsyncJobWorkerPool",
+    "DEFAULT_LANES",
+    "JobWorkerPool",
+    "Lane",
+    "LaneStats",
+    "PoolClosedError",
+    "QueueFullError",
+    "QueueStats",
+]
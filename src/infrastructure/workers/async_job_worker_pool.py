@@ -0,0 +1,73 @@
+"""Worker pool that runs coroutine jobs on one dedicated event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from src.logging_config import get_logger
+
+from .job_worker_pool import JobWorkerPool, _Task
+
+_logger = get_logger(__name__)
+
+
+class AsyncJobWorkerPool(JobWorkerPool):
+    """``JobWorkerPool`` whose jobs are coroutines sharing a single event loop.
+
+    Submitted callables return an awaitable (e.g. ``lambda: arun_job(...)``).
+    Instead of one OS thread per in-flight job, a single background thread
+    runs an event loop and ``workers`` becomes the number of jobs awaited
+    concurrently on it, so it can be set far higher than a thread count.
+    Lanes, admission control, queue statistics, ``wait_idle`` and
+    ``shutdown`` behave exactly as in the threaded pool.
+    """
+
+    runs_async = True
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _start_workers(self, name: str) -> list[threading.Thread]:
+        self._loop = asyncio.new_event_loop()
+        self._tasks: set[asyncio.Task[None]] = set()
+        thread = threading.Thread(
+            target=self._run_loop, name=f"{name}-loop", daemon=True
+        )
+        thread.start()
+        return [thread]
+
+    def _wake(self) -> None:
+        super()._wake()
+        try:
+            self._loop.call_soon_threadsafe(self._dispatch)
+        except RuntimeError:
+            pass  # loop already stopped after a previous shutdown
+
+    # -- event loop ----------------------------------------------------------
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    def _dispatch(self) -> None:
+        """Start queued jobs up to the in-flight limit; stop once closed and idle."""
+        with self._cond:
+            while self._queued and self._running < self._workers:
+                task = self._next_task()
+                job = self._loop.create_task(self._run(task))
+                self._tasks.add(job)
+                job.add_done_callback(self._tasks.discard)
+            if self._closed and not self._queued and self._running == 0:
+                self._loop.stop()
+
+    async def _run(self, task: _Task) -> None:
+        try:
+            await task.fn()
+        except Exception:
+            _logger.exception("Unhandled error in job %s", task.job_id)
+        finally:
+            self._task_done(task)
+            self._dispatch()
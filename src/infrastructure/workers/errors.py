@@ -0,0 +1,23 @@
+"""Infrastructure-level exceptions for background job execution."""
+
+from __future__ import annotations
+
+
+class QueueFullError(Exception):
+    """Raised by ``JobWorkerPool.submit`` when the queue is at max depth.
+
+    ``retry_after`` is a whole-second estimate of when capacity is likely
+    to free up, derived from recent queue wait times.
+    """
+
+    def __init__(self, *, depth: int, retry_after: int) -> None:
+        self.depth = depth
+        self.retry_after = retry_after
+        super().__init__(f"Job queue full ({depth} queued); retry after {retry_after}s")
+
+
+class PoolClosedError(RuntimeError):
+    """Raised by ``JobWorkerPool.submit`` once the pool is draining or shut down."""
+
+    def __init__(self, message: str = "JobWorkerPool: pool is shut down") -> None:
+        super().__init__(message)
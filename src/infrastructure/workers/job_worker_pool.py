@@ -0,0 +1,388 @@
+"""Bounded worker pool that runs graph jobs off the HTTP request path."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Callable, Mapping
+
+from src.domain.models.job_input import JobPriority
+from src.logging_config import get_logger
+
+from .errors import PoolClosedError, QueueFullError
+
+_logger = get_logger(__name__)
+
+# Smoothing factor for the moving average of queue wait times.
+_WAIT_EWMA_ALPHA = 0.2
+
+
+@dataclass(frozen=True)
+class _Task:
+    job_id: str
+    fn: Callable[[], None]
+    lane: str
+    on_drop: Callable[[], None] | None = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass(frozen=True)
+class Lane:
+    """Scheduling lane: share of worker slots and its own queue bound.
+
+    ``max_queue_depth`` of ``None`` uses the pool's ``max_queue_depth``.
+    """
+
+    weight: int = 1
+    max_queue_depth: int | None = None
+
+
+DEFAULT_LANES: Mapping[str, Lane] = {
+    JobPriority.INTERACTIVE.value: Lane(weight=4),
+    JobPriority.BULK.value: Lane(weight=1),
+}
+
+
+@dataclass(frozen=True)
+class LaneStats:
+    """Point-in-time snapshot of one lane."""
+
+    weight: int
+    queued: int
+    max_queue_depth: int
+    avg_wait_seconds: float
+    oldest_wait_seconds: float
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    """Point-in-time snapshot of queue occupancy and latency."""
+
+    workers: int
+    running: int
+    queued: int
+    max_queue_depth: int
+    avg_wait_seconds: float
+    oldest_wait_seconds: float
+    lanes: dict[str, LaneStats] = field(default_factory=dict)
+
+
+class _LaneQueue:
+    """FIFO of one lane plus its scheduling credit and wait average."""
+
+    def __init__(self, lane: Lane, max_queue_depth: int) -> None:
+        self.weight = lane.weight
+        self.max_queue_depth = max_queue_depth
+        self.tasks: deque[_Task] = deque()
+        self.credit = 0.0
+        self.avg_wait = 0.0
+
+    def head_wait(self, now: float) -> float:
+        return now - self.tasks[0].enqueued_at if self.tasks else 0.0
+
+
+class JobWorkerPool:
+    """Fixed set of daemon threads consuming bounded, prioritized job queues.
+
+    ``submit`` never blocks: it appends the job and returns, so request
+    handlers can respond immediately.  At most ``workers`` jobs execute at
+    once (the in-flight limit).  Each job goes into a lane (``lanes``,
+    by default ``interactive`` and ``bulk``) and each lane holds at most
+    its ``max_queue_depth`` waiting jobs while the workers are busy;
+    beyond that ``submit`` raises ``QueueFullError`` so callers can shed
+    load instead of oversubscribing the LLM provider.  A full bulk lane
+    therefore never rejects interactive work.
+
+    Free workers take the next job by smooth weighted round robin over
+    the non-empty lanes, so lanes share slots in proportion to their
+    ``weight``.  To keep low-weight lanes moving, a lane's effective weight
+    grows with the wait of its oldest job by its own ``weight`` per
+    ``aging_seconds``, capped one below the highest lane weight -- so a
+    lane of weight ``w`` is capped after
+    ``((max_weight - 1) / w - 1) * aging_seconds`` (the default bulk
+    lane, 1 against 4, at 3 after 2 x ``aging_seconds``).  However long a
+    backlog waits, a higher-weight lane keeps a larger share than it
+    (interactive 4 of every 7 slots by default).  Within a lane jobs run
+    FIFO.  The
+    callable is expected to handle its own failures (``run_job`` records
+    them on the job); anything that escapes is logged and the worker moves
+    on.
+
+    ``close`` begins a graceful shutdown: submissions are refused, queued
+    jobs are dropped (their ``on_drop`` called, their ids returned to the
+    caller), and ``stopping`` is set so running jobs can wind down at a
+    safe point.
+    """
+
+    # Whether submitted callables are coroutine functions (see AsyncJobWorkerPool).
+    runs_async = False
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        max_queue_depth: int = 100,
+        lanes: Mapping[str, Lane] | None = None,
+        aging_seconds: float = 30.0,
+        name: str = "job-worker",
+    ) -> None:
+        if workers <= 0:
+            raise ValueError("JobWorkerPool: workers must be > 0")
+        if max_queue_depth < 0:
+            raise ValueError("JobWorkerPool: max_queue_depth must be >= 0")
+        if aging_seconds <= 0:
+            raise ValueError("JobWorkerPool: aging_seconds must be > 0")
+        lanes = DEFAULT_LANES if lanes is None else lanes
+        if not lanes:
+            raise ValueError("JobWorkerPool: at least one lane is required")
+        for lane_name, lane in lanes.items():
+            if lane.weight <= 0:
+                raise ValueError(
+                    f"JobWorkerPool: lane {lane_name!r} weight must be > 0"
+                )
+            if lane.max_queue_depth is not None and lane.max_queue_depth < 0:
+                raise ValueError(
+                    f"JobWorkerPool: lane {lane_name!r} max_queue_depth must be >= 0"
+                )
+        self._workers = workers
+        self._max_queue_depth = max_queue_depth
+        self._lanes = {
+            lane_name: _LaneQueue(
+                lane,
+                (
+                    max_queue_depth
+                    if lane.max_queue_depth is None
+                    else lane.max_queue_depth
+                ),
+            )
+            for lane_name, lane in lanes.items()
+        }
+        self._default_lane = next(iter(self._lanes))
+        self._max_weight = max(lane.weight for lane in lanes.values())
+        self._aging_seconds = aging_seconds
+        self._queued = 0
+        self._cond = threading.Condition()
+        self._running = 0
+        # Job ids currently executing (a Counter in case one id is submitted twice).
+        self._active: Counter[str] = Counter()
+        self._closed = False
+        self._stopping = threading.Event()
+        self._avg_wait = 0.0
+        self._threads = self._start_workers(name)
+
+    @property
+    def workers(self) -> int:
+        """Maximum number of jobs executing concurrently."""
+        return self._workers
+
+    @property
+    def queued(self) -> int:
+        """Jobs waiting for a free worker, across all lanes."""
+        with self._cond:
+            return self._queued
+
+    @property
+    def running(self) -> int:
+        """Jobs currently executing."""
+        with self._cond:
+            return self._running
+
+    @property
+    def stopping(self) -> threading.Event:
+        """Set once ``close`` is called; runners poll it to stop early."""
+        return self._stopping
+
+    def active_jobs(self) -> list[str]:
+        """Ids of the jobs currently executing."""
+        with self._cond:
+            return list(self._active)
+
+    def stats(self) -> QueueStats:
+        """Return current depth, in-flight count and queue wait times.
+
+        Top-level ``max_queue_depth`` is the default per-lane bound; each
+        lane reports its own.
+        """
+        with self._cond:
+            now = time.monotonic()
+            lanes = {
+                lane_name: LaneStats(
+                    weight=lane.weight,
+                    queued=len(lane.tasks),
+                    max_queue_depth=lane.max_queue_depth,
+                    avg_wait_seconds=round(lane.avg_wait, 3),
+                    oldest_wait_seconds=round(lane.head_wait(now), 3),
+                )
+                for lane_name, lane in self._lanes.items()
+            }
+            return QueueStats(
+                workers=self._workers,
+                running=self._running,
+                queued=self._queued,
+                max_queue_depth=self._max_queue_depth,
+                avg_wait_seconds=round(self._avg_wait, 3),
+                oldest_wait_seconds=max(s.oldest_wait_seconds for s in lanes.values()),
+                lanes=lanes,
+            )
+
+    # -- public API ----------------------------------------------------------
+
+    def submit(
+        self,
+        job_id: str,
+        fn: Callable[[], None],
+        *,
+        lane: str | None = None,
+        on_drop: Callable[[], None] | None = None,
+    ) -> None:
+        """Enqueue *fn* in *lane* (default: the first lane). Never blocks.
+
+        *on_drop* is called instead of *fn* if ``close`` drops the job
+        before it starts, so the caller can give back what it reserved.
+        Raises ``QueueFullError`` when every worker is busy and the lane
+        already holds its ``max_queue_depth`` jobs, ``ValueError`` for an
+        unknown lane, ``PoolClosedError`` after ``close`` or ``shutdown``.
+        """
+        lane_name = self._default_lane if lane is None else lane
+        queue = self._lanes.get(lane_name)
+        if queue is None:
+            raise ValueError(f"JobWorkerPool: unknown lane {lane_name!r}")
+        with self._cond:
+            if self._closed:
+                raise PoolClosedError()
+            idle = max(self._workers - self._running, 0)
+            if len(queue.tasks) >= queue.max_queue_depth + idle:
+                raise QueueFullError(
+                    depth=len(queue.tasks), retry_after=self._retry_after(queue)
+                )
+            queue.tasks.append(
+                _Task(job_id=job_id, fn=fn, lane=lane_name, on_drop=on_drop)
+            )
+            self._queued += 1
+            self._wake()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until no job is queued or running. Returns ``False`` on timeout."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queued and self._running == 0, timeout=timeout
+            )
+
+    def close(self) -> list[str]:
+        """Stop accepting jobs, drop queued ones and set ``stopping``.
+
+        Calls each dropped (never started) job's ``on_drop`` outside the
+        lock and returns their ids, in lane order, so the caller can record
+        them.  Running jobs continue; use ``wait_idle`` to wait for them and
+        ``active_jobs`` for stragglers.
+        """
+        with self._cond:
+            self._closed = True
+            self._stopping.set()
+            dropped = [task for lane in self._lanes.values() for task in lane.tasks]
+            for lane in self._lanes.values():
+                lane.tasks.clear()
+                lane.credit = 0.0
+            self._queued = 0
+            self._wake()
+        for task in dropped:
+            if task.on_drop is None:
+                continue
+            try:
+                task.on_drop()
+            except Exception:
+                _logger.exception("Unhandled error dropping job %s", task.job_id)
+        return [task.job_id for task in dropped]
+
+    def shutdown(self, *, wait: bool = True, timeout: float | None = None) -> None:
+        """Stop accepting jobs; optionally wait for queued and running jobs."""
+        with self._cond:
+            self._closed = True
+            self._wake()
+        if wait:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            for thread in self._threads:
+                remaining = (
+                    None if deadline is None else max(deadline - time.monotonic(), 0)
+                )
+                thread.join(remaining)
+
+    # -- internal helpers ----------------------------------------------------
+
+    def _start_workers(self, name: str) -> list[threading.Thread]:
+        threads = [
+            threading.Thread(target=self._worker_loop, name=f"{name}-{i}", daemon=True)
+            for i in range(self._workers)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _wake(self) -> None:
+        """Signal that the queue or closed flag changed. Caller holds ``_cond``."""
+        self._cond.notify_all()
+
+    def _retry_after(self, queue: _LaneQueue) -> int:
+        """Estimate seconds until *queue* has room. Caller holds ``_cond``."""
+        oldest = queue.head_wait(time.monotonic())
+        return max(1, math.ceil(max(queue.avg_wait, oldest)))
+
+    def _next_task(self) -> _Task:
+        """Pop the next job by aged smooth weighted round robin and count it running.
+
+        Every non-empty lane earns its effective weight in credit; the
+        richest lane is served and pays back the total.  Empty lanes keep
+        no credit, so an idle lane cannot bank a burst.  Caller holds
+        ``_cond`` and ``_queued > 0``.
+        """
+        now = time.monotonic()
+        active = []
+        for lane in self._lanes.values():
+            if lane.tasks:
+                active.append(lane)
+            else:
+                lane.credit = 0.0
+        total = 0.0
+        for lane in active:
+            aged = lane.weight * (1 + lane.head_wait(now) / self._aging_seconds)
+            weight = min(aged, max(lane.weight, self._max_weight - 1))
+            lane.credit += weight
+            total += weight
+        chosen = max(active, key=lambda lane: lane.credit)
+        chosen.credit -= total
+        task = chosen.tasks.popleft()
+        self._queued -= 1
+        self._running += 1
+        self._active[task.job_id] += 1
+        wait = now - task.enqueued_at
+        chosen.avg_wait += _WAIT_EWMA_ALPHA * (wait - chosen.avg_wait)
+        self._avg_wait += _WAIT_EWMA_ALPHA * (wait - self._avg_wait)
+        return task
+
+    def _task_done(self, task: _Task) -> None:
+        """Release *task*'s worker slot and wake waiters."""
+        with self._cond:
+            self._running -= 1
+            self._active[task.job_id] -= 1
+            if not self._active[task.job_id]:
+                del self._active[task.job_id]
+            self._cond.notify_all()
+
+    # -- worker loop ---------------------------------------------------------
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queued or self._closed)
+                if not self._queued:
+                    return
+                task = self._next_task()
+            try:
+                task.fn()
+            except Exception:
+                _logger.exception("Unhandled error in job %s", task.job_id)
+            finally:
+                self._task_done(task)
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import warnings
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from src.api.routers import health, jobs
+from src.api.deps import (
+    get_graph,
+    get_job_coalescer,
+    get_job_store,
+    get_settings,
+    get_webhook_dispatcher,
+    get_worker_pool,
+)
+from src.api.routers import health, jobs, metrics, results, tenants
+from src.application.use_cases import drain_jobs
 
 # Suppress Pydantic serializer warning from LangChain's with_structured_output(include_raw=True).
 # The return dict has "parsed" which can be None or the model; Pydantic warns when serializing.
@@ -16,6 +28,35 @@ warnings.filterwarnings(
     category=UserWarning,
 )
 
-app = FastAPI(title="AIseo-AI")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Deliver completion webhooks while the app serves; drain jobs on shutdown.
+
+    Draining runs before the dispatcher stops so webhooks for jobs that
+    finish during the grace period are still queued (and sent if time
+    allows; the outbox keeps the rest).  The drain blocks, so it runs in a
+    thread.
+    """
+    dispatcher = get_webhook_dispatcher()
+    dispatcher.start()
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(
+            drain_jobs,
+            worker_pool=get_worker_pool(),
+            job_store=get_job_store(),
+            graph=get_graph(),
+            grace_seconds=get_settings().SHUTDOWN_GRACE_SECONDS,
+            coalescer=get_job_coalescer(),
+        )
+        dispatcher.stop()
+
+
+app = FastAPI(title="AIseo-AI", lifespan=lifespan)
 app.include_router(health.router)
 app.include_router(jobs.router)
+app.include_router(metrics.router)
+app.include_router(results.router)
+app.include_router(tenants.router)
@@ -17,6 +17,35 @@ class Settings(BaseSettings):
     DEFAULT_WORD_COUNT: int = 1500
     DEFAULT_LANGUAGE: str = "en"
     MAX_REVISIONS: int = 2
+    JOB_WORKERS: int = 4
+    JOB_QUEUE_MAX_DEPTH: int = 100
+    JOB_EXECUTION_MODE: str = "thread"
+    JOB_INTERACTIVE_WEIGHT: int = 4
+    JOB_BULK_WEIGHT: int = 1
+    JOB_BULK_QUEUE_MAX_DEPTH: int = 1000
+    JOB_QUEUE_AGING_SECONDS: float = 30.0
+    JOB_COALESCING: bool = False
+    JOB_STORE_BACKEND: str = "memory"
+    JOB_STORE_PATH: str = "data/jobs.sqlite3"
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    TENANT_JOBS_PER_MINUTE: int = 0
+    TENANT_LLM_TOKENS_PER_MINUTE: int = 0
+    TENANT_TOKENS_PER_WORD: float = 8.0
+    TENANT_QUOTA_IDLE_SECONDS: float = 3600.0
+    TENANT_QUOTA_MAX_TENANTS: int = 10_000
+    READY_MAX_QUEUED: int = 100
+    READY_MAX_RUNNING: int = 0
+    READY_MAX_LLM_ERROR_RATE: float = 0.5
+    READY_LLM_MIN_CALLS: int = 10
+    READY_LLM_WINDOW_SECONDS: float = 60.0
+    WEBHOOK_SECRET: str | None = None
+    WEBHOOK_CONCURRENCY: int = 4
+    WEBHOOK_MAX_ATTEMPTS: int = 8
+    WEBHOOK_BACKOFF_BASE_SECONDS: float = 1.0
+    WEBHOOK_BACKOFF_MAX_SECONDS: float = 300.0
+    WEBHOOK_TIMEOUT_SECONDS: float = 10.0
+    WEBHOOK_ALLOW_PRIVATE_URLS: bool = False
+    SHUTDOWN_GRACE_SECONDS: float = 30.0
     APP_ENV: str = "dev"
     SERP_PROVIDER: str = "mock"
     LANGCHAIN_TRACING_V2: bool = True
@@ -38,6 +67,119 @@ class Settings(BaseSettings):
             raise ValueError("MAX_REVISIONS must be >= 0")
         return v
 
+    @field_validator("JOB_WORKERS")
+    @classmethod
+    def _job_workers_positive(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("JOB_WORKERS must be > 0")
+        return v
+
+    @field_validator("JOB_QUEUE_MAX_DEPTH")
+    @classmethod
+    def _queue_depth_non_negative(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("JOB_QUEUE_MAX_DEPTH must be >= 0")
+        return v
+
+    @field_validator("JOB_INTERACTIVE_WEIGHT", "JOB_BULK_WEIGHT")
+    @classmethod
+    def _lane_weight_positive(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("lane weights must be > 0")
+        return v
+
+    @field_validator("JOB_BULK_QUEUE_MAX_DEPTH")
+    @classmethod
+    def _bulk_depth_non_negative(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("JOB_BULK_QUEUE_MAX_DEPTH must be >= 0")
+        return v
+
+    @field_validator("JOB_QUEUE_AGING_SECONDS")
+    @classmethod
+    def _aging_positive(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("JOB_QUEUE_AGING_SECONDS must be > 0")
+        return v
+
+    @field_validator("TENANT_JOBS_PER_MINUTE", "TENANT_LLM_TOKENS_PER_MINUTE")
+    @classmethod
+    def _tenant_limit_non_negative(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("tenant limits must be >= 0 (0 disables)")
+        return v
+
+    @field_validator("TENANT_TOKENS_PER_WORD")
+    @classmethod
+    def _tokens_per_word_positive(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("TENANT_TOKENS_PER_WORD must be > 0")
+        return v
+
+    @field_validator("TENANT_QUOTA_IDLE_SECONDS", "TENANT_QUOTA_MAX_TENANTS")
+    @classmethod
+    def _tenant_quota_bounds_positive(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError(
+                "TENANT_QUOTA_IDLE_SECONDS and TENANT_QUOTA_MAX_TENANTS must be > 0"
+            )
+        return v
+
+    @field_validator("IDEMPOTENCY_TTL_SECONDS")
+    @classmethod
+    def _idempotency_ttl_positive(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("IDEMPOTENCY_TTL_SECONDS must be > 0")
+        return v
+
+    @field_validator("READY_MAX_QUEUED", "READY_MAX_RUNNING", "READY_LLM_MIN_CALLS")
+    @classmethod
+    def _ready_count_non_negative(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("readiness thresholds must be >= 0 (0 disables)")
+        return v
+
+    @field_validator("READY_MAX_LLM_ERROR_RATE")
+    @classmethod
+    def _ready_error_rate_fraction(cls, v: float) -> float:
+        if not 0 <= v <= 1:
+            raise ValueError(
+                "READY_MAX_LLM_ERROR_RATE must be between 0 and 1 (0 disables)"
+            )
+        return v
+
+    @field_validator("READY_LLM_WINDOW_SECONDS")
+    @classmethod
+    def _ready_window_positive(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("READY_LLM_WINDOW_SECONDS must be > 0")
+        return v
+
+    @field_validator("WEBHOOK_CONCURRENCY", "WEBHOOK_MAX_ATTEMPTS")
+    @classmethod
+    def _webhook_count_positive(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("WEBHOOK_CONCURRENCY and WEBHOOK_MAX_ATTEMPTS must be > 0")
+        return v
+
+    @field_validator(
+        "WEBHOOK_BACKOFF_BASE_SECONDS",
+        "WEBHOOK_BACKOFF_MAX_SECONDS",
+        "WEBHOOK_TIMEOUT_SECONDS",
+    )
+    @classmethod
+    def _webhook_seconds_positive(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("webhook backoff and timeout must be > 0")
+        return v
+
+    @field_validator("SHUTDOWN_GRACE_SECONDS")
+    @classmethod
+    def _shutdown_grace_non_negative(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("SHUTDOWN_GRACE_SECONDS must be >= 0")
+        return v
+
     @model_validator(mode="after")
     def _require_api_key_outside_dev(self) -> Settings:
         if self.APP_ENV != "dev" and not self.OPENAI_API_KEY:
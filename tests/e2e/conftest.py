@@ -6,12 +6,33 @@ from pathlib import Path
 
 import pytest
 
-from src.api.deps import get_graph, get_job_store, get_settings
+from src.api.deps import (
+    get_draft_stream,
+    get_event_bus,
+    get_graph,
+    get_job_coalescer,
+    get_job_store,
+    get_llm_call_window,
+    get_metrics,
+    get_settings,
+    get_tenant_quotas,
+    get_upstream_cache,
+    get_webhook_outbox,
+    get_worker_pool,
+)
 from src.application.orchestration.graph_builder import build_graph
 from src.application.orchestration.nodes.deps import NodeDeps
 from src.application.orchestration.nodes.prompt_loader import PromptLoader
+from src.infrastructure.events.draft_stream_hub import DraftStreamHub
+from src.infrastructure.events.job_event_bus import JobEventBus
+from src.infrastructure.metrics import PipelineMetrics
+from src.infrastructure.providers.llm.call_window import LLMCallWindow
 from src.infrastructure.providers.serp.mock_serp import MockSerpProvider
+from src.infrastructure.quotas.tenant_quotas import TenantQuotas
 from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+from src.infrastructure.stores.shared_upstream_cache import SharedUpstreamCache
+from src.infrastructure.webhooks.in_memory_outbox import InMemoryWebhookOutbox
+from src.infrastructure.workers.job_worker_pool import JobWorkerPool
 from src.main import app
 from src.settings import Settings
 
@@ -37,7 +58,53 @@ def e2e_settings() -> Settings:
 
 
 @pytest.fixture
-def e2e_client(e2e_job_store: InMemoryJobStore, e2e_settings: Settings):
+def e2e_worker_pool():
+    """Worker pool for background job execution; shut down after each test."""
+    pool = JobWorkerPool(workers=2, max_queue_depth=2)
+    try:
+        yield pool
+    finally:
+        pool.shutdown(wait=True, timeout=5)
+
+
+@pytest.fixture
+def e2e_tenant_quotas(e2e_settings: Settings) -> TenantQuotas:
+    """Fresh per-tenant rate limiter for each e2e test."""
+    return TenantQuotas(
+        jobs_per_minute=e2e_settings.TENANT_JOBS_PER_MINUTE or None,
+        llm_tokens_per_minute=e2e_settings.TENANT_LLM_TOKENS_PER_MINUTE or None,
+        tokens_per_word=e2e_settings.TENANT_TOKENS_PER_WORD,
+    )
+
+
+@pytest.fixture
+def e2e_webhook_outbox() -> InMemoryWebhookOutbox:
+    """Webhook outbox for each e2e test (no dispatcher runs; tests inspect it)."""
+    return InMemoryWebhookOutbox()
+
+
+@pytest.fixture
+def e2e_llm_call_window() -> LLMCallWindow:
+    """Recent LLM outcomes seen by /health/ready (the fake LLM records none)."""
+    return LLMCallWindow()
+
+
+@pytest.fixture
+def e2e_metrics() -> PipelineMetrics:
+    """Fresh metrics registry for each e2e test."""
+    return PipelineMetrics()
+
+
+@pytest.fixture
+def e2e_client(
+    e2e_job_store: InMemoryJobStore,
+    e2e_settings: Settings,
+    e2e_worker_pool: JobWorkerPool,
+    e2e_tenant_quotas: TenantQuotas,
+    e2e_webhook_outbox: InMemoryWebhookOutbox,
+    e2e_llm_call_window: LLMCallWindow,
+    e2e_metrics: PipelineMetrics,
+):
     """TestClient with overridden deps (FakeLLM, MockSerp, no network)."""
     from fastapi.testclient import TestClient
 
@@ -45,6 +112,9 @@ def e2e_client(e2e_job_store: InMemoryJobStore, e2e_settings: Settings):
     prompt_loader = PromptLoader(base_dir=prompts_dir)
     fake_llm = FakeLLMProvider(topic="seo tools", pass_validation=True, mode="pass")
     serp = MockSerpProvider()
+    upstream_cache = SharedUpstreamCache()
+    event_bus = JobEventBus()
+    draft_stream = DraftStreamHub()
 
     def _get_settings():
         return e2e_settings
@@ -59,12 +129,24 @@ def e2e_client(e2e_job_store: InMemoryJobStore, e2e_settings: Settings):
             job_store=e2e_job_store,
             settings=e2e_settings,
             prompts=prompt_loader,
+            upstream_cache=upstream_cache,
+            draft_stream=draft_stream,
+            metrics=e2e_metrics,
         )
         return build_graph(deps=deps)
 
     app.dependency_overrides[get_settings] = _get_settings
     app.dependency_overrides[get_job_store] = _get_job_store
     app.dependency_overrides[get_graph] = _get_graph
+    app.dependency_overrides[get_worker_pool] = lambda: e2e_worker_pool
+    app.dependency_overrides[get_upstream_cache] = lambda: upstream_cache
+    app.dependency_overrides[get_event_bus] = lambda: event_bus
+    app.dependency_overrides[get_draft_stream] = lambda: draft_stream
+    app.dependency_overrides[get_tenant_quotas] = lambda: e2e_tenant_quotas
+    app.dependency_overrides[get_webhook_outbox] = lambda: e2e_webhook_outbox
+    app.dependency_overrides[get_llm_call_window] = lambda: e2e_llm_call_window
+    app.dependency_overrides[get_metrics] = lambda: e2e_metrics
+    app.dependency_overrides[get_job_coalescer] = lambda: None
 
     try:
         yield TestClient(app)
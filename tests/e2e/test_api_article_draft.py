@@ -0,0 +1,40 @@
+"""E2E test: GET /jobs/{id}/draft streams write_article markdown."""
+
+from __future__ import annotations
+
+import threading
+
+
+def test_api_draft_streams_while_job_runs(e2e_client, e2e_worker_pool) -> None:
+    """Subscribe before the job runs; the streamed draft is the full article."""
+    job_id = e2e_client.post(
+        "/jobs", json={"topic": "seo tools", "run_immediately": False}
+    ).json()["job"]["id"]
+    timer = threading.Timer(0.2, lambda: e2e_client.post(f"/jobs/{job_id}/run"))
+    timer.start()
+
+    with e2e_client.stream("GET", f"/jobs/{job_id}/draft") as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/markdown")
+        draft = "".join(response.iter_text())
+
+    timer.join()
+    assert e2e_worker_pool.wait_idle(timeout=10)
+    assert draft.startswith("# Best Seo Tools Guide")
+    assert "## Conclusion" in draft
+
+
+def test_api_draft_of_completed_job_returns_final_article(
+    e2e_client, e2e_worker_pool
+) -> None:
+    job_id = e2e_client.post("/jobs", json={"topic": "seo tools"}).json()["job"]["id"]
+    assert e2e_worker_pool.wait_idle(timeout=10)
+
+    response = e2e_client.get(f"/jobs/{job_id}/draft")
+    result = e2e_client.get(f"/jobs/{job_id}/result").json()["result"]
+    assert response.status_code == 200
+    assert response.text == result["article_markdown"]
+
+
+def test_api_draft_unknown_job(e2e_client) -> None:
+    assert e2e_client.get("/jobs/missing/draft").status_code == 404
@@ -0,0 +1,45 @@
+"""E2E test: jobs and batches run on the async worker pool."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.domain.models.job import JobStatus
+from src.infrastructure.workers.async_job_worker_pool import AsyncJobWorkerPool
+
+
+@pytest.fixture
+def e2e_worker_pool():
+    """Async pool replacing the threaded one for this module."""
+    pool = AsyncJobWorkerPool(workers=8, max_queue_depth=8)
+    try:
+        yield pool
+    finally:
+        pool.shutdown(wait=True, timeout=5)
+
+
+def test_jobs_complete_on_async_pool(e2e_client, e2e_worker_pool) -> None:
+    job_ids = []
+    for _ in range(3):
+        response = e2e_client.post(
+            "/jobs", json={"topic": "seo tools", "run_immediately": True}
+        )
+        assert response.status_code == 202
+        job_ids.append(response.json()["job"]["id"])
+    batch = e2e_client.post(
+        "/jobs:batch",
+        json={"jobs": [{"topic": "seo tools", "run_immediately": True}] * 3},
+    )
+    assert batch.status_code == 202
+    job_ids += [job["id"] for job in batch.json()["jobs"]]
+
+    assert e2e_worker_pool.wait_idle(timeout=10)
+
+    for job_id in job_ids:
+        data = e2e_client.get(f"/jobs/{job_id}").json()
+        assert data["status"] == JobStatus.COMPLETED.value, data["error"]
+    result = e2e_client.get(f"/jobs/{job_ids[0]}/result")
+    assert result.status_code == 200
+    assert result.json()["result"]["article_markdown"].startswith(
+        "# Best Seo Tools Guide"
+    )
@@ -0,0 +1,43 @@
+"""E2E test: POST /jobs returns 429 with Retry-After when the job queue is full."""
+
+from __future__ import annotations
+
+import threading
+
+from src.domain.models.job import JobStatus
+
+
+def test_api_queue_full_returns_429(e2e_client, e2e_worker_pool) -> None:
+    """Saturate workers and queue; POST /jobs -> 429; health shows depth."""
+    release = threading.Event()
+    for i in range(4):
+        e2e_worker_pool.submit(f"blocker-{i}", lambda: release.wait(10))
+
+    try:
+        response = e2e_client.post(
+            "/jobs",
+            json={"topic": "seo tools", "run_immediately": True},
+        )
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+
+        health = e2e_client.get("/health").json()
+        assert health["queue"]["running"] == 2
+        assert health["queue"]["queued"] == 2
+        assert health["queue"]["max_queue_depth"] == 2
+
+        deferred = e2e_client.post(
+            "/jobs",
+            json={"topic": "seo tools", "run_immediately": False},
+        )
+        job_id = deferred.json()["job"]["id"]
+        run_response = e2e_client.post(f"/jobs/{job_id}/run")
+        assert run_response.status_code == 429
+        assert (
+            e2e_client.get(f"/jobs/{job_id}").json()["status"]
+            == JobStatus.PENDING.value
+        )
+    finally:
+        release.set()
+
+    assert e2e_worker_pool.wait_idle(timeout=10)
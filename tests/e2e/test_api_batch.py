@@ -0,0 +1,70 @@
+"""E2E test: POST /jobs:batch creates and queues many jobs in one call."""
+
+from __future__ import annotations
+
+from src.domain.models.job import JobStatus
+
+
+def test_api_batch_submission(e2e_client, e2e_worker_pool) -> None:
+    """POST /jobs:batch -> 202 with one job per item, in order; all complete."""
+    response = e2e_client.post(
+        "/jobs:batch",
+        json={
+            "jobs": [
+                {"topic": "seo tools"},
+                {"topic": "seo tools"},
+                {"topic": "seo tools", "run_immediately": False},
+            ]
+        },
+    )
+    assert response.status_code == 202
+    jobs = response.json()["jobs"]
+    assert len(jobs) == 3
+    assert [j["status"] for j in jobs] == [
+        JobStatus.QUEUED.value,
+        JobStatus.QUEUED.value,
+        JobStatus.PENDING.value,
+    ]
+
+    assert e2e_worker_pool.wait_idle(timeout=10)
+    for job in jobs[:2]:
+        status = e2e_client.get(f"/jobs/{job['id']}").json()["status"]
+        assert status == JobStatus.COMPLETED.value
+
+
+def test_api_batch_rejects_empty(e2e_client) -> None:
+    response = e2e_client.post("/jobs:batch", json={"jobs": []})
+    assert response.status_code == 422
+
+
+def test_api_batch_jobs_default_to_bulk_lane(
+    e2e_client, e2e_job_store, e2e_worker_pool
+) -> None:
+    """Batch items run in the bulk lane unless they ask for interactive."""
+    response = e2e_client.post(
+        "/jobs:batch",
+        json={
+            "jobs": [
+                {"topic": "seo tools"},
+                {"topic": "seo tools", "priority": "interactive"},
+            ]
+        },
+    )
+    assert response.status_code == 202
+    ids = [job["id"] for job in response.json()["jobs"]]
+    assert [e2e_job_store.get(i).input.priority.value for i in ids] == [
+        "bulk",
+        "interactive",
+    ]
+
+    single = e2e_client.post(
+        "/jobs", json={"topic": "seo tools", "run_immediately": False}
+    )
+    assert (
+        e2e_job_store.get(single.json()["job"]["id"]).input.priority.value
+        == "interactive"
+    )
+
+    lanes = e2e_client.get("/health").json()["queue"]["lanes"]
+    assert set(lanes) == {"interactive", "bulk"}
+    assert e2e_worker_pool.wait_idle(timeout=10)
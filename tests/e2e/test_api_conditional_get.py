@@ -0,0 +1,88 @@
+"""E2E test: ETags, 304s, Cache-Control and compression on job resources."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+
+@pytest.fixture
+def completed_job_id(e2e_client, e2e_worker_pool) -> str:
+    job_id = e2e_client.post("/jobs", json={"topic": "seo tools"}).json()["job"]["id"]
+    assert e2e_worker_pool.wait_idle(timeout=10)
+    return job_id
+
+
+def test_api_result_etag_round_trip(e2e_client, completed_job_id) -> None:
+    first = e2e_client.get(f"/jobs/{completed_job_id}/result")
+    etag = first.headers["etag"]
+    assert "immutable" in first.headers["cache-control"]
+
+    again = e2e_client.get(
+        f"/jobs/{completed_job_id}/result", headers={"If-None-Match": etag}
+    )
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+
+def test_api_result_etag_is_stable_and_per_projection(
+    e2e_client, completed_job_id
+) -> None:
+    full_a = e2e_client.get(f"/jobs/{completed_job_id}/result").headers["etag"]
+    full_b = e2e_client.get(f"/jobs/{completed_job_id}/result").headers["etag"]
+    projected = e2e_client.get(
+        f"/jobs/{completed_job_id}/result?fields=seo_meta"
+    ).headers["etag"]
+    assert full_a == full_b
+    assert projected != full_a
+
+
+def test_api_result_gzip(e2e_client, completed_job_id) -> None:
+    response = e2e_client.get(
+        f"/jobs/{completed_job_id}/result", headers={"Accept-Encoding": "gzip"}
+    )
+    # httpx decodes transparently; the header proves the body was compressed.
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].endswith('-gzip"')
+    assert "result" in response.json()
+
+    revalidated = e2e_client.get(
+        f"/jobs/{completed_job_id}/result",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+
+
+def test_api_result_identity_when_not_accepted(e2e_client, completed_job_id) -> None:
+    response = e2e_client.get(
+        f"/jobs/{completed_job_id}/result", headers={"Accept-Encoding": "identity"}
+    )
+    assert "content-encoding" not in response.headers
+    assert json.loads(response.content)["result"]["article_markdown"]
+
+
+def test_api_job_status_etag(e2e_client, completed_job_id) -> None:
+    first = e2e_client.get(f"/jobs/{completed_job_id}")
+    assert "immutable" in first.headers["cache-control"]
+
+    again = e2e_client.get(
+        f"/jobs/{completed_job_id}", headers={"If-None-Match": first.headers["etag"]}
+    )
+    assert again.status_code == 304
+
+
+def test_api_pending_job_status_revalidates(e2e_client, e2e_job_store) -> None:
+    job = e2e_client.post(
+        "/jobs", json={"topic": "seo tools", "run_immediately": False}
+    ).json()["job"]
+    first = e2e_client.get(f"/jobs/{job['id']}")
+    assert first.headers["cache-control"] == "no-cache"
+
+    e2e_job_store.set_current_node(job["id"], "collect_serp")
+    changed = e2e_client.get(
+        f"/jobs/{job['id']}", headers={"If-None-Match": first.headers["etag"]}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != first.headers["etag"]
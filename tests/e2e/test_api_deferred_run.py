@@ -5,8 +5,11 @@ from __future__ import annotations
 from src.domain.models.job import JobStatus
 
 
-def test_api_deferred_run(e2e_client) -> None:
-    """POST /jobs run_immediately=false -> pending; POST /run -> complete; GET result works."""
+def test_api_deferred_run(e2e_client, e2e_worker_pool) -> None:
+    """POST /jobs run_immediately=false -> pending; POST /run -> 202 queued.
+
+    GET result works once the worker finishes.
+    """
     response = e2e_client.post(
         "/jobs",
         json={"topic": "seo tools", "run_immediately": False},
@@ -17,8 +20,13 @@ def test_api_deferred_run(e2e_client) -> None:
     assert job["status"] == JobStatus.PENDING.value
 
     run_response = e2e_client.post(f"/jobs/{job_id}/run")
-    assert run_response.status_code == 200
-    assert run_response.json()["status"] == JobStatus.COMPLETED.value
+    assert run_response.status_code == 202
+    assert run_response.json()["status"] == JobStatus.QUEUED.value
+
+    assert e2e_worker_pool.wait_idle(timeout=10)
+    assert (
+        e2e_client.get(f"/jobs/{job_id}").json()["status"] == JobStatus.COMPLETED.value
+    )
 
     result_response = e2e_client.get(f"/jobs/{job_id}/result")
     assert result_response.status_code == 200
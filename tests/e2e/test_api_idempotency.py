@@ -0,0 +1,47 @@
+"""E2E test: Idempotency-Key on POST /jobs returns the original job on retry."""
+
+from __future__ import annotations
+
+import threading
+
+from src.domain.models.job import JobStatus
+
+
+def test_api_retry_with_idempotency_key_replays_job(
+    e2e_client, e2e_job_store, e2e_worker_pool
+) -> None:
+    headers = {"Idempotency-Key": "retry-1"}
+    first = e2e_client.post("/jobs", json={"topic": "seo tools"}, headers=headers)
+    assert first.status_code == 202
+    assert "Idempotent-Replayed" not in first.headers
+
+    retry = e2e_client.post("/jobs", json={"topic": "seo tools"}, headers=headers)
+    assert retry.status_code == 200
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.json()["job"]["id"] == first.json()["job"]["id"]
+
+    conflict = e2e_client.post("/jobs", json={"topic": "other"}, headers=headers)
+    assert conflict.status_code == 422
+
+    assert e2e_worker_pool.wait_idle(timeout=10)
+    assert len(e2e_job_store.list_jobs(limit=10)) == 1
+
+
+def test_api_key_released_when_queue_is_full(e2e_client, e2e_worker_pool) -> None:
+    release = threading.Event()
+    for i in range(4):
+        e2e_worker_pool.submit(f"blocker-{i}", lambda: release.wait(10))
+    headers = {"Idempotency-Key": "retry-2"}
+    try:
+        rejected = e2e_client.post(
+            "/jobs", json={"topic": "seo tools"}, headers=headers
+        )
+        assert rejected.status_code == 429
+    finally:
+        release.set()
+    assert e2e_worker_pool.wait_idle(timeout=10)
+
+    accepted = e2e_client.post("/jobs", json={"topic": "seo tools"}, headers=headers)
+    assert accepted.status_code == 202
+    assert accepted.json()["job"]["status"] == JobStatus.QUEUED.value
+    assert e2e_worker_pool.wait_idle(timeout=10)
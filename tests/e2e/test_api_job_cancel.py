@@ -0,0 +1,37 @@
+"""E2E test: POST /jobs/{id}/cancel."""
+
+from __future__ import annotations
+
+from src.domain.models.job import JobStatus
+
+
+def test_cancel_pending_job_then_rerun(e2e_client, e2e_worker_pool) -> None:
+    job_id = e2e_client.post(
+        "/jobs", json={"topic": "seo tools", "run_immediately": False}
+    ).json()["job"]["id"]
+
+    response = e2e_client.post(f"/jobs/{job_id}/cancel")
+    assert response.status_code == 202
+    assert response.json()["status"] == JobStatus.CANCELLED.value
+    assert e2e_client.post(f"/jobs/{job_id}/cancel").status_code == 202
+
+    assert e2e_client.post(f"/jobs/{job_id}/run").status_code == 202
+    assert e2e_worker_pool.wait_idle(timeout=10)
+    assert (
+        e2e_client.get(f"/jobs/{job_id}").json()["status"] == JobStatus.COMPLETED.value
+    )
+
+
+def test_cancel_completed_job_conflicts(e2e_client, e2e_worker_pool) -> None:
+    job_id = e2e_client.post(
+        "/jobs", json={"topic": "seo tools", "run_immediately": True}
+    ).json()["job"]["id"]
+    assert e2e_worker_pool.wait_idle(timeout=10)
+
+    response = e2e_client.post(f"/jobs/{job_id}/cancel")
+    assert response.status_code == 409
+    assert "already completed" in response.json()["detail"]
+
+
+def test_cancel_unknown_job_returns_404(e2e_client) -> None:
+    assert e2e_client.post("/jobs/missing/cancel").status_code == 404
@@ -0,0 +1,55 @@
+"""E2E test: GET /jobs/{id}/events streams node progress as Server-Sent Events."""
+
+from __future__ import annotations
+
+import json
+
+
+def _read_frames(response) -> list[dict]:
+    frames: list[dict] = []
+    current: dict = {}
+    for line in response.iter_lines():
+        if not line:
+            if current:
+                frames.append(current)
+                current = {}
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(": ")
+        current[field] = value
+    return frames
+
+
+def test_api_job_events_stream(e2e_client, e2e_worker_pool) -> None:
+    """Events end with a terminal frame; node_end frames carry durations."""
+    job_id = e2e_client.post("/jobs", json={"topic": "seo tools"}).json()["job"]["id"]
+
+    with e2e_client.stream("GET", f"/jobs/{job_id}/events") as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = _read_frames(response)
+
+    assert frames[-1]["event"] == "terminal"
+    assert json.loads(frames[-1]["data"])["status"] == "completed"
+    node_ends = [json.loads(f["data"]) for f in frames if f["event"] == "node_end"]
+    assert node_ends[0]["node"] == "collect_serp"
+    assert all(e["duration_ms"] is not None for e in node_ends)
+    assert e2e_worker_pool.wait_idle(timeout=10)
+
+
+def test_api_job_events_resume_after_last_event_id(e2e_client, e2e_worker_pool) -> None:
+    job_id = e2e_client.post("/jobs", json={"topic": "seo tools"}).json()["job"]["id"]
+    assert e2e_worker_pool.wait_idle(timeout=10)
+
+    with e2e_client.stream(
+        "GET", f"/jobs/{job_id}/events", headers={"Last-Event-ID": "3"}
+    ) as response:
+        frames = _read_frames(response)
+
+    assert int(frames[0]["id"]) == 4
+    assert frames[-1]["event"] == "terminal"
+
+
+def test_api_job_events_unknown_job(e2e_client) -> None:
+    assert e2e_client.get("/jobs/missing/events").status_code == 404
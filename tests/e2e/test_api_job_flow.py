@@ -5,25 +5,48 @@ from __future__ import annotations
 from src.domain.models.job import JobStatus
 
 
-def test_api_job_flow(e2e_client) -> None:
-    """POST /jobs run_immediately=true -> 200, job completed; GET /jobs/{id} and /result work."""
+def test_api_job_flow(e2e_client, e2e_worker_pool) -> None:
+    """POST /jobs run_immediately=true -> 202 queued; worker completes.
+
+    GET /jobs/{id} and /result work.
+    """
     response = e2e_client.post(
         "/jobs",
         json={"topic": "seo tools", "run_immediately": True},
     )
-    assert response.status_code == 200
+    assert response.status_code == 202
     data = response.json()
     job = data["job"]
     job_id = job["id"]
-    assert job["status"] in (JobStatus.COMPLETED.value, JobStatus.FAILED.value)
+    assert job["status"] == JobStatus.QUEUED.value
+
+    assert e2e_worker_pool.wait_idle(timeout=10)
 
     get_response = e2e_client.get(f"/jobs/{job_id}")
     assert get_response.status_code == 200
-    assert get_response.json()["status"] == job["status"]
+    status = get_response.json()["status"]
+    assert status in (JobStatus.COMPLETED.value, JobStatus.FAILED.value)
 
-    if job["status"] == JobStatus.COMPLETED.value:
+    if status == JobStatus.COMPLETED.value:
         result_response = e2e_client.get(f"/jobs/{job_id}/result")
         assert result_response.status_code == 200
         result = result_response.json()["result"]
         assert "seo_meta" in result
         assert "article_markdown" in result
+
+
+def test_api_job_with_deadline(e2e_client, e2e_worker_pool) -> None:
+    """deadline_seconds is accepted (and a generous one does not affect the run)."""
+    bad = e2e_client.post("/jobs", json={"topic": "seo tools", "deadline_seconds": 0})
+    assert bad.status_code == 422
+
+    response = e2e_client.post(
+        "/jobs", json={"topic": "seo tools", "deadline_seconds": 60}
+    )
+    assert response.status_code == 202
+    job_id = response.json()["job"]["id"]
+
+    assert e2e_worker_pool.wait_idle(timeout=10)
+    assert (
+        e2e_client.get(f"/jobs/{job_id}").json()["status"] == JobStatus.COMPLETED.value
+    )
@@ -0,0 +1,52 @@
+"""E2E test: GET /jobs lists jobs by status with cursor pagination."""
+
+from __future__ import annotations
+
+
+def _create_pending(client, n: int) -> list[str]:
+    return [
+        client.post(
+            "/jobs", json={"topic": f"topic {i}", "run_immediately": False}
+        ).json()["job"]["id"]
+        for i in range(n)
+    ]
+
+
+def test_api_list_jobs_paginates_in_update_order(e2e_client) -> None:
+    ids = _create_pending(e2e_client, 5)
+
+    first = e2e_client.get("/jobs?limit=2").json()
+    second = e2e_client.get(f"/jobs?limit=2&cursor={first['next_cursor']}").json()
+    third = e2e_client.get(f"/jobs?limit=2&cursor={second['next_cursor']}").json()
+
+    listed = [j["id"] for page in (first, second, third) for j in page["jobs"]]
+    assert listed == ids
+    assert third["next_cursor"] is None
+
+
+def test_api_list_jobs_filters_by_status(e2e_client, e2e_job_store) -> None:
+    ids = _create_pending(e2e_client, 3)
+    e2e_job_store.set_error(ids[1], "boom")
+
+    failed = e2e_client.get("/jobs?status=failed").json()["jobs"]
+    pending = e2e_client.get("/jobs?status=pending").json()["jobs"]
+
+    assert [j["id"] for j in failed] == [ids[1]]
+    assert [j["id"] for j in pending] == [ids[0], ids[2]]
+
+
+def test_api_list_jobs_moves_updated_job_to_end(e2e_client, e2e_job_store) -> None:
+    ids = _create_pending(e2e_client, 3)
+    e2e_job_store.set_current_node(ids[0], "collect_serp")
+
+    listed = [j["id"] for j in e2e_client.get("/jobs").json()["jobs"]]
+
+    assert listed == [ids[1], ids[2], ids[0]]
+
+
+def test_api_list_jobs_rejects_bad_cursor(e2e_client) -> None:
+    assert e2e_client.get("/jobs?cursor=not-a-cursor").status_code == 422
+
+
+def test_api_list_jobs_rejects_unknown_status(e2e_client) -> None:
+    assert e2e_client.get("/jobs?status=bogus").status_code == 422
@@ -0,0 +1,20 @@
+"""E2E test: POST /jobs/{id}/resume status mapping."""
+
+from __future__ import annotations
+
+
+def test_api_resume_errors(e2e_client, e2e_worker_pool) -> None:
+    """404 for unknown jobs; 409 unless failed/cancelled with a checkpoint."""
+    assert e2e_client.post("/jobs/missing/resume").status_code == 404
+
+    job_id = e2e_client.post(
+        "/jobs", json={"topic": "seo tools", "run_immediately": False}
+    ).json()["job"]["id"]
+    pending = e2e_client.post(f"/jobs/{job_id}/resume")
+    assert pending.status_code == 409
+    assert "only failed, cancelled or interrupted" in pending.json()["detail"]
+
+    assert e2e_client.post(f"/jobs/{job_id}/cancel").status_code == 202
+    never_ran = e2e_client.post(f"/jobs/{job_id}/resume")
+    assert never_ran.status_code == 409
+    assert "no checkpoint" in never_ran.json()["detail"]
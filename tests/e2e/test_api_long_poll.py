@@ -0,0 +1,98 @@
+"""E2E test: GET /jobs/{id}?wait= long-polls on store change notifications."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+
+def _create_pending(client) -> dict:
+    return client.post(
+        "/jobs", json={"topic": "seo tools", "run_immediately": False}
+    ).json()["job"]
+
+
+def test_api_long_poll_wakes_on_change(e2e_client, e2e_job_store) -> None:
+    job = _create_pending(e2e_client)
+    timer = threading.Timer(
+        0.2, e2e_job_store.set_current_node, args=(job["id"], "collect_serp")
+    )
+    timer.start()
+    try:
+        started = time.monotonic()
+        response = e2e_client.get(f"/jobs/{job['id']}?wait=10&since={job['version']}")
+        elapsed = time.monotonic() - started
+    finally:
+        timer.cancel()
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["current_node"] == "collect_serp"
+    assert body["version"] > job["version"]
+    assert elapsed < 5
+
+
+def test_api_long_poll_returns_immediately_when_behind(
+    e2e_client, e2e_job_store
+) -> None:
+    job = _create_pending(e2e_client)
+    e2e_job_store.set_current_node(job["id"], "collect_serp")
+
+    started = time.monotonic()
+    body = e2e_client.get(f"/jobs/{job['id']}?wait=10&since={job['version']}").json()
+
+    assert body["version"] > job["version"]
+    assert time.monotonic() - started < 5
+
+
+def test_api_long_poll_times_out_unchanged(e2e_client) -> None:
+    job = _create_pending(e2e_client)
+
+    body = e2e_client.get(f"/jobs/{job['id']}?wait=0.2").json()
+
+    assert body["version"] == job["version"]
+    assert body["status"] == "pending"
+
+
+def test_api_long_poll_terminal_job_does_not_wait(e2e_client, e2e_worker_pool) -> None:
+    job = e2e_client.post("/jobs", json={"topic": "seo tools"}).json()["job"]
+    assert e2e_worker_pool.wait_idle(timeout=10)
+
+    started = time.monotonic()
+    body = e2e_client.get(f"/jobs/{job['id']}?wait=30&since=9999").json()
+
+    assert body["status"] == "completed"
+    assert time.monotonic() - started < 5
+
+
+def test_api_long_poll_rejects_excessive_wait(e2e_client) -> None:
+    job = _create_pending(e2e_client)
+    assert e2e_client.get(f"/jobs/{job['id']}?wait=600").status_code == 422
+
+
+def test_api_long_poll_unknown_job(e2e_client) -> None:
+    assert e2e_client.get("/jobs/missing?wait=1").status_code == 404
+
+
+def test_api_status_reads_the_store_off_the_event_loop(
+    e2e_client, e2e_job_store, monkeypatch
+) -> None:
+    job = _create_pending(e2e_client)
+    on_loop: list[str] = []
+    get = e2e_job_store.get
+
+    def _get(job_id: str):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            on_loop.append(job_id)
+        return get(job_id)
+
+    monkeypatch.setattr(e2e_job_store, "get", _get)
+    assert e2e_client.get(f"/jobs/{job['id']}").status_code == 200
+    assert e2e_client.get(f"/jobs/{job['id']}?wait=0.2").status_code == 200
+
+    assert on_loop == []
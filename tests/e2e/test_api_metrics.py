@@ -0,0 +1,22 @@
+"""E2E tests for GET /metrics – Prometheus text after a job has run."""
+
+from __future__ import annotations
+
+
+def test_metrics_after_job(e2e_client, e2e_worker_pool) -> None:
+    resp = e2e_client.post(
+        "/jobs", json={"topic": "seo tools", "target_word_count": 500}
+    )
+    assert resp.status_code == 202
+    assert e2e_worker_pool.wait_idle(timeout=10)
+
+    resp = e2e_client.get("/metrics")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = resp.text
+    assert "# TYPE aiseo_node_duration_seconds histogram" in text
+    assert 'aiseo_node_duration_seconds_count{node="finalize"} 1' in text
+    assert 'aiseo_revision_rounds_count{outcome="completed"} 1' in text
+    assert 'aiseo_queue_depth{lane="interactive"} 0' in text
+    assert "aiseo_jobs_running 0" in text
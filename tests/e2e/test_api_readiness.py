@@ -0,0 +1,50 @@
+"""E2E tests for GET /health/ready – saturation and LLM error thresholds."""
+
+from __future__ import annotations
+
+import threading
+
+
+def test_ready_when_idle(e2e_client) -> None:
+    resp = e2e_client.get("/health/ready")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["status"] == "ready"
+    assert body["queue"]["queued"] == 0
+    assert body["llm"]["calls"] == 0
+
+
+def test_not_ready_when_queue_is_saturated(
+    e2e_client, e2e_worker_pool, e2e_settings
+) -> None:
+    e2e_settings.READY_MAX_QUEUED = 2
+    release = threading.Event()
+    for i in range(4):
+        e2e_worker_pool.submit(f"blocker-{i}", lambda: release.wait(10))
+    try:
+        resp = e2e_client.get("/health/ready")
+    finally:
+        release.set()
+
+    assert resp.status_code == 503
+    body = resp.json()
+    assert body["status"] == "not_ready"
+    assert body["queue"]["queued"] == 2
+    assert body["thresholds"]["max_queued"] == 2
+    assert body["reasons"] == ["interactive queued jobs 2 >= 2"]
+
+
+def test_not_ready_when_llm_calls_fail(e2e_client, e2e_llm_call_window) -> None:
+    for i in range(20):
+        e2e_llm_call_window.record(ok=i % 4 == 0)
+
+    resp = e2e_client.get("/health/ready")
+
+    assert resp.status_code == 503
+    assert resp.json()["llm"] == {
+        "window_seconds": 60.0,
+        "calls": 20,
+        "errors": 15,
+        "error_rate": 0.75,
+    }
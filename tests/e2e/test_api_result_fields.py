@@ -0,0 +1,39 @@
+"""E2E test: GET /jobs/{id}/result?fields= projects the result."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture
+def completed_job_id(e2e_client, e2e_worker_pool) -> str:
+    job_id = e2e_client.post("/jobs", json={"topic": "seo tools"}).json()["job"]["id"]
+    assert e2e_worker_pool.wait_idle(timeout=10)
+    return job_id
+
+
+def test_api_result_fields_projection(e2e_client, completed_job_id) -> None:
+    response = e2e_client.get(
+        f"/jobs/{completed_job_id}/result?fields=seo_meta,article_markdown"
+    )
+
+    assert response.status_code == 200
+    result = response.json()["result"]
+    assert set(result) == {"seo_meta", "article_markdown"}
+    full = e2e_client.get(f"/jobs/{completed_job_id}/result").json()["result"]
+    assert result["seo_meta"] == full["seo_meta"]
+    assert result["article_markdown"] == full["article_markdown"]
+
+
+def test_api_result_without_fields_is_complete(e2e_client, completed_job_id) -> None:
+    result = e2e_client.get(f"/jobs/{completed_job_id}/result").json()["result"]
+    assert "structured_data" in result
+    assert "validation_report" in result
+
+
+@pytest.mark.parametrize("fields", ["bogus", "seo_meta,bogus", ",", ""])
+def test_api_result_fields_rejects_unknown(
+    e2e_client, completed_job_id, fields
+) -> None:
+    response = e2e_client.get(f"/jobs/{completed_job_id}/result?fields={fields}")
+    assert response.status_code == 422
@@ -0,0 +1,37 @@
+"""E2E test: GET /results/export streams results as NDJSON with resumable cursors."""
+
+from __future__ import annotations
+
+import json
+
+from tests.unit.test_result_json_cache import _output
+
+
+def test_api_export_streams_ndjson(e2e_client, e2e_job_store) -> None:
+    for i in range(3):
+        e2e_job_store.create(f"job-{i}")
+        e2e_job_store.set_result(f"job-{i}", _output(f"Title {i}"))
+    e2e_job_store.create("pending")
+
+    response = e2e_client.get("/results/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["job_id"] for line in lines] == ["job-0", "job-1", "job-2"]
+    assert lines[0]["result"]["seo_meta"]["title_tag"] == "Title 0"
+
+    resumed = e2e_client.get("/results/export", params={"cursor": lines[0]["cursor"]})
+    assert [json.loads(line)["job_id"] for line in resumed.text.splitlines()] == [
+        "job-1",
+        "job-2",
+    ]
+
+
+def test_api_export_rejects_non_completed_status(e2e_client) -> None:
+    assert (
+        e2e_client.get("/results/export", params={"status": "failed"}).status_code
+        == 422
+    )
+    assert (
+        e2e_client.get("/results/export", params={"cursor": "%%%"}).status_code == 422
+    )
@@ -0,0 +1,24 @@
+"""E2E test: while the pool drains, submissions get 503 and leave no job behind."""
+
+from __future__ import annotations
+
+from src.domain.models.job import JobStatus
+
+
+def test_api_submissions_rejected_while_draining(e2e_client, e2e_worker_pool) -> None:
+    deferred = e2e_client.post(
+        "/jobs", json={"topic": "seo tools", "run_immediately": False}
+    )
+    job_id = deferred.json()["job"]["id"]
+    e2e_worker_pool.close()
+
+    response = e2e_client.post(
+        "/jobs", json={"topic": "seo tools", "run_immediately": True}
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert [job["id"] for job in e2e_client.get("/jobs").json()["jobs"]] == [job_id]
+
+    run_response = e2e_client.post(f"/jobs/{job_id}/run")
+    assert run_response.status_code == 503
+    assert e2e_client.get(f"/jobs/{job_id}").json()["status"] == JobStatus.PENDING.value
@@ -0,0 +1,61 @@
+"""E2E test: X-Tenant-ID quotas reject over-rate tenants and report usage."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.domain.models.job import JobStatus
+from src.settings import Settings
+
+
+@pytest.fixture
+def e2e_settings() -> Settings:
+    return Settings(
+        MAX_REVISIONS=1,
+        DEFAULT_WORD_COUNT=500,
+        SERP_PROVIDER="mock",
+        APP_ENV="dev",
+        TENANT_JOBS_PER_MINUTE=2,
+    )
+
+
+def test_api_tenant_over_jobs_quota_gets_429(
+    e2e_client, e2e_job_store, e2e_worker_pool
+) -> None:
+    acme = {"X-Tenant-ID": "acme"}
+    for _ in range(2):
+        accepted = e2e_client.post("/jobs", json={"topic": "seo tools"}, headers=acme)
+        assert accepted.status_code == 202
+
+    rejected = e2e_client.post("/jobs", json={"topic": "seo tools"}, headers=acme)
+    assert rejected.status_code == 429
+    assert int(rejected.headers["Retry-After"]) >= 1
+
+    other = e2e_client.post(
+        "/jobs", json={"topic": "seo tools"}, headers={"X-Tenant-ID": "globex"}
+    )
+    assert other.status_code == 202
+    assert e2e_job_store.get(other.json()["job"]["id"]).input.tenant_id == "globex"
+
+    deferred = e2e_client.post(
+        "/jobs", json={"topic": "seo tools", "run_immediately": False}, headers=acme
+    )
+    job_id = deferred.json()["job"]["id"]
+    # Running a deferred job is charged to the tenant that created it.
+    assert e2e_client.post(f"/jobs/{job_id}/run").status_code == 429
+    assert e2e_client.get(f"/jobs/{job_id}").json()["status"] == JobStatus.PENDING.value
+    assert e2e_worker_pool.wait_idle(timeout=10)
+
+    usage = e2e_client.get("/tenants/acme/usage").json()
+    assert usage["jobs_per_minute"] == 2
+    assert usage["jobs_admitted_total"] == 2
+    assert usage["jobs_rejected_total"] == 2
+    assert usage["llm_tokens_reserved"] == 0
+
+
+def test_api_invalid_tenant_id_rejected(e2e_client) -> None:
+    response = e2e_client.post(
+        "/jobs", json={"topic": "seo tools"}, headers={"X-Tenant-ID": "a b"}
+    )
+    assert response.status_code == 422
+    assert e2e_client.get("/tenants/a%20b/usage").status_code == 422
@@ -0,0 +1,62 @@
+"""E2E tests for completion webhooks – callback_url queues a delivery at job end."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.infrastructure.webhooks import WebhookStatus
+
+
+def test_completed_job_queues_webhook(
+    e2e_client, e2e_worker_pool, e2e_webhook_outbox
+) -> None:
+    resp = e2e_client.post(
+        "/jobs",
+        json={
+            "topic": "seo tools",
+            "target_word_count": 500,
+            "callback_url": "https://client.example/hooks/seo",
+        },
+    )
+    assert resp.status_code == 202
+    job_id = resp.json()["job"]["id"]
+    assert e2e_worker_pool.wait_idle(timeout=10)
+
+    [delivery] = e2e_webhook_outbox.deliveries(job_id)
+    assert delivery.url == "https://client.example/hooks/seo"
+    assert delivery.status == WebhookStatus.PENDING
+    payload = json.loads(delivery.body)
+    assert payload["event"] == "job.completed"
+    assert payload["job_id"] == job_id
+    assert payload["status"] == "completed"
+    assert payload["result_hash"]
+
+
+def test_job_without_callback_queues_nothing(
+    e2e_client, e2e_worker_pool, e2e_webhook_outbox
+) -> None:
+    resp = e2e_client.post(
+        "/jobs", json={"topic": "seo tools", "target_word_count": 500}
+    )
+    job_id = resp.json()["job"]["id"]
+    assert e2e_worker_pool.wait_idle(timeout=10)
+
+    assert e2e_webhook_outbox.deliveries(job_id) == []
+
+
+def test_rejects_non_http_callback_url(e2e_client) -> None:
+    resp = e2e_client.post(
+        "/jobs", json={"topic": "seo tools", "callback_url": "ftp://client.example/hook"}
+    )
+    assert resp.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "url", ["http://127.0.0.1:8000/hook", "http://169.254.169.254/latest/meta-data/"]
+)
+def test_rejects_callback_url_on_internal_address(e2e_client, url: str) -> None:
+    resp = e2e_client.post("/jobs", json={"topic": "seo tools", "callback_url": url})
+    assert resp.status_code == 422
+    assert "non-public address" in resp.text
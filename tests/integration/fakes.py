@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, TypeVar
+from typing import Any, AsyncIterator, Iterator, TypeVar
 
 from pydantic import BaseModel
 
@@ -173,3 +173,45 @@ class FakeLLMProvider:
                 return _article_markdown(primary_in_intro=False)
             return _article_markdown(primary_in_intro=True)
         raise ValueError(f"FakeLLMProvider: unknown node_name {node_name}")
+
+    def stream_text(
+        self,
+        *,
+        node_name: str,
+        prompt: str,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        text = self.generate_text(node_name=node_name, prompt=prompt, **kwargs)
+        for line in text.splitlines(keepends=True):
+            yield line
+
+    async def agenerate_structured(
+        self,
+        *,
+        node_name: str,
+        prompt: str,
+        schema: type[T],
+        **kwargs: Any,
+    ) -> T:
+        return self.generate_structured(
+            node_name=node_name, prompt=prompt, schema=schema, **kwargs
+        )
+
+    async def agenerate_text(
+        self,
+        *,
+        node_name: str,
+        prompt: str,
+        **kwargs: Any,
+    ) -> str:
+        return self.generate_text(node_name=node_name, prompt=prompt, **kwargs)
+
+    async def astream_text(
+        self,
+        *,
+        node_name: str,
+        prompt: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        for chunk in self.stream_text(node_name=node_name, prompt=prompt, **kwargs):
+            yield chunk
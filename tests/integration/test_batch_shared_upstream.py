@@ -0,0 +1,194 @@
+"""Integration test: batch jobs with equal (topic, language) share SERP and themes."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from src.application.orchestration.checkpointer import thread_config
+from src.application.orchestration.graph_builder import build_graph
+from src.application.orchestration.nodes.deps import NodeDeps
+from src.application.use_cases import (
+    BatchItem,
+    cancel_job,
+    create_job,
+    get_job,
+    run_job,
+    submit_batch,
+)
+from src.domain.models.job import JobStatus
+from src.domain.models.job_input import JobInput
+from src.domain.models.themes import Themes
+from src.infrastructure.providers.serp.mock_serp import MockSerpProvider
+from src.infrastructure.stores.shared_upstream_cache import SharedUpstreamCache
+from src.infrastructure.workers.job_worker_pool import JobWorkerPool
+from tests.integration.fakes import FakeLLMProvider
+
+
+class _CountingSerp(MockSerpProvider):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def fetch_top_results(self, *, topic, language=None, k=10):
+        self.calls.append(topic)
+        return super().fetch_top_results(topic=topic, language=language, k=k)
+
+
+class _CountingLLM(FakeLLMProvider):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.themes_calls = 0
+
+    def generate_structured(self, *, node_name, prompt, schema, **kwargs):
+        if schema == Themes:
+            self.themes_calls += 1
+        return super().generate_structured(
+            node_name=node_name, prompt=prompt, schema=schema, **kwargs
+        )
+
+
+def test_batch_shares_serp_and_themes_per_group(
+    job_store,
+    settings,
+    prompt_loader,
+) -> None:
+    """Three 'seo tools' jobs + one other language -> SERP and themes computed twice."""
+    serp = _CountingSerp()
+    llm = _CountingLLM(topic="seo tools", pass_validation=True, mode="pass")
+    upstream_cache = SharedUpstreamCache()
+    deps = NodeDeps(
+        serp=serp,
+        llm=llm,
+        job_store=job_store,
+        settings=settings,
+        prompts=prompt_loader,
+        upstream_cache=upstream_cache,
+    )
+    graph = build_graph(deps=deps)
+    pool = JobWorkerPool(workers=3)
+
+    inputs = [
+        JobInput(topic="seo tools", target_word_count=500, language="en"),
+        JobInput(topic="seo tools", target_word_count=500, language="en"),
+        JobInput(topic="seo tools", target_word_count=500, language="en"),
+        JobInput(topic="seo tools", target_word_count=500, language="de"),
+    ]
+    records = submit_batch(
+        items=[BatchItem(input=i) for i in inputs],
+        graph=graph,
+        job_store=job_store,
+        settings=settings,
+        worker_pool=pool,
+        upstream_cache=upstream_cache,
+    )
+    assert pool.wait_idle(timeout=10)
+    pool.shutdown()
+
+    assert len({r.id for r in records}) == 4
+    for r in records:
+        record = get_job(job_id=r.id, job_store=job_store)
+        assert record.status == JobStatus.COMPLETED, record.error
+    assert len(serp.calls) == 2
+    assert llm.themes_calls == 2
+    assert len(upstream_cache) == 0
+
+
+class _FailingSerp(MockSerpProvider):
+    def fetch_top_results(self, *, topic, language=None, k=10):
+        raise RuntimeError("serp down")
+
+
+def test_jobs_failing_before_extract_themes_release_the_group(
+    job_store, settings, prompt_loader
+) -> None:
+    upstream_cache = SharedUpstreamCache()
+    deps = NodeDeps(
+        serp=_FailingSerp(),
+        llm=FakeLLMProvider(topic="seo tools", pass_validation=True, mode="pass"),
+        job_store=job_store,
+        settings=settings,
+        prompts=prompt_loader,
+        upstream_cache=upstream_cache,
+    )
+    pool = JobWorkerPool(workers=2)
+    job_input = JobInput(topic="seo tools", target_word_count=500, language="en")
+    records = submit_batch(
+        items=[BatchItem(input=job_input)] * 3,
+        graph=build_graph(deps=deps),
+        job_store=job_store,
+        settings=settings,
+        worker_pool=pool,
+        upstream_cache=upstream_cache,
+    )
+    assert pool.wait_idle(timeout=10)
+    pool.shutdown()
+
+    for r in records:
+        assert get_job(job_id=r.id, job_store=job_store).status == JobStatus.FAILED
+    assert len(upstream_cache) == 0
+
+
+def test_cancelled_follower_stops_waiting_for_shared_themes(
+    job_store, settings, prompt_loader
+) -> None:
+    upstream_cache = SharedUpstreamCache()
+    upstream_cache.register("group", consumers=2)
+    deps = NodeDeps(
+        serp=MockSerpProvider(),
+        llm=FakeLLMProvider(topic="seo tools", pass_validation=True, mode="pass"),
+        job_store=job_store,
+        settings=settings,
+        prompts=prompt_loader,
+        upstream_cache=upstream_cache,
+    )
+    # Another consumer of the group is computing themes and does not finish.
+    computing = threading.Event()
+    finish = threading.Event()
+
+    def _slow_themes() -> str:
+        computing.set()
+        finish.wait(10)
+        return "themes"
+
+    owner = threading.Thread(
+        target=upstream_cache.get_or_compute,
+        args=("group", "extract_themes", _slow_themes),
+    )
+    owner.start()
+    assert computing.wait(5)
+
+    record, state = create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+        upstream_key="group",
+    )
+    graph = build_graph(deps=deps)
+    worker = threading.Thread(
+        target=run_job,
+        kwargs={
+            "state": state,
+            "graph": graph,
+            "job_store": job_store,
+            "upstream_cache": upstream_cache,
+        },
+    )
+    worker.start()
+    waited = time.monotonic()
+    while graph.get_state(thread_config(record.id)).next != ("extract_themes",):
+        assert time.monotonic() - waited < 5
+        time.sleep(0.01)
+    time.sleep(0.1)  # now blocked on the owner's slot
+
+    cancelled_at = time.monotonic()
+    cancel_job(job_id=record.id, job_store=job_store)
+    worker.join(5)
+
+    assert time.monotonic() - cancelled_at < 1.0
+    assert get_job(job_id=record.id, job_store=job_store).status == JobStatus.CANCELLED
+    finish.set()
+    owner.join(5)
+    upstream_cache.release("group", "owner")
+    assert len(upstream_cache) == 0
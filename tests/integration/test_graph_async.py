@@ -0,0 +1,125 @@
+"""Integration test: the compiled graph runs end to end through async nodes."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator
+
+from src.application.orchestration.checkpointer import thread_config
+from src.application.orchestration.graph_builder import build_graph
+from src.application.orchestration.nodes.deps import NodeDeps
+from src.application.use_cases import arun_job, create_job, get_job
+from src.domain.models.events import JobEventType
+from src.domain.models.job import JobStatus
+from src.infrastructure.events.draft_stream_hub import DraftStreamHub
+from src.infrastructure.events.job_event_bus import JobEventBus
+from tests.integration.fakes import FakeLLMProvider
+
+
+class _AsyncOnlyLLM(FakeLLMProvider):
+    """Fake whose sync methods fail, proving the async twins were awaited."""
+
+    def generate_structured(self, **kwargs: Any) -> Any:
+        raise AssertionError("sync generate_structured called on async path")
+
+    def generate_text(self, **kwargs: Any) -> str:
+        raise AssertionError("sync generate_text called on async path")
+
+    async def agenerate_structured(self, **kwargs: Any) -> Any:
+        await asyncio.sleep(0)
+        return FakeLLMProvider.generate_structured(self, **kwargs)
+
+    async def agenerate_text(self, **kwargs: Any) -> str:
+        await asyncio.sleep(0)
+        return FakeLLMProvider.generate_text(self, **kwargs)
+
+    async def astream_text(self, **kwargs: Any) -> AsyncIterator[str]:
+        for line in FakeLLMProvider.generate_text(self, **kwargs).splitlines(
+            keepends=True
+        ):
+            await asyncio.sleep(0)
+            yield line
+
+
+def _deps(llm, job_store, settings, serp_provider, prompt_loader, **extra) -> NodeDeps:
+    return NodeDeps(
+        serp=serp_provider,
+        llm=llm,
+        job_store=job_store,
+        settings=settings,
+        prompts=prompt_loader,
+        **extra,
+    )
+
+
+def test_graph_ainvoke_completes(
+    job_store, settings, serp_provider, prompt_loader
+) -> None:
+    llm = _AsyncOnlyLLM(mode="pass")
+    graph = build_graph(
+        deps=_deps(llm, job_store, settings, serp_provider, prompt_loader)
+    )
+    record, state = create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+    )
+
+    asyncio.run(graph.ainvoke(state, config=thread_config(record.id)))
+
+    record = get_job(job_id=record.id, job_store=job_store)
+    assert record.status == JobStatus.COMPLETED, record.error
+    assert record.result.validation_report.passed is True
+
+
+def test_arun_job_revision_loop_streams_draft_and_events(
+    job_store, settings, serp_provider, prompt_loader
+) -> None:
+    llm = _AsyncOnlyLLM(mode="revision_loop")
+    drafts = DraftStreamHub()
+    graph = build_graph(
+        deps=_deps(
+            llm, job_store, settings, serp_provider, prompt_loader, draft_stream=drafts
+        )
+    )
+    bus = JobEventBus()
+    record, state = create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+    )
+
+    asyncio.run(arun_job(state=state, graph=graph, job_store=job_store, events=bus))
+
+    assert get_job(job_id=record.id, job_store=job_store).status == JobStatus.COMPLETED
+    events = bus.history(record.id)
+    assert [e.type for e in events].count(JobEventType.REVISION_LOOP) == 1
+    assert events[-1].type == JobEventType.TERMINAL
+    assert events[-1].status == "completed"
+    text, closed, _ = drafts.subscribe(record.id, lambda chunk: None)
+    assert closed and text.startswith("# Best Seo Tools Guide")
+
+
+def test_arun_job_records_node_error(
+    job_store, settings, serp_provider, prompt_loader
+) -> None:
+    graph = build_graph(
+        deps=_deps(None, job_store, settings, serp_provider, prompt_loader)
+    )
+    record, state = create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+    )
+
+    asyncio.run(arun_job(state=state, graph=graph, job_store=job_store))
+
+    record = get_job(job_id=record.id, job_store=job_store)
+    assert record.status == JobStatus.FAILED
+    assert "extract_themes: deps.llm is required" in record.error
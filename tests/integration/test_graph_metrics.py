@@ -0,0 +1,65 @@
+"""Integration test: a graph run with PipelineMetrics records node/revision metrics."""
+
+from __future__ import annotations
+
+import re
+
+from src.application.orchestration.checkpointer import thread_config
+from src.application.orchestration.graph_builder import build_graph
+from src.application.orchestration.nodes.deps import NodeDeps
+from src.application.orchestration.nodes.prompt_loader import PromptLoader
+from src.application.use_cases import create_job, get_job
+from src.domain.models.job import JobStatus
+from src.infrastructure.metrics import PipelineMetrics
+from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+
+
+def _sample(text: str, name: str) -> float:
+    match = re.search(rf"^{re.escape(name)} (\S+)$", text, re.MULTILINE)
+    assert match, f"{name} not in metrics"
+    return float(match.group(1))
+
+
+def test_revision_loop_run_is_measured(
+    settings, fake_llm_revision_loop, prompts_base_dir, serp_provider
+) -> None:
+    metrics = PipelineMetrics()
+    job_store = InMemoryJobStore(metrics=metrics)
+    deps = NodeDeps(
+        serp=serp_provider,
+        llm=fake_llm_revision_loop,
+        job_store=job_store,
+        settings=settings,
+        prompts=PromptLoader(base_dir=prompts_base_dir),
+        metrics=metrics,
+    )
+    graph = build_graph(deps=deps)
+    record, state = create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+    )
+
+    graph.invoke(state, config=thread_config(record.id))
+
+    assert get_job(job_id=record.id, job_store=job_store).status == JobStatus.COMPLETED
+    text = metrics.render()
+    for node in (
+        "collect_serp",
+        "write_article",
+        "repair_spec",
+        "revise_targeted",
+        "finalize",
+    ):
+        assert _sample(text, f'aiseo_node_duration_seconds_count{{node="{node}"}}') >= 1
+    assert (
+        _sample(text, 'aiseo_node_duration_seconds_count{node="validate_and_score"}')
+        == 2
+    )
+    assert _sample(text, "aiseo_revision_loops_total") == 1
+    assert _sample(text, 'aiseo_revision_rounds_sum{outcome="completed"}') == 1
+    assert (
+        _sample(text, 'aiseo_job_store_lock_wait_seconds_count{backend="memory"}') > 0
+    )
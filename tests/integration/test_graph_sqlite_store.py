@@ -0,0 +1,121 @@
+"""Integration test: graph runs to completion on SqliteJobStore + SqliteSaver."""
+
+from __future__ import annotations
+
+import asyncio
+
+from src.api.draft_stream import stream_article_draft
+from src.api.sse import stream_job_events
+from src.application.orchestration.checkpointer import thread_config
+from src.application.orchestration.graph_builder import build_graph
+from src.application.orchestration.nodes.deps import NodeDeps
+from src.application.use_cases import create_job, get_job, run_job
+from src.domain.models.job import JobStatus
+from src.infrastructure.events.draft_stream_hub import DraftStreamHub
+from src.infrastructure.events.job_event_bus import JobEventBus
+from src.infrastructure.stores.sqlite_job_store import SqliteJobStore
+
+
+def test_graph_happy_path_on_sqlite(
+    tmp_path,
+    settings,
+    fake_llm_pass,
+    serp_provider,
+    prompt_loader,
+) -> None:
+    job_store = SqliteJobStore(tmp_path / "jobs.sqlite3")
+    try:
+        graph = build_graph(
+            deps=NodeDeps(
+                serp=serp_provider,
+                llm=fake_llm_pass,
+                job_store=job_store,
+                settings=settings,
+                prompts=prompt_loader,
+            )
+        )
+        record, state = create_job(
+            topic="seo tools",
+            target_word_count=500,
+            language="en",
+            job_store=job_store,
+            settings=settings,
+        )
+
+        graph.invoke(state, config=thread_config(record.id))
+
+        reopened = SqliteJobStore(tmp_path / "jobs.sqlite3")
+        try:
+            record = get_job(job_id=record.id, job_store=reopened)
+            snapshot = reopened.saver.get_tuple(thread_config(record.id))
+        finally:
+            reopened.close()
+    finally:
+        job_store.close()
+
+    assert record.status == JobStatus.COMPLETED, record.error
+    assert record.result is not None and record.result.article_markdown
+    assert snapshot is not None
+
+
+def test_streams_end_for_a_job_running_in_another_process(
+    tmp_path,
+    settings,
+    fake_llm_pass,
+    serp_provider,
+    prompt_loader,
+) -> None:
+    """A worker without the job's events still ends SSE and draft streams."""
+    runner_store = SqliteJobStore(tmp_path / "jobs.sqlite3")
+    client_store = SqliteJobStore(tmp_path / "jobs.sqlite3", poll_interval=0.02)
+    try:
+        graph = build_graph(
+            deps=NodeDeps(
+                serp=serp_provider,
+                llm=fake_llm_pass,
+                job_store=runner_store,
+                settings=settings,
+                prompts=prompt_loader,
+                draft_stream=DraftStreamHub(),
+            )
+        )
+        record, state = create_job(
+            topic="seo tools",
+            target_word_count=500,
+            language="en",
+            job_store=runner_store,
+            settings=settings,
+        )
+
+        async def _stream_while_running() -> tuple[list[str], list[str]]:
+            # This "process" has its own, empty event bus and draft hub.
+            pending = client_store.get(record.id)
+            events = stream_job_events(
+                record=pending, events=JobEventBus(), job_store=client_store
+            )
+            draft = stream_article_draft(
+                record=pending,
+                drafts=DraftStreamHub(),
+                events=JobEventBus(),
+                job_store=client_store,
+            )
+
+            async def _collect(stream) -> list[str]:
+                return [chunk async for chunk in stream]
+
+            collecting = asyncio.gather(_collect(events), _collect(draft))
+            await asyncio.to_thread(
+                run_job, state=state, graph=graph, job_store=runner_store
+            )
+            return await asyncio.wait_for(collecting, timeout=5)
+
+        frames, chunks = asyncio.run(_stream_while_running())
+        completed = client_store.get(record.id)
+    finally:
+        client_store.close()
+        runner_store.close()
+
+    assert completed.status == JobStatus.COMPLETED
+    assert frames[-1].startswith("id: 1\nevent: terminal\n")
+    assert '"status":"completed"' in frames[-1]
+    assert "".join(chunks) == completed.result.article_markdown
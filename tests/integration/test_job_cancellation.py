@@ -0,0 +1,208 @@
+"""Integration test: cancelling a job stops its graph and releases the worker."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Iterator
+from unittest.mock import MagicMock, patch
+
+from src.application.orchestration.graph_builder import build_graph
+from src.application.orchestration.nodes.deps import NodeDeps
+from src.application.use_cases import arun_job, cancel_job, create_job, get_job, run_job
+from src.domain.models.events import JobEventType
+from src.domain.models.job import JobStatus
+from src.domain.models.plan import Plan
+from src.infrastructure.events.draft_stream_hub import DraftStreamHub
+from src.infrastructure.events.job_event_bus import JobEventBus
+from src.infrastructure.providers.llm.openai_provider import OpenAIProvider
+from src.infrastructure.workers.async_job_worker_pool import AsyncJobWorkerPool
+from tests.integration.fakes import FakeLLMProvider
+
+
+class _SlowLLM(FakeLLMProvider):
+    """Fake whose planner call (async) or draft stream (sync) takes a long time."""
+
+    def __init__(self) -> None:
+        super().__init__(mode="pass")
+        self.entered = threading.Event()
+        self.aborted = threading.Event()
+        self.nodes: list[str] = []
+
+    def generate_structured(self, *, node_name: str, **kwargs: Any) -> Any:
+        self.nodes.append(node_name)
+        return super().generate_structured(node_name=node_name, **kwargs)
+
+    async def agenerate_structured(
+        self, *, node_name: str, schema: Any, **kwargs: Any
+    ) -> Any:
+        if schema is Plan:
+            self.entered.set()
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                self.aborted.set()
+                raise
+        return await super().agenerate_structured(
+            node_name=node_name, schema=schema, **kwargs
+        )
+
+    def stream_text(
+        self, *, node_name: str, prompt: str, **kwargs: Any
+    ) -> Iterator[str]:
+        try:
+            for i in range(3000):
+                if i == 1:
+                    self.entered.set()
+                time.sleep(0.01)
+                yield "word "
+        finally:
+            self.aborted.set()
+
+
+class _SlowOpenAIPlanner(FakeLLMProvider):
+    """Fake whose planner call goes through a real ``OpenAIProvider`` that hangs."""
+
+    def __init__(self) -> None:
+        super().__init__(mode="pass")
+        self.entered = threading.Event()
+        self.aborted = threading.Event()
+        with patch(
+            "src.infrastructure.providers.llm.openai_provider.ChatOpenAI",
+            return_value=MagicMock(),
+        ):
+            self.openai = OpenAIProvider(api_key="test-key")
+
+        async def _hang(prompt: str) -> Any:
+            self.entered.set()
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                self.aborted.set()
+                raise
+
+        runnable = MagicMock()
+        runnable.ainvoke = _hang
+        self.openai._llm_json.with_structured_output = MagicMock(return_value=runnable)
+
+    def generate_structured(self, *, node_name: str, schema: Any, **kwargs: Any) -> Any:
+        if schema is Plan:
+            return self.openai.generate_structured(
+                node_name=node_name, schema=schema, **kwargs
+            )
+        return super().generate_structured(node_name=node_name, schema=schema, **kwargs)
+
+
+def _graph(llm, job_store, settings, serp_provider, prompt_loader):
+    deps = NodeDeps(
+        serp=serp_provider,
+        llm=llm,
+        job_store=job_store,
+        settings=settings,
+        prompts=prompt_loader,
+        draft_stream=DraftStreamHub(),
+    )
+    return build_graph(deps=deps)
+
+
+def _new_job(job_store, settings):
+    return create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+    )
+
+
+def test_cancel_stops_streamed_draft_in_thread_mode(
+    job_store, settings, serp_provider, prompt_loader
+) -> None:
+    llm = _SlowLLM()
+    graph = _graph(llm, job_store, settings, serp_provider, prompt_loader)
+    bus = JobEventBus()
+    record, state = _new_job(job_store, settings)
+    worker = threading.Thread(
+        target=run_job,
+        kwargs={"state": state, "graph": graph, "job_store": job_store, "events": bus},
+    )
+    worker.start()
+    assert llm.entered.wait(5)
+
+    cancelled_at = time.monotonic()
+    assert (
+        cancel_job(job_id=record.id, job_store=job_store).status == JobStatus.CANCELLING
+    )
+    worker.join(5)
+
+    assert not worker.is_alive()
+    assert time.monotonic() - cancelled_at < 1.0
+    assert llm.aborted.is_set()
+    assert "seo_packager" not in llm.nodes
+    assert get_job(job_id=record.id, job_store=job_store).status == JobStatus.CANCELLED
+    events = bus.history(record.id)
+    assert events[-1].type == JobEventType.TERMINAL
+    assert events[-1].status == "cancelled"
+
+
+def test_cancel_aborts_in_flight_structured_call_in_thread_mode(
+    job_store, settings, serp_provider, prompt_loader
+) -> None:
+    llm = _SlowOpenAIPlanner()
+    graph = _graph(llm, job_store, settings, serp_provider, prompt_loader)
+    record, state = _new_job(job_store, settings)
+    worker = threading.Thread(
+        target=run_job,
+        kwargs={"state": state, "graph": graph, "job_store": job_store},
+    )
+    worker.start()
+    assert llm.entered.wait(5)
+
+    cancelled_at = time.monotonic()
+    cancel_job(job_id=record.id, job_store=job_store)
+    worker.join(5)
+
+    assert not worker.is_alive()
+    assert time.monotonic() - cancelled_at < 1.0
+    assert llm.aborted.wait(1)
+    assert get_job(job_id=record.id, job_store=job_store).status == JobStatus.CANCELLED
+
+
+def test_cancel_aborts_in_flight_call_in_async_mode(
+    job_store, settings, serp_provider, prompt_loader
+) -> None:
+    llm = _SlowLLM()
+    graph = _graph(llm, job_store, settings, serp_provider, prompt_loader)
+    pool = AsyncJobWorkerPool(workers=2)
+    record, state = _new_job(job_store, settings)
+    pool.submit(
+        record.id, lambda: arun_job(state=state, graph=graph, job_store=job_store)
+    )
+    assert llm.entered.wait(5)
+
+    cancel_job(job_id=record.id, job_store=job_store)
+
+    assert pool.wait_idle(timeout=1.0)
+    assert llm.aborted.is_set()
+    assert get_job(job_id=record.id, job_store=job_store).status == JobStatus.CANCELLED
+    pool.shutdown()
+
+
+def test_job_cancelled_while_queued_never_runs(
+    job_store, settings, serp_provider, prompt_loader
+) -> None:
+    llm = _SlowLLM()
+    graph = _graph(llm, job_store, settings, serp_provider, prompt_loader)
+    bus = JobEventBus()
+    record, state = _new_job(job_store, settings)
+    job_store.set_status(record.id, JobStatus.QUEUED)
+
+    assert (
+        cancel_job(job_id=record.id, job_store=job_store).status == JobStatus.CANCELLED
+    )
+    run_job(state=state, graph=graph, job_store=job_store, events=bus)
+
+    assert llm.nodes == []
+    assert get_job(job_id=record.id, job_store=job_store).status == JobStatus.CANCELLED
+    assert [e.type for e in bus.history(record.id)] == [JobEventType.TERMINAL]
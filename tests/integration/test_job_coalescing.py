@@ -0,0 +1,151 @@
+"""Integration test: identical concurrent jobs share one leader execution."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src.application.orchestration.graph_builder import build_graph
+from src.application.orchestration.nodes.deps import NodeDeps
+from src.application.use_cases import cancel_job, create_job, submit_job
+from src.domain.models.job import JobStatus
+from src.domain.models.job_input import JobPriority
+from src.infrastructure.events.draft_stream_hub import DraftStreamHub
+from src.infrastructure.stores.job_coalescer import JobCoalescer
+from src.infrastructure.workers.job_worker_pool import JobWorkerPool
+from tests.integration.test_job_drain import _GatedLLM
+from tests.integration.test_job_resume import _FlakyLLM
+
+
+@pytest.fixture
+def pool():
+    pool = JobWorkerPool(workers=2)
+    yield pool
+    pool.shutdown()
+
+
+def _graph(llm, job_store, settings, serp_provider, prompt_loader):
+    deps = NodeDeps(
+        serp=serp_provider,
+        llm=llm,
+        job_store=job_store,
+        settings=settings,
+        prompts=prompt_loader,
+        draft_stream=DraftStreamHub(),
+    )
+    return build_graph(deps=deps)
+
+
+def _submit(
+    graph,
+    job_store,
+    settings,
+    pool,
+    coalescer,
+    *,
+    topic="seo tools",
+    words=500,
+    priority=JobPriority.INTERACTIVE,
+) -> str:
+    record, state = create_job(
+        topic=topic,
+        target_word_count=words,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+        priority=priority,
+    )
+    submit_job(
+        state=state,
+        graph=graph,
+        job_store=job_store,
+        worker_pool=pool,
+        coalescer=coalescer,
+    )
+    return record.id
+
+
+def test_followers_receive_leader_result(
+    job_store, settings, serp_provider, prompt_loader, pool
+) -> None:
+    llm = _GatedLLM("planner")
+    graph = _graph(llm, job_store, settings, serp_provider, prompt_loader)
+    coalescer = JobCoalescer()
+
+    leader = _submit(graph, job_store, settings, pool, coalescer)
+    assert llm.entered.wait(10)
+    followers = [
+        _submit(graph, job_store, settings, pool, coalescer, topic="SEO tools")
+        for _ in range(2)
+    ]
+    cancelled = _submit(graph, job_store, settings, pool, coalescer)
+    cancel_job(job_id=cancelled, job_store=job_store)
+    assert pool.queued == 0
+    assert coalescer.leader_of(followers[0]) == leader
+
+    llm.release.set()
+    assert pool.wait_idle(timeout=10)
+
+    expected = job_store.get(leader)
+    assert expected.status == JobStatus.COMPLETED
+    for job_id in followers:
+        record = job_store.get(job_id)
+        assert record.status == JobStatus.COMPLETED
+        assert record.result_hash == expected.result_hash
+    assert job_store.get(cancelled).status == JobStatus.CANCELLED
+    assert llm.calls["planner"] == 1
+    assert len(coalescer) == 0
+
+
+def test_followers_run_themselves_when_leader_fails(
+    job_store, settings, serp_provider, prompt_loader
+) -> None:
+    llm = _FlakyLLM("planner")
+    graph = _graph(llm, job_store, settings, serp_provider, prompt_loader)
+    coalescer = JobCoalescer()
+    pool = JobWorkerPool(workers=1)
+    release = threading.Event()
+    try:
+        # Hold the only worker so the leader is still queued when the followers join.
+        pool.submit("blocker", lambda: release.wait(10))
+        leader = _submit(graph, job_store, settings, pool, coalescer)
+        followers = [
+            _submit(graph, job_store, settings, pool, coalescer) for _ in range(2)
+        ]
+        release.set()
+        assert pool.wait_idle(timeout=10)
+    finally:
+        pool.shutdown()
+
+    assert job_store.get(leader).status == JobStatus.FAILED
+    for job_id in followers:
+        assert job_store.get(job_id).status == JobStatus.COMPLETED
+    # One failed attempt, then a single new leader ran for both followers.
+    assert llm.calls["planner"] == 2
+
+
+def test_interactive_job_does_not_follow_queued_bulk_leader(
+    job_store, settings, serp_provider, prompt_loader
+) -> None:
+    llm = _GatedLLM("planner")
+    llm.release.set()
+    graph = _graph(llm, job_store, settings, serp_provider, prompt_loader)
+    coalescer = JobCoalescer()
+    pool = JobWorkerPool(workers=1)
+    release = threading.Event()
+    try:
+        pool.submit("blocker", lambda: release.wait(10))
+        bulk = _submit(
+            graph, job_store, settings, pool, coalescer, priority=JobPriority.BULK
+        )
+        interactive = _submit(graph, job_store, settings, pool, coalescer)
+        assert coalescer.leader_of(interactive) is None
+        release.set()
+        assert pool.wait_idle(timeout=10)
+    finally:
+        pool.shutdown()
+
+    assert job_store.get(bulk).status == JobStatus.COMPLETED
+    assert job_store.get(interactive).status == JobStatus.COMPLETED
+    assert llm.calls["planner"] == 2
@@ -0,0 +1,86 @@
+"""Integration test: a job's deadline bounds LLM calls, nodes and revisions."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from src.application.orchestration.graph_builder import build_graph
+from src.application.orchestration.nodes.deps import NodeDeps
+from src.application.use_cases import create_job, get_job, run_job
+from src.domain.models.job import JobStatus
+from tests.integration.fakes import FakeLLMProvider
+
+
+class _TimedLLM(FakeLLMProvider):
+    """Fake that records each call's timeout and can be slow for some nodes."""
+
+    def __init__(self, *, slow: dict[str, float], mode: str = "pass") -> None:
+        super().__init__(mode=mode)
+        self.slow = slow
+        self.timeouts: dict[str, float | None] = {}
+
+    def generate_structured(self, *, node_name: str, **kwargs: Any) -> Any:
+        self.timeouts[node_name] = kwargs.get("timeout")
+        time.sleep(self.slow.get(node_name, 0))
+        return super().generate_structured(node_name=node_name, **kwargs)
+
+    def generate_text(self, *, node_name: str, **kwargs: Any) -> str:
+        self.timeouts[node_name] = kwargs.get("timeout")
+        time.sleep(self.slow.get(node_name, 0))
+        return super().generate_text(node_name=node_name, **kwargs)
+
+
+def _run(llm, deadline_seconds, job_store, settings, serp_provider, prompt_loader):
+    deps = NodeDeps(
+        serp=serp_provider,
+        llm=llm,
+        job_store=job_store,
+        settings=settings,
+        prompts=prompt_loader,
+    )
+    record, state = create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+        deadline_seconds=deadline_seconds,
+    )
+    run_job(state=state, graph=build_graph(deps=deps), job_store=job_store)
+    return get_job(job_id=record.id, job_store=job_store)
+
+
+def test_llm_calls_get_remaining_budget(
+    job_store, settings, serp_provider, prompt_loader
+) -> None:
+    llm = _TimedLLM(slow={})
+    record = _run(llm, 60, job_store, settings, serp_provider, prompt_loader)
+
+    assert record.status == JobStatus.COMPLETED
+    assert 0 < llm.timeouts["seo_packager"] < llm.timeouts["extract_themes"] <= 60
+
+
+def test_next_node_fails_fast_once_budget_spent(
+    job_store, settings, serp_provider, prompt_loader
+) -> None:
+    llm = _TimedLLM(slow={"planner": 0.5})
+    record = _run(llm, 0.3, job_store, settings, serp_provider, prompt_loader)
+
+    assert record.status == JobStatus.FAILED
+    assert (
+        "DeadlineExceededError: build_outline: deadline of 0.3s exceeded"
+        in record.error
+    )
+    assert "build_outline" not in llm.timeouts
+
+
+def test_revision_skipped_when_it_would_overrun(
+    job_store, settings, serp_provider, prompt_loader
+) -> None:
+    llm = _TimedLLM(slow={"write_article": 0.6}, mode="revision_loop")
+    record = _run(llm, 1.0, job_store, settings, serp_provider, prompt_loader)
+
+    assert record.status == JobStatus.FAILED
+    assert "deadline leaves no time for another revision" in record.error
+    assert "revise_targeted" not in llm.timeouts
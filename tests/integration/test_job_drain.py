@@ -0,0 +1,168 @@
+"""Integration test: draining on shutdown interrupts running jobs at a node boundary."""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from typing import Any
+
+import pytest
+
+from src.application.orchestration.checkpointer import thread_config
+from src.application.orchestration.graph_builder import build_graph
+from src.application.orchestration.nodes.deps import NodeDeps
+from src.application.use_cases import create_job, drain_jobs, resume_job, submit_job
+from src.domain.models.job import JobStatus
+from src.domain.models.job_input import DEFAULT_TENANT_ID
+from src.infrastructure.events.draft_stream_hub import DraftStreamHub
+from src.infrastructure.quotas.tenant_quotas import TenantQuotas
+from src.infrastructure.workers.job_worker_pool import JobWorkerPool
+from tests.integration.fakes import FakeLLMProvider
+
+
+class _GatedLLM(FakeLLMProvider):
+    """Fake whose first *gate_node* call blocks until released; counts node calls."""
+
+    def __init__(self, gate_node: str) -> None:
+        super().__init__(mode="pass")
+        self.gate_node = gate_node
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.calls: Counter[str] = Counter()
+
+    def generate_structured(self, *, node_name: str, **kwargs: Any) -> Any:
+        self.calls[node_name] += 1
+        if node_name == self.gate_node and self.calls[node_name] == 1:
+            self.entered.set()
+            self.release.wait(10)
+        return super().generate_structured(node_name=node_name, **kwargs)
+
+
+@pytest.fixture
+def llm() -> _GatedLLM:
+    return _GatedLLM("planner")
+
+
+@pytest.fixture
+def graph(llm, job_store, settings, serp_provider, prompt_loader):
+    deps = NodeDeps(
+        serp=serp_provider,
+        llm=llm,
+        job_store=job_store,
+        settings=settings,
+        prompts=prompt_loader,
+        draft_stream=DraftStreamHub(),
+    )
+    return build_graph(deps=deps)
+
+
+def _submit(graph, job_store, settings, pool) -> str:
+    record, state = create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+    )
+    submit_job(state=state, graph=graph, job_store=job_store, worker_pool=pool)
+    return record.id
+
+
+def test_drain_interrupts_running_and_requeues_queued(
+    llm, graph, job_store, settings
+) -> None:
+    pool = JobWorkerPool(workers=1)
+    running_id = _submit(graph, job_store, settings, pool)
+    assert llm.entered.wait(10)
+    queued_id = _submit(graph, job_store, settings, pool)
+
+    results = []
+    drainer = threading.Thread(
+        target=lambda: results.append(
+            drain_jobs(
+                worker_pool=pool, job_store=job_store, graph=graph, grace_seconds=10
+            )
+        )
+    )
+    drainer.start()
+    assert pool.stopping.wait(5)
+    llm.release.set()
+    drainer.join(10)
+
+    [result] = results
+    assert result.drained
+    assert result.pending == [queued_id]
+    assert job_store.get(queued_id).status == JobStatus.PENDING
+    assert job_store.get(running_id).status == JobStatus.INTERRUPTED
+    # The node in flight finished and was checkpointed; the next one never started.
+    assert "planner" not in graph.get_state(thread_config(running_id)).next
+    pool.shutdown()
+
+    fresh = JobWorkerPool(workers=1)
+    try:
+        resume_job(
+            job_id=running_id, graph=graph, job_store=job_store, worker_pool=fresh
+        )
+        assert fresh.wait_idle(timeout=10)
+    finally:
+        fresh.shutdown()
+    assert job_store.get(running_id).status == JobStatus.COMPLETED
+    assert llm.calls["planner"] == 1
+
+
+def test_drain_marks_stragglers_interrupted_after_grace(
+    llm, graph, job_store, settings
+) -> None:
+    pool = JobWorkerPool(workers=1)
+    job_id = _submit(graph, job_store, settings, pool)
+    assert llm.entered.wait(10)
+
+    result = drain_jobs(
+        worker_pool=pool, job_store=job_store, graph=graph, grace_seconds=0.05
+    )
+
+    assert not result.drained
+    assert result.interrupted == [job_id]
+    assert job_store.get(job_id).status == JobStatus.INTERRUPTED
+    llm.release.set()
+    assert pool.wait_idle(timeout=10)
+    pool.shutdown()
+    assert job_store.get(job_id).status == JobStatus.INTERRUPTED
+
+
+def test_drain_releases_the_quota_of_dropped_jobs(graph, job_store, settings) -> None:
+    quotas = TenantQuotas(jobs_per_minute=10, llm_tokens_per_minute=1_000_000)
+    pool = JobWorkerPool(workers=1)
+    gate = threading.Event()
+    pool.submit("blocker", lambda: gate.wait(10))
+    record, state = create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+    )
+    submit_job(
+        state=state, graph=graph, job_store=job_store, worker_pool=pool, quotas=quotas
+    )
+    assert quotas.usage(DEFAULT_TENANT_ID).llm_tokens_reserved > 0
+
+    drainer = threading.Thread(
+        target=drain_jobs,
+        kwargs={
+            "worker_pool": pool,
+            "job_store": job_store,
+            "graph": graph,
+            "grace_seconds": 10,
+        },
+    )
+    drainer.start()
+    assert pool.stopping.wait(5)
+    gate.set()
+    drainer.join(10)
+    pool.shutdown()
+
+    assert job_store.get(record.id).status == JobStatus.PENDING
+    usage = quotas.usage(DEFAULT_TENANT_ID)
+    assert usage.llm_tokens_reserved == 0
+    assert usage.jobs_used == 0
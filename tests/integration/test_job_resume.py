@@ -0,0 +1,167 @@
+"""Integration test: resuming a failed job continues from its last checkpoint."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from typing import Any
+
+import pytest
+
+from src.api.sse import stream_job_events
+from src.application.orchestration.checkpointer import thread_config
+from src.application.orchestration.graph_builder import build_graph
+from src.application.orchestration.nodes.deps import NodeDeps
+from src.application.use_cases import create_job, resume_job, run_job
+from src.domain.models.job import JobStatus
+from src.infrastructure.events.draft_stream_hub import DraftStreamHub
+from src.infrastructure.events.job_event_bus import JobEventBus
+from src.infrastructure.workers.job_worker_pool import JobWorkerPool
+from tests.integration.fakes import FakeLLMProvider
+
+
+class _FlakyLLM(FakeLLMProvider):
+    """Fake that fails the first call made by *fail_node*, counting calls per node."""
+
+    def __init__(self, fail_node: str) -> None:
+        super().__init__(mode="pass")
+        self.fail_node = fail_node
+        self.calls: Counter[str] = Counter()
+
+    def generate_structured(self, *, node_name: str, **kwargs: Any) -> Any:
+        self.calls[node_name] += 1
+        if node_name == self.fail_node and self.calls[node_name] == 1:
+            raise RuntimeError("provider unavailable")
+        return super().generate_structured(node_name=node_name, **kwargs)
+
+
+@pytest.fixture
+def pool():
+    pool = JobWorkerPool(workers=1)
+    yield pool
+    pool.shutdown()
+
+
+def _graph(llm, job_store, settings, serp_provider, prompt_loader):
+    deps = NodeDeps(
+        serp=serp_provider,
+        llm=llm,
+        job_store=job_store,
+        settings=settings,
+        prompts=prompt_loader,
+        draft_stream=DraftStreamHub(),
+    )
+    return build_graph(deps=deps)
+
+
+def _fail_once(llm, job_store, settings, serp_provider, prompt_loader, **job_kwargs):
+    graph = _graph(llm, job_store, settings, serp_provider, prompt_loader)
+    record, state = create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+        **job_kwargs,
+    )
+    run_job(state=state, graph=graph, job_store=job_store)
+    assert job_store.get(record.id).status == JobStatus.FAILED
+    return graph, record.id
+
+
+def test_resume_skips_completed_nodes(
+    job_store, settings, serp_provider, prompt_loader, pool
+) -> None:
+    llm = _FlakyLLM("seo_packager")
+    graph, job_id = _fail_once(llm, job_store, settings, serp_provider, prompt_loader)
+    assert graph.get_state(thread_config(job_id)).next == ("seo_packager",)
+    before = Counter(llm.calls)
+
+    resume_job(job_id=job_id, graph=graph, job_store=job_store, worker_pool=pool)
+    assert pool.wait_idle(timeout=10)
+
+    record = job_store.get(job_id)
+    assert record.status == JobStatus.COMPLETED
+    assert record.result is not None
+    resumed = llm.calls - before
+    assert set(resumed) == {"seo_packager"}
+
+
+def test_resume_refreshes_deadline(
+    job_store, settings, serp_provider, prompt_loader, pool
+) -> None:
+    llm = _FlakyLLM("planner")
+    graph, job_id = _fail_once(
+        llm, job_store, settings, serp_provider, prompt_loader, deadline_seconds=60
+    )
+    old_deadline = graph.get_state(thread_config(job_id)).values["deadline_at"]
+
+    resume_job(job_id=job_id, graph=graph, job_store=job_store, worker_pool=pool)
+    assert pool.wait_idle(timeout=10)
+
+    snapshot = graph.get_state(thread_config(job_id))
+    assert snapshot.values["deadline_at"] > old_deadline
+    assert job_store.get(job_id).status == JobStatus.COMPLETED
+    assert llm.calls["planner"] == 2
+
+
+def test_resume_rejects_finished_and_unstarted_jobs(
+    job_store, settings, serp_provider, prompt_loader, fake_llm_pass, pool
+) -> None:
+    graph = _graph(fake_llm_pass, job_store, settings, serp_provider, prompt_loader)
+    record, state = create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+    )
+    with pytest.raises(RuntimeError, match="only failed, cancelled or interrupted"):
+        resume_job(job_id=record.id, graph=graph, job_store=job_store, worker_pool=pool)
+
+    run_job(state=state, graph=graph, job_store=job_store)
+    job_store.set_error(record.id, "marked failed after completion")
+    with pytest.raises(RuntimeError, match="no checkpoint"):
+        resume_job(job_id=record.id, graph=graph, job_store=job_store, worker_pool=pool)
+
+
+def test_resume_continues_event_sequence(
+    job_store, settings, serp_provider, prompt_loader, pool
+) -> None:
+    """A client reconnecting with the first run's Last-Event-ID sees the new run."""
+    events = JobEventBus()
+    llm = _FlakyLLM("seo_packager")
+    graph = _graph(llm, job_store, settings, serp_provider, prompt_loader)
+    record, state = create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+    )
+    run_job(state=state, graph=graph, job_store=job_store, events=events)
+    last_seen = events.history(record.id)[-1].seq
+
+    resume_job(
+        job_id=record.id,
+        graph=graph,
+        job_store=job_store,
+        worker_pool=pool,
+        events=events,
+    )
+    assert pool.wait_idle(timeout=10)
+
+    async def _collect() -> list[str]:
+        stream = stream_job_events(
+            record=job_store.get(record.id),
+            events=events,
+            job_store=job_store,
+            last_event_id=last_seen,
+        )
+        return [frame async for frame in stream]
+
+    frames = asyncio.run(_collect())
+    ids = [int(frame.split("\n")[0].removeprefix("id: ")) for frame in frames]
+    assert ids and min(ids) == last_seen + 1
+    assert ids == sorted(ids)
+    assert "event: terminal" in frames[-1] and '"status":"completed"' in frames[-1]
@@ -0,0 +1,82 @@
+"""Integration test: run_job publishes node, revision-loop and terminal events."""
+
+from __future__ import annotations
+
+from src.application.orchestration.graph_builder import build_graph
+from src.application.orchestration.nodes.deps import NodeDeps
+from src.application.use_cases import create_job, run_job
+from src.domain.models.events import JobEventType
+from src.infrastructure.events.job_event_bus import JobEventBus
+
+
+def test_run_job_publishes_progress_events(
+    job_store,
+    settings,
+    fake_llm_revision_loop,
+    prompt_loader,
+    serp_provider,
+) -> None:
+    deps = NodeDeps(
+        serp=serp_provider,
+        llm=fake_llm_revision_loop,
+        job_store=job_store,
+        settings=settings,
+        prompts=prompt_loader,
+    )
+    graph = build_graph(deps=deps)
+    bus = JobEventBus()
+    record, state = create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+    )
+
+    run_job(state=state, graph=graph, job_store=job_store, events=bus)
+
+    events = bus.history(record.id)
+    assert [e.seq for e in events] == list(range(1, len(events) + 1))
+    starts = [e.node for e in events if e.type == JobEventType.NODE_START]
+    assert starts[:2] == ["collect_serp", "extract_themes"]
+    assert starts.count("validate_and_score") == 2
+    ends = [e for e in events if e.type == JobEventType.NODE_END]
+    assert len(ends) == len(starts)
+    assert all(e.duration_ms is not None and e.duration_ms >= 0 for e in ends)
+    loops = [e for e in events if e.type == JobEventType.REVISION_LOOP]
+    assert len(loops) == 1
+    assert loops[0].revisions_left == 1
+    assert events[-1].type == JobEventType.TERMINAL
+    assert events[-1].status == "completed"
+
+
+def test_run_job_publishes_failed_node_and_terminal(
+    job_store,
+    settings,
+    prompt_loader,
+    serp_provider,
+) -> None:
+    deps = NodeDeps(
+        serp=serp_provider,
+        llm=None,
+        job_store=job_store,
+        settings=settings,
+        prompts=prompt_loader,
+    )
+    graph = build_graph(deps=deps)
+    bus = JobEventBus()
+    record, state = create_job(
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        job_store=job_store,
+        settings=settings,
+    )
+
+    run_job(state=state, graph=graph, job_store=job_store, events=bus)
+
+    events = bus.history(record.id)
+    failed = [e for e in events if e.type == JobEventType.NODE_END and e.error]
+    assert [e.node for e in failed] == ["extract_themes"]
+    assert events[-1].type == JobEventType.TERMINAL
+    assert events[-1].status == "failed"
@@ -0,0 +1,98 @@
+"""Tests for AsyncJobWorkerPool – coroutine jobs on one event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from src.infrastructure.workers.async_job_worker_pool import AsyncJobWorkerPool
+from src.infrastructure.workers.errors import QueueFullError
+
+
+def test_jobs_share_one_loop_thread_with_bounded_concurrency() -> None:
+    pool = AsyncJobWorkerPool(workers=3, max_queue_depth=10)
+    release = threading.Event()
+    threads: set[int] = set()
+    active = 0
+    peak = 0
+
+    async def _job() -> None:
+        nonlocal active, peak
+        threads.add(threading.get_ident())
+        active += 1
+        peak = max(peak, active)
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+        active -= 1
+
+    for i in range(6):
+        pool.submit(f"j{i}", _job)
+
+    assert not pool.wait_idle(timeout=0.2)
+    assert pool.running == 3
+    assert pool.queued == 3
+
+    release.set()
+    assert pool.wait_idle(timeout=5)
+    assert peak == 3
+    assert len(threads) == 1
+    pool.shutdown()
+
+
+def test_failing_job_does_not_stop_loop() -> None:
+    pool = AsyncJobWorkerPool(workers=1)
+    done = threading.Event()
+
+    async def _boom() -> None:
+        raise RuntimeError("boom")
+
+    async def _ok() -> None:
+        done.set()
+
+    pool.submit("bad", _boom)
+    pool.submit("good", _ok)
+
+    assert pool.wait_idle(timeout=5)
+    assert done.is_set()
+    pool.shutdown()
+
+
+def test_submit_rejected_when_queue_full() -> None:
+    pool = AsyncJobWorkerPool(workers=1, max_queue_depth=1)
+    release = threading.Event()
+
+    async def _block() -> None:
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+
+    async def _noop() -> None:
+        pass
+
+    pool.submit("running", _block)
+    pool.submit("waiting", _noop)
+    with pytest.raises(QueueFullError):
+        pool.submit("rejected", _noop)
+
+    release.set()
+    assert pool.wait_idle(timeout=5)
+    pool.shutdown()
+
+
+def test_shutdown_drains_queue_and_stops_loop() -> None:
+    pool = AsyncJobWorkerPool(workers=1)
+    finished: list[str] = []
+
+    async def _job(name: str) -> None:
+        await asyncio.sleep(0.01)
+        finished.append(name)
+
+    pool.submit("a", lambda: _job("a"))
+    pool.submit("b", lambda: _job("b"))
+    pool.shutdown(wait=True, timeout=5)
+
+    assert finished == ["a", "b"]
+    assert not any(t.is_alive() for t in pool._threads)
+    with pytest.raises(RuntimeError, match="shut down"):
+        pool.submit("c", lambda: _job("c"))
@@ -59,7 +59,9 @@ class FakeLLM:
     def __init__(self, outline: Outline) -> None:
         self._outline = outline
 
-    def generate_structured(self, *, node_name: str, prompt: str, schema: type) -> Outline:
+    def generate_structured(
+        self, *, node_name: str, prompt: str, schema: type, **kwargs
+    ) -> Outline:
         assert node_name == "build_outline"
         assert schema is Outline
         assert "project management" in prompt
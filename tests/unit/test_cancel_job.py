@@ -0,0 +1,59 @@
+"""Unit tests for cancel_job – status transitions and idempotency."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.application.use_cases.cancel_job import cancel_job
+from src.domain.models.job import JobStatus
+from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+
+
+@pytest.fixture
+def store() -> InMemoryJobStore:
+    return InMemoryJobStore()
+
+
+@pytest.mark.parametrize("status", [JobStatus.PENDING, JobStatus.QUEUED])
+def test_not_started_job_is_cancelled_at_once(
+    store: InMemoryJobStore, status: JobStatus
+) -> None:
+    store.create("j1")
+    store.set_status("j1", status)
+
+    assert cancel_job(job_id="j1", job_store=store).status == JobStatus.CANCELLED
+
+
+def test_running_job_becomes_cancelling(store: InMemoryJobStore) -> None:
+    store.create("j1")
+    store.set_status("j1", JobStatus.RUNNING, current_node="planner")
+
+    record = cancel_job(job_id="j1", job_store=store)
+    assert record.status == JobStatus.CANCELLING
+    assert record.current_node == "planner"
+
+
+def test_cancel_is_idempotent(store: InMemoryJobStore) -> None:
+    store.create("j1")
+    store.set_status("j1", JobStatus.RUNNING)
+    first = cancel_job(job_id="j1", job_store=store)
+
+    again = cancel_job(job_id="j1", job_store=store)
+    assert again.status == JobStatus.CANCELLING
+    assert again.version == first.version
+
+
+@pytest.mark.parametrize("status", [JobStatus.COMPLETED, JobStatus.FAILED])
+def test_finished_job_cannot_be_cancelled(
+    store: InMemoryJobStore, status: JobStatus
+) -> None:
+    store.create("j1")
+    store.set_status("j1", status)
+
+    with pytest.raises(RuntimeError, match=f"already {status.value}"):
+        cancel_job(job_id="j1", job_store=store)
+
+
+def test_unknown_job_raises_key_error(store: InMemoryJobStore) -> None:
+    with pytest.raises(KeyError):
+        cancel_job(job_id="missing", job_store=store)
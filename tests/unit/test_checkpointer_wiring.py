@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import pickle
+
+import pytest
 from langgraph.checkpoint.memory import InMemorySaver
 
 from src.application.orchestration.checkpointer import (
     make_checkpointer,
     thread_config,
 )
+from src.domain.models.job import JobStatus
+from src.domain.models.serp import SerpResult
+from src.infrastructure.stores.checkpoint_serde import checkpoint_serde
 from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
 
 
@@ -25,3 +31,21 @@ def test_integration_with_job_store() -> None:
     job_store = InMemoryJobStore()
     checkpointer = make_checkpointer(saver=job_store.saver)
     assert checkpointer is job_store.saver
+
+
+def test_checkpoint_serde_round_trips_domain_types() -> None:
+    serde = checkpoint_serde()
+    serp = [
+        SerpResult(rank=1, url="https://example.com/a", title="A", snippet="a")
+    ]
+    kind, blob = serde.dumps_typed({"serp": serp, "status": JobStatus.FAILED})
+    assert kind == "msgpack"
+    assert serde.loads_typed((kind, blob)) == {
+        "serp": serp,
+        "status": JobStatus.FAILED,
+    }
+
+
+def test_checkpoint_serde_refuses_pickle_blobs() -> None:
+    with pytest.raises(NotImplementedError):
+        checkpoint_serde().loads_typed(("pickle", pickle.dumps({"x": 1})))
@@ -0,0 +1,81 @@
+"""Unit tests for create_job_idempotent – key claims, replays and expiry."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from src.application.use_cases.create_job import create_job_idempotent
+from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+from src.settings import Settings
+
+
+@pytest.fixture
+def store() -> InMemoryJobStore:
+    return InMemoryJobStore()
+
+
+def _create(
+    store: InMemoryJobStore, key: str = "k1", topic: str = "seo tools", **overrides
+):
+    settings = Settings(APP_ENV="dev", **overrides)
+    return create_job_idempotent(
+        idempotency_key=key,
+        topic=topic,
+        language="en",
+        target_word_count=500,
+        job_store=store,
+        settings=settings,
+    )
+
+
+def test_replay_returns_original_job(store: InMemoryJobStore) -> None:
+    first, state = _create(store)
+    assert state is not None
+
+    again, replay_state = _create(store)
+    assert replay_state is None
+    assert again.id == first.id
+    assert len(store.list_jobs(limit=10)) == 1
+
+
+def test_distinct_keys_create_distinct_jobs(store: InMemoryJobStore) -> None:
+    first, _ = _create(store, key="k1")
+    second, _ = _create(store, key="k2")
+    assert first.id != second.id
+
+
+def test_key_reused_with_different_body_raises(store: InMemoryJobStore) -> None:
+    _create(store)
+    with pytest.raises(ValueError, match="different request"):
+        _create(store, topic="other topic")
+    assert len(store.list_jobs(limit=10)) == 1
+
+
+def test_expired_key_creates_new_job(store: InMemoryJobStore, monkeypatch) -> None:
+    first, _ = _create(store, IDEMPOTENCY_TTL_SECONDS=60)
+    later = time.time() + 61
+    monkeypatch.setattr(
+        "src.infrastructure.stores.in_memory_job_store.time.time", lambda: later
+    )
+
+    second, state = _create(store, IDEMPOTENCY_TTL_SECONDS=60)
+    assert state is not None
+    assert second.id != first.id
+
+
+def test_deleted_original_is_reclaimed(store: InMemoryJobStore) -> None:
+    first, _ = _create(store)
+    store.delete(first.id)
+
+    second, state = _create(store)
+    assert state is not None
+    assert second.id != first.id
+    assert _create(store)[0].id == second.id
+
+
+def test_release_only_drops_own_claim(store: InMemoryJobStore) -> None:
+    first, _ = _create(store)
+    store.release_idempotency_key("k1", "someone-else")
+    assert _create(store)[0].id == first.id
@@ -0,0 +1,57 @@
+"""Tests for the per-job deadline budget helpers."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from src.application.orchestration.deadline import (
+    DeadlineExceededError,
+    can_afford_revision,
+    require_time,
+    start_deadline,
+    time_left,
+)
+from src.application.orchestration.state import GraphState
+
+
+def _state(deadline_seconds: float | None = None, **update: object) -> GraphState:
+    state = GraphState.new(
+        job_id="j1",
+        topic="seo tools",
+        target_word_count=500,
+        language="en",
+        max_revisions=1,
+        deadline_seconds=deadline_seconds,
+    )
+    return state.model_copy(update=update)
+
+
+def test_no_deadline_is_unbounded() -> None:
+    state = start_deadline(_state())
+    assert state.deadline_at is None
+    assert time_left(state) is None
+    assert require_time(state, "planner") is None
+    assert can_afford_revision(state.model_copy(update={"draft_seconds": 1e9}))
+
+
+def test_start_deadline_stamps_once() -> None:
+    state = start_deadline(_state(deadline_seconds=30))
+    assert 29 < time_left(state) <= 30
+
+    assert start_deadline(state).deadline_at == state.deadline_at
+
+
+def test_require_time_raises_once_spent() -> None:
+    state = _state(deadline_seconds=5, deadline_at=time.time() - 0.1)
+
+    with pytest.raises(DeadlineExceededError, match="planner: deadline of 5s exceeded"):
+        require_time(state, "planner")
+
+
+def test_revision_skipped_when_last_draft_would_overrun() -> None:
+    state = _state(deadline_seconds=60, deadline_at=time.time() + 10)
+
+    assert can_afford_revision(state.model_copy(update={"draft_seconds": 4.0}))
+    assert not can_afford_revision(state.model_copy(update={"draft_seconds": 12.0}))
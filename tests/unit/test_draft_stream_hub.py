@@ -0,0 +1,55 @@
+"""Tests for DraftStreamHub – buffering and fan-out of draft tokens."""
+
+from __future__ import annotations
+
+from src.infrastructure.events.draft_stream_hub import DraftStreamHub
+
+
+def test_subscriber_gets_buffer_then_live_chunks_then_close() -> None:
+    hub = DraftStreamHub()
+    hub.open("j1")
+    hub.append("j1", "# Title\n")
+    received: list[str | None] = []
+
+    text, closed, _ = hub.subscribe("j1", received.append)
+    hub.append("j1", "Body")
+    hub.close("j1")
+
+    assert text == "# Title\n"
+    assert closed is False
+    assert received == ["Body", None]
+
+
+def test_subscribe_before_open_waits_for_draft() -> None:
+    hub = DraftStreamHub()
+    received: list[str | None] = []
+    text, closed, _ = hub.subscribe("j1", received.append)
+    assert (text, closed) == ("", False)
+    assert not hub.started("j1")
+
+    hub.open("j1")
+    hub.append("j1", "a")
+    hub.close("j1")
+    assert received == ["a", None]
+    assert hub.started("j1")
+
+
+def test_closed_draft_returns_full_text_without_callbacks() -> None:
+    hub = DraftStreamHub()
+    hub.open("j1")
+    hub.append("j1", "a")
+    hub.append("j1", "b")
+    hub.close("j1")
+    received: list[str | None] = []
+
+    text, closed, _ = hub.subscribe("j1", received.append)
+    assert (text, closed) == ("ab", True)
+    assert received == []
+
+
+def test_buffers_bounded() -> None:
+    hub = DraftStreamHub(max_jobs=1)
+    hub.open("j1")
+    hub.open("j2")
+    assert not hub.started("j1")
+    assert hub.started("j2")
@@ -0,0 +1,74 @@
+"""Unit tests for export_results – paged NDJSON export of completed results."""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from src.application.use_cases.export_results import export_results
+from src.domain.models.job import JobStatus
+from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+from src.infrastructure.stores.sqlite_job_store import SqliteJobStore
+from tests.unit.test_result_json_cache import _output
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path: Path):
+    if request.param == "memory":
+        yield InMemoryJobStore(result_cache_size=2)
+        return
+    store = SqliteJobStore(tmp_path / "jobs.sqlite3")
+    yield store
+    store.close()
+
+
+def _fill(store, n: int) -> None:
+    for i in range(n):
+        store.create(f"job-{i}")
+        store.set_result(f"job-{i}", _output(f"Title {i}"))
+    store.create("pending")
+
+
+def _lines(chunks) -> list[dict]:
+    return [json.loads(chunk) for chunk in chunks]
+
+
+def test_export_streams_every_completed_result_across_pages(store) -> None:
+    _fill(store, 7)
+
+    lines = _lines(export_results(job_store=store, page_size=3))
+
+    assert [line["job_id"] for line in lines] == [f"job-{i}" for i in range(7)]
+    assert lines[3]["result"]["seo_meta"]["title_tag"] == "Title 3"
+    assert lines[3]["result_hash"] == store.get_result_json("job-3")[1]
+
+
+def test_export_resumes_after_cursor(store) -> None:
+    _fill(store, 5)
+    first = _lines(export_results(job_store=store, page_size=2))
+
+    rest = _lines(export_results(job_store=store, cursor=first[1]["cursor"]))
+
+    assert [line["job_id"] for line in rest] == ["job-2", "job-3", "job-4"]
+
+
+def test_export_since_keeps_jobs_updated_at_or_after(store) -> None:
+    _fill(store, 3)
+    since = store.get("job-1").updated_at
+
+    lines = _lines(export_results(job_store=store, since=since))
+    later = _lines(export_results(job_store=store, since=since + timedelta(days=1)))
+
+    assert [line["job_id"] for line in lines] == ["job-1", "job-2"]
+    assert later == []
+
+
+def test_export_rejects_bad_arguments_before_streaming() -> None:
+    store = InMemoryJobStore()
+    with pytest.raises(ValueError, match="only completed"):
+        export_results(job_store=store, status=JobStatus.FAILED)
+    with pytest.raises(ValueError, match="cursor is invalid"):
+        export_results(job_store=store, cursor="%%%")
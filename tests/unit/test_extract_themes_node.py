@@ -10,12 +10,15 @@ from src.application.orchestration.nodes.prompt_loader import PromptLoader
 from src.application.orchestration.state import GraphState
 from src.domain.models.themes import Themes
 from src.infrastructure.providers.serp.mock_serp import MockSerpProvider
+from src.infrastructure.stores.shared_upstream_cache import SharedUpstreamCache
 
 
 class FakeLLM:
     """Fake LLM that returns a Themes instance without calling the network."""
 
-    def generate_structured(self, *, node_name: str, prompt: str, schema: type) -> Themes:
+    def generate_structured(
+        self, *, node_name: str, prompt: str, schema: type, **kwargs
+    ) -> Themes:
         assert node_name == "extract_themes"
         assert schema is Themes
         assert "project management" in prompt
@@ -87,3 +90,24 @@ def test_extract_themes_missing_serp_results_raises() -> None:
 
     with pytest.raises(ValueError, match="extract_themes: serp_results is required"):
         extract_themes(state, deps)
+
+
+def test_extract_themes_releases_shared_entry_when_llm_fails() -> None:
+    class FailingLLM:
+        def generate_structured(self, **kwargs) -> Themes:
+            raise RuntimeError("provider down")
+
+    cache = SharedUpstreamCache()
+    cache.register("group", consumers=1)
+    state = _make_state_with_serp().model_copy(update={"upstream_key": "group"})
+    deps = NodeDeps(
+        serp=MockSerpProvider(),
+        llm=FailingLLM(),
+        prompts=PromptLoader(),
+        upstream_cache=cache,
+    )
+
+    with pytest.raises(RuntimeError, match="provider down"):
+        extract_themes(state, deps)
+
+    assert len(cache) == 0
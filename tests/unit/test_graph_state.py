@@ -20,6 +20,7 @@ _OPTIONAL_FIELDS = (
     "repair_spec",
     "current_node",
     "last_error",
+    "upstream_key",
 )
 
 
@@ -0,0 +1,55 @@
+"""Unit tests for ETag matching, encoding negotiation and compression."""
+
+from __future__ import annotations
+
+import gzip
+
+import pytest
+
+from src.api import http_cache
+from src.api.http_cache import (
+    compress,
+    encoded_etag,
+    match_etag,
+    negotiate_encoding,
+    result_etag,
+)
+
+
+def test_result_etag_projection_is_order_independent() -> None:
+    assert result_etag("ab" * 32, ["a", "b"]) == result_etag("ab" * 32, ["b", "a"])
+    assert result_etag("ab" * 32, ["a"]) != result_etag("ab" * 32)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ('"x"', '"x"'),
+        ('W/"x"', 'W/"x"'),
+        ('"y", "x-gzip"', '"x-gzip"'),
+        ("*", '"x"'),
+        ('"y"', None),
+        (None, None),
+    ],
+)
+def test_match_etag(header: str | None, expected: str | None) -> None:
+    assert match_etag(header, '"x"') == expected
+
+
+def test_negotiate_encoding_prefers_gzip_without_brotli(monkeypatch) -> None:
+    monkeypatch.setattr(http_cache, "brotli", None)
+    assert negotiate_encoding("br, gzip") == "gzip"
+    assert negotiate_encoding("gzip;q=0, br") is None
+    assert negotiate_encoding(None) is None
+
+
+def test_compress_skips_small_bodies() -> None:
+    assert compress(b"{}", "gzip") == (b"{}", None)
+
+
+def test_compress_gzip_round_trip() -> None:
+    body = b'{"a": "' + b"x" * 4096 + b'"}'
+    compressed, encoding = compress(body, "gzip")
+    assert encoding == "gzip"
+    assert gzip.decompress(compressed) == body
+    assert encoded_etag('"x"', encoding) == '"x-gzip"'
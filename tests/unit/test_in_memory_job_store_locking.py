@@ -0,0 +1,158 @@
+"""Unit tests for InMemoryJobStore's per-job lock striping."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src.application.use_cases.list_jobs import list_jobs
+from src.domain.models.job import JobStatus
+from src.infrastructure.metrics.pipeline_metrics import PipelineMetrics
+from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+
+
+def _run_threads(count: int, target) -> None:
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+
+def test_concurrent_writes_to_one_job_lose_no_updates() -> None:
+    store = InMemoryJobStore()
+    store.create("j1")
+
+    def _hammer(i: int) -> None:
+        for n in range(50):
+            store.set_current_node("j1", f"node-{i}-{n}")
+
+    _run_threads(8, _hammer)
+
+    assert store.get("j1").version == 1 + 8 * 50
+
+
+def test_other_jobs_and_reads_do_not_wait_for_a_held_stripe() -> None:
+    store = InMemoryJobStore(lock_stripes=8)
+    store.create("a")
+    other = next(
+        f"b{i}" for i in range(100) if store._stripe(f"b{i}") is not store._stripe("a")
+    )
+    store.create(other)
+    done = threading.Event()
+
+    def _write_other() -> None:
+        store.set_status(other, JobStatus.RUNNING)
+        store.get("a")
+        done.set()
+
+    with store._stripe("a"):
+        threading.Thread(target=_write_other).start()
+        assert done.wait(5)
+    assert store.get(other).status == JobStatus.RUNNING
+
+
+def test_writes_do_not_wait_for_index_cache_watch_or_idempotency_locks() -> None:
+    store = InMemoryJobStore()
+    store.create("j1")
+    done = threading.Event()
+
+    def _write() -> None:
+        store.set_status("j1", JobStatus.RUNNING, current_node="planner")
+        store.set_current_node("j1", "write_article")
+        done.set()
+
+    with (
+        store._index_lock,
+        store._cache_lock,
+        store._watch_lock,
+        store._idempotency_lock,
+    ):
+        threading.Thread(target=_write).start()
+        assert done.wait(5)
+    [record] = list_jobs(job_store=store, status=JobStatus.RUNNING).jobs
+    assert record.current_node == "write_article"
+
+
+def test_lock_wait_timing_shares_no_lock_across_stripes() -> None:
+    metrics = PipelineMetrics()
+    store = InMemoryJobStore(metrics=metrics)
+    store.create("j1")
+    shared = metrics.store_lock_wait.labels("memory")
+    done = threading.Event()
+
+    def _write() -> None:
+        store.set_status("j1", JobStatus.RUNNING)
+        done.set()
+
+    with shared._lock:
+        threading.Thread(target=_write).start()
+        assert done.wait(5)
+    assert 'aiseo_job_store_lock_wait_seconds_count{backend="memory"}' in (
+        metrics.render()
+    )
+    counts, _ = shared.snapshot()
+    assert sum(counts) >= 2
+
+
+def test_list_pages_span_stripes_in_update_order() -> None:
+    store = InMemoryJobStore(lock_stripes=8)
+    for i in range(30):
+        store.create(f"job-{i}")
+    for i in range(0, 30, 3):
+        store.set_status(f"job-{i}", JobStatus.RUNNING)
+
+    first = list_jobs(job_store=store, status=JobStatus.RUNNING, limit=4)
+    rest = list_jobs(
+        job_store=store, status=JobStatus.RUNNING, cursor=first.next_cursor
+    )
+    page = first.jobs + rest.jobs
+    keys = [(r.updated_at, r.id) for r in page]
+    assert keys == sorted(keys)
+    assert {r.id for r in page} == {f"job-{i}" for i in range(0, 30, 3)}
+    assert len(list_jobs(job_store=store, limit=100).jobs) == 30
+
+
+def test_indexes_stay_consistent_under_concurrent_writers() -> None:
+    store = InMemoryJobStore()
+    for i in range(40):
+        store.create(f"job-{i}")
+
+    def _advance(i: int) -> None:
+        for j in range(i, 40, 4):
+            store.set_status(f"job-{j}", JobStatus.RUNNING, current_node="collect_serp")
+            store.set_current_node(f"job-{j}", "planner")
+
+    _run_threads(4, _advance)
+
+    running = list_jobs(job_store=store, status=JobStatus.RUNNING, limit=100).jobs
+    assert sorted(r.id for r in running) == sorted(f"job-{i}" for i in range(40))
+    assert list_jobs(job_store=store, status=JobStatus.PENDING).jobs == []
+    assert len(list_jobs(job_store=store, limit=100).jobs) == 40
+
+
+def test_listing_catches_up_with_writes_and_deletes() -> None:
+    store = InMemoryJobStore(lock_stripes=4)
+    for i in range(6):
+        store.create(f"job-{i}")
+    assert len(list_jobs(job_store=store).jobs) == 6
+
+    store.set_status("job-1", JobStatus.RUNNING)
+    store.set_status("job-1", JobStatus.FAILED)
+    store.delete("job-2")
+    store.create("job-6")
+    store.delete("job-6")
+
+    ids = [r.id for r in list_jobs(job_store=store).jobs]
+    assert ids == ["job-0", "job-3", "job-4", "job-5", "job-1"]
+    assert [r.id for r in list_jobs(job_store=store, status=JobStatus.FAILED).jobs] == [
+        "job-1"
+    ]
+    assert list_jobs(job_store=store, status=JobStatus.RUNNING).jobs == []
+    assert store._changed == [{}] * 4
+
+
+def test_lock_stripes_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="lock_stripes must be > 0"):
+        InMemoryJobStore(lock_stripes=0)
@@ -0,0 +1,77 @@
+"""Unit tests for JobCoalescer – singleflight of identical in-flight jobs."""
+
+from __future__ import annotations
+
+from src.domain.models.job import JobRecord, JobStatus
+from src.domain.models.job_input import JobInput, JobPriority
+from src.infrastructure.stores.job_coalescer import JobCoalescer, coalesce_key
+
+
+def _input(topic: str, **kwargs) -> JobInput:
+    kwargs.setdefault("target_word_count", 500)
+    kwargs.setdefault("language", "en")
+    return JobInput(topic=topic, **kwargs)
+
+
+def test_coalesce_key_ignores_case_and_spacing_only() -> None:
+    assert coalesce_key(_input("SEO  tools ")) == coalesce_key(_input("seo tools"))
+    assert coalesce_key(_input("seo tools")) != coalesce_key(
+        _input("seo tools", language="de")
+    )
+    assert coalesce_key(_input("seo tools")) != coalesce_key(
+        _input("seo tools", target_word_count=800)
+    )
+
+
+def test_coalesce_key_separates_priorities_and_deadlines() -> None:
+    interactive = coalesce_key(_input("seo tools"))
+    assert interactive != coalesce_key(_input("seo tools", priority=JobPriority.BULK))
+    assert interactive != coalesce_key(_input("seo tools", deadline_seconds=30))
+    assert coalesce_key(_input("seo tools", deadline_seconds=30)) == coalesce_key(
+        _input("seo tools", deadline_seconds=30.0)
+    )
+
+
+def test_first_job_leads_and_later_ones_follow() -> None:
+    coalescer = JobCoalescer()
+    seen: list[tuple[str, str]] = []
+
+    assert (
+        coalescer.join("k", "leader", lambda r: seen.append(("leader", r.id))) is None
+    )
+    assert coalescer.join("k", "f1", lambda r: seen.append(("f1", r.id))) == "leader"
+    assert coalescer.join("k", "f2", lambda r: seen.append(("f2", r.id))) == "leader"
+    assert coalescer.leader_of("f2") == "leader"
+    assert coalescer.leader_of("leader") is None
+
+    coalescer.finish("k", JobRecord(id="leader", status=JobStatus.COMPLETED))
+
+    assert seen == [("f1", "leader"), ("f2", "leader")]
+    assert len(coalescer) == 0
+    assert coalescer.join("k", "next", lambda r: None) is None
+
+
+def test_finish_ignores_non_leader_and_survives_failing_callback() -> None:
+    coalescer = JobCoalescer()
+    seen: list[str] = []
+    coalescer.join("k", "leader", lambda r: None)
+    coalescer.join("k", "bad", lambda r: 1 / 0)
+    coalescer.join("k", "good", lambda r: seen.append(r.id))
+
+    coalescer.finish("k", JobRecord(id="bad", status=JobStatus.FAILED))
+    assert len(coalescer) == 1
+
+    coalescer.finish("k", JobRecord(id="leader", status=JobStatus.FAILED))
+    assert seen == ["leader"]
+
+
+def test_close_returns_followers_without_notifying() -> None:
+    coalescer = JobCoalescer()
+    seen: list[str] = []
+    coalescer.join("a", "leader-a", seen.append)
+    coalescer.join("a", "f1", seen.append)
+    coalescer.join("b", "leader-b", seen.append)
+
+    assert coalescer.close() == ["f1"]
+    assert seen == []
+    assert len(coalescer) == 0
@@ -0,0 +1,65 @@
+"""Tests for JobEventBus – per-job sequencing, replay and fan-out."""
+
+from __future__ import annotations
+
+from src.domain.models.events import JobEvent, JobEventType
+from src.infrastructure.events.job_event_bus import JobEventBus
+
+
+def _event(job_id: str, event_type: JobEventType, **fields: object) -> JobEvent:
+    return JobEvent(job_id=job_id, type=event_type, **fields)
+
+
+def test_publish_assigns_per_job_sequence() -> None:
+    bus = JobEventBus()
+    a1 = bus.publish(_event("a", JobEventType.NODE_START, node="collect_serp"))
+    b1 = bus.publish(_event("b", JobEventType.NODE_START, node="collect_serp"))
+    a2 = bus.publish(_event("a", JobEventType.NODE_END, node="collect_serp"))
+    assert (a1.seq, a2.seq, b1.seq) == (1, 2, 1)
+
+
+def test_subscriber_gets_history_then_live_events() -> None:
+    bus = JobEventBus()
+    bus.publish(_event("a", JobEventType.NODE_START, node="collect_serp"))
+    received: list[JobEvent] = []
+
+    history, unsubscribe = bus.subscribe("a", received.append)
+    bus.publish(_event("a", JobEventType.NODE_END, node="collect_serp"))
+    unsubscribe()
+    bus.publish(_event("a", JobEventType.NODE_START, node="extract_themes"))
+
+    assert [e.seq for e in history] == [1]
+    assert [e.seq for e in received] == [2]
+
+
+def test_terminal_event_closes_channel() -> None:
+    bus = JobEventBus()
+    received: list[JobEvent] = []
+    bus.subscribe("a", received.append)
+    bus.publish(_event("a", JobEventType.TERMINAL, status="completed"))
+
+    history, _ = bus.subscribe("a", received.append)
+    assert history[-1].type == JobEventType.TERMINAL
+    assert len(received) == 1
+
+
+def test_sequence_continues_when_a_closed_job_runs_again() -> None:
+    bus = JobEventBus()
+    bus.publish(_event("a", JobEventType.NODE_START, node="collect_serp"))
+    bus.publish(_event("a", JobEventType.TERMINAL, status="failed"))
+    received: list[JobEvent] = []
+    bus.subscribe("a", received.append)
+
+    rerun = bus.publish(_event("a", JobEventType.NODE_START, node="seo_packager"))
+
+    assert rerun.seq == 3
+    assert [e.seq for e in bus.history("a")] == [3]
+    assert received == [rerun]
+
+
+def test_history_retention_is_bounded() -> None:
+    bus = JobEventBus(max_jobs=2)
+    for job_id in ("a", "b", "c"):
+        bus.publish(_event(job_id, JobEventType.NODE_START, node="collect_serp"))
+    assert bus.history("a") == []
+    assert len(bus.history("c")) == 1
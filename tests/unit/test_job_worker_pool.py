@@ -0,0 +1,263 @@
+"""Tests for JobWorkerPool – bounded background execution and admission control."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.workers.errors import PoolClosedError, QueueFullError
+from src.infrastructure.workers.job_worker_pool import JobWorkerPool, Lane
+
+
+def test_submit_returns_before_job_finishes() -> None:
+    pool = JobWorkerPool(workers=1)
+    release = threading.Event()
+    done = threading.Event()
+
+    def _job() -> None:
+        release.wait(5)
+        done.set()
+
+    pool.submit("j1", _job)
+    assert not done.is_set()
+
+    release.set()
+    assert pool.wait_idle(timeout=5)
+    assert done.is_set()
+    pool.shutdown()
+
+
+def test_concurrency_bounded_by_workers() -> None:
+    pool = JobWorkerPool(workers=2)
+    release = threading.Event()
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def _job() -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        release.wait(5)
+        with lock:
+            active -= 1
+
+    for i in range(5):
+        pool.submit(f"j{i}", _job)
+
+    assert not pool.wait_idle(timeout=0.2)
+    assert pool.running == 2
+    assert pool.queued == 3
+
+    release.set()
+    assert pool.wait_idle(timeout=5)
+    assert peak == 2
+    pool.shutdown()
+
+
+def test_failing_job_does_not_kill_worker() -> None:
+    pool = JobWorkerPool(workers=1)
+    done = threading.Event()
+
+    def _boom() -> None:
+        raise RuntimeError("boom")
+
+    pool.submit("bad", _boom)
+    pool.submit("good", done.set)
+
+    assert pool.wait_idle(timeout=5)
+    assert done.is_set()
+    pool.shutdown()
+
+
+def test_submit_after_shutdown_raises() -> None:
+    pool = JobWorkerPool(workers=1)
+    pool.shutdown()
+    with pytest.raises(RuntimeError, match="shut down"):
+        pool.submit("j1", lambda: None)
+
+
+def test_close_drops_queued_jobs_and_sets_stopping() -> None:
+    pool = JobWorkerPool(workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    ran: list[str] = []
+
+    def _running() -> None:
+        started.set()
+        release.wait(5)
+
+    pool.submit("running", _running)
+    assert started.wait(5)
+    pool.submit("q1", lambda: ran.append("q1"))
+    pool.submit("q2", lambda: ran.append("q2"), lane="bulk")
+
+    assert pool.close() == ["q1", "q2"]
+    assert pool.stopping.is_set()
+    assert pool.queued == 0
+    assert pool.active_jobs() == ["running"]
+    with pytest.raises(PoolClosedError):
+        pool.submit("late", lambda: None)
+
+    release.set()
+    assert pool.wait_idle(timeout=5)
+    assert pool.active_jobs() == []
+    assert ran == []
+    pool.shutdown()
+
+
+def test_zero_workers_rejected() -> None:
+    with pytest.raises(ValueError, match="workers must be > 0"):
+        JobWorkerPool(workers=0)
+
+
+def test_submit_rejected_when_queue_full() -> None:
+    pool = JobWorkerPool(workers=1, max_queue_depth=1)
+    release = threading.Event()
+
+    pool.submit("running", lambda: release.wait(5))
+    pool.submit("waiting", lambda: None)
+
+    with pytest.raises(QueueFullError) as exc_info:
+        pool.submit("rejected", lambda: None)
+    assert exc_info.value.retry_after >= 1
+
+    release.set()
+    assert pool.wait_idle(timeout=5)
+    pool.submit("accepted", lambda: None)
+    assert pool.wait_idle(timeout=5)
+    pool.shutdown()
+
+
+def test_stats_report_depth_and_wait() -> None:
+    pool = JobWorkerPool(workers=1, max_queue_depth=5)
+    release = threading.Event()
+
+    pool.submit("j1", lambda: release.wait(5))
+    pool.submit("j2", lambda: None)
+    assert not pool.wait_idle(timeout=0.1)
+
+    stats = pool.stats()
+    assert stats.workers == 1
+    assert stats.running == 1
+    assert stats.queued == 1
+    assert stats.max_queue_depth == 5
+    assert stats.oldest_wait_seconds > 0
+
+    release.set()
+    assert pool.wait_idle(timeout=5)
+    assert pool.stats().avg_wait_seconds > 0
+    pool.shutdown()
+
+
+
+def _run_order(
+    pool: JobWorkerPool, jobs: list[tuple[str, str]], settle: float = 0.0
+) -> list[str]:
+    """Queue *jobs* behind a running blocker on a one-worker pool; return run order."""
+    started = threading.Event()
+    release = threading.Event()
+    order: list[str] = []
+
+    def _blocker() -> None:
+        started.set()
+        release.wait(5)
+
+    pool.submit("blocker", _blocker)
+    assert started.wait(5)
+    for job_id, lane in jobs:
+        pool.submit(job_id, lambda job_id=job_id: order.append(job_id), lane=lane)
+    if settle:
+        time.sleep(settle)
+    release.set()
+    assert pool.wait_idle(timeout=5)
+    pool.shutdown()
+    return order
+
+
+def test_lanes_share_workers_by_weight() -> None:
+    pool = JobWorkerPool(
+        workers=1,
+        lanes={"interactive": Lane(weight=3), "bulk": Lane(weight=1)},
+        aging_seconds=3600,
+    )
+    jobs = [(f"b{i}", "bulk") for i in range(8)] + [
+        (f"i{i}", "interactive") for i in range(8)
+    ]
+
+    order = _run_order(pool, jobs)
+    assert [job_id[0] for job_id in order[:8]].count("i") == 6
+    assert [j for j in order if j[0] == "b"] == [f"b{i}" for i in range(8)]
+
+
+def test_interactive_job_overtakes_saturated_bulk_lane() -> None:
+    pool = JobWorkerPool(
+        workers=1,
+        lanes={
+            "interactive": Lane(weight=4),
+            "bulk": Lane(weight=1, max_queue_depth=50),
+        },
+    )
+    jobs = [(f"b{i}", "bulk") for i in range(50)] + [("i0", "interactive")]
+
+    order = _run_order(pool, jobs)
+    assert order[0] == "i0"
+
+
+def test_full_bulk_lane_does_not_reject_interactive() -> None:
+    pool = JobWorkerPool(workers=1, max_queue_depth=1)
+    started = threading.Event()
+    release = threading.Event()
+    pool.submit("blocker", lambda: (started.set(), release.wait(5)))
+    assert started.wait(5)
+    pool.submit("b0", lambda: None, lane="bulk")
+    with pytest.raises(QueueFullError):
+        pool.submit("b1", lambda: None, lane="bulk")
+
+    pool.submit("i0", lambda: None, lane="interactive")
+    lanes = pool.stats().lanes
+    assert lanes["bulk"].queued == 1
+    assert lanes["interactive"].queued == 1
+    release.set()
+    assert pool.wait_idle(timeout=5)
+    pool.shutdown()
+
+
+def test_aging_moves_a_waiting_lane_up() -> None:
+    pool = JobWorkerPool(
+        workers=1,
+        lanes={"interactive": Lane(weight=100), "bulk": Lane(weight=1)},
+        aging_seconds=0.001,
+    )
+    jobs = [("b0", "bulk")] + [(f"i{i}", "interactive") for i in range(10)]
+
+    order = _run_order(pool, jobs, settle=0.2)
+    assert order.index("b0") == 1
+
+
+def test_aged_bulk_backlog_keeps_interactive_weighted_share() -> None:
+    pool = JobWorkerPool(
+        workers=1,
+        lanes={
+            "interactive": Lane(weight=4),
+            "bulk": Lane(weight=1, max_queue_depth=50),
+        },
+        aging_seconds=0.001,
+    )
+    jobs = [(f"b{i}", "bulk") for i in range(20)] + [
+        (f"i{i}", "interactive") for i in range(20)
+    ]
+
+    # Both lanes are fully aged; bulk is capped at 3 against interactive's 4.
+    order = _run_order(pool, jobs, settle=0.2)
+    assert [job_id[0] for job_id in order[:14]].count("i") == 8
+
+
+def test_unknown_lane_rejected() -> None:
+    pool = JobWorkerPool(workers=1)
+    with pytest.raises(ValueError, match="unknown lane"):
+        pool.submit("j1", lambda: None, lane="urgent")
+    pool.shutdown()
@@ -20,7 +20,9 @@ class FakeLLM:
         self._primary = primary
         self._secondary = secondary or ["Task Tracking", "Team Collaboration", "Project Planning"]
 
-    def generate_structured(self, *, node_name: str, prompt: str, schema: type) -> KeywordPlan:
+    def generate_structured(
+        self, *, node_name: str, prompt: str, schema: type, **kwargs
+    ) -> KeywordPlan:
         assert node_name == "keyword_plan"
         assert schema is KeywordPlan
         assert "project management" in prompt
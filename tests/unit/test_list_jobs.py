@@ -0,0 +1,65 @@
+"""Unit tests for list_jobs cursor pagination and the store's listing indexes."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.application.use_cases.list_jobs import decode_cursor, encode_cursor, list_jobs
+from src.domain.models.job import JobStatus
+from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+
+
+def _store_with(n: int) -> InMemoryJobStore:
+    store = InMemoryJobStore()
+    for i in range(n):
+        store.create(f"job-{i}")
+    return store
+
+
+def test_cursor_round_trip() -> None:
+    record = _store_with(1).get("job-0")
+    assert decode_cursor(encode_cursor(record)) == (record.updated_at, "job-0")
+
+
+@pytest.mark.parametrize("cursor", ["%%%", "bm8tc2VwYXJhdG9y", "MjAyNC0wMS0wMXxqb2I="])
+def test_decode_cursor_rejects_malformed(cursor: str) -> None:
+    with pytest.raises(ValueError, match="cursor is invalid"):
+        decode_cursor(cursor)
+
+
+def test_list_jobs_walks_all_pages() -> None:
+    store = _store_with(7)
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page = list_jobs(job_store=store, cursor=cursor, limit=3)
+        seen += [r.id for r in page.jobs]
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+    assert seen == [f"job-{i}" for i in range(7)]
+
+
+def test_status_index_follows_transitions() -> None:
+    store = _store_with(3)
+    store.set_status("job-1", JobStatus.RUNNING, current_node="collect_serp")
+
+    running = list_jobs(job_store=store, status=JobStatus.RUNNING)
+    pending = list_jobs(job_store=store, status=JobStatus.PENDING)
+
+    assert [r.id for r in running.jobs] == ["job-1"]
+    assert [r.id for r in pending.jobs] == ["job-0", "job-2"]
+
+
+def test_delete_removes_from_indexes() -> None:
+    store = _store_with(2)
+    store.delete("job-0")
+    assert [r.id for r in list_jobs(job_store=store).jobs] == ["job-1"]
+    assert [
+        r.id for r in list_jobs(job_store=store, status=JobStatus.PENDING).jobs
+    ] == ["job-1"]
+
+
+def test_list_jobs_rejects_non_positive_limit() -> None:
+    with pytest.raises(ValueError, match="limit must be > 0"):
+        list_jobs(job_store=_store_with(1), limit=0)
@@ -0,0 +1,147 @@
+"""Unit tests for the metrics registry, PipelineMetrics and TimedLock."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.metrics import (
+    MetricsRegistry,
+    PipelineMetrics,
+    TimedLock,
+    timed_lock,
+)
+from src.infrastructure.workers.job_worker_pool import LaneStats, QueueStats
+
+
+def test_counter_renders_labels_and_escapes_values() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("reqs_total", "Requests.", ["node", "outcome"])
+    requests.labels("planner", "ok").inc()
+    requests.labels("planner", "ok").inc(2)
+    requests.labels('we"ird\n', "error").inc()
+
+    assert registry.render() == (
+        "# HELP reqs_total Requests.\n"
+        "# TYPE reqs_total counter\n"
+        'reqs_total{node="planner",outcome="ok"} 3\n'
+        'reqs_total{node="we\\"ird\\n",outcome="error"} 1\n'
+    )
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    registry = MetricsRegistry()
+    latency = registry.histogram(
+        "lat_seconds", "Latency.", ["node"], buckets=(0.1, 1.0)
+    )
+    child = latency.labels("planner")
+    for value in (0.05, 0.1, 0.5, 3.0):
+        child.observe(value)
+
+    lines = registry.render().splitlines()
+    assert lines[2:] == [
+        'lat_seconds_bucket{node="planner",le="0.1"} 2',
+        'lat_seconds_bucket{node="planner",le="1"} 3',
+        'lat_seconds_bucket{node="planner",le="+Inf"} 4',
+        'lat_seconds_sum{node="planner"} 3.65',
+        'lat_seconds_count{node="planner"} 4',
+    ]
+
+
+def test_histogram_split_parts_merge_at_render() -> None:
+    registry = MetricsRegistry()
+    latency = registry.histogram("lat_seconds", "Latency.", buckets=(0.1, 1.0))
+    child = latency.labels()
+    first, second = child.split(2)
+    child.observe(0.05)
+    first.observe(0.5)
+    second.observe(3.0)
+
+    lines = registry.render().splitlines()
+    assert lines[2:] == [
+        'lat_seconds_bucket{le="0.1"} 1',
+        'lat_seconds_bucket{le="1"} 2',
+        'lat_seconds_bucket{le="+Inf"} 3',
+        "lat_seconds_sum 3.55",
+        "lat_seconds_count 3",
+    ]
+
+
+def test_registry_rejects_duplicates_and_wrong_label_count() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs.", ["status"])
+    with pytest.raises(ValueError):
+        registry.counter("jobs_total", "Jobs again.")
+    with pytest.raises(ValueError):
+        counter.labels("a", "b")
+
+
+def test_llm_usage_and_queue_sampling() -> None:
+    metrics = PipelineMetrics()
+    metrics.record_llm_usage(
+        "planner", "gpt-4.1", {"input_tokens": 120, "output_tokens": 30}
+    )
+    metrics.record_llm_usage("planner", "gpt-4.1", None)
+    metrics.sample_queue(
+        QueueStats(
+            workers=4,
+            running=3,
+            queued=7,
+            max_queue_depth=100,
+            avg_wait_seconds=0.0,
+            oldest_wait_seconds=2.5,
+            lanes={
+                "bulk": LaneStats(
+                    weight=1,
+                    queued=7,
+                    max_queue_depth=100,
+                    avg_wait_seconds=0.0,
+                    oldest_wait_seconds=2.5,
+                )
+            },
+        )
+    )
+
+    text = metrics.render()
+    assert (
+        'aiseo_llm_tokens_total{node="planner",model="gpt-4.1",direction="input"} 120'
+        in text
+    )
+    assert (
+        'aiseo_llm_tokens_total{node="planner",model="gpt-4.1",direction="output"} 30'
+        in text
+    )
+    assert 'aiseo_queue_depth{lane="bulk"} 7' in text
+    assert "aiseo_jobs_running 3" in text
+
+
+def test_timed_lock_reports_contended_wait() -> None:
+    waits: list[float] = []
+    lock = TimedLock(threading.Lock(), waits.append)
+    with lock:
+        pass
+    assert waits == [0.0]
+
+    lock.acquire()
+    holder = threading.Timer(0.05, lock.release)
+    holder.start()
+    with lock:
+        pass
+    holder.join()
+    assert waits[-1] >= 0.04
+
+
+def test_timed_lock_without_observer_is_the_plain_lock() -> None:
+    plain = threading.Lock()
+    assert timed_lock(plain, None) is plain
+
+
+def test_recording_is_cheap() -> None:
+    child = PipelineMetrics().node_seconds.labels("planner")
+    started = time.perf_counter()
+    for _ in range(10_000):
+        child.observe(0.01)
+    # Generous bound: catches accidental O(n) work, not machine speed.
+    assert (time.perf_counter() - started) / 10_000 < 50e-6
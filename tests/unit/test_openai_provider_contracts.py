@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from contextlib import aclosing
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pydantic import BaseModel
 
+from src.infrastructure.metrics import PipelineMetrics
+from src.infrastructure.providers.llm.call_window import LLMCallWindow
 from src.infrastructure.providers.llm.errors import LLMProviderError
 from src.infrastructure.providers.llm.openai_provider import OpenAIProvider
 
@@ -120,6 +124,66 @@ def test_generate_text_raises_on_empty():
     assert "empty" in exc_info.value.message.lower()
 
 
+# -- stream_text -------------------------------------------------------------
+
+
+def test_stream_text_yields_chunks():
+    provider = _make_provider()
+    provider._llm_text.stream = MagicMock(
+        return_value=iter(
+            [MagicMock(content=""), MagicMock(content="Hel"), MagicMock(content="lo")]
+        ),
+    )
+
+    chunks = list(provider.stream_text(node_name="writer", prompt="write something"))
+    assert chunks == ["Hel", "lo"]
+
+
+def test_stream_text_raises_on_empty():
+    provider = _make_provider()
+    provider._llm_text.stream = MagicMock(return_value=iter([MagicMock(content="")]))
+
+    with pytest.raises(LLMProviderError) as exc_info:
+        list(provider.stream_text(node_name="writer", prompt="write something"))
+
+    assert "empty" in exc_info.value.message.lower()
+
+
+def test_stream_text_retries_before_first_chunk():
+    provider = _make_provider()
+    call_count = 0
+
+    def _flaky(*args: object, **kwargs: object):
+        nonlocal call_count
+        call_count += 1
+        if call_count == 1:
+            raise ConnectionError("Connection timeout")
+        return iter([MagicMock(content="recovered")])
+
+    provider._llm_text.stream = _flaky
+
+    with patch("src.infrastructure.providers.llm.openai_provider.time.sleep"):
+        chunks = list(provider.stream_text(node_name="writer", prompt="try again"))
+
+    assert chunks == ["recovered"]
+    assert call_count == 2
+
+
+def test_stream_text_wraps_mid_stream_failure():
+    provider = _make_provider()
+
+    def _broken():
+        yield MagicMock(content="partial")
+        raise ConnectionError("reset by peer")
+
+    provider._llm_text.stream = MagicMock(return_value=_broken())
+
+    stream = provider.stream_text(node_name="writer", prompt="write")
+    assert next(stream) == "partial"
+    with pytest.raises(LLMProviderError, match="stream interrupted"):
+        next(stream)
+
+
 # -- retry behaviour ---------------------------------------------------------
 
 
@@ -163,9 +227,237 @@ def test_non_transient_error_limited_retries():
     assert call_count == 2
 
 
+def test_call_window_records_each_attempt():
+    window = LLMCallWindow()
+    provider = _make_provider(call_window=window)
+    provider._llm_text.invoke = MagicMock(
+        side_effect=[
+            ConnectionError("Connection timeout"),
+            MagicMock(content="recovered"),
+        ]
+    )
+
+    with patch("src.infrastructure.providers.llm.openai_provider.time.sleep"):
+        provider.generate_text(node_name="writer", prompt="try again")
+
+    stats = window.stats()
+    assert (stats.calls, stats.errors) == (2, 1)
+
+
+def test_metrics_record_attempts_retries_and_tokens():
+    metrics = PipelineMetrics()
+    provider = _make_provider(metrics=metrics)
+    provider._llm_text.invoke = MagicMock(
+        side_effect=[
+            ConnectionError("Connection timeout"),
+            MagicMock(
+                content="recovered",
+                usage_metadata={
+                    "input_tokens": 50,
+                    "output_tokens": 7,
+                    "total_tokens": 57,
+                },
+            ),
+        ]
+    )
+
+    with patch("src.infrastructure.providers.llm.openai_provider.time.sleep"):
+        provider.generate_text(node_name="writer", prompt="try again")
+
+    text = metrics.render()
+    labels = 'node="writer",model="gpt-4.1"'
+    assert f'aiseo_llm_requests_total{{{labels},outcome="ok"}} 1' in text
+    assert f'aiseo_llm_requests_total{{{labels},outcome="error"}} 1' in text
+    assert f"aiseo_llm_retries_total{{{labels}}} 1" in text
+    assert f'aiseo_llm_tokens_total{{{labels},direction="input"}} 50' in text
+    assert f"aiseo_llm_request_duration_seconds_count{{{labels}}} 2" in text
+
+
+# -- async path --------------------------------------------------------------
+
+
+def test_agenerate_structured_returns_pydantic():
+    provider = _make_provider()
+    expected = _SampleSchema(title="Hello", score=42)
+
+    mock_runnable = MagicMock()
+    mock_runnable.ainvoke = AsyncMock(
+        return_value={
+            "raw": MagicMock(content="{}"),
+            "parsed": expected,
+            "parsing_error": None,
+        }
+    )
+    provider._llm_json.with_structured_output = MagicMock(return_value=mock_runnable)
+
+    result = asyncio.run(
+        provider.agenerate_structured(
+            node_name="planner", prompt="p", schema=_SampleSchema
+        )
+    )
+
+    assert result == expected
+
+
+def test_agenerate_text_retries_with_asyncio_sleep():
+    provider = _make_provider()
+    provider._llm_text.ainvoke = AsyncMock(
+        side_effect=[
+            ConnectionError("Connection timeout"),
+            MagicMock(content="recovered"),
+        ]
+    )
+
+    with (
+        patch(
+            "src.infrastructure.providers.llm.openai_provider.asyncio.sleep",
+            new=AsyncMock(),
+        ) as sleep,
+        patch("src.infrastructure.providers.llm.openai_provider.time.sleep") as tsleep,
+    ):
+        result = asyncio.run(
+            provider.agenerate_text(node_name="writer", prompt="try again")
+        )
+
+    assert result == "recovered"
+    assert sleep.await_count == 1
+    tsleep.assert_not_called()
+
+
+def test_astream_text_yields_chunks():
+    provider = _make_provider()
+
+    async def _chunks(prompt: str):
+        for text in ("", "Hel", "lo"):
+            yield MagicMock(content=text)
+
+    provider._llm_text.astream = _chunks
+
+    async def _collect() -> list[str]:
+        return [c async for c in provider.astream_text(node_name="writer", prompt="w")]
+
+    assert asyncio.run(_collect()) == ["Hel", "lo"]
+
+
+def test_astream_text_raises_on_empty():
+    provider = _make_provider()
+
+    async def _chunks(prompt: str):
+        yield MagicMock(content="")
+
+    provider._llm_text.astream = _chunks
+
+    async def _collect() -> list[str]:
+        return [c async for c in provider.astream_text(node_name="writer", prompt="w")]
+
+    with pytest.raises(LLMProviderError, match="empty"):
+        asyncio.run(_collect())
+
+
+def test_astream_text_closes_upstream_when_cancelled_mid_stream():
+    provider = _make_provider()
+    closed = asyncio.Event()
+
+    async def _chunks(prompt: str):
+        try:
+            yield MagicMock(content="Hel")
+            yield MagicMock(content="lo")
+            await asyncio.Event().wait()
+        finally:
+            closed.set()
+
+    provider._llm_text.astream = _chunks
+
+    async def _run() -> list[str]:
+        received: list[str] = []
+        first_chunk = asyncio.Event()
+
+        async def _consume() -> None:
+            stream = provider.astream_text(node_name="writer", prompt="w")
+            async with aclosing(stream):
+                async for chunk in stream:
+                    received.append(chunk)
+                    first_chunk.set()
+                    await asyncio.Event().wait()  # e.g. a slow draft subscriber
+
+        task = asyncio.create_task(_consume())
+        await first_chunk.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert closed.is_set()
+        return received
+
+    assert asyncio.run(_run()) == ["Hel"]
+
+
 # -- constructor -------------------------------------------------------------
 
 
+# -- timeout budget ----------------------------------------------------------
+
+
+def test_with_timeout_copies_client_sharing_connections():
+    from langchain_openai import ChatOpenAI
+
+    from src.infrastructure.providers.llm.openai_provider import _with_timeout
+
+    llm = ChatOpenAI(api_key="test-key", model="gpt-4.1")
+    bounded = _with_timeout(llm, 2.5)
+
+    assert _with_timeout(llm, None) is llm
+    assert bounded.root_client.timeout == 2.5
+    assert bounded.root_async_client.timeout == 2.5
+    assert bounded.client is bounded.root_client.chat.completions
+    assert bounded.root_client._client is llm.root_client._client
+    assert llm.root_client.timeout != 2.5
+
+
+def test_no_retry_when_backoff_exceeds_timeout_budget():
+    provider = _make_provider()
+    provider._llm_text.model_copy.return_value = provider._llm_text
+    provider._llm_text.invoke = MagicMock(side_effect=Exception("rate limit exceeded"))
+
+    with patch("src.infrastructure.providers.llm.openai_provider.time.sleep") as sleep:
+        with pytest.raises(LLMProviderError):
+            provider.generate_text(node_name="writer", prompt="p", timeout=0.3)
+
+    assert provider._llm_text.invoke.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_spent_timeout_budget_fails_without_calling():
+    provider = _make_provider()
+    provider._llm_text.invoke = MagicMock()
+
+    with pytest.raises(LLMProviderError, match="budget exhausted"):
+        provider.generate_text(node_name="writer", prompt="p", timeout=0)
+    provider._llm_text.invoke.assert_not_called()
+
+
+def test_async_attempt_cut_off_at_timeout():
+    provider = _make_provider()
+
+    calls = 0
+
+    async def _hang(prompt):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(30)
+
+    provider._llm_text.model_copy.return_value = provider._llm_text
+    provider._llm_text.ainvoke = _hang
+
+    with pytest.raises(LLMProviderError, match="after 1 attempt"):
+        asyncio.run(
+            asyncio.wait_for(
+                provider.agenerate_text(node_name="writer", prompt="p", timeout=0.2),
+                5,
+            )
+        )
+    assert calls == 1
+
+
 def test_missing_api_key_raises():
     with patch(
         "src.infrastructure.providers.llm.openai_provider.ChatOpenAI",
@@ -16,7 +16,9 @@ from src.infrastructure.providers.serp.mock_serp import MockSerpProvider
 class FakeLLM:
     """Fake LLM that returns a Plan instance without calling the network."""
 
-    def generate_structured(self, *, node_name: str, prompt: str, schema: type) -> Plan:
+    def generate_structured(
+        self, *, node_name: str, prompt: str, schema: type, **kwargs
+    ) -> Plan:
         assert node_name == "planner"
         assert schema is Plan
         assert "project management" in prompt
@@ -169,7 +171,9 @@ def test_planner_budget_mismatch_raises() -> None:
     """FakeLLM returns Plan with total 100 when target is 1500 – outside +/- 25%."""
 
     class BadBudgetLLM:
-        def generate_structured(self, *, node_name: str, prompt: str, schema: type) -> Plan:
+        def generate_structured(
+            self, *, node_name: str, prompt: str, schema: type, **kwargs
+        ) -> Plan:
             return Plan(
                 h1="Test",
                 intro_target_word_count=50,
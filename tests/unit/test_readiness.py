@@ -0,0 +1,138 @@
+"""Unit tests for readiness – LLM call window and threshold checks."""
+
+from __future__ import annotations
+
+from src.api.readiness import assess_readiness
+from src.infrastructure.providers.llm.call_window import LLMCallStats, LLMCallWindow
+from src.infrastructure.workers.job_worker_pool import LaneStats, QueueStats
+from src.settings import Settings
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _queue(*, queued: int = 0, running: int = 0) -> QueueStats:
+    return QueueStats(
+        workers=4,
+        running=running,
+        queued=queued,
+        max_queue_depth=100,
+        avg_wait_seconds=0.0,
+        oldest_wait_seconds=0.0,
+    )
+
+
+def _lanes(*, interactive: int, bulk: int) -> QueueStats:
+    def _lane(queued: int, depth: int) -> LaneStats:
+        return LaneStats(
+            weight=1,
+            queued=queued,
+            max_queue_depth=depth,
+            avg_wait_seconds=0.0,
+            oldest_wait_seconds=0.0,
+        )
+
+    return QueueStats(
+        workers=4,
+        running=4,
+        queued=interactive + bulk,
+        max_queue_depth=100,
+        avg_wait_seconds=0.0,
+        oldest_wait_seconds=0.0,
+        lanes={"interactive": _lane(interactive, 100), "bulk": _lane(bulk, 1000)},
+    )
+
+
+def _settings(**overrides) -> Settings:
+    return Settings(APP_ENV="dev", **overrides)
+
+
+def test_call_window_counts_and_expires() -> None:
+    clock = _Clock()
+    window = LLMCallWindow(window_seconds=60, clock=clock)
+    window.record(ok=True)
+    window.record(ok=False)
+    clock.now += 30
+    window.record(ok=False)
+
+    stats = window.stats()
+    assert (stats.calls, stats.errors) == (3, 2)
+    assert stats.error_rate == 2 / 3
+
+    clock.now += 45
+    stats = window.stats()
+    assert (stats.calls, stats.errors) == (1, 1)
+
+    clock.now += 60
+    assert window.stats().calls == 0
+    assert window.stats().error_rate == 0.0
+
+
+def test_ready_under_thresholds() -> None:
+    result = assess_readiness(
+        queue=_queue(queued=5, running=4),
+        llm=LLMCallStats(window_seconds=60, calls=20, errors=2),
+        settings=_settings(),
+    )
+    assert result.status == "ready"
+    assert result.reasons == []
+    assert result.queue.queued == 5
+    assert result.llm.error_rate == 0.1
+
+
+def test_not_ready_reports_each_crossed_threshold() -> None:
+    result = assess_readiness(
+        queue=_queue(queued=10, running=4),
+        llm=LLMCallStats(window_seconds=60, calls=20, errors=15),
+        settings=_settings(READY_MAX_QUEUED=10, READY_MAX_RUNNING=4),
+    )
+    assert result.status == "not_ready"
+    assert len(result.reasons) == 3
+    assert result.reasons[0].startswith("queued jobs 10")
+    assert result.reasons[2].startswith("LLM error rate 0.75")
+
+
+def test_full_bulk_lane_stays_ready() -> None:
+    result = assess_readiness(
+        queue=_lanes(interactive=5, bulk=1000),
+        llm=LLMCallStats(window_seconds=60, calls=0, errors=0),
+        settings=_settings(READY_MAX_QUEUED=100),
+    )
+    assert result.status == "ready"
+    assert result.queue.queued == 1005
+
+
+def test_queued_threshold_applies_to_interactive_lane() -> None:
+    result = assess_readiness(
+        queue=_lanes(interactive=100, bulk=0),
+        llm=LLMCallStats(window_seconds=60, calls=0, errors=0),
+        settings=_settings(READY_MAX_QUEUED=100),
+    )
+    assert result.status == "not_ready"
+    assert result.reasons == ["interactive queued jobs 100 >= 100"]
+
+
+def test_llm_error_rate_ignored_below_min_calls() -> None:
+    result = assess_readiness(
+        queue=_queue(),
+        llm=LLMCallStats(window_seconds=60, calls=3, errors=3),
+        settings=_settings(READY_LLM_MIN_CALLS=10),
+    )
+    assert result.status == "ready"
+
+
+def test_zero_disables_a_threshold() -> None:
+    result = assess_readiness(
+        queue=_queue(queued=10_000, running=4),
+        llm=LLMCallStats(window_seconds=60, calls=100, errors=100),
+        settings=_settings(
+            READY_MAX_QUEUED=0, READY_MAX_RUNNING=0, READY_MAX_LLM_ERROR_RATE=0
+        ),
+    )
+    assert result.status == "ready"
+    assert result.thresholds.max_queued is None
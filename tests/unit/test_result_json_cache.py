@@ -0,0 +1,79 @@
+"""Unit tests for InMemoryJobStore's cached result JSON bytes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+from src.api.schemas.responses import ResultResponse
+from src.domain.models.job import JobStatus
+from src.domain.models.outline import Outline
+from src.domain.models.output import SeoArticleOutput
+from src.domain.models.seo_package import KeywordUsage, SeoMeta
+from src.domain.models.validation import ValidationReport
+from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+
+
+def _output(title: str = "Best SEO Tools") -> SeoArticleOutput:
+    return SeoArticleOutput(
+        seo_meta=SeoMeta(title_tag=title, meta_description="A guide."),
+        article_markdown=f"# {title}\n\nBody.",
+        outline=Outline(h1=title),
+        keyword_analysis=KeywordUsage(primary="seo tools", secondary=[], counts=[]),
+        validation_report=ValidationReport(passed=True, score=1.0),
+    )
+
+
+def _completed(store: InMemoryJobStore, job_id: str, output: SeoArticleOutput) -> None:
+    store.create(job_id)
+    store.set_result(job_id, output)
+
+
+def test_cached_bytes_match_model_serialization() -> None:
+    store = InMemoryJobStore()
+    output = _output()
+    _completed(store, "j1", output)
+
+    result_json, result_hash = store.get_result_json("j1")
+
+    assert result_json == output.model_dump_json().encode()
+    assert result_hash == store.get("j1").result_hash
+    assert result_hash == hashlib.sha256(result_json).hexdigest()
+    envelope = b'{"result":' + result_json + b"}"
+    assert envelope == ResultResponse(result=output).model_dump_json().encode()
+    assert json.loads(envelope)["result"]["seo_meta"]["title_tag"] == "Best SEO Tools"
+
+
+def test_returns_none_until_completed() -> None:
+    store = InMemoryJobStore()
+    store.create("j1")
+    assert store.get_result_json("j1") is None
+
+
+def test_rebuilds_after_eviction() -> None:
+    store = InMemoryJobStore(result_cache_size=1)
+    _completed(store, "j1", _output("One"))
+    _completed(store, "j2", _output("Two"))
+
+    result_json, _ = store.get_result_json("j1")
+
+    assert json.loads(result_json)["seo_meta"]["title_tag"] == "One"
+
+
+def test_invalidated_when_job_leaves_completed() -> None:
+    store = InMemoryJobStore()
+    _completed(store, "j1", _output())
+    store.set_status("j1", JobStatus.QUEUED)
+
+    assert store.get_result_json("j1") is None
+
+
+def test_dropped_on_delete() -> None:
+    store = InMemoryJobStore()
+    _completed(store, "j1", _output())
+    store.delete("j1")
+
+    with pytest.raises(KeyError):
+        store.get_result_json("j1")
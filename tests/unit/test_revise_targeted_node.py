@@ -99,7 +99,9 @@ class FakeLLM:
     def __init__(self, result: RevisionResult) -> None:
         self._result = result
 
-    def generate_structured(self, *, node_name: str, prompt: str, schema: type) -> RevisionResult:
+    def generate_structured(
+        self, *, node_name: str, prompt: str, schema: type, **kwargs
+    ) -> RevisionResult:
         assert node_name == "revise_targeted"
         assert schema is RevisionResult
         assert "project management" in prompt
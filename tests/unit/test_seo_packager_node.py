@@ -115,7 +115,9 @@ class FakeLLM:
     def __init__(self, seo_package: SeoPackage) -> None:
         self._pkg = seo_package
 
-    def generate_structured(self, *, node_name: str, prompt: str, schema: type) -> SeoPackage:
+    def generate_structured(
+        self, *, node_name: str, prompt: str, schema: type, **kwargs
+    ) -> SeoPackage:
         assert node_name == "seo_packager"
         assert schema is SeoPackage
         assert "project management" in prompt
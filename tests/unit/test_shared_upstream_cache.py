@@ -0,0 +1,222 @@
+"""Tests for SharedUpstreamCache – singleflight sharing within a batch group."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.stores.shared_upstream_cache import SharedUpstreamCache
+
+
+def test_unregistered_key_computes_every_time() -> None:
+    cache = SharedUpstreamCache()
+    calls = 0
+
+    def _compute() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert cache.get_or_compute("k", "serp", _compute) == 1
+    assert cache.get_or_compute("k", "serp", _compute) == 2
+
+
+def test_registered_key_computes_once() -> None:
+    cache = SharedUpstreamCache()
+    cache.register("k", consumers=3)
+    calls = 0
+
+    def _compute() -> list[str]:
+        nonlocal calls
+        calls += 1
+        return ["a"]
+
+    values = [cache.get_or_compute("k", "serp", _compute) for _ in range(3)]
+    assert calls == 1
+    assert all(v is values[0] for v in values)
+
+
+def test_concurrent_callers_wait_for_single_computation() -> None:
+    cache = SharedUpstreamCache()
+    cache.register("k", consumers=4)
+    calls = 0
+    lock = threading.Lock()
+    results: list[str] = []
+
+    def _compute() -> str:
+        nonlocal calls
+        with lock:
+            calls += 1
+        time.sleep(0.05)
+        return "themes"
+
+    def _worker() -> None:
+        results.append(cache.get_or_compute("k", "themes", _compute))
+
+    threads = [threading.Thread(target=_worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+    assert calls == 1
+    assert results == ["themes"] * 4
+
+
+def test_failed_computation_is_retried_by_next_caller() -> None:
+    cache = SharedUpstreamCache()
+    cache.register("k", consumers=2)
+
+    def _boom() -> str:
+        raise RuntimeError("llm down")
+
+    with pytest.raises(RuntimeError, match="llm down"):
+        cache.get_or_compute("k", "themes", _boom)
+    assert cache.get_or_compute("k", "themes", lambda: "ok") == "ok"
+
+
+def test_async_callers_share_one_computation() -> None:
+    cache = SharedUpstreamCache()
+    cache.register("k", consumers=4)
+    calls = 0
+
+    async def _compute() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "themes"
+
+    async def _run() -> list[str]:
+        return await asyncio.gather(
+            *(cache.aget_or_compute("k", "themes", _compute) for _ in range(4))
+        )
+
+    assert asyncio.run(_run()) == ["themes"] * 4
+    assert calls == 1
+
+
+def test_async_follower_waits_for_thread_owner() -> None:
+    cache = SharedUpstreamCache()
+    cache.register("k", consumers=2)
+    started = threading.Event()
+
+    def _compute() -> str:
+        started.set()
+        time.sleep(0.05)
+        return "serp"
+
+    owner = threading.Thread(target=cache.get_or_compute, args=("k", "serp", _compute))
+    owner.start()
+    started.wait(5)
+
+    async def _never() -> str:
+        raise AssertionError("follower must not compute")
+
+    assert asyncio.run(cache.aget_or_compute("k", "serp", _never)) == "serp"
+    owner.join(5)
+
+
+def test_async_failure_is_retried_by_next_caller() -> None:
+    cache = SharedUpstreamCache()
+    cache.register("k", consumers=2)
+
+    async def _boom() -> str:
+        raise RuntimeError("llm down")
+
+    async def _ok() -> str:
+        return "ok"
+
+    with pytest.raises(RuntimeError, match="llm down"):
+        asyncio.run(cache.aget_or_compute("k", "themes", _boom))
+    assert asyncio.run(cache.aget_or_compute("k", "themes", _ok)) == "ok"
+
+
+def test_release_drops_entry_after_last_consumer() -> None:
+    cache = SharedUpstreamCache()
+    cache.register("k", consumers=2)
+    cache.release("k", "job-1")
+    assert len(cache) == 1
+    cache.release("k", "job-2")
+    assert len(cache) == 0
+    cache.release("k", "job-3")
+
+
+def test_repeat_release_by_one_consumer_is_ignored() -> None:
+    cache = SharedUpstreamCache()
+    cache.register("k", consumers=2)
+    cache.release("k", "job-1")
+    cache.release("k", "job-1")
+    assert len(cache) == 1
+    cache.release("k", "job-2")
+    assert len(cache) == 0
+
+
+def test_follower_check_ends_the_wait() -> None:
+    cache = SharedUpstreamCache()
+    cache.register("k", consumers=2)
+    started = threading.Event()
+    finish = threading.Event()
+
+    def _compute() -> str:
+        started.set()
+        finish.wait(5)
+        return "themes"
+
+    owner = threading.Thread(
+        target=cache.get_or_compute, args=("k", "themes", _compute)
+    )
+    owner.start()
+    started.wait(5)
+    stop = threading.Event()
+
+    def _check() -> None:
+        if stop.is_set():
+            raise RuntimeError("cancelled")
+
+    threading.Timer(0.05, stop.set).start()
+    began = time.monotonic()
+    with pytest.raises(RuntimeError, match="cancelled"):
+        cache.get_or_compute("k", "themes", lambda: "never", check=_check)
+    assert time.monotonic() - began < 1.0
+    finish.set()
+    owner.join(5)
+
+
+def test_async_follower_check_ends_the_wait() -> None:
+    cache = SharedUpstreamCache()
+    cache.register("k", consumers=2)
+
+    async def _run() -> None:
+        async def _slow() -> str:
+            await asyncio.sleep(5)
+            return "themes"
+
+        owner = asyncio.create_task(cache.aget_or_compute("k", "themes", _slow))
+        await asyncio.sleep(0)
+        began = time.monotonic()
+
+        def _check() -> None:
+            if time.monotonic() - began > 0.05:
+                raise RuntimeError("deadline")
+
+        with pytest.raises(RuntimeError, match="deadline"):
+            await cache.aget_or_compute("k", "themes", _slow, check=_check)
+        assert time.monotonic() - began < 1.0
+        owner.cancel()
+
+    asyncio.run(_run())
+
+
+def test_expired_entries_purged_on_register() -> None:
+    cache = SharedUpstreamCache(ttl_seconds=0)
+    cache.register("old", consumers=1)
+    cache.register("new", consumers=1)
+    assert len(cache) == 1
+
+
+def test_register_requires_positive_consumers() -> None:
+    with pytest.raises(ValueError, match="consumers must be > 0"):
+        SharedUpstreamCache().register("k", consumers=0)
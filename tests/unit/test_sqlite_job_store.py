@@ -0,0 +1,251 @@
+"""Unit tests for SqliteJobStore – shared, process-safe job persistence."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.application.use_cases.list_jobs import list_jobs
+from src.domain.models.job import JobStatus
+from src.domain.models.job_input import JobInput
+from src.infrastructure.stores.in_memory_job_store import InMemoryJobStore
+from src.infrastructure.stores.job_store_factory import get_job_store
+from src.infrastructure.stores.sqlite_job_store import SqliteJobStore
+from src.settings import Settings
+from tests.unit.test_result_json_cache import _output
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "jobs.sqlite3"
+
+
+@pytest.fixture
+def store(db_path: Path):
+    store = SqliteJobStore(db_path, poll_interval=0.02)
+    yield store
+    store.close()
+
+
+def test_lifecycle_bumps_version(store: SqliteJobStore) -> None:
+    created = store.create("j1")
+    assert created.status == JobStatus.PENDING
+    assert created.version == 1
+
+    store.set_input(
+        "j1", JobInput(topic="seo tools", target_word_count=500, language="en")
+    )
+    store.set_status("j1", JobStatus.RUNNING, current_node="collect_serp")
+    record = store.get("j1")
+
+    assert record.status == JobStatus.RUNNING
+    assert record.current_node == "collect_serp"
+    assert record.input is not None and record.input.topic == "seo tools"
+    assert record.version == 3
+
+
+def test_create_duplicate_raises(store: SqliteJobStore) -> None:
+    store.create("j1")
+    with pytest.raises(ValueError, match="already exists"):
+        store.create("j1")
+
+
+def test_unknown_job_raises_key_error(store: SqliteJobStore) -> None:
+    with pytest.raises(KeyError):
+        store.get("missing")
+    with pytest.raises(KeyError):
+        store.set_current_node("missing", "collect_serp")
+
+
+def test_result_round_trip(store: SqliteJobStore) -> None:
+    output = _output()
+    store.create("j1")
+    assert store.get_result_json("j1") is None
+
+    record = store.set_result("j1", output)
+    result_json, result_hash = store.get_result_json("j1")
+
+    assert record.status == JobStatus.COMPLETED
+    assert store.get("j1").result == output
+    assert result_json == output.model_dump_json().encode()
+    assert result_hash == record.result_hash
+
+
+def test_set_error_marks_failed(store: SqliteJobStore) -> None:
+    store.create("j1")
+    record = store.set_error("j1", "boom")
+    assert record.status == JobStatus.FAILED
+    assert record.error == "boom"
+
+
+def test_compare_and_set_status(store: SqliteJobStore) -> None:
+    store.create("j1")
+    store.set_status("j1", JobStatus.RUNNING, current_node="planner")
+
+    assert (
+        store.compare_and_set_status("j1", {JobStatus.QUEUED}, JobStatus.CANCELLED)
+        is None
+    )
+    record = store.compare_and_set_status(
+        "j1", {JobStatus.RUNNING}, JobStatus.CANCELLING
+    )
+    assert record.status == JobStatus.CANCELLING
+    assert record.current_node == "planner"
+    assert record.version == 3
+    with pytest.raises(KeyError):
+        store.compare_and_set_status(
+            "missing", {JobStatus.RUNNING}, JobStatus.CANCELLING
+        )
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_compare_and_set_result(backend: str, store: SqliteJobStore) -> None:
+    store = InMemoryJobStore() if backend == "memory" else store
+    store.create("j1")
+    store.set_status("j1", JobStatus.QUEUED)
+    store.set_status("j1", JobStatus.CANCELLED)
+
+    assert store.compare_and_set_result("j1", {JobStatus.QUEUED}, _output()) is None
+    assert store.get("j1").status == JobStatus.CANCELLED
+    assert store.get_result_json("j1") is None
+
+    store.set_status("j1", JobStatus.QUEUED)
+    record = store.compare_and_set_result("j1", {JobStatus.QUEUED}, _output())
+    assert record.status == JobStatus.COMPLETED
+    assert record.result_hash == store.get_result_json("j1")[1]
+    with pytest.raises(KeyError):
+        store.compare_and_set_result("missing", {JobStatus.QUEUED}, _output())
+
+
+def test_list_jobs_pages_by_status(store: SqliteJobStore) -> None:
+    for i in range(5):
+        store.create(f"j{i}")
+    store.set_error("j1", "boom")
+
+    first = list_jobs(job_store=store, status=JobStatus.PENDING, limit=2)
+    second = list_jobs(
+        job_store=store, status=JobStatus.PENDING, cursor=first.next_cursor, limit=2
+    )
+
+    assert [r.id for r in first.jobs] == ["j0", "j2"]
+    assert [r.id for r in second.jobs] == ["j3", "j4"]
+    assert second.next_cursor is None
+
+
+def test_delete(store: SqliteJobStore) -> None:
+    store.create("j1")
+    store.delete("j1")
+    with pytest.raises(KeyError):
+        store.get("j1")
+
+
+def test_second_instance_sees_writes(store: SqliteJobStore, db_path: Path) -> None:
+    """Two instances on one file stand in for two uvicorn worker processes."""
+    other = SqliteJobStore(db_path)
+    try:
+        store.create("j1")
+        other.set_current_node("j1", "collect_serp")
+        assert store.get("j1").current_node == "collect_serp"
+    finally:
+        other.close()
+
+
+def test_watch_sees_writes_from_other_instance(
+    store: SqliteJobStore, db_path: Path
+) -> None:
+    other = SqliteJobStore(db_path)
+    seen: list[int] = []
+    changed = threading.Event()
+
+    def _on_change(record) -> None:
+        seen.append(record.version)
+        changed.set()
+
+    try:
+        store.create("j1")
+        unwatch = store.watch("j1", _on_change)
+        other.set_current_node("j1", "collect_serp")
+        assert changed.wait(timeout=5)
+        unwatch()
+    finally:
+        other.close()
+    assert seen == [2]
+
+
+def test_watch_local_write_notifies_once(store: SqliteJobStore) -> None:
+    store.create("j1")
+    seen: list[int] = []
+    unwatch = store.watch("j1", lambda record: seen.append(record.version))
+
+    store.set_current_node("j1", "collect_serp")
+    threading.Event().wait(0.1)  # let the poller run; it must not re-deliver
+    unwatch()
+
+    assert seen == [2]
+
+
+def test_factory_selects_backend(db_path: Path) -> None:
+    assert isinstance(
+        get_job_store(Settings(JOB_STORE_BACKEND="memory")), InMemoryJobStore
+    )
+    store = get_job_store(
+        Settings(JOB_STORE_BACKEND="sqlite", JOB_STORE_PATH=str(db_path))
+    )
+    try:
+        assert isinstance(store, SqliteJobStore)
+    finally:
+        store.close()
+    with pytest.raises(ValueError, match="Unsupported job store backend"):
+        get_job_store(Settings(JOB_STORE_BACKEND="redis"))
+
+
+def test_idempotency_key_claim_is_shared_and_expires(
+    store: SqliteJobStore, db_path: Path
+) -> None:
+    other = SqliteJobStore(db_path)
+    try:
+        assert store.claim_idempotency_key("k1", "j1", "fp", 60) == ("j1", "fp")
+        assert other.claim_idempotency_key("k1", "j2", "fp", 60) == ("j1", "fp")
+
+        other.release_idempotency_key("k1", "j2")
+        assert store.claim_idempotency_key("k1", "j3", "fp", 60) == ("j1", "fp")
+
+        store.release_idempotency_key("k1", "j1")
+        assert other.claim_idempotency_key("k1", "j2", "fp2", -1) == ("j2", "fp2")
+        assert store.claim_idempotency_key("k1", "j3", "fp3", 60) == ("j3", "fp3")
+    finally:
+        other.close()
+
+
+class _ReleaseBeforeReadBack:
+    """Connection proxy that lets another worker release *key* mid-claim."""
+
+    def __init__(self, conn, release) -> None:
+        self._conn = conn
+        self._release = release
+
+    def execute(self, sql: str, params: tuple = ()):
+        if sql.startswith("SELECT job_id, fingerprint") and self._release:
+            self._release()
+            self._release = None
+        return self._conn.execute(sql, params)
+
+
+def test_idempotency_claim_retries_when_owner_is_released_mid_claim(
+    store: SqliteJobStore, db_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    other = SqliteJobStore(db_path)
+    try:
+        other.claim_idempotency_key("k1", "j1", "fp", 60)
+        proxy = _ReleaseBeforeReadBack(
+            store._conn(), lambda: other.release_idempotency_key("k1", "j1")
+        )
+        monkeypatch.setattr(store, "_conn", lambda: proxy)
+
+        assert store.claim_idempotency_key("k1", "j2", "fp2", 60) == ("j2", "fp2")
+        assert proxy._release is None
+        assert other.claim_idempotency_key("k1", "j3", "fp3", 60) == ("j2", "fp2")
+    finally:
+        other.close()
@@ -0,0 +1,173 @@
+"""Unit tests for TenantQuotas and TokenBucket – admission, settlement, refill."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.domain.models.job_input import DEFAULT_TENANT_ID
+from src.infrastructure.quotas.errors import QuotaExceededError
+from src.infrastructure.quotas.in_memory_quota_store import InMemoryQuotaStore
+from src.infrastructure.quotas.sqlite_quota_store import SqliteQuotaStore
+from src.infrastructure.quotas.tenant_quotas import TenantQuotas
+from src.infrastructure.quotas.token_bucket import TokenBucket
+from src.settings import Settings
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_refills_at_per_minute_rate() -> None:
+    clock = _Clock()
+    bucket = TokenBucket(60, clock=clock)
+    assert bucket.try_take(60)
+    assert not bucket.try_take(1)
+    assert bucket.seconds_until(5) == 5
+
+    clock.now = 5
+    assert bucket.try_take(5)
+    clock.now = 1000
+    assert bucket.level == 60
+
+
+def test_jobs_per_minute_limit_and_retry_after() -> None:
+    clock = _Clock()
+    quotas = TenantQuotas(jobs_per_minute=2, llm_tokens_per_minute=None, clock=clock)
+    quotas.admit("acme", estimated_tokens=0)
+    quotas.admit("acme", estimated_tokens=0)
+
+    with pytest.raises(QuotaExceededError) as exc_info:
+        quotas.admit("acme", estimated_tokens=0)
+    assert exc_info.value.limit == "jobs"
+    assert exc_info.value.retry_after == 30
+
+    quotas.admit("other", estimated_tokens=0)
+    clock.now = 30
+    quotas.admit("acme", estimated_tokens=0)
+    usage = quotas.usage("acme")
+    assert (usage.jobs_admitted_total, usage.jobs_rejected_total) == (3, 1)
+
+
+def test_default_settings_leave_quotas_off() -> None:
+    settings = Settings(_env_file=None)
+    quotas = TenantQuotas(
+        jobs_per_minute=settings.TENANT_JOBS_PER_MINUTE or None,
+        llm_tokens_per_minute=settings.TENANT_LLM_TOKENS_PER_MINUTE or None,
+        clock=_Clock(),
+    )
+    # A 500-topic batch without X-Tenant-ID all lands on the default tenant.
+    for _ in range(500):
+        quotas.admit(DEFAULT_TENANT_ID, estimated_tokens=12_000)
+    assert quotas.usage(DEFAULT_TENANT_ID).jobs_rejected_total == 0
+
+
+def test_token_reservation_is_settled_against_actual_usage() -> None:
+    quotas = TenantQuotas(
+        jobs_per_minute=None, llm_tokens_per_minute=10_000, clock=_Clock()
+    )
+    reserved = quotas.admit("acme", estimated_tokens=6_000)
+    assert quotas.usage("acme").llm_tokens_reserved == 6_000
+    with pytest.raises(QuotaExceededError, match="llm_tokens"):
+        quotas.admit("acme", estimated_tokens=6_000)
+
+    quotas.settle("acme", reserved=reserved, actual_tokens=2_000)
+    usage = quotas.usage("acme")
+    assert usage.llm_tokens_used == 2_000
+    assert usage.llm_tokens_reserved == 0
+    assert usage.llm_tokens_total == 2_000
+    quotas.admit("acme", estimated_tokens=6_000)
+
+
+def test_underestimated_job_leaves_tenant_in_debt() -> None:
+    quotas = TenantQuotas(
+        jobs_per_minute=None, llm_tokens_per_minute=1_000, clock=_Clock()
+    )
+    reserved = quotas.admit("acme", estimated_tokens=5_000)
+    assert reserved == 1_000  # capped at one minute's budget
+
+    quotas.settle("acme", reserved=reserved, actual_tokens=1_600)
+    assert quotas.usage("acme").llm_tokens_used == 1_600
+    with pytest.raises(QuotaExceededError) as exc_info:
+        quotas.admit("acme", estimated_tokens=100)
+    assert exc_info.value.retry_after == 42
+
+
+def test_release_returns_admission() -> None:
+    quotas = TenantQuotas(
+        jobs_per_minute=1, llm_tokens_per_minute=1_000, clock=_Clock()
+    )
+    reserved = quotas.admit("acme", estimated_tokens=800)
+    quotas.release("acme", reserved=reserved)
+
+    usage = quotas.usage("acme")
+    assert (usage.jobs_used, usage.llm_tokens_used, usage.jobs_admitted_total) == (
+        0,
+        0,
+        0,
+    )
+    quotas.admit("acme", estimated_tokens=800)
+
+
+def test_sqlite_store_shares_buckets_between_processes(tmp_path) -> None:
+    clock = _Clock()
+    path = tmp_path / "jobs.sqlite3"
+    stores = [SqliteQuotaStore(path), SqliteQuotaStore(path)]
+    try:
+        worker_a, worker_b = (
+            TenantQuotas(
+                jobs_per_minute=2, llm_tokens_per_minute=None, store=store, clock=clock
+            )
+            for store in stores
+        )
+        worker_a.admit("acme", estimated_tokens=0)
+        worker_b.admit("acme", estimated_tokens=0)
+        with pytest.raises(QuotaExceededError):
+            worker_a.admit("acme", estimated_tokens=0)
+
+        assert worker_a.usage("acme") == worker_b.usage("acme")
+        assert worker_b.usage("acme").jobs_admitted_total == 2
+    finally:
+        for store in stores:
+            store.close()
+
+
+def test_usage_lookup_does_not_store_the_tenant() -> None:
+    store = InMemoryQuotaStore()
+    quotas = TenantQuotas(jobs_per_minute=2, llm_tokens_per_minute=None, store=store)
+    assert quotas.usage("never-seen").jobs_admitted_total == 0
+    assert len(store) == 0
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_idle_tenants_are_dropped(backend, tmp_path) -> None:
+    clock = _Clock()
+    if backend == "memory":
+        store = InMemoryQuotaStore(idle_seconds=600)
+    else:
+        store = SqliteQuotaStore(tmp_path / "jobs.sqlite3", idle_seconds=600)
+    quotas = TenantQuotas(
+        jobs_per_minute=10, llm_tokens_per_minute=1_000, store=store, clock=clock
+    )
+    quotas.admit("idle", estimated_tokens=0)
+    busy = quotas.admit("busy", estimated_tokens=500)
+
+    clock.now = 601
+    quotas.admit("new", estimated_tokens=0)
+
+    assert store.get("idle") is None
+    assert store.get("busy").reserved == busy  # in-flight reservation is kept
+    assert len(store) == 2
+
+
+def test_memory_store_caps_tracked_tenants() -> None:
+    store = InMemoryQuotaStore(max_tenants=2)
+    quotas = TenantQuotas(jobs_per_minute=10, llm_tokens_per_minute=None, store=store)
+    for tenant_id in ("a", "b", "c"):
+        quotas.admit(tenant_id, estimated_tokens=0)
+
+    assert len(store) == 2
+    assert store.get("a") is None
@@ -0,0 +1,325 @@
+"""Unit tests for completion webhooks – signing, outboxes and the dispatcher."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from src.domain.models.job import JobRecord, JobStatus
+from src.domain.models.job_input import JobInput
+from src.infrastructure.webhooks import (
+    UnsafeCallbackURLError,
+    WebhookDispatcher,
+    WebhookStatus,
+    check_callback_url,
+    enqueue_job_finished,
+    sign,
+)
+from src.infrastructure.webhooks.in_memory_outbox import InMemoryWebhookOutbox
+from src.infrastructure.webhooks.sqlite_outbox import SqliteWebhookOutbox
+
+
+class _Receiver:
+    """Local HTTP endpoint answering with a scripted list of status codes."""
+
+    def __init__(self, statuses: list[int]) -> None:
+        self.statuses = list(statuses)
+        self.requests: list[tuple[dict[str, str], bytes]] = []
+        receiver = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                receiver.requests.append((dict(self.headers), body))
+                status = receiver.statuses.pop(0) if receiver.statuses else 200
+                self.send_response(status)
+                if 300 <= status < 400:
+                    self.send_header("Location", "/redirected")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}/hook"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def receiver_factory():
+    receivers: list[_Receiver] = []
+
+    def _make(statuses: list[int]) -> _Receiver:
+        receiver = _Receiver(statuses)
+        receivers.append(receiver)
+        return receiver
+
+    yield _make
+    for receiver in receivers:
+        receiver.close()
+
+
+def _record(callback_url: str | None) -> JobRecord:
+    return JobRecord(
+        id="j1",
+        status=JobStatus.COMPLETED,
+        input=JobInput(
+            topic="seo tools",
+            target_word_count=500,
+            language="en",
+            callback_url=callback_url,
+        ),
+        result_hash="abc",
+    )
+
+
+def _dispatcher(outbox, **kwargs) -> WebhookDispatcher:
+    # The receivers listen on 127.0.0.1, which the default SSRF check refuses.
+    kwargs.setdefault("allow_private_urls", True)
+    kwargs.setdefault("base_delay", 0.01)
+    kwargs.setdefault("max_delay", 0.01)
+    kwargs.setdefault("timeout", 2.0)
+    return WebhookDispatcher(outbox=outbox, **kwargs)
+
+
+def _drain(
+    dispatcher: WebhookDispatcher, outbox, job_id: str, *, rounds: int = 50
+) -> None:
+    """Run the dispatcher until the job's deliveries are all delivered or dead."""
+    for _ in range(rounds):
+        dispatcher.run_once()
+        if all(d.status != WebhookStatus.PENDING for d in outbox.deliveries(job_id)):
+            return
+        threading.Event().wait(0.01)
+
+
+def test_sign_is_hmac_sha256_over_timestamp_and_body() -> None:
+    expected = hmac.new(b"s3cret", b"1700000000.{}", hashlib.sha256).hexdigest()
+    assert sign("s3cret", 1700000000, b"{}") == f"sha256={expected}"
+
+
+def test_enqueue_job_finished_skips_jobs_without_callback() -> None:
+    outbox = InMemoryWebhookOutbox()
+    assert enqueue_job_finished(outbox, _record(None)) is None
+    assert enqueue_job_finished(None, _record("http://example.test/hook")) is None
+    assert outbox.deliveries("j1") == []
+
+
+def test_enqueue_job_finished_records_terminal_event() -> None:
+    outbox = InMemoryWebhookOutbox()
+    enqueue_job_finished(outbox, _record("http://example.test/hook"))
+
+    [delivery] = outbox.deliveries("j1")
+    payload = json.loads(delivery.body)
+    assert delivery.url == "http://example.test/hook"
+    assert delivery.status == WebhookStatus.PENDING
+    assert payload["event"] == "job.completed"
+    assert payload["job_id"] == "j1"
+    assert payload["result_hash"] == "abc"
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_outbox_leases_claims_until_settled(backend: str, tmp_path: Path) -> None:
+    outbox = (
+        InMemoryWebhookOutbox()
+        if backend == "memory"
+        else SqliteWebhookOutbox(tmp_path / "jobs.sqlite3")
+    )
+    delivery_id = outbox.enqueue(
+        job_id="j1", url="http://example.test/hook", body=b"{}"
+    )
+
+    [claimed] = outbox.claim(limit=10, lease_seconds=60)
+    assert claimed.id == delivery_id
+    assert claimed.attempts == 1
+    assert outbox.claim(limit=10, lease_seconds=60) == []
+
+    outbox.retry(delivery_id, delay=0, error="HTTP 503")
+    [again] = outbox.claim(limit=10, lease_seconds=60)
+    assert again.attempts == 2
+    assert again.last_error == "HTTP 503"
+
+    outbox.succeed(delivery_id)
+    assert outbox.claim(limit=10, lease_seconds=60) == []
+    [done] = outbox.deliveries("j1")
+    assert done.status == WebhookStatus.DELIVERED
+
+
+def test_sqlite_outbox_survives_reopen(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.sqlite3"
+    first = SqliteWebhookOutbox(path)
+    first.enqueue(job_id="j1", url="http://example.test/hook", body=b"{}")
+    first.close()
+
+    second = SqliteWebhookOutbox(path)
+    try:
+        [delivery] = second.claim(limit=10, lease_seconds=60)
+        assert delivery.job_id == "j1"
+    finally:
+        second.close()
+
+
+def test_dispatcher_posts_signed_body(receiver_factory) -> None:
+    receiver = receiver_factory([200])
+    outbox = InMemoryWebhookOutbox()
+    enqueue_job_finished(outbox, _record(receiver.url))
+
+    _drain(_dispatcher(outbox, secret="s3cret"), outbox, "j1")
+
+    [delivery] = outbox.deliveries("j1")
+    assert delivery.status == WebhookStatus.DELIVERED
+    [(headers, body)] = receiver.requests
+    assert body == delivery.body
+    assert headers["X-Webhook-Id"] == delivery.id
+    timestamp = int(headers["X-Webhook-Timestamp"])
+    assert headers["X-Webhook-Signature"] == sign("s3cret", timestamp, body)
+
+
+def test_dispatcher_retries_server_errors(receiver_factory) -> None:
+    receiver = receiver_factory([503, 500, 200])
+    outbox = InMemoryWebhookOutbox()
+    enqueue_job_finished(outbox, _record(receiver.url))
+
+    _drain(_dispatcher(outbox), outbox, "j1")
+
+    [delivery] = outbox.deliveries("j1")
+    assert delivery.status == WebhookStatus.DELIVERED
+    assert delivery.attempts == 3
+    assert len(receiver.requests) == 3
+
+
+def test_dispatcher_gives_up_after_max_attempts(receiver_factory) -> None:
+    receiver = receiver_factory([503] * 10)
+    outbox = InMemoryWebhookOutbox()
+    enqueue_job_finished(outbox, _record(receiver.url))
+
+    _drain(_dispatcher(outbox, max_attempts=3), outbox, "j1")
+
+    [delivery] = outbox.deliveries("j1")
+    assert delivery.status == WebhookStatus.DEAD
+    assert delivery.last_error == "HTTP 503"
+    assert len(receiver.requests) == 3
+
+
+def test_dispatcher_does_not_retry_client_errors(receiver_factory) -> None:
+    receiver = receiver_factory([404])
+    outbox = InMemoryWebhookOutbox()
+    enqueue_job_finished(outbox, _record(receiver.url))
+
+    _drain(_dispatcher(outbox), outbox, "j1")
+
+    [delivery] = outbox.deliveries("j1")
+    assert delivery.status == WebhookStatus.DEAD
+    assert len(receiver.requests) == 1
+
+
+def test_dispatcher_retries_unreachable_endpoint() -> None:
+    outbox = InMemoryWebhookOutbox()
+    # Port 9 (discard) on localhost is closed in the test environment.
+    enqueue_job_finished(outbox, _record("http://127.0.0.1:9/hook"))
+
+    _drain(_dispatcher(outbox, max_attempts=2), outbox, "j1")
+
+    [delivery] = outbox.deliveries("j1")
+    assert delivery.status == WebhookStatus.DEAD
+    assert delivery.attempts == 2
+
+
+def _resolver(*addresses: str):
+    def _resolve(host, port, **kwargs):
+        return [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", (a, port))
+            for a in addresses
+        ]
+
+    return _resolve
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        "127.0.0.1",
+        "10.0.0.5",
+        "192.168.1.1",
+        "169.254.169.254",
+        "::1",
+        "::ffff:127.0.0.1",
+    ],
+)
+def test_check_callback_url_rejects_non_public_addresses(address: str) -> None:
+    with pytest.raises(UnsafeCallbackURLError):
+        check_callback_url("https://hooks.example/seo", resolve=_resolver(address))
+
+
+def test_check_callback_url_rejects_if_any_address_is_private() -> None:
+    resolve = _resolver("93.184.216.34", "10.0.0.5")
+    with pytest.raises(UnsafeCallbackURLError):
+        check_callback_url("https://hooks.example/seo", resolve=resolve)
+
+
+def test_check_callback_url_accepts_public_and_unresolved_hosts() -> None:
+    check_callback_url("https://hooks.example/seo", resolve=_resolver("93.184.216.34"))
+
+    def _unresolved(*args, **kwargs):
+        raise socket.gaierror("no such host")
+
+    check_callback_url("https://hooks.example/seo", resolve=_unresolved)
+    with pytest.raises(UnsafeCallbackURLError):
+        check_callback_url("file:///etc/passwd", resolve=_unresolved)
+
+
+def test_dispatcher_refuses_private_addresses_by_default(receiver_factory) -> None:
+    receiver = receiver_factory([200])
+    outbox = InMemoryWebhookOutbox()
+    enqueue_job_finished(outbox, _record(receiver.url))
+
+    _drain(_dispatcher(outbox, allow_private_urls=False), outbox, "j1")
+
+    [delivery] = outbox.deliveries("j1")
+    assert delivery.status == WebhookStatus.DEAD
+    assert delivery.attempts == 1
+    assert "non-public address 127.0.0.1" in delivery.last_error
+    assert receiver.requests == []
+
+
+def test_dispatcher_does_not_follow_redirects(receiver_factory) -> None:
+    receiver = receiver_factory([302, 200])
+    outbox = InMemoryWebhookOutbox()
+    enqueue_job_finished(outbox, _record(receiver.url))
+
+    _drain(_dispatcher(outbox), outbox, "j1")
+
+    [delivery] = outbox.deliveries("j1")
+    assert delivery.status == WebhookStatus.DEAD
+    assert delivery.last_error == "HTTP 302"
+    assert len(receiver.requests) == 1
+
+
+def test_started_dispatcher_delivers_in_background(receiver_factory) -> None:
+    receiver = receiver_factory([200])
+    outbox = InMemoryWebhookOutbox()
+    dispatcher = _dispatcher(outbox, poll_interval=0.01)
+    dispatcher.start()
+    try:
+        enqueue_job_finished(outbox, _record(receiver.url))
+        for _ in range(200):
+            if outbox.deliveries("j1")[0].status == WebhookStatus.DELIVERED:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        dispatcher.stop()
+
+    assert outbox.deliveries("j1")[0].status == WebhookStatus.DELIVERED
+    assert len(receiver.requests) == 1
@@ -11,6 +11,7 @@ from src.application.orchestration.state import GraphState
 from src.domain.models.keyword_plan import KeywordPlan, UsageTargetItem
 from src.domain.models.outline import Outline, OutlineSection
 from src.domain.models.plan import Plan, PlanSection
+from src.infrastructure.events.draft_stream_hub import DraftStreamHub
 from src.infrastructure.providers.serp.mock_serp import MockSerpProvider
 
 
@@ -77,11 +78,15 @@ class FakeLLM:
     def __init__(self, markdown: str) -> None:
         self._markdown = markdown
 
-    def generate_text(self, *, node_name: str, prompt: str) -> str:
+    def generate_text(self, *, node_name: str, prompt: str, **kwargs) -> str:
         assert node_name == "write_article"
         assert "project management" in prompt
         return self._markdown
 
+    def stream_text(self, *, node_name: str, prompt: str, **kwargs):
+        assert node_name == "write_article"
+        yield from self._markdown.splitlines(keepends=True)
+
 
 def test_write_article_returns_patch() -> None:
     md = """# Project Management Tools Guide
@@ -140,3 +145,52 @@ def test_write_article_missing_llm_raises() -> None:
 
     with pytest.raises(ValueError, match="write_article: deps.llm is required"):
         write_article(state, deps)
+
+
+def test_write_article_streams_draft_and_validates_assembled_text() -> None:
+    md = """# Project Management Tools Guide
+
+Intro paragraph with project management tools.
+
+## Introduction
+
+Content for intro.
+
+## Key Features
+
+Content for features.
+"""
+    hub = DraftStreamHub()
+    received: list[str | None] = []
+    hub.subscribe("j1", received.append)
+    deps = NodeDeps(
+        serp=MockSerpProvider(),
+        llm=FakeLLM(md),
+        prompts=PromptLoader(),
+        draft_stream=hub,
+    )
+
+    patch = write_article(_make_state(), deps)
+
+    assert patch["article_markdown"] == md.strip()
+    assert received[-1] is None
+    assert "".join(c for c in received if c is not None) == md
+
+
+def test_write_article_streamed_draft_still_checks_h2() -> None:
+    md = (
+        "# Project Management Tools Guide\n\nIntro.\n\n## Introduction\n\nOnly intro.\n"
+    )
+    hub = DraftStreamHub()
+    deps = NodeDeps(
+        serp=MockSerpProvider(),
+        llm=FakeLLM(md),
+        prompts=PromptLoader(),
+        draft_stream=hub,
+    )
+
+    with pytest.raises(ValueError, match="write_article: missing required H2 headings"):
+        write_article(_make_state(), deps)
+    text, closed, _ = hub.subscribe("j1", lambda chunk: None)
+    assert closed is True
+    assert text == md